@@ -6,13 +6,27 @@ containing Markdown files and expose their content for RAG workflows through
 a local MCP server.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.3.4"
 __author__ = "Ivan Nagy"
 __email__ = "contact@example.com"
 
-from prometh_cortex.config import Config, load_config
-from prometh_cortex.parser import MarkdownDocument, parse_markdown_file
-from prometh_cortex.indexer import DocumentIndexer
+if TYPE_CHECKING:
+    from prometh_cortex.config import Config, load_config
+    from prometh_cortex.indexer import DocumentIndexer
+    from prometh_cortex.parser import MarkdownDocument, parse_markdown_file
+
+# Public attributes resolved on first access (PEP 562) so that `import
+# prometh_cortex` stays cheap for CLI commands that never touch the indexer.
+_LAZY_ATTRIBUTES = {
+    "Config": "prometh_cortex.config",
+    "load_config": "prometh_cortex.config",
+    "MarkdownDocument": "prometh_cortex.parser",
+    "parse_markdown_file": "prometh_cortex.parser",
+    "DocumentIndexer": "prometh_cortex.indexer",
+}
 
 __all__ = [
     "Config",
@@ -20,4 +34,20 @@ __all__ = [
     "MarkdownDocument",
     "parse_markdown_file",
     "DocumentIndexer",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes lazily on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazy attributes in dir() output."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,11 +2,13 @@
 
 import logging
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from prometh_cortex.analyzer.metrics import DocumentMetrics, CollectionAnalysisResult
 from prometh_cortex.analyzer.recommender import ChunkRecommender
-from prometh_cortex.config import CollectionConfig
+from prometh_cortex.config import SourceConfig
+from prometh_cortex.embedding.tokenizer import ModelTokenizer
+from prometh_cortex.parser import extract_document_chunks, parse_markdown_file
 
 logger = logging.getLogger(__name__)
 
@@ -14,20 +16,28 @@ logger = logging.getLogger(__name__)
 class DocumentAnalyzer:
     """Analyze documents to recommend optimal chunk sizes."""
 
-    def __init__(self):
-        """Initialize the analyzer."""
+    def __init__(self, tokenizer: Optional[ModelTokenizer] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            tokenizer: Embedding model tokenizer; when given, sampled files are
+                chunked as configured and each chunk is measured against the
+                model window to report truncation
+        """
         self.recommender = ChunkRecommender()
+        self.tokenizer = tokenizer
 
     def analyze_collection(
         self,
-        collection_config: CollectionConfig,
+        collection_config: SourceConfig,
         max_samples: int = 5,
     ) -> CollectionAnalysisResult:
         """
-        Analyze a collection and provide recommendations.
+        Analyze a source and provide recommendations.
 
         Args:
-            collection_config: Configuration for the collection
+            collection_config: Configuration for the source
             max_samples: Maximum number of files to sample (most recent)
 
         Returns:
@@ -54,6 +64,11 @@ class DocumentAnalyzer:
             collection_config.name,
             metrics_list,
         )
+        if collection_config.chunking == "tokens":
+            # Sizes are in model tokens, not the characters the recommender works in
+            recommended_chunk = collection_config.chunk_size
+            recommended_overlap = collection_config.chunk_overlap
+            rationale = "Chunks are sized in embedding model tokens and capped at the model window"
 
         # Create result
         result = CollectionAnalysisResult(
@@ -66,10 +81,41 @@ class DocumentAnalyzer:
             recommended_chunk_size=recommended_chunk,
             recommended_overlap=recommended_overlap,
             rationale=rationale,
+            chunking=collection_config.chunking,
         )
 
+        if self.tokenizer is not None:
+            result.token_window = self.tokenizer.window
+            for file_path in sampled_files:
+                try:
+                    result.chunk_tokens.extend(
+                        self._chunk_token_counts(file_path, collection_config)
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to chunk {file_path}: {e}")
+
         return result
 
+    def _chunk_token_counts(self, file_path: str, source_config: SourceConfig) -> List[int]:
+        """
+        Chunk a file as the indexer would and count each chunk's tokens.
+
+        Args:
+            file_path: Path to the markdown file
+            source_config: Source whose chunking parameters to use
+
+        Returns:
+            Token count of each chunk
+        """
+        chunks = extract_document_chunks(
+            parse_markdown_file(Path(file_path)),
+            chunk_size=source_config.chunk_size,
+            chunk_overlap=source_config.chunk_overlap,
+            chunking=source_config.chunking,
+            tokenizer=self.tokenizer,
+        )
+        return self.tokenizer.count([chunk["content"] for chunk in chunks if chunk["content"]])
+
     def _sample_documents(
         self,
         source_patterns: List[str],
@@ -215,7 +261,7 @@ class DocumentAnalyzer:
         lines.append("# Prometh Cortex - Chunk Size Analysis Report")
         lines.append("")
         lines.append(
-            f"**Generated:** Analysis of {sum(len(r.metrics_list) for r in analysis_results)} files across {len(analysis_results)} collections"
+            f"**Generated:** Analysis of {sum(len(r.metrics_list) for r in analysis_results)} files across {len(analysis_results)} sources"
         )
         lines.append("")
 
@@ -223,16 +269,17 @@ class DocumentAnalyzer:
         lines.append("## Executive Summary")
         lines.append("")
         lines.append(
-            "| Collection | Current | Recommended | Change |"
+            "| Source | Current | Recommended | Change | Truncated Chunks |"
         )
-        lines.append("|---|---|---|---|")
+        lines.append("|---|---|---|---|---|")
 
         for result in analysis_results:
             current = f"{result.current_chunk_size}/{result.current_overlap}"
             recommended = f"{result.recommended_chunk_size}/{result.recommended_overlap}"
             change = result.chunk_change
+            truncated = _percent(result.truncation_rate)
             lines.append(
-                f"| {result.collection_name} | {current} | {recommended} | {change} |"
+                f"| {result.collection_name} | {current} | {recommended} | {change} | {truncated} |"
             )
 
         lines.append("")
@@ -273,6 +320,28 @@ class DocumentAnalyzer:
             lines.append(f"- **Rationale:** {result.rationale}")
             lines.append("")
 
+            # Token window usage
+            if result.truncation_rate is not None:
+                lines.append("**Embedding Window:**")
+                lines.append("")
+                lines.append(
+                    f"- Chunks: {len(result.chunk_tokens)} | Window: {result.token_window} tokens"
+                    f" | Longest chunk: {max(result.chunk_tokens)} tokens"
+                )
+                lines.append(
+                    f"- Truncated chunks: {_percent(result.truncation_rate)}"
+                    f" | Tokens never embedded: {_percent(result.ignored_token_rate)}"
+                    f" | Window used: {_percent(result.window_utilization)}"
+                )
+                if result.chunking != "tokens" and (
+                    result.truncation_rate > 0 or result.window_utilization < 0.5
+                ):
+                    lines.append(
+                        f"- Set `chunking = \"tokens\"` and `chunk_size = {result.token_window}`"
+                        " to size chunks to the model window"
+                    )
+                lines.append("")
+
         # Implementation
         lines.append("## Implementation")
         lines.append("")
@@ -280,10 +349,12 @@ class DocumentAnalyzer:
         lines.append("")
         lines.append("```toml")
         for result in analysis_results:
-            lines.append(f"[[collections]]")
+            lines.append(f"[[sources]]")
             lines.append(f"name = \"{result.collection_name}\"")
             lines.append(f"chunk_size = {result.recommended_chunk_size}")
             lines.append(f"chunk_overlap = {result.recommended_overlap}")
+            if result.chunking != "fixed":
+                lines.append(f"chunking = \"{result.chunking}\"")
             lines.append(f"source_patterns = {result.source_patterns!r}")
             lines.append("")
         lines.append("```")
@@ -297,3 +368,8 @@ class DocumentAnalyzer:
         lines.append("")
 
         return "\n".join(lines)
+
+
+def _percent(rate: Optional[float]) -> str:
+    """Format a rate for the report ("n/a" when not measured)."""
+    return "n/a" if rate is None else f"{rate:.0%}"
@@ -1,6 +1,6 @@
 """Document metrics for chunking analysis."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -116,6 +116,39 @@ class CollectionAnalysisResult:
     rationale: str
     """Explanation for recommendations."""
 
+    chunking: str = "fixed"
+    """Current chunking mode from config."""
+
+    token_window: Optional[int] = None
+    """Embedding model input window in text tokens (None = not measured)."""
+
+    chunk_tokens: list = field(default_factory=list)
+    """Token count of each chunk of the sampled files, as currently chunked."""
+
+    @property
+    def truncation_rate(self) -> Optional[float]:
+        """Fraction of chunks longer than the model window, which the model cuts."""
+        if self.token_window is None or not self.chunk_tokens:
+            return None
+        truncated = sum(1 for tokens in self.chunk_tokens if tokens > self.token_window)
+        return truncated / len(self.chunk_tokens)
+
+    @property
+    def ignored_token_rate(self) -> Optional[float]:
+        """Fraction of chunk tokens beyond the model window, never embedded."""
+        if self.token_window is None or not self.chunk_tokens:
+            return None
+        ignored = sum(max(0, tokens - self.token_window) for tokens in self.chunk_tokens)
+        return ignored / max(1, sum(self.chunk_tokens))
+
+    @property
+    def window_utilization(self) -> Optional[float]:
+        """Average fraction of the model window filled by a chunk."""
+        if self.token_window is None or not self.chunk_tokens:
+            return None
+        used = sum(min(tokens, self.token_window) for tokens in self.chunk_tokens)
+        return used / (len(self.chunk_tokens) * self.token_window)
+
     @property
     def average_metrics(self) -> dict:
         """Calculate average metrics across sampled files."""
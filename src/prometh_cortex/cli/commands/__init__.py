@@ -1,3 +1 @@
 """CLI command modules for prometh-cortex."""
-
-from . import fields
\ No newline at end of file
@@ -12,6 +12,8 @@ from rich.table import Table
 
 from prometh_cortex.analyzer import DocumentAnalyzer
 from prometh_cortex.cli.animations import ClaudeProgress, ClaudeStatusDisplay
+from prometh_cortex.config.settings import MEMORY_SOURCE
+from prometh_cortex.embedding.tokenizer import TokenizerError, load_tokenizer
 
 console = Console()
 
@@ -21,7 +23,7 @@ console = Console()
     "--samples",
     type=int,
     default=5,
-    help="Number of most recent files to sample per collection",
+    help="Number of most recent files to sample per source",
 )
 @click.option(
     "--output",
@@ -31,24 +33,27 @@ console = Console()
 )
 @click.pass_context
 def analyze(ctx: click.Context, samples: int, output: Path):
-    """Analyze collections and recommend optimal chunk sizes.
+    """Analyze sources and recommend optimal chunk sizes.
 
-    Samples the most recent files (by modification time) from each collection
-    to provide data-driven chunking recommendations.
+    Samples the most recent files (by modification time) from each source
+    to provide data-driven chunking recommendations, and reports how many
+    of the source's chunks exceed the embedding model's token window and
+    are silently truncated.
 
     Examples:
       pcortex analyze                    # Analyze with default settings
-      pcortex analyze --samples 10       # Sample 10 most recent files per collection
+      pcortex analyze --samples 10       # Sample 10 most recent files per source
       pcortex analyze --output ~/report.md  # Save report to specific location
     """
     config = ctx.obj["config"]
     verbose = ctx.obj["verbose"]
 
-    if not config.collections:
+    sources = [source for source in config.sources if source.name != MEMORY_SOURCE.name]
+    if not sources:
         console.print(
             ClaudeStatusDisplay.create_info_panel(
-                "No Collections Configured",
-                "No RAG collections are configured in your settings",
+                "No Sources Configured",
+                "No RAG sources are configured in your settings",
             )
         )
         return
@@ -60,13 +65,19 @@ def analyze(ctx: click.Context, samples: int, output: Path):
         output = Path(output).expanduser()
 
     try:
-        # Initialize analyzer
-        analyzer = DocumentAnalyzer()
+        # Initialize analyzer with the embedding model's tokenizer, if available
+        tokenizer_name = config.embedding_tokenizer or config.embedding_model
+        try:
+            tokenizer = load_tokenizer(tokenizer_name, config.embedding_max_tokens)
+        except TokenizerError as e:
+            tokenizer = None
+            console.print(f"[yellow]⚠ Truncation not measured: {e}[/yellow]")
+        analyzer = DocumentAnalyzer(tokenizer=tokenizer)
         console.print()
         console.print(
             ClaudeStatusDisplay.create_info_panel(
-                "Collection Analyzer",
-                f"Sampling up to {samples} most recent files per collection",
+                "Source Analyzer",
+                f"Sampling up to {samples} most recent files per source",
             )
         )
         console.print()
@@ -79,12 +90,12 @@ def analyze(ctx: click.Context, samples: int, output: Path):
             """Update progress display."""
             console.print(msg)
 
-        # Analyze each collection
+        # Analyze each source
         start_time = time.time()
         analysis_results = []
 
         with Live(progress, console=console, refresh_per_second=10):
-            for i, coll_config in enumerate(config.collections):
+            for i, coll_config in enumerate(sources):
                 # Add task for this collection
                 task_id = progress.add_task(
                     f"[bold blue]Analyzing: {coll_config.name}[/bold blue] (sampling {samples} files)",
@@ -147,19 +158,25 @@ def analyze(ctx: click.Context, samples: int, output: Path):
             header_style="bold blue",
             border_style="blue",
         )
-        table.add_column("Collection", style="cyan", width=25)
+        table.add_column("Source", style="cyan", width=25)
         table.add_column("Current", style="yellow", width=12)
         table.add_column("Recommended", style="green", width=14)
         table.add_column("Change", style="dim", width=15)
+        table.add_column("Truncated", style="red", width=10)
         table.add_column("Sampled", style="magenta", width=10)
 
         for result in analysis_results:
             current = f"{result.current_chunk_size}/{result.current_overlap}"
             recommended = f"{result.recommended_chunk_size}/{result.recommended_overlap}"
             change = result.chunk_change
+            truncated = (
+                "n/a" if result.truncation_rate is None else f"{result.truncation_rate:.0%}"
+            )
             sampled = f"{len(result.sampled_files)} files"
 
-            table.add_row(result.collection_name, current, recommended, change, sampled)
+            table.add_row(
+                result.collection_name, current, recommended, change, truncated, sampled
+            )
 
         console.print(table)
         console.print()
@@ -0,0 +1,162 @@
+"""Backup and restore commands for the Qdrant backend."""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+
+from prometh_cortex.vector_store import create_vector_store
+from prometh_cortex.vector_store.qdrant_archive import ArchiveError
+
+console = Console()
+
+
+def _open_qdrant_store(config):
+    if config.vector_store_type != "qdrant":
+        console.print(
+            Panel(
+                "[yellow]Backup and restore are only available for the Qdrant backend; "
+                f"copy {config.rag_index_dir} to back up a FAISS index[/yellow]",
+                title="Not Supported",
+                expand=False,
+            )
+        )
+        sys.exit(1)
+    return create_vector_store(config)
+
+
+@click.command()
+@click.argument("path", required=False, type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Collection partitions read in parallel",
+)
+@click.option(
+    "--snapshot",
+    is_flag=True,
+    help="Create a native snapshot on the Qdrant server instead of an archive",
+)
+@click.pass_context
+def backup(ctx: click.Context, path: Optional[Path], workers: int, snapshot: bool):
+    """Back up the Qdrant collection with its vectors.
+
+    Writes ids, vectors and payloads to a compact archive that restores
+    without re-embedding, or creates a server-side snapshot.
+
+    Examples:
+      pcortex backup notes.pcqa             # Archive file
+      pcortex backup --snapshot             # Snapshot on the Qdrant server
+    """
+    config = ctx.obj["config"]
+    if not snapshot and path is None:
+        raise click.UsageError("Give an archive PATH or use --snapshot")
+    vector_store = _open_qdrant_store(config)
+
+    try:
+        if snapshot:
+            name = vector_store.create_snapshot()
+            collection = vector_store._resolve_alias() or vector_store.alias_name
+            scheme = "https" if config.qdrant_use_https else "http"
+            console.print(
+                Panel(
+                    f"[green]✓ Snapshot {name} created[/green]\n\n"
+                    f"Download: {scheme}://{config.qdrant_host}:{config.qdrant_port}"
+                    f"/collections/{collection}/snapshots/{name}",
+                    title="Success",
+                    expand=False,
+                )
+            )
+            return
+
+        with console.status("Exporting points..."):
+            points = vector_store.export_archive(path, workers=workers)
+    except Exception as e:
+        console.print(Panel(f"[red]Error: {e}[/red]", title="Error", expand=False))
+        sys.exit(1)
+
+    console.print(
+        Panel(
+            f"[green]✓ Backed up {points} points to {path}[/green]",
+            title="Success",
+            expand=False,
+        )
+    )
+
+
+@click.command()
+@click.argument(
+    "path", required=False, type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    "--snapshot",
+    "snapshot_location",
+    type=str,
+    help="Recover a snapshot URL or server-side file:// path instead of an archive",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Concurrent upload requests",
+)
+@click.option(
+    "--confirm",
+    is_flag=True,
+    help="Skip confirmation prompt",
+)
+@click.pass_context
+def restore(
+    ctx: click.Context,
+    path: Optional[Path],
+    snapshot_location: Optional[str],
+    workers: int,
+    confirm: bool,
+):
+    """Replace the Qdrant collection with a backup.
+
+    The backup is loaded into a new collection version and published by
+    switching the alias, so queries keep using the current collection until
+    the restore completes. Nothing is re-embedded.
+
+    Examples:
+      pcortex restore notes.pcqa
+      pcortex restore --snapshot http://qdrant:6333/collections/notes_v3/snapshots/s.snapshot
+    """
+    config = ctx.obj["config"]
+    if (path is None) == (snapshot_location is None):
+        raise click.UsageError("Give either an archive PATH or --snapshot LOCATION")
+    vector_store = _open_qdrant_store(config)
+
+    if not confirm:
+        console.print(
+            f"[yellow]This will replace the collection '{config.qdrant_collection_name}', "
+            "memories included.[/yellow]"
+        )
+        if not click.confirm("Restore the backup?", default=False):
+            console.print("[yellow]Cancelled.[/yellow]")
+            return
+
+    try:
+        if snapshot_location:
+            with console.status("Recovering snapshot..."):
+                collection = vector_store.recover_snapshot(snapshot_location)
+            message = f"[green]✓ Snapshot recovered into {collection}[/green]"
+        else:
+            with console.status("Restoring points..."):
+                points = vector_store.restore_archive(path, workers=workers)
+            message = f"[green]✓ Restored {points} points from {path}[/green]"
+    except (ArchiveError, ValueError) as e:
+        console.print(Panel(f"[red]Error: {e}[/red]", title="Error", expand=False))
+        sys.exit(1)
+    except Exception as e:
+        console.print(Panel(f"[red]Restore failed: {e}[/red]", title="Error", expand=False))
+        sys.exit(1)
+
+    console.print(Panel(message, title="Success", expand=False))
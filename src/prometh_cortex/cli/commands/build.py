@@ -34,12 +34,29 @@ console = Console()
     default=True,
     help="Use incremental indexing (default: enabled)"
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for parsing and chunking (0 = all CPUs)"
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue an interrupted build from its last checkpoint"
+)
 @click.pass_context
-def build(ctx: click.Context, force: bool, incremental: bool):
+def build(ctx: click.Context, force: bool, incremental: bool, jobs: int, resume: bool):
     """Build unified RAG index from datalake repositories with per-source chunking.
 
     By default, uses incremental indexing to only process changed files.
     Use --force to rebuild the entire index from scratch.
+    Use --jobs to parse and chunk files in parallel worker processes.
+
+    Progress is checkpointed periodically ([build] checkpoint_chunks and
+    checkpoint_seconds); use --resume to continue an interrupted build.
 
     Per-source chunking (v0.3.0+): Documents are automatically routed
     to sources based on configured source patterns. Each source has
@@ -48,6 +65,10 @@ def build(ctx: click.Context, force: bool, incremental: bool):
     config = ctx.obj["config"]
     verbose = ctx.obj["verbose"]
 
+    if resume and (force or not incremental):
+        console.print("[red]✗[/red] --resume cannot be combined with --force or --no-incremental")
+        sys.exit(1)
+
     # Display beautiful header with source info
     if verbose:
         header_text = Text()
@@ -79,7 +100,17 @@ def build(ctx: click.Context, force: bool, incremental: bool):
 
         config_info.append(f"Model: [dim]{config.embedding_model.split('/')[-1]}[/dim]")
 
-        if force:
+        if config.build_memory_limit_mb:
+            config_info.append(
+                f"Streaming Build: [dim]{config.build_memory_limit_mb} MB buffer limit[/dim]"
+            )
+
+        if jobs != 1:
+            config_info.append(f"Parse Workers: [dim]{jobs or 'all CPUs'}[/dim]")
+
+        if resume:
+            config_info.append("[yellow]↻ Resuming from last checkpoint[/yellow]")
+        elif force:
             config_info.append("[yellow]⚡ Force rebuild enabled[/yellow]")
         elif not incremental:
             config_info.append("[yellow]⚠ Incremental indexing disabled[/yellow]")
@@ -112,6 +143,19 @@ def build(ctx: click.Context, force: bool, incremental: bool):
             progress.update(init_task, description="[bold green]✓ Unified collection initialized[/bold green]")
             time.sleep(0.3)  # Let user see the success
 
+        interrupted = indexer.get_build_checkpoint()
+        if resume and interrupted is None:
+            console.print("[dim]No interrupted build found; running an incremental build[/dim]")
+        elif resume:
+            console.print(
+                f"[bold blue]↻ Resuming interrupted build[/bold blue] "
+                f"({interrupted.get('documents', 0)} documents already checkpointed)"
+            )
+        elif interrupted is not None:
+            console.print(
+                "[yellow]⚠ Discarding an interrupted build; use --resume to continue it[/yellow]"
+            )
+
         console.print(ClaudeStatusDisplay.create_success_panel(
             "Unified RAG Indexer Ready",
             f"Initialized {len(config.sources)} sources with {config.vector_store_type.upper()}"
@@ -129,9 +173,10 @@ def build(ctx: click.Context, force: bool, incremental: bool):
             """Callback to handle source-level progress updates."""
             if event_type == "start":
                 # Create a new task for this source
-                doc_count = data.get("doc_count", 0)
+                doc_count = data.get("doc_count")
+                count_str = f" ({doc_count} docs)" if doc_count is not None else ""
                 task_id = build_progress.add_task(
-                    f"[bold blue]Indexing: {source_name}[/bold blue] ({doc_count} docs)",
+                    f"[bold blue]Indexing: {source_name}[/bold blue]{count_str}",
                     total=None,
                     status="🚀 Processing"
                 )
@@ -166,7 +211,9 @@ def build(ctx: click.Context, force: bool, incremental: bool):
             # Build all collections with progress callback
             stats = indexer.build_index(
                 force_rebuild=force_rebuild,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                jobs=jobs,
+                resume=resume
             )
 
         # Phase 3: Beautiful results display with per-collection statistics
@@ -223,6 +270,8 @@ def build(ctx: click.Context, force: bool, incremental: bool):
                 "Total Chunks Created": total_chunks,
                 "Build Time": f"{build_time:.1f}s",
             }
+            if stats.get("generation"):
+                build_stats["Published Generation"] = stats["generation"]
 
             console.print(ClaudeStatusDisplay.create_success_panel(
                 "Build Successful",
@@ -278,7 +327,7 @@ def build(ctx: click.Context, force: bool, incremental: bool):
     except KeyboardInterrupt:
         console.print()
         cancel_panel = Panel(
-            "[yellow]Build cancelled by user[/yellow]\nYou can resume with 'pcortex build' for incremental updates",
+            "[yellow]Build cancelled by user[/yellow]\nProgress up to the last checkpoint was saved; continue with 'pcortex build --resume'",
             title="[yellow]⚠[/yellow] Cancelled",
             border_style="yellow",
             padding=(1, 2)
@@ -0,0 +1,128 @@
+"""Embedd command for running the shared embedding daemon."""
+
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on (default: [embedding] daemon_socket)",
+)
+@click.option(
+    "--model",
+    type=str,
+    help="Embedding model to serve (default: [embedding] model)",
+)
+@click.option(
+    "--provider",
+    type=str,
+    help="Embedding provider (default: [embedding] provider)",
+)
+@click.option(
+    "--max-batch-size",
+    type=click.IntRange(1, 1024),
+    default=64,
+    show_default=True,
+    help="Maximum number of texts embedded in one model call",
+)
+@click.option(
+    "--batch-wait-ms",
+    type=click.FloatRange(0, 1000),
+    default=5.0,
+    show_default=True,
+    help="How long to wait for concurrent requests to join a batch",
+)
+@click.pass_context
+def embedd(
+    ctx: click.Context,
+    socket_path: Path,
+    model: str,
+    provider: str,
+    max_batch_size: int,
+    batch_wait_ms: float,
+):
+    """Run the embedding daemon that keeps one warm model for all pcortex processes.
+
+    While it runs, `pcortex query`, `pcortex build` and the servers embed
+    through it instead of loading the model themselves.
+    """
+    from prometh_cortex.embedding import get_embedding_model
+    from prometh_cortex.embedding.daemon import EmbeddingDaemon, EmbeddingDaemonError
+
+    config = ctx.obj["config"]
+    verbose = ctx.obj["verbose"]
+
+    if socket_path is None:
+        socket_path = config.embedding_daemon_socket
+    if socket_path is None:
+        console.print(
+            "[red]✗[/red] No daemon socket configured. Pass --socket or set "
+            "[embedding] daemon_socket."
+        )
+        sys.exit(1)
+    model_name = model or config.embedding_model
+    provider = provider or config.embedding_provider
+
+    if verbose:
+        console.print(f"[bold blue]Loading embedding model {model_name}...[/bold blue]")
+
+    start_time = time.time()
+    try:
+        embed_model = get_embedding_model(
+            model_name,
+            provider=provider,
+            batch_size=config.embedding_batch_size,
+            num_threads=config.embedding_threads,
+        )
+        daemon = EmbeddingDaemon(
+            embed_model,
+            model_name,
+            socket_path,
+            max_batch_size=max_batch_size,
+            batch_wait_ms=batch_wait_ms,
+            provider=provider,
+        )
+        daemon.bind()
+    except EmbeddingDaemonError as e:
+        console.print(f"[red]✗[/red] {e}")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]✗[/red] Failed to start embedding daemon: {e}")
+        sys.exit(1)
+
+    console.print(
+        Panel(
+            f"[bold cyan]Embedding Daemon[/bold cyan]\n\n"
+            f"[bold]Model:[/bold] {model_name} ({provider}, {daemon.dimension} dims)\n"
+            f"[bold]Socket:[/bold] {daemon.socket_path}\n"
+            f"[bold]Batching:[/bold] up to {max_batch_size} texts, "
+            f"{batch_wait_ms:g} ms window\n"
+            f"[bold]Load time:[/bold] {time.time() - start_time:.1f}s\n\n"
+            f"[dim]Press Ctrl+C to stop the daemon[/dim]",
+            border_style="blue",
+        )
+    )
+
+    def _stop(signum, frame):
+        # shutdown() blocks until serve_forever() returns, so call it off-thread
+        threading.Thread(target=daemon.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+    console.print("[yellow]Embedding daemon stopped[/yellow]")
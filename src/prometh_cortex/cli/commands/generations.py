@@ -0,0 +1,101 @@
+"""Generations command group for listing and rolling back index generations."""
+
+import sys
+from datetime import datetime
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from prometh_cortex.vector_store import GenerationError, IndexGenerations
+
+console = Console()
+
+
+def _open_generations(config) -> IndexGenerations:
+    if config.vector_store_type != "faiss":
+        console.print(
+            Panel(
+                "[yellow]Index generations are only used by the FAISS backend[/yellow]",
+                title="Not Supported",
+                expand=False,
+            )
+        )
+        sys.exit(1)
+    return IndexGenerations(config.rag_index_dir, keep=config.index_keep_generations)
+
+
+@click.group()
+def generations():
+    """Manage published index generations (FAISS backend).
+
+    Every forced rebuild publishes a new generation atomically; running
+    servers switch to it on their next query. The previous generations are
+    kept for rollback (see keep_generations in [storage]).
+    """
+    pass
+
+
+@generations.command("list")
+@click.pass_context
+def generations_list(ctx: click.Context):
+    """List published generations, newest first."""
+    index_generations = _open_generations(ctx.obj["config"])
+
+    history = index_generations.history()
+    if not history:
+        console.print(
+            Panel("[yellow]No index generation published yet[/yellow]", title="Generations")
+        )
+        return
+
+    table = Table(title="Index Generations", show_header=True, header_style="bold cyan")
+    table.add_column("Generation", style="white", no_wrap=True)
+    table.add_column("Published", style="green", no_wrap=True)
+    table.add_column("Status", style="blue")
+
+    for entry in history:
+        published = datetime.fromtimestamp(entry["published_at"]).strftime("%Y-%m-%d %H:%M:%S")
+        table.add_row(entry["name"], published, "current" if entry["current"] else "")
+
+    console.print(table)
+
+
+@generations.command("rollback")
+@click.argument("name", required=False)
+@click.option(
+    "--confirm",
+    is_flag=True,
+    help="Skip confirmation prompt",
+)
+@click.pass_context
+def generations_rollback(ctx: click.Context, name: str, confirm: bool):
+    """Publish a previous generation again (default: the one before the current).
+
+    Examples:
+      pcortex generations rollback                 # Previous generation
+      pcortex generations rollback gen-000003      # Specific generation
+    """
+    index_generations = _open_generations(ctx.obj["config"])
+
+    if not confirm:
+        target = name or "the previous generation"
+        if not click.confirm(f"Roll the index back to {target}?", default=False):
+            console.print("[yellow]Cancelled.[/yellow]")
+            return
+
+    try:
+        restored = index_generations.rollback(name)
+    except GenerationError as e:
+        console.print(Panel(f"[red]Error: {e}[/red]", title="Error", expand=False))
+        sys.exit(1)
+
+    console.print(
+        Panel(
+            f"[green]✓ Generation {restored} is now current[/green]\n\n"
+            "Memories are stored outside generations and are all kept.",
+            title="Success",
+            expand=False,
+        )
+    )
@@ -6,6 +6,7 @@ from rich.table import Table
 from rich.panel import Panel
 
 from prometh_cortex.vector_store import create_vector_store
+from prometh_cortex.vector_store.memory_catalog import memory_cursor
 from prometh_cortex.utils.time_parser import (
     parse_time_filter,
     format_timestamp,
@@ -40,8 +41,25 @@ def memory():
     type=str,
     help="Filter by tag",
 )
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    help="Show at most this many memories (newest first)",
+)
+@click.option(
+    "--cursor",
+    type=str,
+    help="Continue a previous listing (printed after a full page)",
+)
 @click.pass_context
-def memory_list(ctx: click.Context, since: str, project: str, tag: str):
+def memory_list(
+    ctx: click.Context,
+    since: str,
+    project: str,
+    tag: str,
+    limit: int,
+    cursor: str,
+):
     """List memory documents.
 
     Examples:
@@ -50,6 +68,7 @@ def memory_list(ctx: click.Context, since: str, project: str, tag: str):
       pcortex memory list --since 2026-03-01           # Since specific date
       pcortex memory list --project myproject          # By project
       pcortex memory list --since 7d --project test    # Combined filters
+      pcortex memory list --limit 20                   # Newest 20
     """
     config = ctx.obj["config"]
     verbose = ctx.obj["verbose"]
@@ -75,7 +94,9 @@ def memory_list(ctx: click.Context, since: str, project: str, tag: str):
                 raise click.Exit(1)
 
         # List memories directly from vector store
-        memories = vector_store.list_memory_documents(since=since_ts, project=project, tag=tag)
+        memories = vector_store.list_memory_documents(
+            since=since_ts, project=project, tag=tag, limit=limit, cursor=cursor
+        )
 
         if not memories:
             console.print(
@@ -124,6 +145,11 @@ def memory_list(ctx: click.Context, since: str, project: str, tag: str):
 
         console.print(table)
 
+        if limit is not None and len(memories) == limit:
+            console.print(
+                f"[dim]More memories may follow: --cursor '{memory_cursor(memories[-1])}'[/dim]"
+            )
+
     except Exception as e:
         console.print(
             Panel(
@@ -0,0 +1,99 @@
+"""Export and import commands for moving an index between backends."""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+
+from prometh_cortex.indexer import DocumentIndexer, IndexerError
+
+console = Console()
+
+
+@click.command("export")
+@click.argument("directory", type=click.Path(file_okay=False, path_type=Path))
+@click.pass_context
+def export_index(ctx: click.Context, directory: Path):
+    """Export all chunks and memories with their vectors to DIRECTORY.
+
+    The export is backend-independent: float16 vectors in .npy shards, chunk
+    text and metadata in JSONL, described by manifest.json. Load it into
+    FAISS or Qdrant with 'pcortex import' without re-embedding.
+
+    Examples:
+      pcortex export ./cortex-export
+    """
+    config = ctx.obj["config"]
+
+    try:
+        indexer = DocumentIndexer(config)
+        with console.status("Exporting chunks...") as status:
+            manifest = indexer.export_index(
+                directory,
+                progress_callback=lambda n: status.update(f"Exporting chunks... {n}"),
+            )
+    except IndexerError as e:
+        console.print(Panel(f"[red]Error: {e}[/red]", title="Error", expand=False))
+        sys.exit(1)
+
+    console.print(
+        Panel(
+            f"[green]✓ Exported {manifest['chunks']} chunks from {config.vector_store_type} "
+            f"to {directory}[/green]",
+            title="Success",
+            expand=False,
+        )
+    )
+
+
+@click.command("import")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option(
+    "--confirm",
+    is_flag=True,
+    help="Skip confirmation prompt",
+)
+@click.pass_context
+def import_index(ctx: click.Context, directory: Path, confirm: bool):
+    """Replace the index with an export from 'pcortex export'.
+
+    Chunks are bulk-loaded with their stored vectors into the configured
+    backend, in a new generation published atomically; nothing is
+    re-embedded. Exported memories are added to the existing ones.
+
+    Examples:
+      pcortex import ./cortex-export
+      pcortex import ./cortex-export --confirm
+    """
+    config = ctx.obj["config"]
+
+    if not confirm:
+        console.print(
+            f"[yellow]This will replace the {config.vector_store_type} index with "
+            f"{directory}.[/yellow]"
+        )
+        if not click.confirm("Import the export?", default=False):
+            console.print("[yellow]Cancelled.[/yellow]")
+            return
+
+    try:
+        indexer = DocumentIndexer(config)
+        with console.status("Importing chunks...") as status:
+            stats = indexer.import_index(
+                directory,
+                progress_callback=lambda n: status.update(f"Importing chunks... {n}"),
+            )
+    except IndexerError as e:
+        console.print(Panel(f"[red]Error: {e}[/red]", title="Error", expand=False))
+        sys.exit(1)
+
+    console.print(
+        Panel(
+            f"[green]✓ Imported {stats['chunks']} chunks "
+            f"({stats['memories']} memory chunks) into {config.vector_store_type}[/green]",
+            title="Success",
+            expand=False,
+        )
+    )
@@ -248,7 +248,7 @@ def query(ctx: click.Context, search_term: str, max_results: int, show_content:
                 
                 # Show curated metadata fields in a useful order
                 priority_keys = [
-                    "file_path", "title", "file_name", "source_type",
+                    "file_path", "title", "section_path", "file_name", "source_type",
                     "file_extension", "file_size", "chunk_index",
                 ]
                 shown_keys = set()
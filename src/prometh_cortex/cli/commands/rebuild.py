@@ -1,6 +1,5 @@
 """Rebuild command for recreating the entire RAG index."""
 
-import shutil
 import sys
 
 import click
@@ -50,27 +49,19 @@ def rebuild(ctx: click.Context, confirm: bool):
     # Confirm rebuild unless --confirm flag is used
     if not confirm:
         if config.vector_store_type == 'faiss':
-            console.print(f"[yellow]This will delete the existing index at:[/yellow] {config.rag_index_dir}")
+            console.print(f"[yellow]This will replace the existing index at:[/yellow] {config.rag_index_dir}")
+            console.print("[dim]The current index stays live until the new one is published and is kept for rollback.[/dim]")
         else:
-            console.print(f"[yellow]This will delete the existing index in Qdrant:[/yellow] {config.qdrant_host}:{config.qdrant_port}")
+            console.print(f"[yellow]This will replace the existing index in Qdrant:[/yellow] {config.qdrant_host}:{config.qdrant_port}")
+            console.print(f"[dim]Queries keep using the current collection until the alias '{config.qdrant_collection_name}' is switched to the new one.[/dim]")
         if not click.confirm("Are you sure you want to rebuild the index?"):
             console.print("Rebuild cancelled")
             return
     
     try:
-        # Remove existing index using the indexer
-        if verbose:
-            console.print("[yellow]Removing existing index...[/yellow]")
-        
-        indexer = DocumentIndexer(config)
-        indexer.delete_index()
-        
-        # For FAISS, also remove the directory
-        if config.vector_store_type == 'faiss' and config.rag_index_dir.exists():
-            shutil.rmtree(config.rag_index_dir)
-        
-        console.print("[green]✓[/green] Existing index removed")
-        
+        # The force build fills a new generation (FAISS directory or Qdrant
+        # collection) and publishes it atomically, so the existing index
+        # keeps serving queries until then
         # Build new index with force rebuild
         ctx.invoke(build_command, force=True, incremental=True)
         
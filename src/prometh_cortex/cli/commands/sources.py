@@ -135,6 +135,7 @@ def sources(ctx: click.Context):
                     f"[bold cyan]{source_config.name}[/bold cyan]\n"
                     f"  Chunk Size: {source_config.chunk_size}\n"
                     f"  Overlap: {source_config.chunk_overlap}\n"
+                    f"  Chunking: {source_config.chunking}\n"
                     f"  Patterns: {pattern_text}"
                 )
                 console.print(Panel(source_info, border_style="blue", padding=(0, 1)))
@@ -1,19 +1,70 @@
 """Main CLI entry point for pcortex commands."""
 
+import importlib
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 
 from prometh_cortex.config import ConfigValidationError, load_config
-from prometh_cortex.cli.commands import build, rebuild, query, serve, mcp, health, fields, sources, analyze, memory
 
 
 console = Console()
 
+# Subcommands are registered as "module:attribute" and imported on first use,
+# so lightweight commands don't pay for the indexer and vector store imports.
+LAZY_COMMANDS: Dict[str, str] = {
+    "build": "prometh_cortex.cli.commands.build:build",
+    "rebuild": "prometh_cortex.cli.commands.rebuild:rebuild",
+    "query": "prometh_cortex.cli.commands.query:query",
+    "sources": "prometh_cortex.cli.commands.sources:sources",
+    "analyze": "prometh_cortex.cli.commands.analyze:analyze",
+    "serve": "prometh_cortex.cli.commands.serve:serve",
+    "mcp": "prometh_cortex.cli.commands.mcp:mcp",
+    "memory": "prometh_cortex.cli.commands.memory:memory",
+    "health": "prometh_cortex.cli.commands.health:health",
+    "fields": "prometh_cortex.cli.commands.fields:fields",
+    "embedd": "prometh_cortex.cli.commands.embedd:embedd",
+    "generations": "prometh_cortex.cli.commands.generations:generations",
+    "backup": "prometh_cortex.cli.commands.backup:backup",
+    "restore": "prometh_cortex.cli.commands.backup:restore",
+    "export": "prometh_cortex.cli.commands.portable:export_index",
+    "import": "prometh_cortex.cli.commands.portable:import_index",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked."""
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eagerly registered and lazy commands together."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Resolve a command, importing its module on first use."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_lazy_command(cmd_name)
+        return command
+
+    def _load_lazy_command(self, cmd_name: str) -> click.Command:
+        """Import a lazy command and register it on the group."""
+        module_name, attr_name = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise click.ClickException(
+                f"Lazy command '{cmd_name}' did not resolve to a click command"
+            )
+        self.add_command(command, cmd_name)
+        return command
+
 
 def display_welcome():
     """Display welcome message with version info in Claude Code style."""
@@ -53,7 +104,7 @@ def display_welcome():
     ))
 
 
-@click.group(name="pcortex")
+@click.group(name="pcortex", cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option(
     "--config",
     "-c",
@@ -196,19 +247,6 @@ def config(sample: bool, init: bool, show_paths: bool):
         console.print("  --show-paths  Show config file search paths")
 
 
-# Add command groups
-cli.add_command(build.build)
-cli.add_command(rebuild.rebuild)
-cli.add_command(query.query)
-cli.add_command(sources.sources)
-cli.add_command(analyze.analyze)
-cli.add_command(serve.serve)
-cli.add_command(mcp.mcp)
-cli.add_command(memory.memory)
-cli.add_command(health.health)
-cli.add_command(fields.fields)
-
-
 def main():
     """Main entry point for the CLI."""
     try:
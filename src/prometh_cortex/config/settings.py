@@ -40,6 +40,10 @@ def _resolve_env_ref(value: str) -> str:
     return value
 
 
+# Chunk boundary placement strategies (see parser.markdown)
+CHUNKING_MODES = ("fixed", "content_defined", "tokens", "markdown")
+
+
 class SourceConfig(BaseModel):
     """Configuration for a document source with chunking parameters."""
 
@@ -59,6 +63,17 @@ class SourceConfig(BaseModel):
         le=256,
         description="Overlap between text chunks for this source",
     )
+    chunking: str = Field(
+        default="fixed",
+        description=(
+            "Chunk boundary placement: 'fixed' (every chunk_size characters, with "
+            "overlap), 'content_defined' (at paragraph and sentence anchors, so "
+            "edits only change nearby chunks), 'tokens' (chunk_size and "
+            "chunk_overlap in embedding model tokens, capped at the model window) or "
+            "'markdown' (whole heading sections packed up to chunk_size, never "
+            "splitting code blocks or table rows)"
+        ),
+    )
     source_patterns: List[str] = Field(
         default_factory=list,
         description="Path patterns that route documents to this source (e.g., ['docs/specs', 'docs/prds'])",
@@ -69,6 +84,15 @@ class SourceConfig(BaseModel):
 
         arbitrary_types_allowed = True
 
+    @validator("chunking")
+    def validate_chunking(cls, v):
+        """Validate the chunking mode."""
+        if v.lower() not in CHUNKING_MODES:
+            raise ValueError(
+                f"Unsupported chunking mode: {v}. Supported modes: {CHUNKING_MODES}"
+            )
+        return v.lower()
+
 
 # Built-in virtual source for prometh_cortex_memory (v0.4.0+)
 MEMORY_SOURCE = SourceConfig(
@@ -101,6 +125,11 @@ class Config(BaseModel):
     rag_index_dir: Path = Field(
         default=Path(".rag_index"), description="Directory to store RAG index files"
     )
+    index_keep_generations: int = Field(
+        default=3,
+        ge=1,
+        description="Published FAISS index generations kept for rollback, including the current one",
+    )
     mcp_port: int = Field(
         default=8080, ge=1024, le=65535, description="Port for MCP server"
     )
@@ -116,6 +145,44 @@ class Config(BaseModel):
         default="sentence-transformers/all-MiniLM-L6-v2",
         description="Name of the embedding model to use",
     )
+    embedding_provider: str = Field(
+        default="llama-index",
+        description="Embedding provider: llama-index, sentence-transformers or hash",
+    )
+    embedding_batch_size: int = Field(
+        default=32, ge=1, le=1024, description="Texts per embedding model call"
+    )
+    embedding_threads: Optional[int] = Field(
+        default=None, ge=1, description="Torch CPU threads for local embedding models"
+    )
+    embedding_tokenizer: Optional[str] = Field(
+        default=None,
+        description="Model id or directory of the tokenizer for token-sized chunks (None = embedding_model)",
+    )
+    embedding_max_tokens: Optional[int] = Field(
+        default=None,
+        ge=8,
+        description="Embedding model input window in tokens (None = read from the model)",
+    )
+    embedding_daemon_socket: Optional[Path] = Field(
+        default=Path("~/.prometh-cortex/embedd.sock"),
+        description="Unix socket of the `pcortex embedd` daemon, used when it exists (None disables)",
+    )
+    build_memory_limit_mb: Optional[int] = Field(
+        default=None,
+        ge=64,
+        description="Stream builds within this memory budget for buffered chunks (None = in-memory build)",
+    )
+    build_checkpoint_chunks: int = Field(
+        default=5000,
+        ge=0,
+        description="Checkpoint a running build every N indexed chunks (0 disables)",
+    )
+    build_checkpoint_seconds: float = Field(
+        default=300.0,
+        ge=0,
+        description="Checkpoint a running build every N seconds (0 disables)",
+    )
     max_query_results: int = Field(
         default=10,
         ge=1,
@@ -158,6 +225,61 @@ class Config(BaseModel):
     qdrant_use_https: bool = Field(
         default=False, description="Use HTTPS for Qdrant connection"
     )
+    qdrant_timeout: int = Field(
+        default=30, ge=1, description="Qdrant request timeout in seconds"
+    )
+    qdrant_pool_size: int = Field(
+        default=16,
+        ge=1,
+        description="Connections kept open to Qdrant for concurrent requests",
+    )
+    qdrant_prefer_grpc: bool = Field(
+        default=False, description="Use gRPC instead of REST where supported"
+    )
+    qdrant_grpc_port: int = Field(
+        default=6334, ge=1, le=65535, description="Qdrant gRPC port"
+    )
+    qdrant_quantization: Optional[str] = Field(
+        default=None,
+        description="Vector quantization: 'scalar' (int8), 'binary' or none",
+    )
+    qdrant_quantization_always_ram: bool = Field(
+        default=True, description="Keep quantized vectors in RAM"
+    )
+    qdrant_quantization_rescore: bool = Field(
+        default=True, description="Rescore quantized search hits with the original vectors"
+    )
+    qdrant_quantization_oversampling: Optional[float] = Field(
+        default=None,
+        ge=1.0,
+        description="Fetch this many times top_k quantized candidates before rescoring",
+    )
+    qdrant_hnsw_m: Optional[int] = Field(
+        default=None, ge=0, description="HNSW graph degree (Qdrant default when unset)"
+    )
+    qdrant_hnsw_ef_construct: Optional[int] = Field(
+        default=None, ge=4, description="HNSW build-time search width"
+    )
+    qdrant_hnsw_ef: Optional[int] = Field(
+        default=None, ge=1, description="HNSW query-time search width"
+    )
+    qdrant_on_disk_vectors: bool = Field(
+        default=False, description="Store original vectors on disk (memory-mapped)"
+    )
+    qdrant_on_disk_payload: bool = Field(
+        default=False, description="Store payloads on disk"
+    )
+    qdrant_tenant_index: bool = Field(
+        default=False,
+        description="Partition storage by source_type (is_tenant payload index)",
+    )
+    qdrant_hybrid: bool = Field(
+        default=False,
+        description="Store BM25 sparse vectors and fuse lexical with semantic search",
+    )
+    qdrant_fusion: str = Field(
+        default="rrf", description="Hybrid result fusion: 'rrf' or 'dbsf'"
+    )
 
     # Structured query configuration (Option 1: Hybrid auto-discovery + user config)
     structured_query_core_fields: List[str] = Field(
@@ -238,6 +360,13 @@ class Config(BaseModel):
         """Resolve RAG index directory path."""
         return Path(v).expanduser().resolve()
 
+    @validator("embedding_daemon_socket", pre=True)
+    def resolve_embedding_daemon_socket(cls, v):
+        """Resolve the embedding daemon socket path; empty disables the daemon."""
+        if v is None or str(v).strip() == "":
+            return None
+        return Path(v).expanduser()
+
     @validator("mcp_auth_token", pre=True)
     def generate_auth_token_if_needed(cls, v):
         """Generate authentication token if not provided."""
@@ -264,6 +393,42 @@ class Config(BaseModel):
             return v.lower() in ("true", "1", "yes", "on")
         return bool(v)
 
+    @validator(
+        "qdrant_on_disk_vectors",
+        "qdrant_on_disk_payload",
+        "qdrant_prefer_grpc",
+        "qdrant_hybrid",
+        "qdrant_tenant_index",
+        "qdrant_quantization_always_ram",
+        "qdrant_quantization_rescore",
+        pre=True,
+    )
+    def parse_qdrant_flags(cls, v):
+        """Parse the QDRANT_* boolean environment variables from string."""
+        if isinstance(v, str):
+            return v.lower() in ("true", "1", "yes", "on")
+        return bool(v)
+
+    @validator("qdrant_quantization", pre=True)
+    def validate_qdrant_quantization(cls, v):
+        """Validate the Qdrant quantization mode; empty or 'none' disables it."""
+        if v is None or str(v).strip().lower() in ("", "none"):
+            return None
+        supported = {"scalar", "binary"}
+        if v.lower() not in supported:
+            raise ValueError(
+                f"Unsupported Qdrant quantization: {v}. Supported: {supported}"
+            )
+        return v.lower()
+
+    @validator("qdrant_fusion")
+    def validate_qdrant_fusion(cls, v):
+        """Validate the hybrid search fusion method."""
+        supported = {"rrf", "dbsf"}
+        if v.lower() not in supported:
+            raise ValueError(f"Unsupported Qdrant fusion: {v}. Supported: {supported}")
+        return v.lower()
+
     @validator("sources", pre=True)
     def parse_sources(cls, v):
         """Parse sources from various formats."""
@@ -405,6 +570,14 @@ def _load_from_env() -> Config:
     if rag_index_dir := os.getenv("RAG_INDEX_DIR"):
         config_data["rag_index_dir"] = rag_index_dir
 
+    if keep_generations := os.getenv("INDEX_KEEP_GENERATIONS"):
+        try:
+            config_data["index_keep_generations"] = int(keep_generations)
+        except ValueError:
+            raise ConfigValidationError(
+                f"Invalid INDEX_KEEP_GENERATIONS value: {keep_generations}"
+            )
+
     if mcp_port := os.getenv("MCP_PORT"):
         try:
             config_data["mcp_port"] = int(mcp_port)
@@ -428,6 +601,50 @@ def _load_from_env() -> Config:
     if embedding_model := os.getenv("EMBEDDING_MODEL"):
         config_data["embedding_model"] = embedding_model
 
+    if embedding_provider := os.getenv("EMBEDDING_PROVIDER"):
+        config_data["embedding_provider"] = embedding_provider
+
+    if embedding_tokenizer := os.getenv("EMBEDDING_TOKENIZER"):
+        config_data["embedding_tokenizer"] = embedding_tokenizer
+
+    for env_name, field_name in (
+        ("EMBEDDING_BATCH_SIZE", "embedding_batch_size"),
+        ("EMBEDDING_THREADS", "embedding_threads"),
+        ("EMBEDDING_MAX_TOKENS", "embedding_max_tokens"),
+    ):
+        if env_value := os.getenv(env_name):
+            try:
+                config_data[field_name] = int(env_value)
+            except ValueError:
+                raise ConfigValidationError(f"Invalid {env_name} value: {env_value}")
+
+    if (daemon_socket := os.getenv("EMBEDDING_DAEMON_SOCKET")) is not None:
+        config_data["embedding_daemon_socket"] = daemon_socket
+
+    if memory_limit := os.getenv("BUILD_MEMORY_LIMIT_MB"):
+        try:
+            config_data["build_memory_limit_mb"] = int(memory_limit)
+        except ValueError:
+            raise ConfigValidationError(
+                f"Invalid BUILD_MEMORY_LIMIT_MB value: {memory_limit}"
+            )
+
+    if checkpoint_chunks := os.getenv("BUILD_CHECKPOINT_CHUNKS"):
+        try:
+            config_data["build_checkpoint_chunks"] = int(checkpoint_chunks)
+        except ValueError:
+            raise ConfigValidationError(
+                f"Invalid BUILD_CHECKPOINT_CHUNKS value: {checkpoint_chunks}"
+            )
+
+    if checkpoint_seconds := os.getenv("BUILD_CHECKPOINT_SECONDS"):
+        try:
+            config_data["build_checkpoint_seconds"] = float(checkpoint_seconds)
+        except ValueError:
+            raise ConfigValidationError(
+                f"Invalid BUILD_CHECKPOINT_SECONDS value: {checkpoint_seconds}"
+            )
+
     if max_query_results := os.getenv("MAX_QUERY_RESULTS"):
         try:
             config_data["max_query_results"] = int(max_query_results)
@@ -539,6 +756,64 @@ def _load_from_env() -> Config:
     if qdrant_use_https := os.getenv("QDRANT_USE_HTTPS"):
         config_data["qdrant_use_https"] = qdrant_use_https
 
+    for env_name, field_name in (
+        ("QDRANT_TIMEOUT", "qdrant_timeout"),
+        ("QDRANT_POOL_SIZE", "qdrant_pool_size"),
+        ("QDRANT_GRPC_PORT", "qdrant_grpc_port"),
+    ):
+        if value := os.getenv(env_name):
+            try:
+                config_data[field_name] = int(value)
+            except ValueError:
+                raise ConfigValidationError(f"Invalid {env_name} value: {value}")
+
+    if qdrant_prefer_grpc := os.getenv("QDRANT_PREFER_GRPC"):
+        config_data["qdrant_prefer_grpc"] = qdrant_prefer_grpc
+
+    if qdrant_quantization := os.getenv("QDRANT_QUANTIZATION"):
+        config_data["qdrant_quantization"] = qdrant_quantization
+
+    for env_name, field_name in (
+        ("QDRANT_QUANTIZATION_ALWAYS_RAM", "qdrant_quantization_always_ram"),
+        ("QDRANT_QUANTIZATION_RESCORE", "qdrant_quantization_rescore"),
+    ):
+        if value := os.getenv(env_name):
+            config_data[field_name] = value
+
+    if oversampling := os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING"):
+        try:
+            config_data["qdrant_quantization_oversampling"] = float(oversampling)
+        except ValueError:
+            raise ConfigValidationError(
+                f"Invalid QDRANT_QUANTIZATION_OVERSAMPLING value: {oversampling}"
+            )
+
+    for env_name, field_name in (
+        ("QDRANT_HNSW_M", "qdrant_hnsw_m"),
+        ("QDRANT_HNSW_EF_CONSTRUCT", "qdrant_hnsw_ef_construct"),
+        ("QDRANT_HNSW_EF", "qdrant_hnsw_ef"),
+    ):
+        if value := os.getenv(env_name):
+            try:
+                config_data[field_name] = int(value)
+            except ValueError:
+                raise ConfigValidationError(f"Invalid {env_name} value: {value}")
+
+    if qdrant_on_disk_vectors := os.getenv("QDRANT_ON_DISK_VECTORS"):
+        config_data["qdrant_on_disk_vectors"] = qdrant_on_disk_vectors
+
+    if qdrant_on_disk_payload := os.getenv("QDRANT_ON_DISK_PAYLOAD"):
+        config_data["qdrant_on_disk_payload"] = qdrant_on_disk_payload
+
+    if qdrant_tenant_index := os.getenv("QDRANT_TENANT_INDEX"):
+        config_data["qdrant_tenant_index"] = qdrant_tenant_index
+
+    if qdrant_hybrid := os.getenv("QDRANT_HYBRID"):
+        config_data["qdrant_hybrid"] = qdrant_hybrid
+
+    if qdrant_fusion := os.getenv("QDRANT_FUSION"):
+        config_data["qdrant_fusion"] = qdrant_fusion
+
     # Structured query configuration
     if structured_query_core_fields := os.getenv("STRUCTURED_QUERY_CORE_FIELDS"):
         config_data["structured_query_core_fields"] = [
@@ -677,6 +952,7 @@ def config_to_env_vars(config: Config) -> Dict[str, str]:
     # Storage configuration
     if config.rag_index_dir:
         env_vars["RAG_INDEX_DIR"] = str(config.rag_index_dir)
+    env_vars["INDEX_KEEP_GENERATIONS"] = str(config.index_keep_generations)
 
     # Server configuration
     if config.mcp_port:
@@ -691,6 +967,20 @@ def config_to_env_vars(config: Config) -> Dict[str, str]:
     # Embedding configuration
     if config.embedding_model:
         env_vars["EMBEDDING_MODEL"] = config.embedding_model
+    env_vars["EMBEDDING_PROVIDER"] = config.embedding_provider
+    env_vars["EMBEDDING_BATCH_SIZE"] = str(config.embedding_batch_size)
+    if config.embedding_threads:
+        env_vars["EMBEDDING_THREADS"] = str(config.embedding_threads)
+    if config.embedding_tokenizer:
+        env_vars["EMBEDDING_TOKENIZER"] = config.embedding_tokenizer
+    if config.embedding_max_tokens:
+        env_vars["EMBEDDING_MAX_TOKENS"] = str(config.embedding_max_tokens)
+    env_vars["EMBEDDING_DAEMON_SOCKET"] = str(config.embedding_daemon_socket or "")
+    # Build configuration
+    if config.build_memory_limit_mb:
+        env_vars["BUILD_MEMORY_LIMIT_MB"] = str(config.build_memory_limit_mb)
+    env_vars["BUILD_CHECKPOINT_CHUNKS"] = str(config.build_checkpoint_chunks)
+    env_vars["BUILD_CHECKPOINT_SECONDS"] = str(config.build_checkpoint_seconds)
     if config.max_query_results:
         env_vars["MAX_QUERY_RESULTS"] = str(config.max_query_results)
 
@@ -702,6 +992,7 @@ def config_to_env_vars(config: Config) -> Dict[str, str]:
                 "name": s.name,
                 "chunk_size": s.chunk_size,
                 "chunk_overlap": s.chunk_overlap,
+                "chunking": s.chunking,
                 "source_patterns": s.source_patterns,
             }
             for s in config.sources
@@ -723,6 +1014,38 @@ def config_to_env_vars(config: Config) -> Dict[str, str]:
         env_vars["QDRANT_API_KEY"] = config.qdrant_api_key
     if config.qdrant_use_https:
         env_vars["QDRANT_USE_HTTPS"] = str(config.qdrant_use_https).lower()
+    env_vars["QDRANT_TIMEOUT"] = str(config.qdrant_timeout)
+    env_vars["QDRANT_POOL_SIZE"] = str(config.qdrant_pool_size)
+    if config.qdrant_prefer_grpc:
+        env_vars["QDRANT_PREFER_GRPC"] = "true"
+        env_vars["QDRANT_GRPC_PORT"] = str(config.qdrant_grpc_port)
+    if config.qdrant_quantization:
+        env_vars["QDRANT_QUANTIZATION"] = config.qdrant_quantization
+        env_vars["QDRANT_QUANTIZATION_ALWAYS_RAM"] = str(
+            config.qdrant_quantization_always_ram
+        ).lower()
+        env_vars["QDRANT_QUANTIZATION_RESCORE"] = str(
+            config.qdrant_quantization_rescore
+        ).lower()
+        if config.qdrant_quantization_oversampling is not None:
+            env_vars["QDRANT_QUANTIZATION_OVERSAMPLING"] = str(
+                config.qdrant_quantization_oversampling
+            )
+    if config.qdrant_hnsw_m is not None:
+        env_vars["QDRANT_HNSW_M"] = str(config.qdrant_hnsw_m)
+    if config.qdrant_hnsw_ef_construct is not None:
+        env_vars["QDRANT_HNSW_EF_CONSTRUCT"] = str(config.qdrant_hnsw_ef_construct)
+    if config.qdrant_hnsw_ef is not None:
+        env_vars["QDRANT_HNSW_EF"] = str(config.qdrant_hnsw_ef)
+    if config.qdrant_on_disk_vectors:
+        env_vars["QDRANT_ON_DISK_VECTORS"] = "true"
+    if config.qdrant_on_disk_payload:
+        env_vars["QDRANT_ON_DISK_PAYLOAD"] = "true"
+    if config.qdrant_tenant_index:
+        env_vars["QDRANT_TENANT_INDEX"] = "true"
+    if config.qdrant_hybrid:
+        env_vars["QDRANT_HYBRID"] = "true"
+        env_vars["QDRANT_FUSION"] = config.qdrant_fusion
 
     # Structured query configuration
     if config.structured_query_core_fields:
@@ -788,6 +1111,8 @@ def _flatten_toml_config(toml_data: Dict[str, Any]) -> Dict[str, Any]:
         storage = toml_data["storage"]
         if "rag_index_dir" in storage:
             config_data["rag_index_dir"] = storage["rag_index_dir"]
+        if "keep_generations" in storage:
+            config_data["index_keep_generations"] = storage["keep_generations"]
 
     # Server configuration
     if "server" in toml_data:
@@ -815,6 +1140,30 @@ def _flatten_toml_config(toml_data: Dict[str, Any]) -> Dict[str, Any]:
             config_data["embedding_model"] = embedding["model"]
         if "max_query_results" in embedding:
             config_data["max_query_results"] = embedding["max_query_results"]
+        if "provider" in embedding:
+            config_data["embedding_provider"] = embedding["provider"]
+        if "batch_size" in embedding:
+            config_data["embedding_batch_size"] = embedding["batch_size"]
+        if "threads" in embedding:
+            config_data["embedding_threads"] = embedding["threads"]
+        if "tokenizer" in embedding:
+            config_data["embedding_tokenizer"] = embedding["tokenizer"]
+        if "max_tokens" in embedding:
+            config_data["embedding_max_tokens"] = embedding["max_tokens"]
+        if "daemon_socket" in embedding:
+            config_data["embedding_daemon_socket"] = embedding["daemon_socket"]
+        if embedding.get("use_daemon") is False:
+            config_data["embedding_daemon_socket"] = None
+
+    # Build configuration
+    if "build" in toml_data:
+        build = toml_data["build"]
+        if "memory_limit_mb" in build:
+            config_data["build_memory_limit_mb"] = build["memory_limit_mb"]
+        if "checkpoint_chunks" in build:
+            config_data["build_checkpoint_chunks"] = build["checkpoint_chunks"]
+        if "checkpoint_seconds" in build:
+            config_data["build_checkpoint_seconds"] = build["checkpoint_seconds"]
 
     # Collection configuration
     if "collections" in toml_data:
@@ -851,6 +1200,26 @@ def _flatten_toml_config(toml_data: Dict[str, Any]) -> Dict[str, Any]:
                 config_data["qdrant_api_key"] = _resolve_env_ref(qdrant["api_key"])
             if "use_https" in qdrant:
                 config_data["qdrant_use_https"] = qdrant["use_https"]
+            for key in (
+                "timeout",
+                "pool_size",
+                "prefer_grpc",
+                "grpc_port",
+                "quantization",
+                "quantization_always_ram",
+                "quantization_rescore",
+                "quantization_oversampling",
+                "hnsw_m",
+                "hnsw_ef_construct",
+                "hnsw_ef",
+                "on_disk_vectors",
+                "on_disk_payload",
+                "tenant_index",
+                "hybrid",
+                "fusion",
+            ):
+                if key in qdrant:
+                    config_data[f"qdrant_{key}"] = qdrant[key]
 
     # Structured query configuration
     if "structured_query" in toml_data:
@@ -933,6 +1302,8 @@ repos = [
 [storage]
 # Directory where RAG index will be stored
 rag_index_dir = "/path/to/index/storage"
+# Rebuilt FAISS indexes kept for `pcortex generations rollback`
+keep_generations = 3
 
 [server]
 # MCP and HTTP server configuration
@@ -944,6 +1315,23 @@ auth_token = "your-secure-token-here"
 # Embedding model and query configuration
 model = "sentence-transformers/all-MiniLM-L6-v2"
 max_query_results = 10
+# Provider: "llama-index" (default), "sentence-transformers" (direct, lower
+# overhead) or "hash" (deterministic, no model download; tests/benchmarks only)
+# provider = "llama-index"
+# batch_size = 32
+# threads = 4
+# Shared warm model served by `pcortex embedd`; used automatically when the
+# socket exists. Set use_daemon = false to always load the model in-process.
+# daemon_socket = "~/.prometh-cortex/embedd.sock"
+# use_daemon = true
+
+[build]
+# Save vectors and the build manifest together every N chunks or N seconds,
+# so an interrupted build resumes from there (`pcortex build --resume`)
+checkpoint_chunks = 5000
+checkpoint_seconds = 300
+# Stream very large builds to disk within this budget (MB) for buffered chunks
+# memory_limit_mb = 1024
 
 # Unified Collection Configuration
 # Single collection for all documents with per-source chunking
@@ -994,6 +1382,24 @@ port = 6333
 collection_name = "prometh_cortex"
 # api_key = "your-qdrant-api-key"  # For Qdrant Cloud
 # use_https = true  # For Qdrant Cloud
+# timeout = 30
+# pool_size = 16                    # Connections for concurrent server queries
+# prefer_grpc = true                # gRPC on grpc_port instead of REST
+# grpc_port = 6334
+# Memory footprint and search tuning, applied to new and existing collections
+# quantization = "scalar"           # "scalar" (int8, ~4x smaller) or "binary"
+# quantization_always_ram = true
+# quantization_rescore = true       # Rescore hits with the original vectors
+# quantization_oversampling = 2.0
+# hnsw_m = 16
+# hnsw_ef_construct = 100
+# hnsw_ef = 128                     # Per-query search width
+# on_disk_vectors = true            # Keep original vectors on disk
+# on_disk_payload = true
+# tenant_index = true               # Partition storage by source_type
+# Hybrid search, for new collections and rebuilds (pcortex rebuild)
+# hybrid = true                     # BM25 sparse vectors fused with dense search
+# fusion = "rrf"                    # "rrf" (rank) or "dbsf" (score distribution)
 
 # FAISS configuration (when type = "faiss") 
 [vector_store.faiss]
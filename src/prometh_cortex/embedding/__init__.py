@@ -0,0 +1,35 @@
+"""Embedding model loading shared by the indexer and vector stores."""
+
+from prometh_cortex.embedding.loader import (
+    DEFAULT_PROVIDER,
+    get_embedding_dimension,
+    get_embedding_model,
+    get_embedding_model_for_config,
+)
+from prometh_cortex.embedding.providers import (
+    EmbeddingProvider,
+    HashEmbeddingProvider,
+    LlamaIndexProvider,
+    SentenceTransformersProvider,
+    available_embedding_providers,
+    create_embedding_provider,
+    register_embedding_provider,
+)
+from prometh_cortex.embedding.tokenizer import ModelTokenizer, TokenizerError, load_tokenizer
+
+__all__ = [
+    "DEFAULT_PROVIDER",
+    "EmbeddingProvider",
+    "HashEmbeddingProvider",
+    "LlamaIndexProvider",
+    "ModelTokenizer",
+    "SentenceTransformersProvider",
+    "TokenizerError",
+    "available_embedding_providers",
+    "create_embedding_provider",
+    "get_embedding_dimension",
+    "get_embedding_model",
+    "get_embedding_model_for_config",
+    "load_tokenizer",
+    "register_embedding_provider",
+]
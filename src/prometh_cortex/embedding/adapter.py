@@ -0,0 +1,51 @@
+"""LlamaIndex adapter for embedding providers."""
+
+from typing import Any, List
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from pydantic import PrivateAttr
+
+from prometh_cortex.embedding.providers import EmbeddingProvider
+
+
+class ProviderEmbedding(BaseEmbedding):
+    """LlamaIndex embedding that delegates to an :class:`EmbeddingProvider`."""
+
+    dimension: int = 0
+
+    _provider: EmbeddingProvider = PrivateAttr()
+
+    def __init__(self, provider: EmbeddingProvider, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._provider = provider
+
+    @classmethod
+    def from_provider(cls, provider: EmbeddingProvider) -> "ProviderEmbedding":
+        """Wrap a provider, batching texts by the provider's batch size."""
+        return cls(
+            provider,
+            model_name=provider.model_name,
+            dimension=provider.dimension,
+            embed_batch_size=provider.batch_size,
+        )
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "ProviderEmbedding"
+
+    @property
+    def provider(self) -> EmbeddingProvider:
+        """The wrapped provider."""
+        return self._provider
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._provider.embed_query(query).tolist()
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._provider.embed_batch([text])[0].tolist()
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._provider.embed_batch(texts).tolist()
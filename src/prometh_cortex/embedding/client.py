@@ -0,0 +1,162 @@
+"""Client for the `pcortex embedd` daemon.
+
+:class:`EmbeddingClient` speaks the daemon's socket protocol (see
+:mod:`prometh_cortex.embedding.daemon`). :class:`DaemonEmbedding` wraps it as a
+LlamaIndex embedding so the indexer and vector stores can use the daemon in
+place of an in-process model.
+"""
+
+import json
+import logging
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingClientError(Exception):
+    """Raised when the embedding daemon is unreachable or returns an error."""
+
+    pass
+
+
+class EmbeddingClient:
+    """Persistent connection to an embedding daemon."""
+
+    def __init__(self, socket_path: Path, timeout: float = 60.0):
+        """
+        Initialize the client. The connection is opened on first request.
+
+        Args:
+            socket_path: Path of the daemon's Unix socket
+            timeout: Socket timeout in seconds for each request
+        """
+        self.socket_path = Path(socket_path).expanduser()
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def ping(self) -> Dict[str, Any]:
+        """Return the daemon's model name and vector dimension."""
+        return self._request({"op": "ping"})
+
+    def embed(self, texts: List[str], kind: str = "text") -> List[List[float]]:
+        """Embed texts on the daemon.
+
+        Args:
+            texts: Texts to embed
+            kind: "text" for documents, "query" for search queries
+
+        Returns:
+            One vector per input text
+        """
+        return self._request({"op": "embed", "kind": kind, "texts": texts})[
+            "embeddings"
+        ]
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._disconnect()
+
+    def _request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                self._sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+                line = self._reader.readline()
+            except OSError as e:
+                self._disconnect()
+                raise EmbeddingClientError(
+                    f"Embedding daemon at {self.socket_path} unreachable: {e}"
+                )
+
+        if not line:
+            with self._lock:
+                self._disconnect()
+            raise EmbeddingClientError("Embedding daemon closed the connection")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise EmbeddingClientError(f"Embedding daemon error: {response['error']}")
+        return response
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def _disconnect(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class DaemonEmbedding(BaseEmbedding):
+    """LlamaIndex embedding backed by the `pcortex embedd` daemon.
+
+    If the daemon goes away mid-session, embedding falls back to the model
+    returned by ``fallback`` (normally an in-process load).
+    """
+
+    dimension: int = 0
+
+    _client: EmbeddingClient = PrivateAttr()
+    _fallback: Optional[Callable[[], BaseEmbedding]] = PrivateAttr(default=None)
+    _fallback_model: Optional[BaseEmbedding] = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        client: EmbeddingClient,
+        fallback: Optional[Callable[[], BaseEmbedding]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self._client = client
+        self._fallback = fallback
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "DaemonEmbedding"
+
+    def _embed(self, texts: List[str], kind: str) -> List[List[float]]:
+        if self._fallback_model is None:
+            try:
+                return self._client.embed(texts, kind)
+            except EmbeddingClientError as e:
+                if self._fallback is None:
+                    raise
+                logger.warning(f"{e}; loading the embedding model in-process")
+                self._fallback_model = self._fallback()
+
+        if kind == "query":
+            return [self._fallback_model.get_query_embedding(t) for t in texts]
+        return self._fallback_model.get_text_embedding_batch(texts)
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed([query], "query")[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed([text], "text")[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts, "text")
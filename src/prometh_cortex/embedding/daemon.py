@@ -0,0 +1,303 @@
+"""Unix-socket embedding daemon keeping one warm model for all pcortex processes.
+
+Protocol: newline-delimited JSON over a Unix stream socket. Each request is a
+single line and gets a single-line response.
+
+    {"op": "ping"}
+        -> {"model": "<name>", "provider": "<provider>", "dimension": 384}
+    {"op": "embed", "kind": "text" | "query", "texts": ["...", ...]}
+        -> {"embeddings": [[...], ...]}
+
+Errors are reported as ``{"error": "<message>"}``. Requests arriving from
+concurrent connections within a short window are merged into one model batch.
+"""
+
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from prometh_cortex.embedding.loader import DEFAULT_PROVIDER, get_embedding_dimension
+
+logger = logging.getLogger(__name__)
+
+EMBED_KINDS = ("text", "query")
+
+
+class EmbeddingDaemonError(Exception):
+    """Raised when the embedding daemon cannot start or serve requests."""
+
+    pass
+
+
+class _EmbeddingBatcher:
+    """Merges concurrent embed requests into model batches on one worker thread."""
+
+    def __init__(self, embed_model: Any, max_batch_size: int, batch_wait_ms: float):
+        self.embed_model = embed_model
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait_ms / 1000.0
+        self._requests: "queue.Queue[Optional[Tuple[str, List[str], Future]]]" = (
+            queue.Queue()
+        )
+        self._stopped = False
+        self._worker = threading.Thread(
+            target=self._run, name="embedd-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, kind: str, texts: List[str]) -> List[List[float]]:
+        """Queue texts for embedding and wait for their vectors."""
+        if self._stopped:
+            raise EmbeddingDaemonError("Embedding daemon is shutting down")
+        future: Future = Future()
+        self._requests.put((kind, texts, future))
+        return future.result()
+
+    def stop(self) -> None:
+        """Stop the worker thread after pending requests are served."""
+        self._stopped = True
+        self._requests.put(None)
+        self._worker.join()
+
+        # Fail requests that raced with shutdown instead of leaving them waiting
+        while True:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None:
+                request[2].set_exception(
+                    EmbeddingDaemonError("Embedding daemon is shutting down")
+                )
+
+    def _run(self) -> None:
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+
+            batch = [request]
+            batch_texts = len(request[1])
+            deadline = time.monotonic() + self.batch_wait
+            stopping = False
+
+            # Gather more requests until the batch is full or the window closes
+            while batch_texts < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+                batch_texts += len(request[1])
+
+            for kind in EMBED_KINDS:
+                self._embed_requests([r for r in batch if r[0] == kind], kind)
+
+            if stopping:
+                return
+
+    def _embed_requests(
+        self, requests: List[Tuple[str, List[str], Future]], kind: str
+    ) -> None:
+        if not requests:
+            return
+
+        texts = [text for _, request_texts, _ in requests for text in request_texts]
+        try:
+            if kind == "query":
+                vectors = [self.embed_model.get_query_embedding(t) for t in texts]
+            else:
+                vectors = self.embed_model.get_text_embedding_batch(texts)
+        except Exception as e:
+            for _, _, future in requests:
+                future.set_exception(e)
+            return
+
+        offset = 0
+        for _, request_texts, future in requests:
+            end = offset + len(request_texts)
+            future.set_result([list(map(float, v)) for v in vectors[offset:end]])
+            offset = end
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves newline-delimited JSON requests on one client connection."""
+
+    server: "_EmbeddingServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.daemon.track_connection(self.connection, True)
+
+    def finish(self) -> None:
+        self.server.daemon.track_connection(self.connection, False)
+        super().finish()
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.daemon.handle_request(json.loads(line))
+            except Exception as e:
+                response = {"error": str(e)}
+            try:
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            except OSError:
+                return
+
+
+class _EmbeddingServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    daemon: "EmbeddingDaemon"
+
+
+class EmbeddingDaemon:
+    """Serves embeddings from one warm model over a Unix socket."""
+
+    def __init__(
+        self,
+        embed_model: Any,
+        model_name: str,
+        socket_path: Path,
+        max_batch_size: int = 64,
+        batch_wait_ms: float = 5.0,
+        provider: str = DEFAULT_PROVIDER,
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            embed_model: Loaded LlamaIndex embedding model
+            model_name: Name of the model, reported to clients
+            socket_path: Path of the Unix socket to listen on
+            max_batch_size: Maximum number of texts embedded in one model call
+            batch_wait_ms: How long to wait for concurrent requests to join a batch
+            provider: Embedding provider the model was created with
+        """
+        self.embed_model = embed_model
+        self.model_name = model_name
+        self.provider = provider
+        self.socket_path = Path(socket_path).expanduser()
+        self.dimension = get_embedding_dimension(embed_model)
+        self._batcher = _EmbeddingBatcher(embed_model, max_batch_size, batch_wait_ms)
+        self._server: Optional[_EmbeddingServer] = None
+        self._connections: Set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one decoded protocol request.
+
+        Args:
+            request: Decoded JSON request
+
+        Returns:
+            JSON-serializable response
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {
+                "model": self.model_name,
+                "provider": self.provider,
+                "dimension": self.dimension,
+            }
+
+        if op == "embed":
+            kind = request.get("kind", "text")
+            texts = request.get("texts")
+            if kind not in EMBED_KINDS:
+                return {"error": f"Unknown embedding kind: {kind}"}
+            if not isinstance(texts, list) or not all(
+                isinstance(t, str) for t in texts
+            ):
+                return {"error": "'texts' must be a list of strings"}
+            if not texts:
+                return {"embeddings": []}
+            return {"embeddings": self._batcher.submit(kind, texts)}
+
+        return {"error": f"Unknown op: {op}"}
+
+    def track_connection(self, connection: socket.socket, is_open: bool) -> None:
+        """Register or unregister a client connection so shutdown can close it."""
+        with self._connections_lock:
+            if is_open:
+                self._connections.add(connection)
+            else:
+                self._connections.discard(connection)
+
+    def bind(self) -> None:
+        """Bind the Unix socket, replacing a stale socket file if present.
+
+        Raises:
+            EmbeddingDaemonError: If another daemon is already listening
+        """
+        if self.socket_path.exists():
+            if _socket_is_live(self.socket_path):
+                raise EmbeddingDaemonError(
+                    f"An embedding daemon is already listening on {self.socket_path}"
+                )
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _EmbeddingServer(str(self.socket_path), _RequestHandler)
+        self._server.daemon = self
+        os.chmod(self.socket_path, 0o600)
+
+    def serve_forever(self) -> None:
+        """Serve requests until :meth:`shutdown` is called."""
+        if self._server is None:
+            self.bind()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+    def shutdown(self) -> None:
+        """Stop serving; safe to call from another thread."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _close(self) -> None:
+        self._server.server_close()
+        self._batcher.stop()
+
+        # Disconnect idle clients so they notice the daemon is gone
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _socket_is_live(socket_path: Path) -> bool:
+    """Check whether something is accepting connections on a Unix socket."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(1.0)
+    try:
+        probe.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
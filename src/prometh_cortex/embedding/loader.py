@@ -0,0 +1,170 @@
+"""Lazy, process-wide embedding model loader.
+
+Loading a sentence-transformers model pulls in torch and transformers and
+reads ~100 MB of weights, so it only happens on the first embed call. Every
+consumer in the process (indexer, vector stores, MCP tools) shares the same
+instance per provider and model. When a `pcortex embedd` daemon is serving the
+same model, a client for it is returned instead and no model is loaded at all.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Provider used when none is configured
+DEFAULT_PROVIDER = "llama-index"
+
+# Batch size used when sending texts to the embedding daemon
+DAEMON_EMBED_BATCH_SIZE = 64
+
+_models: Dict[Tuple[Any, ...], Any] = {}
+_models_lock = threading.Lock()
+
+
+def get_embedding_model(
+    model_name: str,
+    daemon_socket: Optional[Path] = None,
+    provider: str = DEFAULT_PROVIDER,
+    **provider_options: Any,
+) -> Any:
+    """Return the shared embedding model for ``model_name``, loading it on first use.
+
+    Args:
+        model_name: HuggingFace model name (e.g. ``sentence-transformers/all-MiniLM-L6-v2``)
+        daemon_socket: Socket of a `pcortex embedd` daemon to use if it is
+            running and serves ``model_name`` with ``provider``
+        provider: Registered embedding provider name
+        **provider_options: Provider options (e.g. ``batch_size``, ``num_threads``)
+
+    Returns:
+        LlamaIndex embedding: a ``DaemonEmbedding`` client when the daemon is
+        available, otherwise the provider's in-process embedding
+
+    Raises:
+        Exception: Whatever the underlying model load raises; callers wrap it
+            in their own error type.
+    """
+    if daemon_socket is not None and Path(daemon_socket).expanduser().exists():
+        key = (provider, model_name, str(daemon_socket))
+        with _models_lock:
+            model = _models.get(key)
+        if model is None:
+            model = _connect_daemon(
+                model_name, Path(daemon_socket).expanduser(), provider, provider_options
+            )
+            if model is not None:
+                with _models_lock:
+                    model = _models.setdefault(key, model)
+        if model is not None:
+            return model
+
+    key = (provider, model_name, None, tuple(sorted(provider_options.items())))
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = _load_local_model(model_name, provider, provider_options)
+            _models[key] = model
+            logger.info(f"Embedding model loaded: {model_name} ({provider})")
+        return model
+
+
+def get_embedding_model_for_config(config: Any, use_daemon: bool = True) -> Any:
+    """Return the shared embedding model selected by a :class:`Config`.
+
+    Args:
+        config: Configuration with ``embedding_*`` settings
+        use_daemon: Whether to use the configured embedding daemon if running
+
+    Returns:
+        LlamaIndex embedding
+    """
+    return get_embedding_model(
+        config.embedding_model,
+        config.embedding_daemon_socket if use_daemon else None,
+        provider=config.embedding_provider,
+        batch_size=config.embedding_batch_size,
+        num_threads=config.embedding_threads,
+    )
+
+
+def get_embedding_dimension(embed_model: Any) -> int:
+    """Return the output dimension of an embedding model.
+
+    Uses the sentence-transformers metadata when available and falls back to
+    embedding a probe string.
+
+    Args:
+        embed_model: LlamaIndex embedding model
+
+    Returns:
+        Vector dimension
+    """
+    dimension = getattr(embed_model, "dimension", None)
+    if isinstance(dimension, int) and dimension > 0:
+        return dimension
+
+    inner_model = getattr(embed_model, "_model", None)
+    get_dimension = getattr(inner_model, "get_sentence_embedding_dimension", None)
+    if callable(get_dimension):
+        dimension = get_dimension()
+        if dimension:
+            return int(dimension)
+
+    probe: List[float] = embed_model.get_text_embedding("dimension probe")
+    return len(probe)
+
+
+def _connect_daemon(
+    model_name: str,
+    socket_path: Path,
+    provider: str,
+    provider_options: Dict[str, Any],
+) -> Optional[Any]:
+    """Return a daemon-backed embedding if the daemon serves ``model_name``."""
+    from prometh_cortex.embedding.client import (
+        DaemonEmbedding,
+        EmbeddingClient,
+        EmbeddingClientError,
+    )
+
+    client = EmbeddingClient(socket_path)
+    try:
+        info = client.ping()
+    except EmbeddingClientError as e:
+        logger.debug(f"Embedding daemon not available: {e}")
+        client.close()
+        return None
+
+    served = (info.get("provider", DEFAULT_PROVIDER), info.get("model"))
+    if served != (provider, model_name):
+        logger.warning(
+            f"Embedding daemon at {socket_path} serves {served[1]} ({served[0]}), "
+            f"not {model_name} ({provider}); loading the model in-process"
+        )
+        client.close()
+        return None
+
+    logger.info(f"Using embedding daemon at {socket_path} for {model_name}")
+    return DaemonEmbedding(
+        client=client,
+        fallback=lambda: get_embedding_model(
+            model_name, provider=provider, **provider_options
+        ),
+        model_name=model_name,
+        dimension=int(info.get("dimension") or 0),
+        embed_batch_size=DAEMON_EMBED_BATCH_SIZE,
+    )
+
+
+def _load_local_model(
+    model_name: str, provider: str, provider_options: Dict[str, Any]
+) -> Any:
+    """Create the provider in-process and return its LlamaIndex embedding."""
+    from prometh_cortex.embedding.providers import create_embedding_provider
+
+    return create_embedding_provider(
+        provider, model_name, **provider_options
+    ).as_llama_embedding()
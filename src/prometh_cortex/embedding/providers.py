@@ -0,0 +1,273 @@
+"""Embedding providers and their registry.
+
+An :class:`EmbeddingProvider` turns a batch of texts into a float32 matrix.
+Providers are registered by name and selected with ``[embedding] provider``:
+
+- ``llama-index``: LlamaIndex ``HuggingFaceEmbedding`` (the default)
+- ``sentence-transformers``: ``SentenceTransformer`` directly, without the
+  LlamaIndex layer, with configurable batch size and torch threads
+- ``hash``: deterministic feature hashing; no model download, for tests and
+  offline build/query benchmarks
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sys
+import warnings
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from prometh_cortex.embedding.loader import DEFAULT_PROVIDER
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingProvider(ABC):
+    """Interface for embedding providers."""
+
+    name: str = ""
+
+    def __init__(self, model_name: str, batch_size: int = 32):
+        self.model_name = model_name
+        self.batch_size = batch_size
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Dimension of the vectors returned by this provider."""
+        pass
+
+    @abstractmethod
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed documents.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape ``(len(texts), dimension)``
+        """
+        pass
+
+    def embed_query(self, text: str) -> np.ndarray:
+        """Embed a search query. Defaults to document embedding.
+
+        Args:
+            text: Query text
+
+        Returns:
+            float32 array of shape ``(dimension,)``
+        """
+        return self.embed_batch([text])[0]
+
+    def as_llama_embedding(self) -> Any:
+        """Return a LlamaIndex embedding backed by this provider."""
+        from prometh_cortex.embedding.adapter import ProviderEmbedding
+
+        return ProviderEmbedding.from_provider(self)
+
+
+class LlamaIndexProvider(EmbeddingProvider):
+    """LlamaIndex ``HuggingFaceEmbedding`` provider."""
+
+    name = DEFAULT_PROVIDER
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = 10,
+        num_threads: Optional[int] = None,
+        **_: Any,
+    ):
+        super().__init__(model_name, batch_size)
+        _set_torch_threads(num_threads)
+        with _quiet_model_load():
+            # Imported here: llama-index pulls in torch and transformers
+            from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+
+            self.model = HuggingFaceEmbedding(
+                model_name=model_name, embed_batch_size=batch_size
+            )
+        self._dimension: Optional[int] = None
+
+    @property
+    def dimension(self) -> int:
+        if self._dimension is None:
+            self._dimension = self.model._model.get_sentence_embedding_dimension()
+        return self._dimension
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        return _as_matrix(self.model.get_text_embedding_batch(texts), self.dimension)
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return np.asarray(self.model.get_query_embedding(text), dtype=np.float32)
+
+    def as_llama_embedding(self) -> Any:
+        # Already a LlamaIndex embedding; no adapter needed
+        return self.model
+
+
+class SentenceTransformersProvider(EmbeddingProvider):
+    """``SentenceTransformer`` provider without the LlamaIndex layer."""
+
+    name = "sentence-transformers"
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = 32,
+        num_threads: Optional[int] = None,
+        device: Optional[str] = None,
+        **_: Any,
+    ):
+        super().__init__(model_name, batch_size)
+        _set_torch_threads(num_threads)
+        with _quiet_model_load():
+            from sentence_transformers import SentenceTransformer
+
+            self.model = SentenceTransformer(model_name, device=device)
+
+    @property
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        # Normalized like HuggingFaceEmbedding, so indexes stay interchangeable
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.astype(np.float32, copy=False)
+
+
+class HashEmbeddingProvider(EmbeddingProvider):
+    """Deterministic feature-hashing provider.
+
+    Each lowercase word is hashed into a signed bucket, so texts sharing words
+    get similar vectors. Needs no model, network or GPU.
+    """
+
+    name = "hash"
+
+    _token_pattern = re.compile(r"\w+")
+
+    def __init__(
+        self,
+        model_name: str = "hash",
+        batch_size: int = 32,
+        dimension: int = 384,
+        **_: Any,
+    ):
+        super().__init__(model_name, batch_size)
+        self._dimension = dimension
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in self._token_pattern.findall(text.lower()):
+                digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                sign = 1.0 if value & 1 else -1.0
+                vectors[row, (value >> 1) % self._dimension] += sign
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+_PROVIDERS: Dict[str, Callable[..., EmbeddingProvider]] = {
+    LlamaIndexProvider.name: LlamaIndexProvider,
+    SentenceTransformersProvider.name: SentenceTransformersProvider,
+    HashEmbeddingProvider.name: HashEmbeddingProvider,
+}
+
+
+def register_embedding_provider(
+    name: str, factory: Callable[..., EmbeddingProvider]
+) -> None:
+    """Register an embedding provider factory under ``name``.
+
+    Args:
+        name: Provider name used in ``[embedding] provider``
+        factory: Callable taking ``model_name`` and keyword options
+    """
+    _PROVIDERS[name] = factory
+
+
+def available_embedding_providers() -> List[str]:
+    """Return the names of all registered embedding providers."""
+    return sorted(_PROVIDERS)
+
+
+def create_embedding_provider(
+    name: str, model_name: str, **options: Any
+) -> EmbeddingProvider:
+    """Create a registered embedding provider.
+
+    Args:
+        name: Registered provider name
+        model_name: Model to load
+        **options: Provider options (e.g. ``batch_size``, ``num_threads``)
+
+    Returns:
+        Embedding provider instance
+
+    Raises:
+        ValueError: If no provider is registered under ``name``
+    """
+    factory = _PROVIDERS.get(name)
+    if factory is None:
+        raise ValueError(
+            f"Unknown embedding provider: {name}. "
+            f"Available providers: {', '.join(available_embedding_providers())}"
+        )
+    return factory(model_name, **options)
+
+
+def _as_matrix(vectors: List[List[float]], dimension: int) -> np.ndarray:
+    if not vectors:
+        return np.zeros((0, dimension), dtype=np.float32)
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def _set_torch_threads(num_threads: Optional[int]) -> None:
+    if num_threads:
+        import torch
+
+        torch.set_num_threads(num_threads)
+
+
+@contextmanager
+def _quiet_model_load() -> Iterator[None]:
+    """Suppress noisy HuggingFace/sentence-transformers output while loading."""
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=FutureWarning)
+        warnings.filterwarnings("ignore", message=".*position_ids.*")
+        warnings.filterwarnings("ignore", message=".*unauthenticated.*")
+        logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
+        logging.getLogger("sentence_transformers").setLevel(logging.ERROR)
+        logging.getLogger("transformers").setLevel(logging.ERROR)
+        # Suppress stderr output from model loading (progress bars, load reports)
+        old_stderr = sys.stderr
+        sys.stderr = open(os.devnull, "w")
+        try:
+            yield
+        finally:
+            sys.stderr.close()
+            sys.stderr = old_stderr
@@ -0,0 +1,172 @@
+"""Embedding model tokenizers, for sizing chunks in tokens.
+
+Sentence-transformers models silently truncate their input at a fixed number
+of tokens (256 for ``all-MiniLM-L6-v2``), so a character-sized chunk may be
+partly ignored or use only a fraction of the window. :class:`ModelTokenizer`
+wraps the model's fast (Rust) tokenizer from the ``tokenizers`` package to
+count tokens and to split text into chunks that fill the window exactly.
+"""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Window assumed when a model publishes no maximum sequence length
+DEFAULT_MAX_TOKENS = 512
+
+# Values above this in tokenizer_config.json mean "no limit"
+_UNBOUNDED_LENGTH = 100_000
+
+
+class TokenizerError(Exception):
+    """Raised when a model's tokenizer cannot be loaded."""
+
+
+class ModelTokenizer:
+    """Fast tokenizer of an embedding model and the size of its input window."""
+
+    def __init__(self, tokenizer: Any, max_tokens: int):
+        """Wrap a ``tokenizers.Tokenizer``.
+
+        Args:
+            tokenizer: Loaded ``tokenizers.Tokenizer``
+            max_tokens: Model input window, including special tokens
+        """
+        self.tokenizer = tokenizer
+        self.tokenizer.no_truncation()
+        self.tokenizer.no_padding()
+        self.max_tokens = max_tokens
+        special_tokens = len(tokenizer.encode("", add_special_tokens=True).ids)
+        # Text tokens the model sees per input
+        self.window = max(1, max_tokens - special_tokens)
+
+    def count(self, texts: List[str]) -> List[int]:
+        """Number of text tokens (without special tokens) of each text."""
+        if not texts:
+            return []
+        encodings = self.tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
+
+    def spans(self, text: str, max_tokens: int, overlap: int = 0) -> List[Tuple[int, int]]:
+        """Split text into character spans of at most max_tokens tokens.
+
+        Cuts fall between words, at a line break if one is in the last
+        quarter of the window, so no chunk ends in the middle of a word
+        unless a single word fills half the window.
+
+        Args:
+            text: Text to split
+            max_tokens: Tokens per span, capped at the model window
+            overlap: Tokens shared by consecutive spans
+
+        Returns:
+            (start, end) character offsets of each span
+        """
+        max_tokens = max(1, min(max_tokens, self.window))
+        overlap = max(0, min(overlap, max_tokens // 2))
+        offsets = self.tokenizer.encode(text, add_special_tokens=False).offsets
+        if not offsets:
+            return [(0, len(text))] if text else []
+
+        # Gap before token i: word start (1) or line start (2)
+        gaps = [0] * len(offsets)
+        for i in range(1, len(offsets)):
+            between = text[offsets[i - 1][1] : offsets[i][0]]
+            if between:
+                gaps[i] = 2 if "\n" in between else 1
+
+        spans = []
+        start = 0
+        while start < len(offsets):
+            end = start + max_tokens
+            if end < len(offsets):
+                end = self._cut(gaps, start, end)
+            else:
+                end = len(offsets)
+            spans.append((offsets[start][0], offsets[end - 1][1]))
+            if end >= len(offsets):
+                break
+
+            next_start = end
+            if overlap:
+                for i in range(end - overlap, end):
+                    if i > start and gaps[i]:
+                        next_start = i
+                        break
+            start = next_start
+        return spans
+
+    @staticmethod
+    def _cut(gaps: List[int], start: int, end: int) -> int:
+        """Token to end a span at: line start, else word start, else ``end``."""
+        size = end - start
+        for i in range(end, end - size // 4, -1):
+            if gaps[i] == 2:
+                return i
+        for i in range(end, start + size // 2, -1):
+            if gaps[i]:
+                return i
+        return end
+
+
+@lru_cache(maxsize=4)
+def load_tokenizer(model_name: str, max_tokens: Optional[int] = None) -> ModelTokenizer:
+    """Load a model's fast tokenizer, once per process.
+
+    Args:
+        model_name: Hugging Face model id or local model directory
+        max_tokens: Input window override; by default the model's
+            ``max_seq_length`` (sentence-transformers) or ``model_max_length``
+
+    Returns:
+        Tokenizer with the model's window
+
+    Raises:
+        TokenizerError: If the model has no fast tokenizer or cannot be fetched
+    """
+    # Imported here: only token-sized chunking and analysis need it
+    from tokenizers import Tokenizer
+
+    path = Path(model_name).expanduser()
+    try:
+        if path.is_dir():
+            tokenizer = Tokenizer.from_file(str(path / "tokenizer.json"))
+        else:
+            tokenizer = Tokenizer.from_pretrained(model_name)
+    except Exception as e:
+        raise TokenizerError(f"Cannot load the tokenizer of {model_name}: {e}")
+
+    if max_tokens is None:
+        max_tokens = _model_max_tokens(model_name)
+    logger.debug(f"Loaded tokenizer of {model_name} ({max_tokens} tokens)")
+    return ModelTokenizer(tokenizer, max_tokens)
+
+
+def _model_max_tokens(model_name: str) -> int:
+    """Input window published with the model."""
+    sentence_config = _model_file(model_name, "sentence_bert_config.json")
+    if sentence_config.get("max_seq_length"):
+        return int(sentence_config["max_seq_length"])
+
+    length = _model_file(model_name, "tokenizer_config.json").get("model_max_length")
+    if length and length < _UNBOUNDED_LENGTH:
+        return int(length)
+    return DEFAULT_MAX_TOKENS
+
+
+def _model_file(model_name: str, filename: str) -> Dict[str, Any]:
+    """A JSON file of a local or Hugging Face model, or {} if it has none."""
+    path = Path(model_name).expanduser() / filename
+    try:
+        if not path.parent.is_dir():
+            from huggingface_hub import hf_hub_download
+
+            path = Path(hf_hub_download(model_name, filename))
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
@@ -1,20 +1,36 @@
 """Single-collection document indexer with per-document-source chunking for RAG operations (v0.3.0+)."""
 
+import asyncio
 import json
 import logging
+import os
+import time
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
-
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from prometh_cortex.config import Config, SourceConfig
+from prometh_cortex.embedding import (
+    TokenizerError,
+    get_embedding_model_for_config,
+    load_tokenizer,
+)
+from prometh_cortex.indexer.pipeline import (
+    DEFAULT_BATCH_CHUNKS,
+    BuildCheckpointer,
+    ChunkBatcher,
+    ChunkTask,
+    PreparedDocument,
+    StoreWriter,
+    embed_documents,
+    iter_prepared_documents,
+    prepare_document,
+    resolve_jobs,
+)
 from prometh_cortex.parser import (
     MarkdownDocument,
     ParsedQuery,
     QueryParser,
-    extract_document_chunks,
-    parse_markdown_file,
 )
 from prometh_cortex.router import DocumentRouter, RouterError
 from prometh_cortex.vector_store import (
@@ -23,9 +39,31 @@ from prometh_cortex.vector_store import (
     VectorStoreInterface,
     create_vector_store,
 )
+from prometh_cortex.vector_store.portable import (
+    ExportFormatError,
+    IndexExportWriter,
+    iter_export,
+    read_export_build_manifest,
+    read_export_manifest,
+)
+from prometh_cortex.utils.atomic import atomic_write_json
 
 logger = logging.getLogger(__name__)
 
+# Change detection manifest: indexed files with their hash and mtime
+BUILD_MANIFEST_FILE = "build_manifest.json"
+
+# Where older releases kept the manifest; the FAISS store also writes its
+# chunk metadata there, so the two overwrote each other
+LEGACY_MANIFEST_FILE = "document_metadata.json"
+
+# Present while a build is running or was interrupted
+BUILD_CHECKPOINT_FILE = "build_checkpoint.json"
+
+# Write buffer for builds without [build] memory_limit_mb, so the FAISS store
+# writes a few large segments rather than one per batch
+DEFAULT_BULK_LOAD_MB = 512
+
 
 class IndexerError(Exception):
     """Raised when indexer operations fail."""
@@ -47,45 +85,41 @@ class DocumentIndexer:
             IndexerError: If initialization fails
         """
         self.config = config
-        self.embed_model = None
+        self._embed_model = None
         self.router = None
         self.vector_store: Optional[VectorStoreInterface] = None
         self.change_detector: Optional[DocumentChangeDetector] = None
         self.query_parser = QueryParser(config=config)
         self.auto_discovered_fields: Optional[Set[str]] = None
 
-        # Initialize components
-        self._initialize_embedding_model()
+        # Initialize components (the embedding model loads lazily on first embed)
         self._initialize_router()
         self._initialize_vector_store()
 
+    @property
+    def embed_model(self):
+        """Embedding model, loaded on first use.
+
+        Metadata-only operations (listing sources, memory list/forget, health)
+        never touch this property, so they do not pay the model load cost.
+        """
+        if self._embed_model is None:
+            self._initialize_embedding_model()
+        return self._embed_model
+
+    @embed_model.setter
+    def embed_model(self, value) -> None:
+        self._embed_model = value
+
+    @property
+    def _sparse_vectors(self) -> bool:
+        """Whether chunks get BM25 sparse vectors for Qdrant hybrid search."""
+        return self.config.vector_store_type == "qdrant" and self.config.qdrant_hybrid
+
     def _initialize_embedding_model(self) -> None:
         """Initialize the embedding model."""
-        import os
-        import sys
-        import warnings
-
         try:
-            # Suppress noisy HuggingFace/sentence-transformers warnings
-            os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
-            os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=FutureWarning)
-                warnings.filterwarnings("ignore", message=".*position_ids.*")
-                warnings.filterwarnings("ignore", message=".*unauthenticated.*")
-                logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
-                logging.getLogger("sentence_transformers").setLevel(logging.ERROR)
-                logging.getLogger("transformers").setLevel(logging.ERROR)
-                # Suppress stderr output from model loading (progress bars, load reports)
-                old_stderr = sys.stderr
-                sys.stderr = open(os.devnull, "w")
-                try:
-                    self.embed_model = HuggingFaceEmbedding(
-                        model_name=self.config.embedding_model
-                    )
-                finally:
-                    sys.stderr.close()
-                    sys.stderr = old_stderr
+            self._embed_model = get_embedding_model_for_config(self.config)
             logger.info(f"Embedding model initialized: {self.config.embedding_model}")
         except Exception as e:
             raise IndexerError(
@@ -109,12 +143,11 @@ class DocumentIndexer:
             storage_path.mkdir(parents=True, exist_ok=True)
 
             # Create vector store with config (chunk size is not used for storage)
-            self.vector_store = create_vector_store(self.config, self.embed_model)
+            self.vector_store = create_vector_store(self.config, self._embed_model)
             self.vector_store.initialize()
 
             # Initialize change detector for single collection
-            metadata_path = storage_path / "document_metadata.json"
-            self.change_detector = DocumentChangeDetector(str(metadata_path))
+            self._open_change_detector()
 
             logger.info(
                 f"Initialized unified collection: {self.config.collection.name}"
@@ -123,6 +156,46 @@ class DocumentIndexer:
         except Exception as e:
             raise IndexerError(f"Failed to initialize vector store: {e}")
 
+    def _open_change_detector(self) -> None:
+        """Load the change manifest stored with the vector store's current index."""
+        storage_dir = self.vector_store.get_storage_dir()
+        manifest_path = storage_dir / BUILD_MANIFEST_FILE
+        self.change_detector = DocumentChangeDetector(str(manifest_path))
+        if not manifest_path.exists():
+            self._migrate_legacy_manifest(storage_dir / LEGACY_MANIFEST_FILE)
+
+    def _migrate_layout(self) -> None:
+        """Move an index in an older on-disk layout before writing to it."""
+        if self.vector_store.migrate_layout():
+            self._open_change_detector()
+
+    def _refresh_generation(self) -> None:
+        """Follow the vector store to a generation published by another process."""
+        if self.vector_store.refresh_generation():
+            self._open_change_detector()
+
+    def _migrate_legacy_manifest(self, legacy_path: Path) -> None:
+        """Adopt file entries from the manifest's old location, if any survived."""
+        if not legacy_path.exists():
+            return
+
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+
+        # Skip FAISS chunk metadata that shares the file
+        entries = {
+            path: entry
+            for path, entry in legacy.items()
+            if isinstance(entry, dict) and "file_hash" in entry and "indexed_at" in entry
+        }
+        if entries:
+            self.change_detector.indexed_docs.update(entries)
+            self.change_detector.save()
+            logger.info(f"Migrated {len(entries)} entries to {BUILD_MANIFEST_FILE}")
+
     def discover_documents(self) -> List[str]:
         """
         Discover all Markdown documents from source patterns.
@@ -132,29 +205,49 @@ class DocumentIndexer:
         Returns:
             List of document file paths
         """
-        document_paths = []
-        discovered_patterns = set()
+        document_paths = sorted(self.iter_document_paths())
 
-        # Collect all unique source patterns from all sources
-        for source in self.config.sources:
-            for pattern in source.source_patterns:
-                if pattern != "*":  # Skip catch-all for now
-                    discovered_patterns.add(pattern)
+        if not document_paths:
+            logger.warning("No documents discovered from source patterns")
+
+        return document_paths
+
+    def iter_document_paths(self) -> Iterator[str]:
+        """
+        Discover Markdown documents lazily from source patterns.
+
+        Walks each source pattern directory in sorted order without building
+        the full path list; directories nested in another pattern are walked
+        once, as part of the outer one.
+
+        Yields:
+            Document file paths
+        """
+        patterns = sorted(
+            {
+                pattern
+                for source in self.config.sources
+                for pattern in source.source_patterns
+                if pattern != "*"  # Skip catch-all for now
+            }
+        )
 
-        # Scan each source pattern directory
-        for pattern in discovered_patterns:
+        roots = {}
+        for pattern in patterns:
             pattern_path = Path(pattern)
             if pattern_path.exists() and pattern_path.is_dir():
-                # Find all markdown files recursively in this pattern
-                markdown_files = list(pattern_path.rglob("*.md"))
-                document_paths.extend(str(f) for f in markdown_files)
+                roots.setdefault(pattern_path.resolve(), pattern_path)
             else:
                 logger.warning(f"Source pattern path does not exist: {pattern}")
 
-        if not document_paths:
-            logger.warning("No documents discovered from source patterns")
-
-        return sorted(document_paths)
+        for resolved, root in roots.items():
+            if any(other in resolved.parents for other in roots):
+                continue
+            for dirpath, dirnames, filenames in os.walk(str(root)):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith(".md"):
+                        yield os.path.join(dirpath, filename)
 
     def _route_documents(self, document_paths: List[str]) -> Dict[str, List[str]]:
         """
@@ -196,58 +289,34 @@ class DocumentIndexer:
             IndexerError: If document addition fails
         """
         try:
-            # Get file metadata for change detection
-            import os
-
-            file_stat = os.stat(file_path)
-            modified_time = file_stat.st_mtime
-
-            # Compute file hash for change detection
-            file_hash = self.change_detector._compute_file_hash(str(file_path))
-
-            # Parse markdown document
-            markdown_doc = parse_markdown_file(file_path)
+            self._migrate_layout()
 
             # Route to get source and chunking parameters
             source_name, chunk_size, chunk_overlap = self.router.route_document(
                 str(file_path)
             )
 
-            # Extract chunks with source-specific parameters
-            chunks = extract_document_chunks(
-                markdown_doc,
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
+            # Parse and chunk with source-specific parameters
+            prepared = prepare_document(
+                self._chunk_task(str(file_path), source_name, chunk_size, chunk_overlap)
             )
+            if prepared.error:
+                raise IndexerError(prepared.error)
 
-            # Convert chunks to documents for vector store
-            documents = []
-            for chunk in chunks:
-                doc = {
-                    "id": f"{file_path}_{chunk['chunk_index']}",
-                    "text": chunk["content"],
-                    "metadata": {
-                        **chunk["metadata"],
-                        "file_path": str(file_path),
-                        "chunk_index": chunk["chunk_index"],
-                        "source_type": source_name,  # Changed from "collection"
-                        "chunk_config": {
-                            "chunk_size": chunk_size,
-                            "chunk_overlap": chunk_overlap,
-                        },
-                    },
-                }
-                documents.append(doc)
-
-            # Add to unified vector store
-            self.vector_store.add_documents(documents)
+            # Add to unified vector store, embedding only new or changed text
+            reused = self._reuse_vectors([prepared])
+            self.vector_store.add_documents(prepared.documents)
+            self._delete_stale_chunks([prepared])
+            self._record_indexed([prepared])
+            self.change_detector.save()
 
             return {
                 "status": "success",
                 "source_type": source_name,
-                "chunks": len(chunks),
-                "file_hash": file_hash,
-                "modified_time": modified_time,
+                "chunks": len(prepared.documents),
+                "reused_chunks": reused,
+                "file_hash": prepared.file_hash,
+                "modified_time": prepared.modified_time,
             }
 
         except Exception as e:
@@ -290,29 +359,64 @@ class DocumentIndexer:
         self,
         force_rebuild: bool = False,
         progress_callback: Optional[Callable[[str, str, Any], None]] = None,
+        jobs: int = 1,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         """
         Build unified index from all sources.
 
+        Vectors and the change detection manifest are checkpointed together
+        every ``build_checkpoint_chunks`` chunks or ``build_checkpoint_seconds``
+        seconds, and when the build is interrupted, so files indexed before a
+        crash or Ctrl-C are not indexed again.
+
+        With a store that supports generations, a forced rebuild writes a new
+        generation and publishes it only once complete; until then queries,
+        including those of running servers, are answered from the previous one.
+
         Args:
             force_rebuild: If True, rebuild entire index ignoring changes
             progress_callback: Optional callback function to report progress.
                              Signature: callback(event_type: str, source_name: str, data: Any)
                              event_type can be: "start", "complete", "error"
+            jobs: Worker processes for parsing and chunking (0 = all CPUs)
+            resume: Continue an interrupted build from its last checkpoint
+                (incremental; cannot be combined with force_rebuild). Without
+                it, the checkpoint and an interrupted rebuild's unpublished
+                generation are discarded
 
         Returns:
             Statistics dict with per-source results
         """
+        if resume and force_rebuild:
+            raise IndexerError("Cannot resume a build and force a rebuild at once")
+
+        if any(source.chunking == "tokens" for source in self.config.sources):
+            # Fail once here rather than once per file in the workers
+            try:
+                load_tokenizer(
+                    self.config.embedding_tokenizer or self.config.embedding_model,
+                    self.config.embedding_max_tokens,
+                )
+            except TokenizerError as e:
+                raise IndexerError(str(e))
+
+        streaming = self.config.build_memory_limit_mb is not None
+
         try:
-            # Discover all documents from source patterns
-            document_paths = self.discover_documents()
+            if streaming:
+                # Documents are discovered and routed while the build runs
+                routed_docs = None
+            else:
+                # Discover all documents from source patterns
+                document_paths = self.discover_documents()
 
-            if not document_paths:
-                logger.warning("No documents found from source patterns")
-                return {"message": "No documents found", "sources": {}}
+                if not document_paths:
+                    logger.warning("No documents found from source patterns")
+                    return {"message": "No documents found", "sources": {}}
 
-            # Route documents to sources
-            routed_docs = self._route_documents(document_paths)
+                # Route documents to sources
+                routed_docs = self._route_documents(document_paths)
 
             stats = {
                 "total_documents": 0,
@@ -320,20 +424,105 @@ class DocumentIndexer:
                 "sources": {},
             }
 
-            # Force rebuild: clear entire index (but preserve memories)
+            self._migrate_layout()
+
+            generation = None
+            interrupted = self.get_build_checkpoint()
+            if interrupted is not None and resume:
+                logger.info(
+                    f"Resuming interrupted build from checkpoint "
+                    f"({interrupted.get('documents', 0)} documents already indexed)"
+                )
+                stats["resumed_from"] = interrupted
+                # An interrupted rebuild continues in its unpublished generation
+                if interrupted.get("generation") and self.vector_store.resume_generation(
+                    interrupted["generation"]
+                ):
+                    generation = interrupted["generation"]
+                    self._open_change_detector()
+            elif resume:
+                logger.info("No interrupted build to resume; running incremental build")
+            elif interrupted is not None:
+                logger.warning(
+                    "Discarding the checkpoint of an interrupted build; "
+                    "resume the build to continue it instead"
+                )
+                if interrupted.get("generation"):
+                    self.vector_store.discard_unpublished_generations()
+                self._clear_build_checkpoint()
+
+            # Force rebuild: start a new generation, or clear the index (but
+            # preserve memories) if the store has no generations
             if force_rebuild:
                 logger.info("Performing full rebuild of unified index")
-                self._clear_index(preserve_memory=True)
+                if self.vector_store.begin_generation("prmth_memory") is None:
+                    self._clear_index(preserve_memory=True)
+                else:
+                    generation = self.vector_store.get_generation()
+                    # The new generation starts empty, whatever manifest is on disk
+                    self._open_change_detector()
+                    self.change_detector.indexed_docs.clear()
+
+            build_state = {
+                "started_at": time.time(),
+                "force_rebuild": force_rebuild,
+                "documents": 0,
+                "chunks": 0,
+            }
+            if generation:
+                build_state["generation"] = generation
+            checkpointer = BuildCheckpointer(
+                lambda: self._save_checkpoint(build_state),
+                every_chunks=self.config.build_checkpoint_chunks,
+                every_seconds=self.config.build_checkpoint_seconds,
+            )
+            self._write_build_checkpoint(build_state)
 
             # Build unified index with per-document chunking
-            index_stats = self._build_unified_index(
-                routed_docs, force_rebuild, progress_callback
-            )
+            memory_limit_mb = self.config.build_memory_limit_mb or DEFAULT_BULK_LOAD_MB
+            self.vector_store.begin_bulk_load(memory_limit_mb * 1024 * 1024)
+            try:
+                if streaming:
+                    index_stats = self._build_streaming_index(
+                        force_rebuild,
+                        progress_callback,
+                        jobs,
+                        checkpointer=checkpointer,
+                        build_state=build_state,
+                    )
+                else:
+                    index_stats = self._build_unified_index(
+                        routed_docs,
+                        force_rebuild,
+                        progress_callback,
+                        jobs,
+                        checkpointer=checkpointer,
+                        build_state=build_state,
+                    )
+            except BaseException:
+                # Keep everything written before the failure for --resume
+                try:
+                    checkpointer.checkpoint()
+                except Exception as e:
+                    logger.warning(f"Failed to checkpoint interrupted build: {e}")
+                raise
+            finally:
+                self.vector_store.end_bulk_load()
+
+            if streaming and not index_stats.pop("discovered_documents"):
+                self._clear_build_checkpoint()
+                logger.warning("No documents found from source patterns")
+                return {"message": "No documents found", "sources": {}}
 
             stats.update(index_stats)
+            stats["checkpoints"] = checkpointer.checkpoints
 
-            # Save unified index
+            # Save unified index, then the manifest that refers to it
             self.vector_store.save_index()
+            self.change_detector.save()
+            if generation:
+                stats["generation"] = self.vector_store.publish_generation()
+            self._clear_build_checkpoint()
 
             logger.info(f"Index build completed: {stats}")
             return stats
@@ -346,14 +535,23 @@ class DocumentIndexer:
         routed_docs: Dict[str, List[str]],
         force: bool,
         progress_callback: Optional[Callable[[str, str, Any], None]] = None,
+        jobs: int = 1,
+        checkpointer: Optional[BuildCheckpointer] = None,
+        build_state: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Build single unified index with per-document-source chunking.
 
+        Changed files are parsed and chunked by ``jobs`` worker processes and
+        streamed, in order, to batched embedding and a background store writer.
+
         Args:
             routed_docs: Dictionary mapping source names to document paths
             force: Force full rebuild
             progress_callback: Optional progress callback
+            jobs: Worker processes for parsing and chunking (0 = all CPUs)
+            checkpointer: Saves checkpoints as batches are written
+            build_state: Running totals recorded in checkpoints
 
         Returns:
             Statistics dict
@@ -362,69 +560,324 @@ class DocumentIndexer:
             "total_documents": 0,
             "total_chunks": 0,
             "sources": {},
+            "errors": [],
         }
 
+        # Decide up front which files need indexing, in source order
+        tasks_by_source: Dict[str, List[ChunkTask]] = {}
         for source_name, docs in routed_docs.items():
-            if not docs:
-                logger.info(f"No documents for source '{source_name}'")
-                stats["sources"][source_name] = {"documents": 0, "chunks": 0}
-                continue
+            tasks = []
+            for doc_path in docs:
+                if not force and not self.change_detector.has_changed(doc_path):
+                    continue
+                _, chunk_size, chunk_overlap = self.router.route_document(doc_path)
+                tasks.append(
+                    self._chunk_task(doc_path, source_name, chunk_size, chunk_overlap)
+                )
+            tasks_by_source[source_name] = tasks
 
-            try:
-                # Report start of source processing
-                if progress_callback:
-                    progress_callback("start", source_name, {"doc_count": len(docs)})
+        all_tasks = [task for tasks in tasks_by_source.values() for task in tasks]
+        prepared_docs = iter_prepared_documents(all_tasks, resolve_jobs(jobs))
+        writer = self._create_store_writer(checkpointer, build_state)
+        batcher = ChunkBatcher(self._embed_batch, writer, DEFAULT_BATCH_CHUNKS)
 
-                source_stats = {"documents": 0, "chunks": 0}
+        try:
+            for source_name, docs in routed_docs.items():
+                if not docs:
+                    logger.info(f"No documents for source '{source_name}'")
+                    stats["sources"][source_name] = {"documents": 0, "chunks": 0}
+                    continue
+
+                remaining = len(tasks_by_source[source_name])
+                try:
+                    # Report start of source processing
+                    if progress_callback:
+                        progress_callback("start", source_name, {"doc_count": len(docs)})
 
-                for doc_path in docs:
-                    # Detect changes
-                    if not force and not self.change_detector.has_changed(doc_path):
-                        continue
+                    source_stats = {"documents": 0, "chunks": 0}
 
-                    # Add document with source-specific chunking
-                    result = self.add_document(Path(doc_path))
+                    while remaining:
+                        prepared = next(prepared_docs)
+                        remaining -= 1
+
+                        if prepared.error:
+                            error_msg = f"{prepared.file_path}: {prepared.error}"
+                            stats["errors"].append(error_msg)
+                            logger.error(f"Failed to add document {error_msg}")
+                            continue
 
-                    if result["status"] == "success":
                         source_stats["documents"] += 1
-                        source_stats["chunks"] += result["chunks"]
-                        # Update change detector metadata for incremental indexing
-                        from prometh_cortex.vector_store.interface import DocumentChange
-
-                        change = DocumentChange(
-                            file_path=doc_path,
-                            change_type=(
-                                "add"
-                                if doc_path not in self.change_detector.indexed_docs
-                                else "update"
-                            ),
-                            file_hash=result.get("file_hash"),
-                            modified_time=result.get("modified_time"),
-                        )
-                        self.change_detector.update_metadata([change])
-
-                stats["sources"][source_name] = source_stats
-                stats["total_documents"] += source_stats["documents"]
-                stats["total_chunks"] += source_stats["chunks"]
-
-                # Report completion of source processing
-                if progress_callback:
-                    progress_callback("complete", source_name, source_stats)
-
-            except Exception as e:
-                logger.error(f"Failed to process source '{source_name}': {e}")
-                stats["sources"][source_name] = {
-                    "documents": 0,
-                    "chunks": 0,
-                    "error": str(e),
-                }
+                        source_stats["chunks"] += len(prepared.documents)
+                        batcher.add(prepared)
 
-                # Report error in source processing
-                if progress_callback:
-                    progress_callback("error", source_name, {"error": str(e)})
+                    batcher.flush()
+                    writer.flush()
+
+                    stats["sources"][source_name] = source_stats
+                    stats["total_documents"] += source_stats["documents"]
+                    stats["total_chunks"] += source_stats["chunks"]
+
+                    # Report completion of source processing
+                    if progress_callback:
+                        progress_callback("complete", source_name, source_stats)
+
+                except Exception as e:
+                    logger.error(f"Failed to process source '{source_name}': {e}")
+                    stats["sources"][source_name] = {
+                        "documents": 0,
+                        "chunks": 0,
+                        "error": str(e),
+                    }
+
+                    # Skip this source's remaining files so later sources line up
+                    for _ in range(remaining):
+                        next(prepared_docs)
+
+                    # Report error in source processing
+                    if progress_callback:
+                        progress_callback("error", source_name, {"error": str(e)})
+        finally:
+            prepared_docs.close()
+            writer.close()
 
         return stats
 
+    def _build_streaming_index(
+        self,
+        force: bool,
+        progress_callback: Optional[Callable[[str, str, Any], None]] = None,
+        jobs: int = 1,
+        checkpointer: Optional[BuildCheckpointer] = None,
+        build_state: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the unified index in a single streaming pass with bounded memory.
+
+        Documents are discovered lazily and indexed in discovery order, so no
+        full path list or per-source list is built. build_index() asks the
+        vector store to keep buffered chunks within ``build_memory_limit_mb``.
+
+        Args:
+            force: Force full rebuild
+            progress_callback: Optional progress callback
+            jobs: Worker processes for parsing and chunking (0 = all CPUs)
+            checkpointer: Saves checkpoints as batches are written
+            build_state: Running totals recorded in checkpoints
+
+        Returns:
+            Statistics dict, including the number of discovered documents
+        """
+        stats = {
+            "total_documents": 0,
+            "total_chunks": 0,
+            "sources": {
+                source.name: {"documents": 0, "chunks": 0} for source in self.config.sources
+            },
+            "errors": [],
+            "discovered_documents": 0,
+        }
+
+        # Document counts are unknown until discovery finishes
+        if progress_callback:
+            for source_name in stats["sources"]:
+                progress_callback("start", source_name, {"doc_count": None})
+
+        prepared_docs = iter_prepared_documents(
+            self._iter_changed_tasks(force, stats), resolve_jobs(jobs)
+        )
+        writer = self._create_store_writer(checkpointer, build_state)
+        batcher = ChunkBatcher(self._embed_batch, writer, DEFAULT_BATCH_CHUNKS)
+
+        try:
+            for prepared in prepared_docs:
+                if prepared.error:
+                    error_msg = f"{prepared.file_path}: {prepared.error}"
+                    stats["errors"].append(error_msg)
+                    logger.error(f"Failed to add document {error_msg}")
+                    continue
+
+                source_stats = stats["sources"][prepared.source_name]
+                source_stats["documents"] += 1
+                source_stats["chunks"] += len(prepared.documents)
+                batcher.add(prepared)
+
+            batcher.flush()
+        finally:
+            prepared_docs.close()
+            writer.close()
+
+        for source_name, source_stats in stats["sources"].items():
+            stats["total_documents"] += source_stats["documents"]
+            stats["total_chunks"] += source_stats["chunks"]
+
+            # Report completion of source processing
+            if progress_callback:
+                progress_callback("complete", source_name, source_stats)
+
+        return stats
+
+    def _iter_changed_tasks(
+        self, force: bool, stats: Dict[str, Any]
+    ) -> Iterator[ChunkTask]:
+        """Yield chunking tasks for new or changed documents as they are discovered."""
+        for doc_path in self.iter_document_paths():
+            stats["discovered_documents"] += 1
+            if not force and not self.change_detector.has_changed(doc_path):
+                continue
+
+            try:
+                source_name, chunk_size, chunk_overlap = self.router.route_document(
+                    doc_path
+                )
+            except RouterError as e:
+                logger.warning(f"Failed to route document {doc_path}: {e}")
+                if "default" not in stats["sources"]:
+                    continue
+                # Default to "default" source on routing failure
+                source = self.router.get_source_config("default")
+                source_name = source.name
+                chunk_size, chunk_overlap = source.chunk_size, source.chunk_overlap
+
+            yield self._chunk_task(doc_path, source_name, chunk_size, chunk_overlap)
+
+    def _chunk_task(
+        self, doc_path: str, source_name: str, chunk_size: int, chunk_overlap: int
+    ) -> ChunkTask:
+        """Chunking task for a routed document, with its source's chunking mode."""
+        return ChunkTask(
+            doc_path,
+            source_name,
+            chunk_size,
+            chunk_overlap,
+            chunking=self.router.get_source_config(source_name).chunking,
+            tokenizer=self.config.embedding_tokenizer or self.config.embedding_model,
+            max_tokens=self.config.embedding_max_tokens,
+            sparse_vectors=self._sparse_vectors,
+        )
+
+    def _create_store_writer(
+        self,
+        checkpointer: Optional[BuildCheckpointer],
+        build_state: Optional[Dict[str, Any]],
+    ) -> StoreWriter:
+        """Create the build's store writer, recording and checkpointing written batches."""
+
+        def on_written(batch: List[PreparedDocument]) -> None:
+            self._delete_stale_chunks(batch)
+            self._record_indexed(batch)
+            chunks = sum(len(prepared.documents) for prepared in batch)
+            if build_state is not None:
+                build_state["documents"] += len(batch)
+                build_state["chunks"] += chunks
+            if checkpointer is not None:
+                checkpointer.record(chunks)
+
+        return StoreWriter(self.vector_store, on_written)
+
+    def _embed_batch(self, batch: List[PreparedDocument]) -> None:
+        """Embed all new or changed chunks of a batch of prepared files in one call."""
+        self._reuse_vectors(batch)
+        embed_documents(
+            [doc for prepared in batch for doc in prepared.documents],
+            self.embed_model,
+        )
+
+    def _reuse_vectors(self, batch: List[PreparedDocument]) -> int:
+        """Attach stored vectors to chunks whose text was already indexed.
+
+        The manifest records the text hash of each indexed chunk. A chunk of
+        a re-indexed file whose hash matches one of the file's previous
+        chunks, at any position, takes that chunk's vector, once the stored
+        text is confirmed equal. Only new or changed text is embedded.
+
+        Returns:
+            Number of chunks given a stored vector
+        """
+        wanted: Dict[str, List[Dict[str, Any]]] = {}
+        for prepared in batch:
+            entry = self.change_detector.indexed_docs.get(prepared.file_path) or {}
+            if not entry.get("chunks"):
+                continue
+            by_hash = {text_hash: chunk_id for chunk_id, text_hash in entry["chunks"].items()}
+            for doc, text_hash in zip(prepared.documents, prepared.chunk_hashes.values()):
+                chunk_id = by_hash.get(text_hash)
+                if chunk_id is not None and doc.get("vector") is None:
+                    wanted.setdefault(chunk_id, []).append(doc)
+        if not wanted:
+            return 0
+
+        reused = 0
+        for chunk_id, (text, vector) in self.vector_store.fetch_vectors(list(wanted)).items():
+            for doc in wanted[chunk_id]:
+                if doc["text"] == text:
+                    doc["vector"] = vector
+                    reused += 1
+        logger.debug(f"Reused stored vectors for {reused} chunks")
+        return reused
+
+    def _delete_stale_chunks(self, batch: List[PreparedDocument]) -> None:
+        """Delete the previous chunks of re-indexed files that no longer exist."""
+        stale = []
+        for prepared in batch:
+            entry = self.change_detector.indexed_docs.get(prepared.file_path) or {}
+            current = {doc["id"] for doc in prepared.documents}
+            stale.extend(
+                chunk_id for chunk_id in entry.get("chunks", {}) if chunk_id not in current
+            )
+        if stale:
+            self.vector_store.delete_chunks(stale)
+
+    def _record_indexed(self, batch: List[PreparedDocument]) -> None:
+        """Update change detection metadata for files written to the store.
+
+        The manifest is only written to disk at checkpoints, after the
+        vectors it refers to.
+        """
+        changes = [
+            DocumentChange(
+                file_path=prepared.file_path,
+                change_type=(
+                    "add"
+                    if prepared.file_path not in self.change_detector.indexed_docs
+                    else "update"
+                ),
+                file_hash=prepared.file_hash,
+                modified_time=prepared.modified_time,
+                chunks=prepared.chunk_hashes,
+            )
+            for prepared in batch
+        ]
+        self.change_detector.update_metadata(changes, save=False)
+
+    def _save_checkpoint(self, build_state: Dict[str, Any]) -> None:
+        """Persist written vectors, then the manifest that claims them.
+
+        A crash between the two leaves chunks the manifest does not claim yet;
+        their files are indexed again on resume, overwriting the same ids.
+        """
+        self.vector_store.save_index()
+        self.change_detector.save()
+        self._write_build_checkpoint({**build_state, "checkpoint_at": time.time()})
+
+    def get_build_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the state of an interrupted build, or None if there is none."""
+        checkpoint_path = self.config.rag_index_dir / BUILD_CHECKPOINT_FILE
+        if not checkpoint_path.exists():
+            return None
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _write_build_checkpoint(self, build_state: Dict[str, Any]) -> None:
+        """Record the running build's state."""
+        atomic_write_json(self.config.rag_index_dir / BUILD_CHECKPOINT_FILE, build_state)
+
+    def _clear_build_checkpoint(self) -> None:
+        """Mark the build as complete."""
+        (self.config.rag_index_dir / BUILD_CHECKPOINT_FILE).unlink(missing_ok=True)
+
     def _clear_index(self, preserve_memory: bool = True) -> None:
         """Clear the unified index.
 
@@ -465,21 +918,147 @@ class DocumentIndexer:
         except Exception as e:
             logger.warning(f"Error during index loading: {e}")
 
+    def export_index(
+        self,
+        directory: Path,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Export every chunk, memories included, with its vector.
+
+        The export is backend-independent (see ``vector_store.portable``) and
+        can be loaded into either backend with import_index() without
+        re-embedding.
+
+        Args:
+            directory: Export directory; must not exist or be empty
+            progress_callback: Called with the number of chunks exported so far
+
+        Returns:
+            The export manifest
+
+        Raises:
+            IndexerError: If export fails
+        """
+        try:
+            self._refresh_generation()
+            writer = IndexExportWriter(
+                directory,
+                {
+                    "embedding_model": self.config.embedding_model,
+                    "dimension": 0,
+                    "source_backend": self.config.vector_store_type,
+                },
+            )
+            exported = 0
+            for records, vectors in self.vector_store.iter_chunks():
+                writer.header["dimension"] = int(vectors.shape[1])
+                writer.write(records, vectors)
+                exported += len(records)
+                if progress_callback:
+                    progress_callback(exported)
+            writer.write_build_manifest(self.change_detector.indexed_docs)
+            return writer.close()
+        except (ExportFormatError, OSError) as e:
+            raise IndexerError(f"Failed to export index: {e}")
+
+    def import_index(
+        self,
+        directory: Path,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Replace the index with an export, using its stored vectors.
+
+        Documents are bulk-loaded into a new generation (FAISS directory or
+        Qdrant collection) that is published atomically, like a force
+        rebuild. Exported memories are added to the existing ones. The
+        export's file hashes become the change manifest, so the next
+        incremental build only re-indexes files changed since the export.
+
+        Args:
+            directory: Directory written by export_index()
+            progress_callback: Called with the number of chunks imported so far
+
+        Returns:
+            Import statistics
+
+        Raises:
+            IndexerError: If the export is unreadable or was made with another
+                embedding model
+        """
+        try:
+            manifest = read_export_manifest(directory)
+        except ExportFormatError as e:
+            raise IndexerError(str(e))
+        if manifest["embedding_model"] != self.config.embedding_model:
+            raise IndexerError(
+                f"Export was created with embedding model {manifest['embedding_model']}, "
+                f"but {self.config.embedding_model} is configured"
+            )
+
+        try:
+            generation = None
+            if self.vector_store.begin_generation("prmth_memory") is None:
+                self._clear_index(preserve_memory=True)
+            else:
+                generation = self.vector_store.get_generation()
+            self._open_change_detector()
+            self.change_detector.indexed_docs.clear()
+
+            stats = {"chunks": 0, "memories": 0}
+            memory_limit_mb = self.config.build_memory_limit_mb or DEFAULT_BULK_LOAD_MB
+            self.vector_store.begin_bulk_load(memory_limit_mb * 1024 * 1024)
+            try:
+                for records, vectors in iter_export(directory):
+                    self.vector_store.add_documents(
+                        [
+                            {**record, "vector": vector.tolist()}
+                            for record, vector in zip(records, vectors)
+                        ]
+                    )
+                    stats["chunks"] += len(records)
+                    stats["memories"] += sum(
+                        record["metadata"].get("source_type") == "prmth_memory"
+                        for record in records
+                    )
+                    if progress_callback:
+                        progress_callback(stats["chunks"])
+            finally:
+                self.vector_store.end_bulk_load()
+
+            self.vector_store.save_index()
+            self.change_detector.indexed_docs.update(
+                read_export_build_manifest(directory) or {}
+            )
+            self.change_detector.save()
+            if generation:
+                stats["generation"] = self.vector_store.publish_generation()
+            return stats
+        except Exception as e:
+            raise IndexerError(f"Failed to import index: {e}")
+
     def query(
         self,
         query_text: str,
         source_type: Optional[str] = None,
         max_results: Optional[int] = None,
         filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Query the unified index with optional source filtering.
 
+        When the search fetches more candidates than ``max_results``, text is
+        fetched in a second request for the returned results only.
+
         Args:
             query_text: Query text (simple or structured)
             source_type: Specific source to filter by (None = all sources)
             max_results: Maximum number of results to return
             filters: Optional metadata filters
+            fields: Metadata fields to return (None = all)
+            include_text: Return chunk text; without it ``content`` is None
+                and results can be completed later with hydrate_text()
 
         Returns:
             List of result dictionaries with content, metadata, and scores
@@ -494,46 +1073,142 @@ class DocumentIndexer:
             max_results = self.config.max_query_results
 
         try:
-            # Parse structured query
-            parsed_query = self.query_parser.parse_query(query_text)
-
-            # Add source filter if specified
-            if source_type:
-                if filters is None:
-                    filters = {}
-                filters["source_type"] = source_type
-
-            # Build semantic query
-            semantic_query = self.query_parser.build_semantic_query(parsed_query)
+            self._refresh_generation()
+            semantic_query, search = self._plan_query(
+                query_text, source_type, max_results, filters
+            )
 
             # Generate query vector
             query_vector = self.embed_model.get_text_embedding(semantic_query)
 
-            # Merge filters
-            combined_filters = {}
-            if filters:
-                combined_filters.update(filters)
-            if parsed_query.metadata_filters:
-                qdrant_filters = self.query_parser.convert_to_qdrant_filters(
-                    parsed_query.metadata_filters
-                )
-                combined_filters.update(qdrant_filters)
-
             # Perform vector search on unified index
-            search_limit = (
-                max_results * 3 if parsed_query.metadata_filters else max_results
-            )
+            lazy_text = include_text and search["top_k"] > max_results
             results = self.vector_store.query(
                 query_vector=query_vector,
-                top_k=search_limit,
-                filters=combined_filters if combined_filters else None,
+                fields=fields,
+                include_text=include_text and not lazy_text,
+                query_text=semantic_query,
+                **search,
+            )[:max_results]
+
+            if lazy_text:
+                results = self.vector_store.hydrate_text(results)
+            return results
+
+        except Exception as e:
+            raise IndexerError(f"Query failed: {e}")
+
+    async def aquery(
+        self,
+        query_text: str,
+        source_type: Optional[str] = None,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Async query() for the MCP and HTTP servers.
+
+        Embedding runs in a worker thread and the search uses the vector
+        store's async path, so concurrent queries do not block the event loop.
+
+        Raises:
+            IndexerError: If querying fails
+        """
+        if not self.vector_store:
+            raise IndexerError("Vector store not initialized")
+
+        if max_results is None:
+            max_results = self.config.max_query_results
+
+        try:
+            await asyncio.to_thread(self._refresh_generation)
+            semantic_query, search = self._plan_query(
+                query_text, source_type, max_results, filters
             )
+            query_vector = await asyncio.to_thread(
+                self.embed_model.get_text_embedding, semantic_query
+            )
+            lazy_text = include_text and search["top_k"] > max_results
+            results = (
+                await self.vector_store.aquery(
+                    query_vector=query_vector,
+                    fields=fields,
+                    include_text=include_text and not lazy_text,
+                    query_text=semantic_query,
+                    **search,
+                )
+            )[:max_results]
 
-            return results[:max_results]
+            if lazy_text:
+                results = await self.vector_store.ahydrate_text(results)
+            return results
 
         except Exception as e:
             raise IndexerError(f"Query failed: {e}")
 
+    def hydrate_text(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch the text of results queried with ``include_text=False``.
+
+        Raises:
+            IndexerError: If fetching fails
+        """
+        if not self.vector_store:
+            raise IndexerError("Vector store not initialized")
+        try:
+            return self.vector_store.hydrate_text(results)
+        except Exception as e:
+            raise IndexerError(f"Fetching result text failed: {e}")
+
+    async def ahydrate_text(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async hydrate_text() for the MCP and HTTP servers.
+
+        Raises:
+            IndexerError: If fetching fails
+        """
+        if not self.vector_store:
+            raise IndexerError("Vector store not initialized")
+        try:
+            return await self.vector_store.ahydrate_text(results)
+        except Exception as e:
+            raise IndexerError(f"Fetching result text failed: {e}")
+
+    def _plan_query(
+        self,
+        query_text: str,
+        source_type: Optional[str],
+        max_results: int,
+        filters: Optional[Dict[str, Any]],
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Parse a query into its semantic text and vector search arguments."""
+        # Parse structured query
+        parsed_query = self.query_parser.parse_query(query_text)
+
+        # Add source filter if specified
+        if source_type:
+            if filters is None:
+                filters = {}
+            filters["source_type"] = source_type
+
+        # Build semantic query
+        semantic_query = self.query_parser.build_semantic_query(parsed_query)
+
+        # Merge filters
+        combined_filters = {}
+        if filters:
+            combined_filters.update(filters)
+        if parsed_query.metadata_filters:
+            qdrant_filters = self.query_parser.convert_to_qdrant_filters(
+                parsed_query.metadata_filters
+            )
+            combined_filters.update(qdrant_filters)
+
+        search_limit = max_results * 3 if parsed_query.metadata_filters else max_results
+        return semantic_query, {
+            "top_k": search_limit,
+            "filters": combined_filters if combined_filters else None,
+        }
+
     def query_by_text(
         self,
         query_text: str,
@@ -557,6 +1232,7 @@ class DocumentIndexer:
             stats["sources"][source.name] = {
                 "chunk_size": source.chunk_size,
                 "chunk_overlap": source.chunk_overlap,
+                "chunking": source.chunking,
                 "source_patterns": source.source_patterns,
             }
 
@@ -578,6 +1254,7 @@ class DocumentIndexer:
                 "name": source.name,
                 "chunk_size": source.chunk_size,
                 "chunk_overlap": source.chunk_overlap,
+                "chunking": source.chunking,
                 "source_patterns": source.source_patterns,
                 "document_count": 0,  # Placeholder - would need index stats to populate
             }
@@ -637,11 +1314,14 @@ class DocumentIndexer:
             searchable_text = f"{title} {' '.join(tags_list)} {content}".strip()
 
             # Build base metadata
-            now = datetime.utcnow().isoformat()
+            created = datetime.utcnow()
+            now = created.isoformat()
             base_metadata = {
                 "title": title,
                 "tags": tags_list,
                 "created": now,
+                # Numeric copy for ordered, range-filtered listing
+                "created_ts": created.timestamp(),
                 "author": "prometh_cortex_memory",
                 "source_type": "prmth_memory",
                 "document_id": document_id,
@@ -715,20 +1395,24 @@ class DocumentIndexer:
         since: Optional[float] = None,
         project: Optional[str] = None,
         tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List memory documents with optional filtering.
 
         Args:
             since: Unix timestamp - only include docs created after this time
-            project: Filter by metadata.project value
+            project: Filter by project value
             tag: Filter by tag value
+            limit: Maximum number of documents to return
+            cursor: Continue after a previous page (see memory_cursor())
 
         Returns:
             List of memory documents sorted by creation date (newest first)
         """
         try:
             return self.vector_store.list_memory_documents(
-                since=since, project=project, tag=tag
+                since=since, project=project, tag=tag, limit=limit, cursor=cursor
             )
         except Exception as e:
             logger.error(f"Failed to list memory documents: {e}")
@@ -0,0 +1,313 @@
+"""Producer/consumer build pipeline.
+
+Parsing (YAML frontmatter, pydantic validation, markdown cleanup) and chunking
+are CPU-bound and independent per file, so they run in a process pool. The
+prepared chunks stream back in submission order through a bounded window of
+in-flight files to a single consumer in the parent process that embeds them in
+batches, while a background writer thread hands the previous batch to the
+vector store.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+from prometh_cortex.embedding.tokenizer import load_tokenizer
+from prometh_cortex.parser import extract_document_chunks, parse_markdown_file
+from prometh_cortex.vector_store.sparse import document_sparse_vector
+
+logger = logging.getLogger(__name__)
+
+# Number of chunks embedded and written per batch
+DEFAULT_BATCH_CHUNKS = 256
+
+# In-flight files per worker; bounds memory held by prepared-but-unconsumed files
+PENDING_FILES_PER_JOB = 4
+
+
+@dataclass
+class ChunkTask:
+    """A file to parse and chunk with its source's chunking parameters."""
+
+    file_path: str
+    source_name: str
+    chunk_size: int
+    chunk_overlap: int
+    # Boundary placement: "fixed", "content_defined" or "tokens"
+    chunking: str = "fixed"
+    # Tokenizer model and window for "tokens" chunking
+    tokenizer: Optional[str] = None
+    max_tokens: Optional[int] = None
+    # Attach BM25 sparse vectors for hybrid search
+    sparse_vectors: bool = False
+
+
+@dataclass
+class PreparedDocument:
+    """Vector store documents produced from one file."""
+
+    file_path: str
+    source_name: str
+    documents: List[Dict[str, Any]] = field(default_factory=list)
+    file_hash: Optional[str] = None
+    modified_time: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def chunk_hashes(self) -> Dict[str, str]:
+        """Chunk id -> text hash, as recorded in the build manifest."""
+        return {doc["id"]: chunk_text_hash(doc["text"]) for doc in self.documents}
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """Translate a ``--jobs`` value into a worker count (0 or None = all CPUs)."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def compute_file_hash(file_path: str) -> str:
+    """Compute the SHA256 hash of a file, as used for change detection."""
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def chunk_text_hash(text: str) -> str:
+    """Short hash of a chunk's text, for spotting chunks that can keep their vector."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def prepare_document(task: ChunkTask) -> PreparedDocument:
+    """Parse and chunk one file into vector store documents.
+
+    Runs in worker processes, so it must stay a picklable module-level
+    function and never raise: failures are reported in ``error``.
+
+    Args:
+        task: File and chunking parameters
+
+    Returns:
+        Prepared documents for the file
+    """
+    prepared = PreparedDocument(file_path=task.file_path, source_name=task.source_name)
+    try:
+        prepared.modified_time = os.stat(task.file_path).st_mtime
+        prepared.file_hash = compute_file_hash(task.file_path)
+
+        markdown_doc = parse_markdown_file(Path(task.file_path))
+        chunks = extract_document_chunks(
+            markdown_doc,
+            chunk_size=task.chunk_size,
+            chunk_overlap=task.chunk_overlap,
+            chunking=task.chunking,
+            tokenizer=(
+                load_tokenizer(task.tokenizer, task.max_tokens)
+                if task.chunking == "tokens"
+                else None
+            ),
+        )
+
+        for chunk in chunks:
+            prepared.documents.append(
+                {
+                    "id": f"{task.file_path}_{chunk['chunk_index']}",
+                    "text": chunk["content"],
+                    "metadata": {
+                        **chunk["metadata"],
+                        "file_path": task.file_path,
+                        "chunk_index": chunk["chunk_index"],
+                        "source_type": task.source_name,
+                        "chunk_config": {
+                            "chunk_size": task.chunk_size,
+                            "chunk_overlap": task.chunk_overlap,
+                        },
+                    },
+                }
+            )
+            if task.sparse_vectors:
+                prepared.documents[-1]["sparse"] = document_sparse_vector(chunk["content"])
+    except Exception as e:
+        prepared.error = str(e)
+    return prepared
+
+
+def iter_prepared_documents(
+    tasks: Iterable[ChunkTask], jobs: int = 1
+) -> Iterator[PreparedDocument]:
+    """Prepare files, in parallel when ``jobs > 1``, yielding in task order.
+
+    At most ``jobs * PENDING_FILES_PER_JOB`` files are in flight, so workers
+    stay busy while the consumer embeds without prepared chunks piling up.
+
+    Args:
+        tasks: Files to prepare
+        jobs: Number of worker processes
+
+    Yields:
+        Prepared documents, one per task, in the order given
+    """
+    if jobs <= 1:
+        for task in tasks:
+            yield prepare_document(task)
+        return
+
+    max_pending = jobs * PENDING_FILES_PER_JOB
+    # spawn: workers must not inherit torch/tokenizer threads from the parent
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        pending: Deque[Future] = deque()
+        for task in tasks:
+            pending.append(pool.submit(prepare_document, task))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def embed_documents(documents: List[Dict[str, Any]], embed_model: Any) -> None:
+    """Attach vectors to documents that lack one, in a single batched call.
+
+    Args:
+        documents: Vector store documents; ``vector`` is set in place
+        embed_model: LlamaIndex embedding model
+    """
+    missing = [doc for doc in documents if doc.get("vector") is None]
+    if not missing:
+        return
+    vectors = embed_model.get_text_embedding_batch([doc["text"] for doc in missing])
+    for doc, vector in zip(missing, vectors):
+        doc["vector"] = vector
+
+
+class StoreWriter:
+    """Writes batches to the vector store on one background thread.
+
+    One batch is written while the caller embeds the next. ``on_written`` runs
+    in the caller's thread once a batch is stored, in submission order.
+    """
+
+    def __init__(
+        self,
+        vector_store: Any,
+        on_written: Callable[[List[PreparedDocument]], None],
+    ):
+        self.vector_store = vector_store
+        self.on_written = on_written
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="store-writer"
+        )
+        self._pending: Optional[Future] = None
+        self._pending_batch: List[PreparedDocument] = []
+
+    def submit(self, batch: List[PreparedDocument]) -> None:
+        """Queue a batch for writing after the previous one completes."""
+        self.flush()
+        documents = [doc for prepared in batch for doc in prepared.documents]
+        self._pending = self._executor.submit(self.vector_store.add_documents, documents)
+        self._pending_batch = batch
+
+    def flush(self) -> None:
+        """Wait for the in-flight batch, re-raising its error."""
+        if self._pending is None:
+            return
+        pending, batch = self._pending, self._pending_batch
+        self._pending, self._pending_batch = None, []
+        pending.result()
+        self.on_written(batch)
+
+    def close(self) -> None:
+        """Flush and stop the writer thread."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+class ChunkBatcher:
+    """Groups prepared files into batches that are embedded and then written.
+
+    A batch is embedded in the caller's thread once it holds at least
+    ``batch_chunks`` chunks, then handed to the store writer.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[List[PreparedDocument]], None],
+        writer: StoreWriter,
+        batch_chunks: int = DEFAULT_BATCH_CHUNKS,
+    ):
+        self.embed = embed
+        self.writer = writer
+        self.batch_chunks = batch_chunks
+        self._batch: List[PreparedDocument] = []
+        self._batch_chunks = 0
+
+    def add(self, prepared: PreparedDocument) -> None:
+        """Add a prepared file, embedding and writing the batch when full."""
+        self._batch.append(prepared)
+        self._batch_chunks += len(prepared.documents)
+        if self._batch_chunks >= self.batch_chunks:
+            self.flush()
+
+    def flush(self) -> None:
+        """Embed and submit the pending batch, if any."""
+        if not self._batch:
+            return
+        batch, self._batch, self._batch_chunks = self._batch, [], 0
+        self.embed(batch)
+        self.writer.submit(batch)
+
+
+class BuildCheckpointer:
+    """Decides when a running build saves a checkpoint.
+
+    ``save`` persists the vectors written so far together with the manifest
+    that claims them; it is called every ``every_chunks`` chunks or
+    ``every_seconds`` seconds, whichever comes first (0 disables a trigger).
+    """
+
+    def __init__(
+        self,
+        save: Callable[[], None],
+        every_chunks: int = 0,
+        every_seconds: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.save = save
+        self.every_chunks = every_chunks
+        self.every_seconds = every_seconds
+        self.clock = clock
+        self.checkpoints = 0
+        self._pending_chunks = 0
+        self._last_checkpoint = clock()
+
+    def record(self, chunks: int) -> None:
+        """Count newly written chunks and checkpoint if one is due."""
+        self._pending_chunks += chunks
+        if self._due():
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Save a checkpoint now."""
+        self.save()
+        self.checkpoints += 1
+        self._pending_chunks = 0
+        self._last_checkpoint = self.clock()
+
+    def _due(self) -> bool:
+        if not self._pending_chunks:
+            return False
+        if self.every_chunks and self._pending_chunks >= self.every_chunks:
+            return True
+        elapsed = self.clock() - self._last_checkpoint
+        return bool(self.every_seconds) and elapsed >= self.every_seconds
@@ -172,6 +172,8 @@ async def prometh_cortex_query(
     filters: Optional[Dict[str, Any]] = None,
     show_query_info: bool = False,
     include_full_content: bool = False,
+    include_text: bool = True,
+    fields: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """Query indexed documents with enhanced tag-based filtering and semantic search.
 
@@ -193,6 +195,8 @@ async def prometh_cortex_query(
         filters: Optional additional filters (merged with parsed structured filters)
         show_query_info: Include query parsing information in response for debugging
         include_full_content: Load and include complete document content (not just chunks)
+        include_text: Include chunk text; set false for citations only
+        fields: Metadata fields to return (default: all)
 
     Returns:
         Dictionary containing query results, timing, metadata, and optionally full document content
@@ -232,14 +236,21 @@ async def prometh_cortex_query(
                     # Direct metadata filters can be handled by vector store
                     vector_store_filters[key] = value
 
-        # Perform query with optional source_type filtering
-        results = indexer.query(
+        query_fields = fields
+        if fields is not None and "tags" in post_process_filters:
+            query_fields = [*fields, "tags"]
+
+        # Perform query with optional source_type filtering; when post-filtering,
+        # text is fetched afterwards for the results that are kept
+        results = await indexer.aquery(
             query,
             source_type=source_type,
             max_results=(
                 max_results * 2 if post_process_filters else max_results
             ),  # Get more if post-filtering
             filters=vector_store_filters if vector_store_filters else None,
+            fields=query_fields,
+            include_text=include_text and not post_process_filters,
         )
 
         # Apply post-processing filters if provided
@@ -265,6 +276,8 @@ async def prometh_cortex_query(
                     filtered_results.append(result)
 
             results = filtered_results[:max_results]
+            if include_text:
+                results = await indexer.ahydrate_text(results)
 
         query_time = (time.time() - start_time) * 1000  # Convert to milliseconds
 
@@ -308,6 +321,8 @@ async def prometh_cortex_query(
                 "metadata": result["metadata"],
                 "similarity_score": result["similarity_score"],
             }
+            if not include_text:
+                del formatted_result["content"]
 
             # Add full document content if requested and available
             if include_full_content:
@@ -612,7 +627,9 @@ async def prometh_cortex_memory(
             return {"error": "Indexer not initialized"}
 
         # Call indexer method to add memory document
-        result = indexer.add_memory_document(
+        # Embedding and the write block, so keep them off the event loop
+        result = await asyncio.to_thread(
+            indexer.add_memory_document,
             title=title,
             content=content,
             tags=tags or [],
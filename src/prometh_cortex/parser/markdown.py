@@ -1,13 +1,16 @@
 """Markdown document parsing and content extraction."""
 
 import re
+import zlib
+from bisect import bisect_right
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import frontmatter
 from pydantic import BaseModel
 
 from prometh_cortex.parser.frontmatter import FrontmatterSchema, parse_frontmatter, extract_searchable_text
+from prometh_cortex.parser.structure import structural_chunks
 
 
 class MarkdownDocument(BaseModel):
@@ -324,33 +327,81 @@ def discover_markdown_files(directory: Path, recursive: bool = True) -> List[Pat
     return sorted(markdown_files)
 
 
-def extract_document_chunks(document: MarkdownDocument, chunk_size: int = 512, chunk_overlap: int = 50) -> List[Dict]:
-    """
-    Split document into chunks for embedding.
-    
+# Anchors where content-defined chunking may cut, strongest last. The cut
+# in each size window is the strongest anchor present, and among anchors of
+# equal strength the one whose surrounding text hashes lowest, so boundaries
+# depend on nearby content rather than on their offset in the file.
+_CHUNK_ANCHORS = (
+    re.compile(r" +"),  # Between words
+    re.compile(r"[.!?] +"),  # After a sentence
+    re.compile(r"\n"),  # After a line
+    re.compile(r"\n[ \t]*\n\s*"),  # After a blank line
+)
+
+# Characters on each side of an anchor that decide its hash
+_ANCHOR_CONTEXT = 16
+
+# Smallest content-defined chunk, as a fraction of chunk_size
+_MIN_CHUNK_FRACTION = 4
+
+
+def content_defined_spans(text: str, max_size: int) -> List[Tuple[int, int]]:
+    """Split text at content-defined anchors into spans of at most max_size.
+
+    Inserting or deleting text only moves the boundaries of the chunks around
+    the edit; the chunking falls back into step with the old boundaries at
+    the next anchor both versions choose.
+
     Args:
-        document: MarkdownDocument to chunk
-        chunk_size: Maximum size of each chunk in characters
-        chunk_overlap: Overlap between chunks in characters
-        
+        text: Text to split
+        max_size: Maximum span length in characters
+
     Returns:
-        List of chunk dictionaries with content and metadata
+        (start, end) offsets covering the text
     """
-    chunks = []
-    text = document.searchable_text
+    strength: Dict[int, int] = {}
+    for level, pattern in enumerate(_CHUNK_ANCHORS):
+        for match in pattern.finditer(text):
+            strength[match.end()] = level
+    positions = sorted(strength)
+
+    def rank(position: int) -> Tuple[int, int]:
+        context = text[position - _ANCHOR_CONTEXT : position + _ANCHOR_CONTEXT]
+        return strength[position], -zlib.crc32(context.encode("utf-8"))
+
+    min_size = max(1, max_size // _MIN_CHUNK_FRACTION)
+    spans = []
+    start = 0
+    while len(text) - start > max_size:
+        window = positions[
+            bisect_right(positions, start + min_size) : bisect_right(positions, start + max_size)
+        ]
+        end = max(window, key=rank) if window else start + max_size
+        spans.append((start, end))
+        start = end
+    spans.append((start, len(text)))
+    return spans
+
+
+def _markdown_preamble(document: MarkdownDocument) -> str:
+    """Frontmatter text, plus the title when the body has no heading for it."""
+    parts = []
+    if document.frontmatter:
+        frontmatter_text = extract_searchable_text(document.frontmatter)
+        if frontmatter_text:
+            parts.append(frontmatter_text)
     
-    if not text.strip():
-        # Return single empty chunk if no content
-        return [{
-            "content": "",
-            "metadata": document.metadata,
-            "chunk_index": 0,
-            "total_chunks": 1
-        }]
+    title_heading = re.compile(rf'^#\s+{re.escape(document.title or "")}\s*$', re.MULTILINE)
+    if document.title and not parts and not title_heading.search(document.content):
+        parts.append(document.title)
     
-    # Split text into chunks
+    return " ".join(parts)
+
+
+def _fixed_spans(text: str, chunk_size: int, chunk_overlap: int) -> List[Tuple[int, int]]:
+    """Split text every chunk_size characters at a word break, with overlap."""
+    spans = []
     start = 0
-    chunk_index = 0
     
     while start < len(text):
         end = start + chunk_size
@@ -367,7 +418,75 @@ def extract_document_chunks(document: MarkdownDocument, chunk_size: int = 512, c
             if break_point > start:
                 end = break_point + 1
         
-        chunk_text = text[start:end].strip()
+        spans.append((start, end))
+        
+        # Move start position with overlap
+        start = max(end - chunk_overlap, start + 1)
+        
+        # Prevent infinite loop
+        if start >= len(text):
+            break
+    
+    return spans
+
+
+def extract_document_chunks(
+    document: MarkdownDocument,
+    chunk_size: int = 512,
+    chunk_overlap: int = 50,
+    chunking: str = "fixed",
+    tokenizer: Optional[Any] = None,
+) -> List[Dict]:
+    """
+    Split document into chunks for embedding.
+    
+    Args:
+        document: MarkdownDocument to chunk
+        chunk_size: Maximum size of each chunk in characters (tokens for "tokens")
+        chunk_overlap: Overlap between chunks ("fixed" and "tokens" only)
+        chunking: "fixed", "content_defined", "tokens" or "markdown" boundary
+            placement; "markdown" chunks the raw body by section and adds
+            ``section_path`` to each chunk's metadata
+        tokenizer: Embedding model tokenizer with a ``spans()`` method,
+            required by "tokens" chunking
+        
+    Returns:
+        List of chunk dictionaries with content and metadata
+    """
+    chunks = []
+    text = document.searchable_text
+    
+    if not text.strip():
+        # Return single empty chunk if no content
+        return [{
+            "content": "",
+            "metadata": document.metadata,
+            "chunk_index": 0,
+            "total_chunks": 1
+        }]
+    
+    if chunking == "markdown":
+        # Offsets refer to the markdown body rather than searchable_text
+        pieces = [
+            (chunk.text, chunk.start, chunk.end, {"section_path": chunk.section_path})
+            for chunk in structural_chunks(
+                document.content, chunk_size, preamble=_markdown_preamble(document)
+            )
+        ]
+    else:
+        if chunking == "tokens":
+            if tokenizer is None:
+                raise ValueError("Token-sized chunking needs the embedding model's tokenizer")
+            spans = tokenizer.spans(text, chunk_size, chunk_overlap)
+        elif chunking == "content_defined":
+            spans = content_defined_spans(text, chunk_size)
+        else:
+            spans = _fixed_spans(text, chunk_size, chunk_overlap)
+        pieces = [(text[start:end], start, end, {}) for start, end in spans]
+    
+    chunk_index = 0
+    for chunk_text, start, end, extra_metadata in pieces:
+        chunk_text = chunk_text.strip()
         
         if chunk_text:  # Only add non-empty chunks
             chunk_metadata = document.metadata.copy()
@@ -375,6 +494,7 @@ def extract_document_chunks(document: MarkdownDocument, chunk_size: int = 512, c
                 "chunk_index": chunk_index,
                 "chunk_start": start,
                 "chunk_end": end,
+                **extra_metadata,
             })
             
             chunks.append({
@@ -384,13 +504,6 @@ def extract_document_chunks(document: MarkdownDocument, chunk_size: int = 512, c
             })
             
             chunk_index += 1
-        
-        # Move start position with overlap
-        start = max(end - chunk_overlap, start + 1)
-        
-        # Prevent infinite loop
-        if start >= len(text):
-            break
     
     # Add total_chunks to all chunk metadata
     for chunk in chunks:
@@ -0,0 +1,305 @@
+"""Markdown-structure-aware chunking.
+
+The document body is tokenized once with ``markdown-it-py`` into top-level
+blocks (headings, paragraphs, lists, tables, code blocks, quotes), grouped
+into sections by heading. A heading with all its subsections is kept whole
+when it fits and packed with its neighbours up to the chunk size. A larger
+one is split into its subsections, and its own text is split between
+blocks. Code blocks are never split, including those nested in lists and
+quotes, and tables are split only between rows, with the header row
+repeated, so every chunk is readable on its own.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+
+# Separator between blocks in a chunk
+BLOCK_SEPARATOR = "\n\n"
+
+# Separator between headings in a section path
+SECTION_PATH_SEPARATOR = " > "
+
+# Block tokens whose source lines form one block
+_BLOCK_TOKENS = {
+    "paragraph_open": "paragraph",
+    "bullet_list_open": "list",
+    "ordered_list_open": "list",
+    "blockquote_open": "quote",
+    "table_open": "table",
+    "fence": "code",
+    "code_block": "code",
+    "html_block": "html",
+    "hr": "hr",
+}
+
+_parser = MarkdownIt("commonmark").enable("table")
+
+
+@dataclass
+class MarkdownBlock:
+    """A top-level markdown block and its character span in the body."""
+
+    kind: str
+    text: str
+    start: int
+    end: int
+    # Line ranges [first, stop) within the block that are never split,
+    # e.g. code blocks nested in a list
+    unsplittable: List[Tuple[int, int]] = field(default_factory=list)
+
+
+@dataclass
+class MarkdownSection:
+    """A heading and the blocks up to the next heading."""
+
+    path: List[str]
+    blocks: List[MarkdownBlock] = field(default_factory=list)
+
+    @property
+    def section_path(self) -> str:
+        """Heading path, e.g. ``"Guide > Install > Linux"``."""
+        return SECTION_PATH_SEPARATOR.join(self.path)
+
+
+@dataclass
+class StructuralChunk:
+    """Chunk text with the section it starts in and its span in the body."""
+
+    text: str
+    section_path: str
+    start: int
+    end: int
+
+
+def parse_sections(content: str) -> List[MarkdownSection]:
+    """Split a markdown body into sections by heading, in one tokenization pass.
+
+    Args:
+        content: Markdown body (without frontmatter)
+
+    Returns:
+        Sections in document order; text before the first heading is a
+        section with an empty path
+    """
+    lines = content.splitlines(keepends=True)
+    line_offsets = [0]
+    for line in lines:
+        line_offsets.append(line_offsets[-1] + len(line))
+
+    sections = [MarkdownSection(path=[])]
+    headings: List[Tuple[int, str]] = []
+    tokens = _parser.parse(content)
+
+    for i, token in enumerate(tokens):
+        if token.level != 0 or token.map is None:
+            continue
+        start, end = line_offsets[token.map[0]], line_offsets[token.map[1]]
+        text = content[start:end].strip("\n")
+
+        if token.type == "heading_open":
+            level = int(token.tag[1:])
+            title = tokens[i + 1].content.strip()
+            while headings and headings[-1][0] >= level:
+                headings.pop()
+            headings.append((level, title))
+            sections.append(MarkdownSection(path=[title for _, title in headings]))
+            sections[-1].blocks.append(MarkdownBlock("heading", text, start, end))
+        elif token.type in _BLOCK_TOKENS and text.strip():
+            block = MarkdownBlock(_BLOCK_TOKENS[token.type], text, start, end)
+            if block.kind in ("list", "quote"):
+                block.unsplittable = _nested_code_lines(tokens, i)
+            sections[-1].blocks.append(block)
+
+    return [section for section in sections if section.blocks]
+
+
+def _nested_code_lines(tokens: List[Token], index: int) -> List[Tuple[int, int]]:
+    """Line ranges, relative to block token ``index``, of the code blocks inside it."""
+    first_line = tokens[index].map[0]
+    ranges = []
+    index += 1
+    # The block ends with its level-0 closing token
+    while index < len(tokens) and tokens[index].level > 0:
+        token = tokens[index]
+        if token.type in ("fence", "code_block") and token.map is not None:
+            ranges.append((token.map[0] - first_line, token.map[1] - first_line))
+        index += 1
+    return ranges
+
+
+def structural_chunks(
+    content: str, chunk_size: int, preamble: str = ""
+) -> List[StructuralChunk]:
+    """Chunk a markdown body along its heading structure.
+
+    Args:
+        content: Markdown body (without frontmatter)
+        chunk_size: Maximum chunk size in characters; exceeded only by a code
+            block, a table row or a heading with its first block that are
+            larger on their own
+        preamble: Text placed before the body, e.g. frontmatter fields
+
+    Returns:
+        Chunks in document order
+    """
+    sections = parse_sections(content)
+    if preamble.strip():
+        if not sections or sections[0].path:
+            sections.insert(0, MarkdownSection(path=[]))
+        sections[0].blocks.insert(0, MarkdownBlock("preamble", preamble.strip(), 0, 0))
+
+    # Whole heading subtrees where they fit, then neighbours packed together
+    chunks: List[StructuralChunk] = []
+    for unit in _subtree_units(sections, 0, len(sections), chunk_size):
+        if chunks and _joined_length(chunks[-1].text, unit.text) <= chunk_size:
+            last = chunks[-1]
+            last.text = last.text + BLOCK_SEPARATOR + unit.text
+            last.end = max(last.end, unit.end)
+        else:
+            chunks.append(unit)
+    return chunks
+
+
+def _subtree_units(
+    sections: List[MarkdownSection], first: int, last: int, chunk_size: int
+) -> List[StructuralChunk]:
+    """Units for sibling sections[first:last] and their subsections.
+
+    A section whose subtree fits is one unit; otherwise its own blocks are
+    packed into units and its subsections are handled the same way.
+    """
+    units: List[StructuralChunk] = []
+    index = first
+    while index < last:
+        section = sections[index]
+        end = index + 1
+        # Text before the first heading has no subsections
+        while section.path and end < last and _is_within(sections[end], section):
+            end += 1
+
+        blocks = [block for subsection in sections[index:end] for block in subsection.blocks]
+        text = BLOCK_SEPARATOR.join(block.text for block in blocks)
+        if len(text) <= chunk_size:
+            units.append(
+                StructuralChunk(text, section.section_path, blocks[0].start, blocks[-1].end)
+            )
+        else:
+            own = _section_units(section, chunk_size)
+            subsections = _subtree_units(sections, index + 1, end, chunk_size)
+            if subsections and [block.kind for block in section.blocks] == ["heading"]:
+                # A heading without text of its own leads its first subsection
+                heading, first = own.pop(), subsections[0]
+                subsections[0] = StructuralChunk(
+                    heading.text + BLOCK_SEPARATOR + first.text,
+                    first.section_path,
+                    heading.start,
+                    first.end,
+                )
+            units.extend(own)
+            units.extend(subsections)
+        index = end
+    return units
+
+
+def _section_units(section: MarkdownSection, chunk_size: int) -> List[StructuralChunk]:
+    """Units of one section's own blocks, split and packed up to chunk_size."""
+    pieces = [piece for block in section.blocks for piece in _split_block(block, chunk_size)]
+    if len(pieces) > 1 and pieces[0].kind == "heading":
+        # A heading always stays with the block that follows it
+        heading, first = pieces[0], pieces[1]
+        pieces[:2] = [
+            MarkdownBlock(
+                first.kind, heading.text + BLOCK_SEPARATOR + first.text, heading.start, first.end
+            )
+        ]
+    return _pack(pieces, section.section_path, chunk_size)
+
+
+def _is_within(section: MarkdownSection, ancestor: MarkdownSection) -> bool:
+    """Whether section is nested under ancestor's heading."""
+    depth = len(ancestor.path)
+    return len(section.path) > depth and section.path[:depth] == ancestor.path
+
+
+def _pack(blocks: List[MarkdownBlock], section_path: str, chunk_size: int) -> List[StructuralChunk]:
+    """Greedily join consecutive blocks of one section up to chunk_size."""
+    packed: List[StructuralChunk] = []
+    for block in blocks:
+        if packed and _joined_length(packed[-1].text, block.text) <= chunk_size:
+            packed[-1].text = packed[-1].text + BLOCK_SEPARATOR + block.text
+            packed[-1].end = block.end
+        else:
+            packed.append(StructuralChunk(block.text, section_path, block.start, block.end))
+    return packed
+
+
+def _split_block(block: MarkdownBlock, chunk_size: int) -> List[MarkdownBlock]:
+    """Split a block larger than chunk_size where markdown allows it."""
+    if len(block.text) <= chunk_size or block.kind == "code":
+        return [block]
+
+    lines = block.text.split("\n")
+    # Offset of each line in the block
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+
+    header: List[str] = []
+    first_line = 0
+    if block.kind == "table":
+        # Header and delimiter rows start every part of the table
+        header, first_line = lines[:2], 2
+
+    # Runs of lines never split: a nested code block, or else a single line
+    runs: List[Tuple[int, int]] = []
+    index = first_line
+    while index < len(lines):
+        stop = next((stop for first, stop in block.unsplittable if first == index), index + 1)
+        runs.append((index, min(stop, len(lines))))
+        index = runs[-1][1]
+
+    # Each part: its lines and the index of its first and last own line
+    parts: List[Tuple[List[str], int, int]] = []
+    for first, stop in runs:
+        run = lines[first:stop]
+        if parts and len("\n".join(parts[-1][0] + run)) <= chunk_size:
+            parts[-1] = (parts[-1][0] + run, parts[-1][1], stop - 1)
+        elif block.kind != "table" and len(run) == 1 and len(run[0]) > chunk_size:
+            parts.extend(([words], first, first) for words in _split_words(run[0], chunk_size))
+        else:
+            parts.append((header + run, first, stop - 1))
+
+    return [
+        MarkdownBlock(
+            block.kind,
+            "\n".join(part),
+            block.start + offsets[first],
+            block.start + offsets[last + 1] - 1,
+        )
+        for part, first, last in parts
+    ]
+
+
+def _split_words(text: str, chunk_size: int) -> List[str]:
+    """Split a long line at spaces into runs of at most chunk_size characters."""
+    runs: List[str] = []
+    current = ""
+    for word in text.split(" "):
+        if current and len(current) + 1 + len(word) > chunk_size:
+            runs.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+        while len(current) > chunk_size:
+            runs.append(current[:chunk_size])
+            current = current[chunk_size:]
+    if current:
+        runs.append(current)
+    return runs
+
+
+def _joined_length(first: str, second: str) -> int:
+    return len(first) + len(BLOCK_SEPARATOR) + len(second)
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field
 from prometh_cortex.config import Config, load_config
 from prometh_cortex.indexer import DocumentIndexer, IndexerError
 from prometh_cortex.parser import parse_markdown_file
+from prometh_cortex.vector_store import IndexGenerations
 
 
 # Global variables for application state
@@ -47,11 +48,19 @@ class QueryRequest(BaseModel):
         default=False,
         description="Load and include complete document content (not just chunks)"
     )
+    include_text: bool = Field(
+        default=True,
+        description="Include chunk text; set false for citations only"
+    )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Metadata fields to return (default: all)"
+    )
 
 
 class QueryResult(BaseModel):
     """Individual query result."""
-    content: str = Field(..., description="Content snippet from document")
+    content: Optional[str] = Field(None, description="Content snippet from document (unless include_text=false)")
     source_file: str = Field(..., description="Path to source document")
     metadata: Dict[str, Any] = Field(..., description="Document metadata")
     similarity_score: float = Field(..., description="Similarity score (0-1)")
@@ -204,11 +213,13 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
                     )
 
             # Perform query with optional source_type filtering
-            results = indexer.query(
+            results = await indexer.aquery(
                 request.query,
                 source_type=request.source_type,
                 max_results=max_results,
-                filters=request.filters  # Additional filters merged with parsed filters
+                filters=request.filters,  # Additional filters merged with parsed filters
+                fields=request.fields,
+                include_text=request.include_text
             )
             
             query_time = (time.time() - start_time) * 1000  # Convert to milliseconds
@@ -358,7 +369,10 @@ def create_app(config: Optional[Config] = None) -> FastAPI:
             
             # Check last index update (placeholder - would need to store this)
             last_index_update = None
-            config_file = (config.rag_index_dir / "config.json").resolve()
+            index_dir = config.rag_index_dir
+            if config.vector_store_type == "faiss":
+                index_dir = IndexGenerations(config.rag_index_dir).current_path()
+            config_file = (index_dir / "config.json").resolve()
             base_dir = config.rag_index_dir.resolve()
             # Validate that config_file stays within base_dir (path traversal defense)
             if config_file.is_relative_to(base_dir) and config_file.exists():
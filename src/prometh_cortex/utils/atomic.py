@@ -0,0 +1,62 @@
+"""Crash-safe file writes."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+def fsync_directory(directory: Union[str, Path]) -> None:
+    """Flush a directory entry so renames inside it survive a crash.
+
+    Args:
+        directory: Directory whose entries were changed
+    """
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        # Not supported on every platform/filesystem
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(
+    path: Union[str, Path], data: Any, indent: Optional[int] = 2, **dump_kwargs: Any
+) -> None:
+    """Write JSON so readers see either the old or the new file, never a partial one.
+
+    The data is written to a temporary file in the same directory, flushed to
+    disk and renamed over ``path``.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+        indent: JSON indentation
+        **dump_kwargs: Extra arguments for ``json.dump``
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    fsync_directory(path.parent)
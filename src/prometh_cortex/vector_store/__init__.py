@@ -1,10 +1,24 @@
 """Vector store abstraction layer for supporting multiple vector databases."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .interface import VectorStoreInterface, DocumentChange
 from .factory import VectorStoreFactory, create_vector_store
-from .faiss_store import FAISSVectorStore
-from .qdrant_store import QdrantVectorStore
 from .change_detector import DocumentChangeDetector
+from .generations import GenerationError, IndexGenerations
+from .portable import ExportFormatError
+
+if TYPE_CHECKING:
+    from .faiss_store import FAISSVectorStore
+    from .qdrant_store import QdrantVectorStore
+
+# Backend implementations pull in faiss/llama-index or qdrant-client, so they
+# are only imported when accessed (PEP 562) or created through the factory.
+_LAZY_BACKENDS = {
+    "FAISSVectorStore": ".faiss_store",
+    "QdrantVectorStore": ".qdrant_store",
+}
 
 __all__ = [
     "VectorStoreInterface",
@@ -14,4 +28,23 @@ __all__ = [
     "FAISSVectorStore",
     "QdrantVectorStore",
     "DocumentChangeDetector",
-]
\ No newline at end of file
+    "GenerationError",
+    "IndexGenerations",
+    "ExportFormatError",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import vector store backends lazily on first access."""
+    module_name = _LAZY_BACKENDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include lazy backends in dir() output."""
+    return sorted(set(globals()) | set(__all__))
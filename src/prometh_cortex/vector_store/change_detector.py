@@ -7,6 +7,8 @@ import time
 from pathlib import Path
 from typing import Dict, List, Set
 
+from prometh_cortex.utils.atomic import atomic_write_json
+
 from .interface import DocumentChange
 
 
@@ -78,11 +80,13 @@ class DocumentChangeDetector:
         
         return changes
     
-    def update_metadata(self, changes: List[DocumentChange]) -> None:
+    def update_metadata(self, changes: List[DocumentChange], save: bool = True) -> None:
         """Update metadata after successful indexing.
         
         Args:
             changes: List of successfully applied changes
+            save: Write metadata to disk now. Builds pass False and call
+                save() at checkpoints, once the vectors are persisted too.
         """
         current_time = time.time()
         
@@ -95,7 +99,14 @@ class DocumentChangeDetector:
                     'modified_time': change.modified_time,
                     'indexed_at': current_time
                 }
+                if change.chunks is not None:
+                    self.indexed_docs[change.file_path]['chunks'] = change.chunks
         
+        if save:
+            self._save_metadata()
+    
+    def save(self) -> None:
+        """Write metadata to disk."""
         self._save_metadata()
     
     def has_changed(self, doc_path: str) -> bool:
@@ -183,15 +194,8 @@ class DocumentChangeDetector:
     def _save_metadata(self) -> None:
         """Save index metadata to file."""
         try:
-            # Ensure parent directory exists
-            self.metadata_path.parent.mkdir(parents=True, exist_ok=True)
-            
             # Write metadata atomically (write to temp file, then rename)
-            temp_path = self.metadata_path.with_suffix('.tmp')
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.indexed_docs, f, indent=2, sort_keys=True)
-            
-            temp_path.replace(self.metadata_path)
+            atomic_write_json(self.metadata_path, self.indexed_docs, sort_keys=True)
             
         except (OSError, IOError) as e:
             # Log error but don't crash - metadata is not critical
@@ -4,8 +4,6 @@ from typing import Optional
 
 from prometh_cortex.config import Config
 from .interface import VectorStoreInterface
-from .faiss_store import FAISSVectorStore
-from .qdrant_store import QdrantVectorStore
 
 
 class VectorStoreFactory:
@@ -17,7 +15,8 @@ class VectorStoreFactory:
         
         Args:
             config: Configuration object with vector store settings
-            embed_model: Pre-initialized embedding model (optional)
+            embed_model: Pre-initialized embedding model (optional, loaded lazily
+                on first embed when omitted)
             
         Returns:
             Vector store instance (FAISS or Qdrant)
@@ -27,9 +26,15 @@ class VectorStoreFactory:
         """
         vector_store_type = getattr(config, 'vector_store_type', 'faiss').lower()
         
+        # Backends are imported on demand so that only the selected one
+        # (faiss + llama-index, or qdrant-client) is ever loaded.
         if vector_store_type == 'faiss':
+            from .faiss_store import FAISSVectorStore
+
             return FAISSVectorStore(config, embed_model)
         elif vector_store_type == 'qdrant':
+            from .qdrant_store import QdrantVectorStore
+
             return QdrantVectorStore(config, embed_model)
         else:
             raise ValueError(
@@ -52,7 +57,8 @@ def create_vector_store(config: Config, embed_model=None) -> VectorStoreInterfac
     
     Args:
         config: Configuration object with vector store settings
-        embed_model: Pre-initialized embedding model (optional)
+        embed_model: Pre-initialized embedding model (optional, loaded lazily
+            on first embed when omitted)
         
     Returns:
         Vector store instance based on configuration
@@ -1,27 +1,55 @@
-"""FAISS vector store implementation wrapper for existing functionality."""
+"""FAISS (local) vector store implementation.
+
+The local index is a set of immutable on-disk segments (see ``segments.py``)
+plus a small mutable head segment held in memory. Writes land in the head,
+which is sealed into a new segment: immediately for ordinary writes, so
+persisting a memory costs time proportional to the memory and not to the
+index, or when it fills up during a bulk load. Searches fan out over the head
+and every segment and merge by score. Deletes are tombstones, and a
+background merge compacts small segments after saves.
+
+The segments live in the published generation of the index directory (see
+``generations.py``). A full rebuild fills a new generation and publishes it
+atomically; other processes switch to it on their next query. Memory chunks
+are kept in a separate segment store under ``<rag_index_dir>/memory``, shared
+by all generations, so they survive rebuilds, deletes and rollbacks with
+their vectors.
+"""
 
 import json
-import pickle
+import logging
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-
-import faiss
-from llama_index.core import (
-    Document,
-    StorageContext,
-    VectorStoreIndex,
-    load_index_from_storage,
-)
-from llama_index.core.retrievers import VectorIndexRetriever
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-from llama_index.vector_stores.faiss import FaissVectorStore
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
 
-from .interface import DocumentChange, VectorStoreInterface
+from prometh_cortex.embedding import (
+    get_embedding_dimension,
+    get_embedding_model_for_config,
+)
+from prometh_cortex.utils.atomic import atomic_write_json
+
+from .generations import MEMORY_DIR, IndexGenerations
+from .interface import DocumentChange, VectorStoreInterface, project_result
+from .memory_catalog import MemoryCatalog
+from .segments import MergePolicy, SegmentStore, normalize_rows, top_rows
+
+logger = logging.getLogger(__name__)
+
+# Files of the LlamaIndex storage used by indexes written before segments
+LEGACY_STORAGE_FILES = (
+    "docstore.json",
+    "index_store.json",
+    "graph_store.json",
+    "default__vector_store.json",
+    "image__vector_store.json",
+)
 
 
 class FAISSVectorStore(VectorStoreInterface):
-    """FAISS vector store implementation using LlamaIndex."""
+    """Local vector store built from on-disk segments."""
 
     def __init__(self, config, embed_model=None):
         """Initialize FAISS vector store.
@@ -31,89 +59,232 @@ class FAISSVectorStore(VectorStoreInterface):
             embed_model: Pre-initialized embedding model (optional)
         """
         self.config = config
-        self.index: Optional[VectorStoreIndex] = None
-        self.embed_model = embed_model or HuggingFaceEmbedding(
-            model_name=config.embedding_model
+        self._embed_model = embed_model
+        self._merge_policy = MergePolicy()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._bulk_limit_bytes: Optional[int] = None
+        self._generations = IndexGenerations(
+            config.rag_index_dir, keep=config.index_keep_generations
         )
+        # Unpublished generation being built, if any
+        self._staging: Optional[str] = None
+        self._generation_stamp = self._generations.pointer_stamp()
+        self._memory_dir = Path(config.rag_index_dir) / MEMORY_DIR
+        self._memory = SegmentStore(self._memory_dir)
+        # Metadata of memory chunks, kept beside the memory segments so
+        # memories can be listed without reading them
         self._document_metadata: Dict[str, Dict[str, Any]] = {}
+        self._metadata_dirty = False
+        # Memory documents by document_id and creation time, for listing
+        self._catalog = MemoryCatalog()
+        self._reset(self._generations.current_path())
         self._initialized = False
 
+    def _reset(self, index_dir: Path) -> None:
+        """Point the store at a generation directory with nothing loaded."""
+        self._index_dir = index_dir
+        self._vector_dimension: Optional[int] = None
+        self._segments = SegmentStore(index_dir)
+        self._head_records: List[Dict[str, Any]] = []
+        self._head_vectors: List[np.ndarray] = []
+        self._head_rows: Dict[str, int] = {}
+        self._head_bytes = 0
+
+    @property
+    def embed_model(self):
+        """Embedding model, loaded on first embed rather than at construction."""
+        if self._embed_model is None:
+            self._embed_model = get_embedding_model_for_config(self.config)
+        return self._embed_model
+
     def initialize(self) -> None:
         """Initialize the vector store connection and setup."""
         try:
+            self._load_memory()
             # Try to load existing index first
             if self._index_exists():
                 self.load_index()
             self._initialized = True
         except Exception as e:
             # If loading fails, we'll create a new index on first add_documents
+            logger.warning(f"Failed to load existing index: {e}")
             self._initialized = True
 
     def add_documents(self, documents: List[Dict[str, Any]]) -> None:
         """Add documents with vectors and metadata.
 
+        Outside a bulk load the documents are persisted as one new segment
+        before returning. Memory chunks always are, in the memory store.
+
         Args:
             documents: List of documents with 'id', 'text', 'metadata' keys
         """
         if not documents:
             return
 
-        # Convert to LlamaIndex Document objects
-        llama_docs = []
-        for doc in documents:
-            llama_doc = Document(
-                text=doc["text"], metadata=doc.get("metadata", {}), id_=doc["id"]
+        # Embed chunk text for documents without a precomputed vector
+        missing = [doc for doc in documents if doc.get("vector") is None]
+        if missing:
+            vectors = self.embed_model.get_text_embedding_batch(
+                [doc["text"] for doc in missing]
             )
-            llama_docs.append(llama_doc)
+            for doc, vector in zip(missing, vectors):
+                doc["vector"] = vector
 
-            # Store metadata for later retrieval
-            self._document_metadata[doc["id"]] = doc.get("metadata", {})
+        memories = [doc for doc in documents if self._is_memory(doc.get("metadata", {}))]
+        if memories:
+            self._add_memories(memories)
+        if len(memories) == len(documents):
+            return
 
-        # Create or update index
-        if self.index is None:
-            self.index = VectorStoreIndex.from_documents(
-                llama_docs, embed_model=self.embed_model
-            )
-        else:
-            for doc in llama_docs:
-                self.index.insert(doc)
+        for doc in documents:
+            if not self._is_memory(doc.get("metadata", {})):
+                self._add_to_head(doc)
+
+        if self._bulk_limit_bytes is None:
+            self.save_index()
+        elif self._head_bytes >= self._bulk_limit_bytes // 2:
+            self._seal_head()
+
+    @staticmethod
+    def _is_memory(metadata: Dict[str, Any]) -> bool:
+        return metadata.get("source_type") == "prmth_memory"
+
+    def _add_memories(self, documents: List[Dict[str, Any]]) -> None:
+        """Write memory chunks to the memory store and publish them."""
+        records = [
+            {"id": doc["id"], "text": doc["text"], "metadata": doc.get("metadata", {})}
+            for doc in documents
+        ]
+        vectors = np.vstack([np.asarray(doc["vector"], dtype=np.float32) for doc in documents])
+
+        # Pick up memories written by other processes before adding ours
+        self._refresh_memory()
+        self._memory.append(records, vectors)
+        for record in records:
+            self._record_memory(record["id"], record["metadata"])
+        self._save_memory()
+        if self._vector_dimension is None:
+            self._vector_dimension = int(vectors.shape[1])
+
+        if self._bulk_limit_bytes is None:
+            self._schedule_compaction()
+
+    def _record_memory(self, chunk_id: str, metadata: Dict[str, Any]) -> None:
+        """Keep a memory chunk's metadata, replacing an earlier copy."""
+        if chunk_id in self._document_metadata:
+            self._catalog.remove_chunks([chunk_id])
+        self._document_metadata[chunk_id] = metadata
+        self._catalog.add(chunk_id, metadata)
+        self._metadata_dirty = True
+
+    def begin_bulk_load(self, memory_limit_bytes: int) -> None:
+        """Buffer subsequent add_documents() calls in the head segment.
+
+        The head is sealed into an immutable segment whenever it reaches half
+        of ``memory_limit_bytes``, so memory stays bounded regardless of
+        corpus size. Sealed segments are published at the next save_index().
+        """
+        self._bulk_limit_bytes = memory_limit_bytes
+
+    def end_bulk_load(self) -> None:
+        """Seal buffered chunks into a segment and return to write-through."""
+        if self._head_rows:
+            self._seal_head()
+        self._bulk_limit_bytes = None
+
+    def _add_to_head(self, doc: Dict[str, Any]) -> None:
+        """Append one chunk to the head; a later copy of an id replaces earlier ones."""
+        record = {
+            "id": doc["id"],
+            "text": doc["text"],
+            "metadata": doc.get("metadata", {}),
+        }
+        vector = np.asarray(doc["vector"], dtype=np.float32)
+        self._head_rows[record["id"]] = len(self._head_records)
+        self._head_records.append(record)
+        self._head_vectors.append(vector)
+        # Rough resident size: text, metadata, vector and object overhead
+        self._head_bytes += (
+            len(record["text"]) + len(json.dumps(record["metadata"])) + vector.nbytes + 512
+        )
 
-        # Save metadata
-        self._save_metadata()
+    def _seal_head(self) -> None:
+        """Write the head's current chunks as a new segment."""
+        rows = sorted(self._head_rows.values())
+        records = [self._head_records[row] for row in rows]
+        vectors = np.vstack([self._head_vectors[row] for row in rows])
+        self._clear_head()
+
+        self._segments.append(records, vectors)
+        if self._vector_dimension is None:
+            self._vector_dimension = int(vectors.shape[1])
+
+    def _clear_head(self) -> None:
+        self._head_records, self._head_vectors = [], []
+        self._head_rows, self._head_bytes = {}, 0
+
+    def _search_head(
+        self, query_vector: List[float], top_k: int, accept=None
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Brute-force search of the head's current chunks."""
+        if not self._head_rows:
+            return []
+
+        rows = list(self._head_rows.values())
+        vectors = normalize_rows(np.vstack([self._head_vectors[row] for row in rows]))
+        query = normalize_rows(np.asarray([query_vector], dtype=np.float32))[0]
+
+        results = []
+        for score, index in top_rows(vectors, query, len(rows)):
+            record = self._head_records[rows[index]]
+            if accept and not accept(record):
+                continue
+            results.append((score, record))
+            if len(results) >= top_k:
+                break
+        return results
 
     def update_document(self, document_id: str, document: Dict[str, Any]) -> None:
         """Update a single document by ID."""
-        # LlamaIndex doesn't have direct update, so we delete and add
-        self.delete_document(document_id)
-
-        # Add the updated document
+        # The new copy supersedes the old one
         doc_with_id = document.copy()
         doc_with_id["id"] = document_id
         self.add_documents([doc_with_id])
 
     def delete_document(self, document_id: str) -> None:
         """Delete a single document by ID."""
-        if self.index is None:
-            return
-
-        try:
-            # LlamaIndex doesn't have direct delete, this is a limitation
-            # We'll track this in metadata and filter during queries
-            self._document_metadata.pop(document_id, None)
-            self._save_metadata()
-
-            # Note: This is a limitation of the current LlamaIndex FAISS implementation
-            # For true deletion, we'd need to rebuild the entire index
-        except Exception:
-            pass
+        self._delete_chunks({document_id})
+        if self._bulk_limit_bytes is None:
+            self.save_index()
+
+    def _delete_chunks(self, chunk_ids: Set[str]) -> None:
+        """Drop chunks from the head and tombstone their segment copies."""
+        for chunk_id in chunk_ids:
+            self._head_rows.pop(chunk_id, None)
+            if self._document_metadata.pop(chunk_id, None) is not None:
+                self._metadata_dirty = True
+        self._catalog.remove_chunks(chunk_ids)
+        self._segments.delete(chunk_ids)
+        self._memory.delete(chunk_ids)
 
     def document_exists(self, document_id: str) -> bool:
         """Check if a document exists in the index."""
-        return document_id in self._document_metadata
+        return (
+            document_id in self._head_rows
+            or document_id in self._document_metadata
+            or self._segments.contains(document_id)
+            or self._memory.contains(document_id)
+        )
 
     def get_indexed_documents(self) -> Set[str]:
         """Get set of all indexed document IDs/paths."""
-        return set(self._document_metadata.keys())
+        return (
+            self._segments.live_ids()
+            | set(self._head_rows)
+            | set(self._document_metadata)
+            | self._memory.live_ids()
+        )
 
     def get_document_metadata(self, document_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a specific document.
@@ -122,14 +293,18 @@ class FAISSVectorStore(VectorStoreInterface):
         this tries exact match first, then falls back to finding the first chunk
         of the parent document (e.g., memory_hash).
         """
-        # Try exact match first
-        if document_id in self._document_metadata:
-            return self._document_metadata[document_id]
-
-        # For chunked documents, try to find the first chunk of the parent
-        first_chunk_id = f"{document_id}_0"
-        if first_chunk_id in self._document_metadata:
-            return self._document_metadata[first_chunk_id]
+        if document_id in self._catalog:
+            return self._catalog.get(document_id)
+
+        # For chunked documents, fall back to the first chunk of the parent
+        for chunk_id in (document_id, f"{document_id}_0"):
+            if chunk_id in self._document_metadata:
+                return self._document_metadata[chunk_id]
+            if chunk_id in self._head_rows:
+                return self._head_records[self._head_rows[chunk_id]]["metadata"]
+            record = self._segments.get(chunk_id) or self._memory.get(chunk_id)
+            if record is not None:
+                return record["metadata"]
 
         return None
 
@@ -179,100 +354,148 @@ class FAISSVectorStore(VectorStoreInterface):
         query_vector: List[float],
         top_k: int = 10,
         filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+        query_text: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Search for similar vectors with optional metadata filters."""
-        if self.index is None:
+        """Search for similar vectors with optional metadata filters.
+
+        Searches the head, every segment and the memory segments, merging by
+        score. Segments published by another process since the last query
+        are picked up first. The search is dense only; ``query_text`` is
+        ignored.
+        """
+        self.refresh_generation()
+        self._segments.refresh()
+        self._refresh_memory()
+        if not self._has_vectors():
             return []
 
         try:
-            retriever = VectorIndexRetriever(
-                index=self.index,
-                similarity_top_k=top_k,
+            accept = (
+                (lambda record: self._matches_filters(record["metadata"], filters))
+                if filters
+                else None
             )
+            hits = self._search_head(query_vector, top_k, accept)
+            hits.extend(
+                self._segments.search(
+                    query_vector,
+                    top_k,
+                    accept=accept,
+                    # The head holds the newest copy of its ids
+                    exclude=self._head_rows,
+                )
+            )
+            hits.extend(self._memory.search(query_vector, top_k, accept=accept))
+            hits.sort(key=lambda hit: hit[0], reverse=True)
 
-            # Convert query vector to text (limitation of current approach)
-            # In practice, this would be called with query text from higher level
-            query_text = "query"  # This is a limitation of the wrapper approach
-
-            nodes = retriever.retrieve(query_text)
-
-            results = []
-            for node in nodes:
-                # Apply metadata filters if specified
-                if filters and not self._matches_filters(node.node.metadata, filters):
-                    continue
-
-                result = {
-                    "content": node.node.get_content(),
-                    "metadata": dict(node.node.metadata),
-                    "similarity_score": (
-                        float(node.score) if node.score is not None else 0.0
-                    ),
-                    "source_file": node.node.metadata.get("file_path", "Unknown"),
-                }
-                results.append(result)
-
-            return results[:top_k]  # Ensure we don't exceed requested count
+            return [
+                project_result(
+                    {
+                        "content": record["text"],
+                        "metadata": record["metadata"],
+                        "similarity_score": score,
+                        "source_file": record["metadata"].get("file_path", "Unknown"),
+                    },
+                    record["id"],
+                    fields,
+                    include_text,
+                )
+                for score, record in hits[:top_k]
+            ]
 
         except Exception as e:
             raise RuntimeError(f"Query failed: {e}")
 
+    def fetch_texts(self, chunk_ids: List[str]) -> Dict[str, str]:
+        """Get the text of chunks by ID from the head, segments or memories."""
+        texts = {}
+        for chunk_id in chunk_ids:
+            if chunk_id in self._head_rows:
+                record = self._head_records[self._head_rows[chunk_id]]
+            else:
+                record = self._segments.get(chunk_id) or self._memory.get(chunk_id)
+            if record is not None:
+                texts[chunk_id] = record["text"]
+        return texts
+
+    def fetch_vectors(self, chunk_ids: List[str]) -> Dict[str, Tuple[str, Any]]:
+        """Get the stored text and vector of chunks from the head or segments."""
+        found = {}
+        for chunk_id in chunk_ids:
+            if chunk_id in self._head_rows:
+                row = self._head_rows[chunk_id]
+                found[chunk_id] = (self._head_records[row]["text"], self._head_vectors[row])
+                continue
+            stored = self._segments.get_with_vector(chunk_id)
+            if stored is not None:
+                found[chunk_id] = (stored[0]["text"], stored[1])
+        return found
+
+    def delete_chunks(self, chunk_ids: List[str]) -> None:
+        """Delete chunks by ID, saving once."""
+        if not chunk_ids:
+            return
+        self._delete_chunks(set(chunk_ids))
+        if self._bulk_limit_bytes is None:
+            self.save_index()
+
+    def iter_chunks(
+        self, batch_size: int = 1024
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """Yield the visible chunks of the segments, the head and the memory store."""
+        self.refresh_generation()
+        self._segments.refresh()
+        self._refresh_memory()
+        for records, vectors in self._segments.iter_live(batch_size):
+            # Chunks rewritten in the head are yielded from there
+            keep = [i for i, record in enumerate(records) if record["id"] not in self._head_rows]
+            if keep:
+                yield [records[i] for i in keep], vectors[keep]
+
+        rows = sorted(self._head_rows.values())
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            yield (
+                [self._head_records[row] for row in batch],
+                np.vstack([self._head_vectors[row] for row in batch]).astype(np.float32),
+            )
+
+        yield from self._memory.iter_live(batch_size)
+
     def query_by_text(
         self, query_text: str, top_k: int = 10, filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Query using text (convenience method for FAISS)."""
-        if self.index is None:
+        self.refresh_generation()
+        self._segments.refresh()
+        self._refresh_memory()
+        if not self._has_vectors():
             return []
-
-        try:
-            retriever = VectorIndexRetriever(
-                index=self.index,
-                similarity_top_k=top_k,
-            )
-
-            nodes = retriever.retrieve(query_text)
-
-            results = []
-            for node in nodes:
-                # Apply metadata filters if specified
-                if filters and not self._matches_filters(node.node.metadata, filters):
-                    continue
-
-                result = {
-                    "content": node.node.get_content(),
-                    "metadata": dict(node.node.metadata),
-                    "similarity_score": (
-                        float(node.score) if node.score is not None else 0.0
-                    ),
-                    "source_file": node.node.metadata.get("file_path", "Unknown"),
-                }
-                results.append(result)
-
-            return results[:top_k]
-
-        except Exception as e:
-            raise RuntimeError(f"Query failed: {e}")
+        return self.query(self.embed_model.get_query_embedding(query_text), top_k, filters)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get vector store statistics and health info."""
         stats = {
             "type": "faiss",
-            "index_exists": self.index is not None,
+            "index_exists": self._has_vectors(),
             "embedding_model": self.config.embedding_model,
-            "total_documents": len(self._document_metadata),
+            "total_documents": len(self.get_indexed_documents()),
+            "total_vectors": len(self._segments) + len(self._head_rows) + len(self._memory),
+            "segments": len(self._segments.segments),
+            "segment_chunks": len(self._segments),
+            "tombstones": len(self._segments.tombstones),
+            "memory_segments": len(self._memory.segments),
+            "memory_chunks": len(self._memory.live_ids()),
         }
-
-        if self.index:
-            try:
-                vector_store = self.index.vector_store
-                if hasattr(vector_store, "_faiss_index") and vector_store._faiss_index:
-                    stats["total_vectors"] = vector_store._faiss_index.ntotal
-                    stats["vector_dimension"] = vector_store._faiss_index.d
-            except Exception:
-                pass
+        if self._vector_dimension is not None:
+            stats["vector_dimension"] = self._vector_dimension
 
         # Check index directory size
-        index_path = self.config.rag_index_dir
+        if self._generations.current():
+            stats["generation"] = self._generations.current()
+        index_path = self._index_dir
         if index_path.exists():
             stats["index_directory_size"] = sum(
                 f.stat().st_size for f in index_path.rglob("*") if f.is_file()
@@ -281,22 +504,23 @@ class FAISSVectorStore(VectorStoreInterface):
         return stats
 
     def delete_collection(self) -> None:
-        """Delete the entire collection/index."""
-        self.index = None
-        self._document_metadata.clear()
-
-        # Delete index files
-        index_path = self.config.rag_index_dir
-        if index_path.exists():
-            import shutil
+        """Delete the entire collection/index.
 
-            shutil.rmtree(index_path)
+        Publishes a new, empty generation; the previous one stays available
+        for rollback until it ages out. Memories are kept; remove them with
+        delete_memory_documents().
+        """
+        self.wait_for_compaction()
+        self._start_generation()
+        self._save_empty_generation()
+        self.publish_generation()
 
     def delete_documents_except_source(self, excluded_source: str) -> int:
         """Delete all documents except those from a specific source.
 
-        For FAISS backend, we preserve memory metadata in a sidecar file
-        and restore it after rebuild.
+        Publishes a new generation holding only the excluded source's chunks,
+        copied with their vectors, so nothing is re-embedded. Memories live
+        outside generations and are always kept.
 
         Args:
             excluded_source: Source type to preserve (e.g., "prmth_memory")
@@ -304,59 +528,145 @@ class FAISSVectorStore(VectorStoreInterface):
         Returns:
             Number of documents deleted
         """
-        import logging
+        indexed = len(self._segments.live_ids() | set(self._head_rows))
+        self.wait_for_compaction()
+        kept = self.begin_generation(carry_source=excluded_source)
+        self._save_empty_generation()
+        self.publish_generation()
 
-        logger = logging.getLogger(__name__)
+        deleted_count = indexed - kept
+        logger.info(
+            f"Deleted {deleted_count} documents (kept source_type='{excluded_source}')"
+        )
+        return deleted_count
 
-        # Find and backup memory documents metadata
-        memory_metadata = {}
-        for doc_id, metadata in self._document_metadata.items():
-            if metadata.get("source_type") == excluded_source:
-                memory_metadata[doc_id] = metadata
+    def get_storage_dir(self) -> Path:
+        """Directory of the generation this store reads and writes."""
+        return self._index_dir
 
-        deleted_count = len(self._document_metadata) - len(memory_metadata)
+    def get_generation(self) -> Optional[str]:
+        """Generation being written: the unpublished one, or the published one."""
+        return self._staging or self._index_dir.name
 
-        # Save memory metadata to sidecar for restoration after rebuild
-        if memory_metadata:
-            sidecar_path = (
-                self.config.rag_index_dir / f".{excluded_source}_sidecar.json"
-            )
-            # Create parent dir if needed (before delete_collection wipes everything)
-            sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+    def begin_generation(self, carry_source: str = "prmth_memory") -> Optional[int]:
+        """Direct all writes to a new, unpublished generation.
 
-            sidecar_data = {
-                "timestamp": time.time(),
-                "excluded_source": excluded_source,
-                "memory_metadata": memory_metadata,
-            }
+        Chunks of ``carry_source`` are copied into it with their vectors.
+        Memories are kept in their own store, shared by all generations, and
+        need no copying. Readers keep using the published generation until
+        publish_generation().
 
-            try:
-                with open(sidecar_path, "w", encoding="utf-8") as f:
-                    json.dump(sidecar_data, f, indent=2)
-                logger.info(
-                    f"Backed up {len(memory_metadata)} memory doc metadata to {sidecar_path}"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to backup memory metadata: {e}")
+        Returns:
+            Number of chunks carried over
+        """
+        self.wait_for_compaction()
+        self._generations.discard_unpublished()
+
+        carried = []
+        if carry_source != "prmth_memory":
+            for doc_id in self._segments.live_ids() | set(self._head_rows):
+                if doc_id in self._head_rows:
+                    row = self._head_rows[doc_id]
+                    record, vector = self._head_records[row], self._head_vectors[row]
+                else:
+                    record, vector = self._segments.get_with_vector(doc_id)
+                if record["metadata"].get("source_type") == carry_source:
+                    carried.append({**record, "vector": vector})
+
+        self._start_generation()
+        for doc in carried:
+            self._add_to_head(doc)
+        logger.info(f"Started index generation {self._staging} ({len(carried)} chunks carried)")
+        return len(carried)
+
+    def resume_generation(self, name: str) -> bool:
+        """Continue writing to an unpublished generation left by an interrupted build.
 
-        # Clear everything
-        self.delete_collection()
+        Returns:
+            Whether the generation exists and was resumed
+        """
+        path = self._generations.path(name)
+        if not path.is_dir() or self._generations.is_published(name):
+            return False
+
+        self.wait_for_compaction()
+        self._reset(path)
+        self._staging = name
+        self._load_generation()
+        return True
 
-        # Restore memory metadata (vectors will be re-embedded on next query or rebuild)
-        if memory_metadata:
-            try:
-                self._document_metadata = memory_metadata.copy()
-                self._save_metadata()
-                logger.info(
-                    f"Restored {len(memory_metadata)} memory doc metadata after clear"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to restore memory metadata: {e}")
+    def discard_unpublished_generations(self) -> None:
+        """Remove generation directories left by interrupted rebuilds."""
+        self._generations.discard_unpublished(keep=self._staging)
+
+    def publish_generation(self) -> Optional[str]:
+        """Atomically publish the generation started by begin_generation()."""
+        name = self._staging
+        if name is None:
+            return None
+        self.save_index()
+        self._generations.publish(name)
+        self._staging = None
+        self._generation_stamp = self._generations.pointer_stamp()
+        self._schedule_compaction()
+        return name
+
+    def refresh_generation(self) -> bool:
+        """Switch to a generation published by another process.
 
-        logger.info(
-            f"Deleted {deleted_count} documents (kept source_type='{excluded_source}')"
-        )
-        return deleted_count
+        Returns:
+            Whether the store switched generations
+        """
+        if self._staging is not None:
+            return False
+        stamp = self._generations.pointer_stamp()
+        if stamp == self._generation_stamp:
+            return False
+
+        self._generation_stamp = stamp
+        path = self._generations.current_path()
+        if path == self._index_dir:
+            return False
+
+        logger.info(f"Switching to index generation {path.name}")
+        self.wait_for_compaction()
+        self._reset(path)
+        self._load_generation()
+        return True
+
+    def migrate_layout(self) -> bool:
+        """Move an index written before generations into the first generation.
+
+        Must be called with nothing buffered, e.g. before a build starts.
+        """
+        if self._staging is not None or not self._generations.has_legacy_layout():
+            return False
+
+        self.wait_for_compaction()
+        self._generations.adopt_legacy_layout()
+        self._generation_stamp = self._generations.pointer_stamp()
+        self._reset(self._generations.current_path())
+        self._load_generation()
+        return True
+
+    def _start_generation(self) -> None:
+        # An index from before generations becomes the one to roll back to
+        self._generations.adopt_legacy_layout()
+        name = self._generations.create()
+        self._reset(self._generations.path(name))
+        self._staging = name
+
+    def _save_empty_generation(self) -> None:
+        """Save the new generation even when nothing was written to it."""
+        self.save_index()
+        if not self._segments.manifest_path.exists():
+            self._index_dir.mkdir(parents=True, exist_ok=True)
+            self._segments.save()
+            self._save_index_config()
+
+    def _load_generation(self) -> None:
+        if self._index_exists():
+            self.load_index()
 
     def backup_metadata(self, backup_path: str) -> None:
         """Backup index metadata for recovery."""
@@ -365,8 +675,7 @@ class FAISSVectorStore(VectorStoreInterface):
             "document_metadata": self._document_metadata.copy(),
             "config": {
                 "embedding_model": self.config.embedding_model,
-                "chunk_size": self.config.chunk_size,
-                "chunk_overlap": self.config.chunk_overlap,
+                "vector_dimension": self._vector_dimension,
             },
         }
 
@@ -385,156 +694,279 @@ class FAISSVectorStore(VectorStoreInterface):
             backup_data = json.load(f)
 
         self._document_metadata = backup_data.get("document_metadata", {})
-        self._save_metadata()
+        self._catalog = MemoryCatalog.from_chunks(self._document_metadata)
+        self._metadata_dirty = True
+        self._save_memory()
 
     def load_index(self) -> None:
-        """Load existing index from disk."""
+        """Load existing index metadata from disk.
+
+        Only the segment manifest and index config are read here; segment
+        vectors are memory-mapped on first search. An index still in the
+        LlamaIndex storage format is converted to a segment once, and memory
+        chunks stored in the generation are moved to the memory store.
+        """
         if not self._index_exists():
             raise RuntimeError("No index found. Run 'pcortex build' first.")
 
         try:
-            # Load LlamaIndex storage
-            self.index = load_index_from_storage(
-                StorageContext.from_defaults(
-                    persist_dir=str(self.config.rag_index_dir)
-                ),
-                embed_model=self.embed_model,
+            self._load_index_config()
+            self._segments.load()
+            if self._storage_exists():
+                self._migrate_legacy_storage()
+            if (self._index_dir / "document_metadata.json").exists():
+                self._migrate_memories()
+        except Exception as e:
+            raise RuntimeError(f"Failed to load index: {e}")
+
+    def _migrate_legacy_storage(self) -> None:
+        """Move the nodes of a LlamaIndex storage into a segment, with their vectors.
+
+        LlamaIndex nodes were written after any segment copy of the same id,
+        so they become the newest segment. No re-embedding is needed.
+        """
+        from llama_index.core import StorageContext
+
+        index_dir = self._index_dir
+        storage = StorageContext.from_defaults(persist_dir=str(index_dir))
+
+        records, vectors, seen = [], [], set()
+        for node_id, node in storage.docstore.docs.items():
+            try:
+                vector = storage.vector_store.get(node_id)
+            except KeyError:
+                continue
+            document_id = node.ref_doc_id or node_id
+            if document_id in seen:
+                # Documents split into several nodes keep their node ids
+                document_id = node_id
+            seen.add(document_id)
+            records.append(
+                {
+                    "id": document_id,
+                    "text": node.get_content(),
+                    "metadata": dict(node.metadata),
+                }
             )
+            vectors.append(vector)
 
-            # Load metadata
-            self._load_metadata()
+        if records:
+            self._segments.append(records, np.asarray(vectors, dtype=np.float32))
+            self._vector_dimension = len(vectors[0])
+        self.save_index()
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to load index: {e}")
+        for name in LEGACY_STORAGE_FILES:
+            (index_dir / name).unlink(missing_ok=True)
+        logger.info(f"Migrated {len(records)} chunks from LlamaIndex storage to a segment")
 
     def save_index(self) -> None:
-        """Save index to disk."""
-        if self.index is None:
+        """Save index to disk.
+
+        Publishes pending memory changes, then seals the head into a segment
+        and atomically publishes the segment manifest, followed by the index
+        config. The cost is proportional to what changed since the last save,
+        not to the index. Builds call this at checkpoints.
+        """
+        try:
+            self._save_memory()
+        except Exception as e:
+            raise RuntimeError(f"Failed to save memories: {e}")
+
+        if self._head_rows:
+            self._seal_head()
+        if not self._segments.dirty:
             return
 
         try:
             # Ensure index directory exists
-            self.config.rag_index_dir.mkdir(parents=True, exist_ok=True)
+            self._index_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save LlamaIndex storage
-            self.index.storage_context.persist(str(self.config.rag_index_dir))
-
-            # Save metadata
-            self._save_metadata()
+            # Publish segments and deletes since the last save
+            self._segments.save()
 
             # Save configuration
-            config_path = self.config.rag_index_dir / "config.json"
-            with open(config_path, "w") as f:
-                json.dump(
-                    {
-                        "embedding_model": self.config.embedding_model,
-                        "chunk_size": self.config.chunk_size,
-                        "chunk_overlap": self.config.chunk_overlap,
-                        "vector_store_type": "faiss",
-                        "created_at": time.strftime(
-                            "%Y-%m-%dT%H:%M:%SZ", time.gmtime()
-                        ),
-                    },
-                    f,
-                    indent=2,
-                )
+            self._save_index_config()
 
         except Exception as e:
             raise RuntimeError(f"Failed to save index: {e}")
 
+        if self._staging is None and self._index_dir != self._generations.root:
+            # The first save of a new index publishes its generation
+            self._generations.ensure_published(self._index_dir.name)
+            self._generation_stamp = self._generations.pointer_stamp()
+
+            # Builds merge once the bulk load is over
+            if self._bulk_limit_bytes is None:
+                self._schedule_compaction()
+
+    def _save_index_config(self) -> None:
+        if self._vector_dimension is None and self._embed_model is not None:
+            self._vector_dimension = get_embedding_dimension(self._embed_model)
+
+        atomic_write_json(
+            self._index_dir / "config.json",
+            {
+                "embedding_model": self.config.embedding_model,
+                "vector_dimension": self._vector_dimension,
+                "vector_store_type": "faiss",
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            },
+        )
+
+    def _migrate_memories(self) -> None:
+        """Move memory chunks from the generation to the memory store, with their vectors.
+
+        Indexes written before the memory store kept memory chunks in the
+        generation and their metadata in its ``document_metadata.json``.
+        """
+        metadata_path = self._index_dir / "document_metadata.json"
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            stored = {}
+
+        records, vectors, moved = [], [], set()
+        memories = {doc_id: m for doc_id, m in stored.items() if self._is_memory(m)}
+        if not memories:
+            return
+
+        for doc_id, metadata in memories.items():
+            if doc_id in self._document_metadata:
+                # Already moved while another generation was current
+                moved.add(doc_id)
+                continue
+            found = self._segments.get_with_vector(doc_id)
+            if found is None:
+                # Metadata restored without vectors before they were kept
+                self._record_memory(doc_id, metadata)
+                continue
+            record, vector = found
+            records.append(record)
+            vectors.append(vector)
+            moved.add(doc_id)
+
+        if records:
+            self._memory.append(records, np.vstack(vectors))
+            for record in records:
+                self._record_memory(record["id"], record["metadata"])
+        self._save_memory()
+
+        # Memories are published before their generation copies are dropped
+        self._segments.delete(moved)
+        self.save_index()
+
+        # Older indexes shared this file with the build manifest
+        remaining = {k: v for k, v in stored.items() if k not in memories}
+        if remaining:
+            atomic_write_json(metadata_path, remaining)
+        else:
+            metadata_path.unlink(missing_ok=True)
+        logger.info(f"Moved {len(records)} memory chunks to the memory store")
+
+    def _load_memory(self) -> None:
+        self._memory.load()
+        self._load_metadata()
+
+    def _refresh_memory(self) -> None:
+        """Reload memories if another process published changes."""
+        if not self._metadata_dirty and self._memory.refresh():
+            self._load_metadata()
+
+    def _save_memory(self) -> None:
+        """Publish memory metadata, then the memory segments it describes."""
+        if not self._metadata_dirty and not self._memory.dirty:
+            return
+        self._memory_dir.mkdir(parents=True, exist_ok=True)
+        if self._metadata_dirty:
+            self._save_metadata()
+        if self._memory.dirty:
+            self._memory.save()
+
+    def _has_vectors(self) -> bool:
+        return bool(self._head_rows or self._segments.segments or self._memory.segments)
+
+    def compact(self) -> int:
+        """Merge small segments now, as the background merge would.
+
+        Returns:
+            Number of merges performed
+        """
+        return self._segments.compact(self._merge_policy) + self._memory.compact(
+            self._merge_policy
+        )
+
+    def wait_for_compaction(self) -> None:
+        """Wait for a running background merge to finish."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+            self._compaction_thread = None
+
+    def _schedule_compaction(self) -> None:
+        """Start a background merge if the merge policy has work."""
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        if not (
+            self._merge_policy.select(self._segments.segments)
+            or self._merge_policy.select(self._memory.segments)
+        ):
+            return
+
+        # Not a daemon: a short-lived CLI process finishes the merge on exit
+        self._compaction_thread = threading.Thread(
+            target=self._run_compaction, name="segment-merge"
+        )
+        self._compaction_thread.start()
+
+    def _run_compaction(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.warning(f"Background segment merge failed: {e}")
+
     def _index_exists(self) -> bool:
         """Check if index exists on disk."""
-        return self.config.rag_index_dir.exists() and any(
-            self.config.rag_index_dir.iterdir()
+        return self._index_dir.exists() and any(
+            self._index_dir.iterdir()
         )
 
+    def _storage_exists(self) -> bool:
+        """Check if LlamaIndex storage from before segments exists on disk."""
+        return (self._index_dir / "docstore.json").exists()
+
     def list_memory_documents(
         self,
         since: Optional[float] = None,
         project: Optional[str] = None,
         tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List memory documents with optional filtering.
 
-        Returns one entry per unique document_id (deduplicated across chunks).
+        Returns one entry per unique document_id (deduplicated across chunks),
+        read from the memory catalog without scanning chunk metadata.
 
         Args:
             since: Unix timestamp - only include docs created after this time
-            project: Filter by metadata.project value
+            project: Filter by project value
             tag: Filter by tag value
+            limit: Maximum number of documents to return
+            cursor: Continue after a previous page (see memory_cursor())
 
         Returns:
-            List of memory documents with metadata, deduplicated by document_id
+            List of memory documents with metadata, newest first
         """
-        from logging import getLogger
-
-        logger = getLogger(__name__)
-
-        # Collect unique documents by document_id
-        docs_by_id: Dict[str, Dict[str, Any]] = {}
-
-        for doc_id, metadata in self._document_metadata.items():
-            # Filter by source_type
-            if metadata.get("source_type") != "prmth_memory":
-                continue
-
-            # Get the base document_id (remove chunk suffix if present)
-            base_doc_id = metadata.get("document_id", doc_id)
-
-            # Skip if already processed
-            if base_doc_id in docs_by_id:
-                continue
-
-            # Apply time filter
-            if since is not None:
-                created_str = metadata.get("created")
-                if created_str:
-                    try:
-                        # Parse ISO timestamp
-                        from datetime import datetime
-
-                        created_dt = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                        created_ts = created_dt.timestamp()
-                        if created_ts < since:
-                            continue
-                    except Exception:
-                        pass
-
-            # Apply project filter
-            if project is not None:
-                if metadata.get("metadata", {}).get("project") != project:
-                    continue
-
-            # Apply tag filter
-            if tag is not None:
-                doc_tags = metadata.get("tags", [])
-                if tag not in doc_tags:
-                    continue
-
-            # Add to results (deduplicated)
-            docs_by_id[base_doc_id] = metadata
-
-        # Convert to list and sort by created date (newest first)
-        result = list(docs_by_id.values())
-        try:
-            from datetime import datetime
-
-            result.sort(
-                key=lambda x: datetime.fromisoformat(
-                    x.get("created", "").replace("Z", "+00:00")
-                ),
-                reverse=True,
-            )
-        except Exception:
-            pass
-
-        return result
+        self._refresh_memory()
+        return self._catalog.list(
+            since=since, project=project, tag=tag, limit=limit, cursor=cursor
+        )
 
     def delete_memory_documents(self, document_ids: List[str]) -> int:
         """Delete specific memory documents by their document_ids.
 
-        For FAISS, this removes metadata entries and rebuilds the index
-        to exclude deleted documents.
+        For FAISS, this removes metadata entries and tombstones the chunks,
+        without rewriting segments or re-embedding the remaining documents.
 
         Args:
             document_ids: List of document_ids to delete
@@ -542,71 +974,24 @@ class FAISSVectorStore(VectorStoreInterface):
         Returns:
             Number of documents deleted
         """
-        from logging import getLogger
-
-        logger = getLogger(__name__)
-
         if not document_ids:
             return 0
 
-        # Track which chunk IDs to delete
-        chunk_ids_to_delete = set()
+        self._refresh_memory()
 
         # Find all chunk IDs that belong to the documents being deleted
-        for doc_id, metadata in list(self._document_metadata.items()):
-            if metadata.get("document_id") in document_ids:
-                chunk_ids_to_delete.add(doc_id)
+        chunk_ids_to_delete = self._catalog.chunk_ids(document_ids)
 
         if not chunk_ids_to_delete:
             logger.info(f"No chunks found for document_ids: {document_ids}")
             return 0
 
-        # Remove from metadata
-        for chunk_id in chunk_ids_to_delete:
-            self._document_metadata.pop(chunk_id, None)
-
-        # Save updated metadata
-        self._save_metadata()
-
-        # Rebuild index without deleted documents
-        # This is necessary because FAISS doesn't support selective deletion
-        if self.index is not None:
-            try:
-                # Save current metadata backup
-                remaining_docs = {
-                    doc_id: metadata
-                    for doc_id, metadata in self._document_metadata.items()
-                }
-
-                # Clear index
-                self.delete_collection()
-
-                # Rebuild with remaining documents
-                if remaining_docs:
-                    from llama_index.core import Document
-
-                    llama_docs = []
-                    for doc_id, metadata in remaining_docs.items():
-                        llama_doc = Document(
-                            text=metadata.get("text", ""),
-                            metadata=metadata,
-                            id_=doc_id,
-                        )
-                        llama_docs.append(llama_doc)
-
-                    if llama_docs:
-                        self.index = VectorStoreIndex.from_documents(
-                            llama_docs, embed_model=self.embed_model
-                        )
-                        self._save_metadata()
-
-                logger.info(
-                    f"Deleted {len(chunk_ids_to_delete)} chunks from {len(document_ids)} memory documents"
-                )
-            except Exception as e:
-                logger.error(f"Failed to rebuild index after deletion: {e}")
-                raise
+        self._delete_chunks(chunk_ids_to_delete)
+        self.save_index()
 
+        logger.info(
+            f"Deleted {len(chunk_ids_to_delete)} chunks from {len(document_ids)} memory documents"
+        )
         return len(document_ids)
 
     def _matches_filters(
@@ -627,16 +1012,28 @@ class FAISSVectorStore(VectorStoreInterface):
         return True
 
     def _save_metadata(self) -> None:
-        """Save document metadata to disk."""
-        metadata_path = self.config.rag_index_dir / "document_metadata.json"
-        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        """Save memory metadata to disk."""
+        atomic_write_json(
+            self._memory_dir / "document_metadata.json",
+            self._document_metadata,
+        )
+        self._metadata_dirty = False
+
+    def _load_index_config(self) -> None:
+        """Load index configuration (e.g. vector dimension) from disk."""
+        config_path = self._index_dir / "config.json"
 
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(self._document_metadata, f, indent=2)
+        if config_path.exists():
+            try:
+                with open(config_path, "r", encoding="utf-8") as f:
+                    self._vector_dimension = json.load(f).get("vector_dimension")
+            except (json.JSONDecodeError, OSError):
+                self._vector_dimension = None
 
     def _load_metadata(self) -> None:
-        """Load document metadata from disk."""
-        metadata_path = self.config.rag_index_dir / "document_metadata.json"
+        """Load memory metadata from disk."""
+        metadata_path = self._memory_dir / "document_metadata.json"
+        self._document_metadata = {}
 
         if metadata_path.exists():
             try:
@@ -644,3 +1041,4 @@ class FAISSVectorStore(VectorStoreInterface):
                     self._document_metadata = json.load(f)
             except (json.JSONDecodeError, OSError):
                 self._document_metadata = {}
+        self._catalog = MemoryCatalog.from_chunks(self._document_metadata)
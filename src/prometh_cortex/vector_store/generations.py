@@ -0,0 +1,240 @@
+"""Published generations of the local index directory.
+
+Each generation is a complete, self-contained index under
+``<rag_index_dir>/generations/gen-NNNNNN``. A small pointer file names the
+current generation and is replaced atomically, so a rebuild writes a new
+generation while readers keep using the published one, and switching is a
+single rename. The last few published generations are kept for rollback.
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from prometh_cortex.utils.atomic import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+GENERATIONS_DIR = "generations"
+GENERATIONS_POINTER = "generations.json"
+
+# Memories are shared by all generations, so rebuilds and rollbacks keep them
+MEMORY_DIR = "memory"
+
+# Files of an index written before generations, directly in the index root:
+# segments and their manifests, or the LlamaIndex storage before segments
+LEGACY_INDEX_FILES = (
+    "segments",
+    "config.json",
+    "document_metadata.json",
+    "build_manifest.json",
+    "docstore.json",
+    "index_store.json",
+    "graph_store.json",
+    "default__vector_store.json",
+    "image__vector_store.json",
+)
+
+DEFAULT_KEEP_GENERATIONS = 3
+
+
+class GenerationError(Exception):
+    """Raised when a generation cannot be published or rolled back."""
+
+    pass
+
+
+class IndexGenerations:
+    """Generation directories and the pointer to the published one."""
+
+    def __init__(self, root: Path, keep: int = DEFAULT_KEEP_GENERATIONS):
+        """Initialize for an index root.
+
+        Args:
+            root: The configured ``rag_index_dir``
+            keep: Published generations kept for rollback, including the current one
+        """
+        self.root = Path(root)
+        self.keep = max(1, keep)
+
+    @property
+    def directory(self) -> Path:
+        return self.root / GENERATIONS_DIR
+
+    @property
+    def pointer_path(self) -> Path:
+        return self.root / GENERATIONS_POINTER
+
+    def path(self, name: str) -> Path:
+        """Directory of generation ``name``."""
+        return self.directory / name
+
+    def read_pointer(self) -> Dict[str, Any]:
+        """Published state: {"current": name, "history": [newest first, ...]}."""
+        try:
+            with open(self.pointer_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def pointer_stamp(self) -> Optional[Tuple[int, int]]:
+        """Cheap change marker for the pointer file, or None if unpublished."""
+        try:
+            stat = self.pointer_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def current(self) -> Optional[str]:
+        """Name of the published generation, or None."""
+        return self.read_pointer().get("current")
+
+    def current_path(self) -> Path:
+        """Directory of the published generation.
+
+        An index written before generations existed is read in place from
+        the index root until a writer calls adopt_legacy_layout(). If nothing
+        was published yet, the first generation's path is returned without
+        creating it; publish it with ensure_published().
+        """
+        current = self.current()
+        if current:
+            return self.path(current)
+        if self.has_legacy_layout():
+            return self.root
+        return self.path(self._name(1))
+
+    def has_legacy_layout(self) -> bool:
+        """Whether the index root holds an unpublished index from before generations."""
+        return self.current() is None and any(
+            (self.root / name).exists() for name in LEGACY_INDEX_FILES
+        )
+
+    def adopt_legacy_layout(self) -> Optional[str]:
+        """Move an index written before generations into the first generation.
+
+        Only the files of such an index are moved; anything else in the index
+        root is left alone. Call this before writing, never from readers.
+
+        Returns:
+            The published generation, or None if there was nothing to move
+        """
+        if not self.has_legacy_layout():
+            return None
+
+        name = self._name(1)
+        target = self.path(name)
+        target.mkdir(parents=True, exist_ok=True)
+        for entry in LEGACY_INDEX_FILES:
+            try:
+                os.replace(self.root / entry, target / entry)
+            except FileNotFoundError:
+                # Not part of this index, or adopted concurrently by another process
+                pass
+        self.publish(name)
+        logger.info(f"Moved existing index into generation {name}")
+        return name
+
+    def ensure_published(self, name: str) -> None:
+        """Publish ``name`` if no generation has been published yet."""
+        if self.current() is None:
+            self.publish(name)
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Published generations still on disk, newest first."""
+        pointer = self.read_pointer()
+        return [
+            {**entry, "current": entry["name"] == pointer.get("current")}
+            for entry in pointer.get("history", [])
+            if self.path(entry["name"]).is_dir()
+        ]
+
+    def create(self) -> str:
+        """Create an empty, unpublished generation directory.
+
+        Returns:
+            Its name
+        """
+        existing = [self._number(path.name) for path in self._generation_dirs()]
+        name = self._name(max(existing, default=0) + 1)
+        self.path(name).mkdir(parents=True)
+        return name
+
+    def publish(self, name: str) -> None:
+        """Atomically make ``name`` the current generation.
+
+        Generations beyond the newest ``keep`` published ones are removed.
+        """
+        if not self.path(name).is_dir():
+            raise GenerationError(f"Generation {name} does not exist")
+
+        pointer = self.read_pointer()
+        history = [entry for entry in pointer.get("history", []) if entry["name"] != name]
+        history.insert(0, {"name": name, "published_at": time.time()})
+        kept, dropped = history[: self.keep], history[self.keep :]
+
+        atomic_write_json(self.pointer_path, {"current": name, "history": kept})
+        logger.info(f"Published index generation {name}")
+
+        for entry in dropped:
+            shutil.rmtree(self.path(entry["name"]), ignore_errors=True)
+
+    def rollback(self, name: Optional[str] = None) -> str:
+        """Publish a previously published generation again.
+
+        Args:
+            name: Generation to restore (default: the one before the current)
+
+        Returns:
+            The generation now current
+        """
+        history = self.history()
+        candidates = [entry["name"] for entry in history if not entry["current"]]
+        if name is None:
+            if not candidates:
+                raise GenerationError("No previous generation to roll back to")
+            name = candidates[0]
+        elif name not in {entry["name"] for entry in history}:
+            raise GenerationError(f"Generation {name} is not available for rollback")
+
+        self.publish(name)
+        return name
+
+    def is_published(self, name: str) -> bool:
+        return any(entry["name"] == name for entry in self.read_pointer().get("history", []))
+
+    def discard_unpublished(self, keep: Optional[str] = None) -> None:
+        """Remove generations that were created but never published.
+
+        Args:
+            keep: A generation to leave in place (e.g. one being resumed)
+        """
+        published = {entry["name"] for entry in self.read_pointer().get("history", [])}
+        for path in self._generation_dirs():
+            if path.name not in published and path.name != keep:
+                logger.info(f"Removing unpublished generation {path.name}")
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _generation_dirs(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            path
+            for path in self.directory.iterdir()
+            if path.is_dir() and path.name.startswith("gen-")
+        )
+
+    @staticmethod
+    def _name(number: int) -> str:
+        return f"gen-{number:06d}"
+
+    @staticmethod
+    def _number(name: str) -> int:
+        try:
+            return int(name.split("-", 1)[1])
+        except (IndexError, ValueError):
+            return 0
@@ -1,9 +1,13 @@
 """Abstract interface for vector store implementations."""
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -14,6 +18,8 @@ class DocumentChange:
     change_type: str  # 'add', 'update', 'delete'
     file_hash: Optional[str] = None
     modified_time: Optional[float] = None
+    # Chunk id -> text hash of the file's chunks, for reusing their vectors
+    chunks: Optional[Dict[str, str]] = None
 
     def __post_init__(self) -> None:
         """Validate change type."""
@@ -22,6 +28,46 @@ class DocumentChange:
             raise ValueError(f"change_type must be one of {valid_types}")
 
 
+def project_result(
+    result: Dict[str, Any],
+    chunk_id: str,
+    fields: Optional[List[str]] = None,
+    include_text: bool = True,
+) -> Dict[str, Any]:
+    """Reduce a query result to the requested metadata fields and text.
+
+    Args:
+        result: Result with ``content``, ``metadata`` and ``source_file``
+        chunk_id: ID of the result's chunk
+        fields: Metadata fields to keep (None = all)
+        include_text: Keep ``content``; otherwise it is None and the result
+            carries ``chunk_id`` so its text can be fetched later
+
+    Returns:
+        The result, updated in place
+    """
+    if fields is not None:
+        metadata = result["metadata"]
+        result["metadata"] = {key: metadata[key] for key in fields if key in metadata}
+    if not include_text:
+        result["content"] = None
+        result["chunk_id"] = chunk_id
+    return result
+
+
+def _textless_chunk_ids(results: List[Dict[str, Any]]) -> List[str]:
+    return [result["chunk_id"] for result in results if result.get("content") is None]
+
+
+def _hydrated(
+    results: List[Dict[str, Any]], texts: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    for result in results:
+        if result.get("content") is None and "chunk_id" in result:
+            result["content"] = texts.get(result.pop("chunk_id"), "")
+    return results
+
+
 class VectorStoreInterface(ABC):
     """Abstract interface for vector store implementations."""
 
@@ -111,6 +157,9 @@ class VectorStoreInterface(ABC):
         query_vector: List[float],
         top_k: int = 10,
         filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+        query_text: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Search for similar vectors with optional metadata filters.
 
@@ -118,12 +167,103 @@ class VectorStoreInterface(ABC):
             query_vector: Query vector for similarity search
             top_k: Number of results to return
             filters: Optional metadata filters
+            fields: Metadata fields to return (None = all)
+            include_text: Return chunk text; without it ``content`` is None
+                and each result carries a ``chunk_id`` for hydrate_text()
+            query_text: Text the vector was embedded from, for stores that
+                also search lexically
 
         Returns:
             List of similar documents with metadata and scores
         """
         pass
 
+    async def aquery(
+        self,
+        query_vector: List[float],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+        query_text: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async query() for servers running on an event loop.
+
+        Stores without a native async client run query() in a worker thread
+        so the event loop is never blocked.
+        """
+        return await asyncio.to_thread(
+            self.query, query_vector, top_k, filters, fields, include_text, query_text
+        )
+
+    @abstractmethod
+    def fetch_texts(self, chunk_ids: List[str]) -> Dict[str, str]:
+        """Get the text of chunks by ID.
+
+        Args:
+            chunk_ids: ``chunk_id`` values of text-less query results
+
+        Returns:
+            Chunk id -> text, for the chunks that exist
+        """
+        pass
+
+    @abstractmethod
+    def fetch_vectors(self, chunk_ids: List[str]) -> Dict[str, Tuple[str, Any]]:
+        """Get the stored text and vector of chunks by ID.
+
+        Lets re-indexing reuse the vectors of chunks whose text is unchanged.
+
+        Args:
+            chunk_ids: Chunk IDs as given to add_documents()
+
+        Returns:
+            Chunk id -> (text, vector), for the chunks that exist
+        """
+        pass
+
+    def delete_chunks(self, chunk_ids: List[str]) -> None:
+        """Delete individual chunks by ID.
+
+        Args:
+            chunk_ids: Chunk IDs as given to add_documents()
+        """
+        for chunk_id in chunk_ids:
+            self.delete_document(chunk_id)
+
+    async def afetch_texts(self, chunk_ids: List[str]) -> Dict[str, str]:
+        """Async fetch_texts(); runs it in a worker thread by default."""
+        return await asyncio.to_thread(self.fetch_texts, chunk_ids)
+
+    def hydrate_text(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in the text of results queried with ``include_text=False``.
+
+        Lets callers search wide without text, filter and truncate, and then
+        fetch text for the final results only.
+        """
+        return _hydrated(results, self.fetch_texts(_textless_chunk_ids(results)))
+
+    async def ahydrate_text(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async hydrate_text()."""
+        return _hydrated(results, await self.afetch_texts(_textless_chunk_ids(results)))
+
+    async def aadd_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """Async add_documents(); runs it in a worker thread by default."""
+        await asyncio.to_thread(self.add_documents, documents)
+
+    async def adelete(self, document_ids: List[str]) -> None:
+        """Delete documents by ID without blocking the event loop.
+
+        Args:
+            document_ids: Document identifiers, as accepted by delete_document()
+        """
+
+        def delete_all() -> None:
+            for document_id in document_ids:
+                self.delete_document(document_id)
+
+        await asyncio.to_thread(delete_all)
+
     @abstractmethod
     def get_stats(self) -> Dict[str, Any]:
         """Get vector store statistics and health info.
@@ -133,6 +273,100 @@ class VectorStoreInterface(ABC):
         """
         pass
 
+    def begin_bulk_load(self, memory_limit_bytes: int) -> None:
+        """Prepare for a streaming build with bounded memory.
+
+        Stores that buffer writes in memory flush them to disk as needed to
+        stay within ``memory_limit_bytes`` until end_bulk_load(). Stores that
+        write through on every add_documents() call need not override this.
+
+        Args:
+            memory_limit_bytes: Budget for buffered writes
+        """
+        pass
+
+    def end_bulk_load(self) -> None:
+        """Finish a streaming build started with begin_bulk_load()."""
+        pass
+
+    def get_storage_dir(self) -> Path:
+        """Local directory for files that must stay consistent with the index."""
+        return Path(self.config.rag_index_dir)
+
+    def get_generation(self) -> Optional[str]:
+        """Name of the generation being written, or None without generations."""
+        return None
+
+    def begin_generation(self, carry_source: str = "prmth_memory") -> Optional[int]:
+        """Start a new index generation for a full rebuild.
+
+        Stores that support generations write everything after this call to
+        a new generation holding only ``carry_source`` documents, while
+        readers keep using the published one until publish_generation().
+
+        Args:
+            carry_source: Source type copied into the new generation
+
+        Returns:
+            Number of documents carried over, or None if generations are not
+            supported and the caller must clear the index itself
+        """
+        return None
+
+    def resume_generation(self, name: str) -> bool:
+        """Continue writing to an unpublished generation of an interrupted build.
+
+        Returns:
+            Whether the generation was resumed
+        """
+        return False
+
+    def discard_unpublished_generations(self) -> None:
+        """Remove generations left unpublished by interrupted rebuilds."""
+        pass
+
+    def publish_generation(self) -> Optional[str]:
+        """Atomically publish the generation started by begin_generation().
+
+        Returns:
+            Name of the published generation, or None if none was started
+        """
+        return None
+
+    def refresh_generation(self) -> bool:
+        """Switch to a generation published by another process.
+
+        Returns:
+            Whether the store switched generations
+        """
+        return False
+
+    def migrate_layout(self) -> bool:
+        """Move an index written in an older on-disk layout to the current one.
+
+        Called by writers before they change the index; readers use older
+        layouts in place.
+
+        Returns:
+            Whether the index was moved
+        """
+        return False
+
+    @abstractmethod
+    def iter_chunks(
+        self, batch_size: int = 1024
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """Yield every stored chunk with its vector, for exports.
+
+        Args:
+            batch_size: Chunks per batch
+
+        Yields:
+            ``(records, vectors)``: chunk dicts with 'id', 'text' and
+            'metadata' keys, and one float32 vector row per chunk
+        """
+        pass
+
     @abstractmethod
     def delete_collection(self) -> None:
         """Delete the entire collection/index."""
@@ -176,15 +410,21 @@ class VectorStoreInterface(ABC):
         since: Optional[float] = None,
         project: Optional[str] = None,
         tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List memory documents with optional filtering.
 
-        Returns one entry per unique document_id (deduplicated across chunks).
+        Returns one entry per unique document_id (deduplicated across chunks),
+        newest first.
 
         Args:
             since: Unix timestamp - only include docs created after this time
-            project: Filter by metadata.project value
+            project: Filter by project value
             tag: Filter by tag value
+            limit: Maximum number of documents to return
+            cursor: Continue after the last document of a previous page,
+                as returned by ``memory_cursor()``
 
         Returns:
             List of memory documents with metadata, deduplicated by document_id
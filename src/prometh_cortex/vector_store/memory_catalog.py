@@ -0,0 +1,224 @@
+"""In-memory catalog of memory documents for fast, paginated listing.
+
+Memory chunks are stored per chunk, but memories are listed per document,
+newest first, filtered by creation time, project and tag. The catalog keeps
+one entry per ``document_id`` with its creation timestamp parsed once, a
+sorted ``(created_ts, document_id)`` index and secondary indexes on project
+and tag. Listing the newest page, or everything since a point in time, is a
+binary search followed by a walk over the returned entries only.
+
+Pages are continued with a cursor naming the last entry returned (see
+``memory_cursor``); the cursor is a position in the ordering, so pages stay
+consistent while memories are added or deleted between calls.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Memories without a readable creation time sort after all dated ones
+UNDATED = float("-inf")
+
+CatalogKey = Tuple[float, str]
+
+
+def created_timestamp(metadata: Dict[str, Any]) -> Optional[float]:
+    """Unix timestamp a memory was created at, or None if unknown.
+
+    Uses the stored ``created_ts`` when present, else parses ``created``.
+    """
+    created_ts = metadata.get("created_ts")
+    if isinstance(created_ts, (int, float)):
+        return float(created_ts)
+    created = metadata.get("created")
+    if not isinstance(created, str) or not created:
+        return None
+    try:
+        return datetime.fromisoformat(created.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def memory_project(metadata: Dict[str, Any]) -> Optional[str]:
+    """Project of a memory.
+
+    Memory metadata is merged into the chunk metadata, so the project is a
+    top-level field; some older memories nested it under ``metadata``.
+    """
+    project = metadata.get("project")
+    if project is None and isinstance(metadata.get("metadata"), dict):
+        project = metadata["metadata"].get("project")
+    return project
+
+
+def memory_cursor(memory: Dict[str, Any]) -> str:
+    """Cursor continuing a listing after ``memory``.
+
+    Args:
+        memory: The last memory of the previous page
+
+    Returns:
+        An opaque cursor string for ``list(cursor=...)``
+    """
+    timestamp = created_timestamp(memory)
+    return f"{UNDATED if timestamp is None else timestamp!r}:{memory['document_id']}"
+
+
+def parse_memory_cursor(cursor: str) -> CatalogKey:
+    """Decode a cursor produced by ``memory_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    timestamp, separator, document_id = cursor.partition(":")
+    if not separator or not document_id:
+        raise ValueError(f"Invalid memory cursor: {cursor!r}")
+    return float(timestamp), document_id
+
+
+class MemoryCatalog:
+    """Memory documents keyed by document_id, ordered by creation time."""
+
+    def __init__(self):
+        # document_id -> {"key", "metadata", "chunks"}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._chunk_documents: Dict[str, str] = {}
+        # (created_ts, document_id), ascending
+        self._by_created: List[CatalogKey] = []
+        self._by_project: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def from_chunks(cls, chunks: Dict[str, Dict[str, Any]]) -> "MemoryCatalog":
+        """Build a catalog from chunk id -> chunk metadata."""
+        catalog = cls()
+        for chunk_id, metadata in chunks.items():
+            catalog.add(chunk_id, metadata)
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, document_id: object) -> bool:
+        return document_id in self._entries
+
+    def add(self, chunk_id: str, metadata: Dict[str, Any]) -> None:
+        """Record one memory chunk; the first chunk seen describes the document."""
+        document_id = metadata.get("document_id", chunk_id)
+        self._chunk_documents[chunk_id] = document_id
+        entry = self._entries.get(document_id)
+        if entry is not None:
+            entry["chunks"].add(chunk_id)
+            return
+
+        timestamp = created_timestamp(metadata)
+        key = (UNDATED if timestamp is None else timestamp, document_id)
+        self._entries[document_id] = {
+            "key": key,
+            "metadata": metadata,
+            "chunks": {chunk_id},
+        }
+        insort(self._by_created, key)
+
+        project = memory_project(metadata)
+        if project is not None:
+            self._by_project.setdefault(project, set()).add(document_id)
+        for tag in metadata.get("tags") or []:
+            self._by_tag.setdefault(tag, set()).add(document_id)
+
+    def remove_chunks(self, chunk_ids: Iterable[str]) -> None:
+        """Forget chunks; a document goes once its last chunk is removed."""
+        for chunk_id in chunk_ids:
+            document_id = self._chunk_documents.pop(chunk_id, None)
+            entry = self._entries.get(document_id)
+            if entry is None:
+                continue
+            entry["chunks"].discard(chunk_id)
+            if not entry["chunks"]:
+                self._remove_document(document_id)
+
+    def chunk_ids(self, document_ids: Iterable[str]) -> Set[str]:
+        """All chunk ids of the given documents."""
+        chunks: Set[str] = set()
+        for document_id in document_ids:
+            entry = self._entries.get(document_id)
+            if entry is not None:
+                chunks |= entry["chunks"]
+        return chunks
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """Metadata describing a memory document, or None."""
+        entry = self._entries.get(document_id)
+        return entry["metadata"] if entry is not None else None
+
+    def list(
+        self,
+        since: Optional[float] = None,
+        project: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Memory documents, newest first.
+
+        Args:
+            since: Unix timestamp - only include docs created at or after this time
+            project: Filter by project
+            tag: Filter by tag
+            limit: Maximum number of documents to return
+            cursor: Continue after the entry named by ``memory_cursor``
+
+        Returns:
+            Metadata of the matching documents
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        keys = self._by_created
+        if project is not None or tag is not None:
+            # Only the documents matching the secondary indexes are ordered
+            candidates = None
+            if project is not None:
+                candidates = set(self._by_project.get(project, ()))
+            if tag is not None:
+                tagged = self._by_tag.get(tag, set())
+                candidates = tagged.copy() if candidates is None else candidates & tagged
+            keys = sorted(self._entries[document_id]["key"] for document_id in candidates)
+
+        start = 0 if since is None else bisect_left(keys, (since, ""))
+        end = len(keys)
+        if cursor is not None:
+            end = max(start, bisect_left(keys, parse_memory_cursor(cursor)))
+
+        result = []
+        for key in self._newest_first(keys, start, end):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(self._entries[key[1]]["metadata"])
+        return result
+
+    @staticmethod
+    def _newest_first(keys: List[CatalogKey], start: int, end: int) -> Iterator[CatalogKey]:
+        for position in range(end - 1, start - 1, -1):
+            yield keys[position]
+
+    def _remove_document(self, document_id: str) -> None:
+        entry = self._entries.pop(document_id)
+        position = bisect_left(self._by_created, entry["key"])
+        if position < len(self._by_created) and self._by_created[position] == entry["key"]:
+            del self._by_created[position]
+
+        metadata = entry["metadata"]
+        project = memory_project(metadata)
+        if project is not None:
+            self._discard(self._by_project, project, document_id)
+        for tag in metadata.get("tags") or []:
+            self._discard(self._by_tag, tag, document_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], value: str, document_id: str) -> None:
+        members = index.get(value)
+        if members is not None:
+            members.discard(document_id)
+            if not members:
+                del index[value]
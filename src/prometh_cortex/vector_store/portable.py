@@ -0,0 +1,174 @@
+"""Portable index exports, readable by every vector store backend.
+
+An export is one directory:
+
+- ``manifest.json``: format version, embedding model, vector dimension,
+  source backend, chunk count and the list of shards; written last, so a
+  directory without it is an incomplete export
+- ``vectors-<n>.npy``: (rows, dimension) float16 vectors of shard ``n``
+- ``chunks-<n>.jsonl``: one ``{"id", "text", "metadata"}`` object per row
+  of shard ``n``, in the same order
+- ``build_manifest.json``: the file hashes of the exported build, so an
+  incremental build after an import only re-indexes changed files
+
+Shards bound the memory used on both sides; vectors are loaded memory-mapped
+and converted to float32 one batch at a time.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from prometh_cortex.utils.atomic import atomic_write_json
+
+EXPORT_FORMAT = "prometh-cortex-index"
+EXPORT_VERSION = 1
+EXPORT_MANIFEST = "manifest.json"
+EXPORT_BUILD_MANIFEST = "build_manifest.json"
+
+# Chunks per shard file
+EXPORT_SHARD_SIZE = 32768
+
+
+class ExportFormatError(Exception):
+    """Raised when a directory is not a complete, readable index export."""
+
+
+class IndexExportWriter:
+    """Write chunks and their vectors to an export directory in shards."""
+
+    def __init__(self, directory: Union[str, Path], header: Dict[str, Any]):
+        """Start an export.
+
+        Args:
+            directory: Export directory; must not exist or be empty
+            header: Manifest fields describing the index (embedding_model,
+                dimension, source_backend)
+
+        Raises:
+            ExportFormatError: If the directory already has files
+        """
+        self.directory = Path(directory)
+        if self.directory.exists() and any(self.directory.iterdir()):
+            raise ExportFormatError(f"Export directory is not empty: {self.directory}")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.header = header
+        self.chunks = 0
+        self._shards: List[Dict[str, Any]] = []
+        self._records: List[Dict[str, Any]] = []
+        self._vectors: List[np.ndarray] = []
+
+    def write(self, records: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        """Add chunks ``{"id", "text", "metadata"}`` with one vector row each."""
+        vectors = np.asarray(vectors, dtype=np.float16)
+        for start in range(0, len(records), EXPORT_SHARD_SIZE):
+            self._records.extend(records[start : start + EXPORT_SHARD_SIZE])
+            self._vectors.append(vectors[start : start + EXPORT_SHARD_SIZE])
+            if len(self._records) >= EXPORT_SHARD_SIZE:
+                self._flush_shard()
+
+    def write_build_manifest(self, entries: Dict[str, Any]) -> None:
+        """Store the build's file hashes with the export."""
+        atomic_write_json(self.directory / EXPORT_BUILD_MANIFEST, entries)
+
+    def close(self) -> Dict[str, Any]:
+        """Write the last shard and the manifest that completes the export.
+
+        Returns:
+            The manifest
+        """
+        if self._records:
+            self._flush_shard()
+        manifest = {
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_VERSION,
+            "created": time.time(),
+            **self.header,
+            "vector_dtype": "float16",
+            "chunks": self.chunks,
+            "shards": self._shards,
+        }
+        atomic_write_json(self.directory / EXPORT_MANIFEST, manifest)
+        return manifest
+
+    def _flush_shard(self) -> None:
+        number = len(self._shards)
+        vectors_file = f"vectors-{number:05d}.npy"
+        chunks_file = f"chunks-{number:05d}.jsonl"
+        vectors = np.vstack(self._vectors)
+
+        with open(self.directory / chunks_file, "w", encoding="utf-8") as f:
+            for record in self._records:
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+        np.save(self.directory / vectors_file, vectors)
+
+        self._shards.append(
+            {"vectors": vectors_file, "chunks": chunks_file, "count": len(self._records)}
+        )
+        self.chunks += len(self._records)
+        self._records, self._vectors = [], []
+
+
+def read_export_manifest(directory: Union[str, Path]) -> Dict[str, Any]:
+    """Manifest of an export directory.
+
+    Raises:
+        ExportFormatError: If the directory is not a complete export
+    """
+    path = Path(directory) / EXPORT_MANIFEST
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise ExportFormatError(f"No export manifest in {directory} (incomplete export?)")
+    except json.JSONDecodeError as e:
+        raise ExportFormatError(f"Unreadable export manifest: {e}")
+
+    if manifest.get("format") != EXPORT_FORMAT:
+        raise ExportFormatError(f"{directory} is not a prometh-cortex index export")
+    if manifest.get("version") != EXPORT_VERSION:
+        raise ExportFormatError(f"Unsupported export version: {manifest.get('version')}")
+    return manifest
+
+
+def read_export_build_manifest(directory: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """File hashes stored with an export, if any."""
+    path = Path(directory) / EXPORT_BUILD_MANIFEST
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_export(
+    directory: Union[str, Path], batch_size: int = 1024
+) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+    """Yield ``(records, float32 vectors)`` batches of an export in order.
+
+    Raises:
+        ExportFormatError: If the export is incomplete or its files disagree
+    """
+    directory = Path(directory)
+    manifest = read_export_manifest(directory)
+    for shard in manifest["shards"]:
+        try:
+            vectors = np.load(directory / shard["vectors"], mmap_mode="r")
+            with open(directory / shard["chunks"], "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+        except (OSError, ValueError) as e:
+            raise ExportFormatError(f"Unreadable export shard {shard['chunks']}: {e}")
+
+        if not (len(records) == vectors.shape[0] == shard["count"]):
+            raise ExportFormatError(f"Export shard {shard['chunks']} is incomplete")
+        if vectors.ndim != 2 or vectors.shape[1] != manifest["dimension"]:
+            raise ExportFormatError(f"Export shard {shard['vectors']} has the wrong shape")
+
+        for start in range(0, len(records), batch_size):
+            yield (
+                records[start : start + batch_size],
+                np.asarray(vectors[start : start + batch_size], dtype=np.float32),
+            )
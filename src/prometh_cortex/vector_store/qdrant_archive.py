@@ -0,0 +1,177 @@
+"""Binary archive of Qdrant points for backup and restore without re-embedding.
+
+An archive is a single file of frames. Each frame is a one-byte kind, a
+4-byte little-endian length and a body:
+
+- ``H`` header: JSON with the format version, embedding model, vector
+  dimension and creation time
+- ``P`` page: zlib-compressed; a 4-byte JSON length, the JSON ids, payloads
+  and sparse vectors of the page's points, then their dense vectors as
+  little-endian float32 rows
+- ``E`` end: JSON with the number of points written
+
+Readers stop with an error when the end frame is missing or its count does
+not match, so a truncated archive is never restored as if it were complete.
+"""
+
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from prometh_cortex.utils.atomic import fsync_directory
+
+ARCHIVE_MAGIC = b"PCORTEX-QDRANT\n"
+ARCHIVE_VERSION = 1
+
+_FRAME = struct.Struct("<cI")
+_JSON_LENGTH = struct.Struct("<I")
+
+
+class ArchiveError(Exception):
+    """Raised when an archive is malformed or incomplete."""
+
+
+class ArchivePage:
+    """Points of one archive page."""
+
+    def __init__(
+        self,
+        ids: List[Any],
+        payloads: List[Dict[str, Any]],
+        vectors: np.ndarray,
+        sparse: Optional[List[Optional[Dict[str, List]]]] = None,
+    ):
+        self.ids = ids
+        self.payloads = payloads
+        self.vectors = vectors
+        self.sparse = sparse or [None] * len(ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class ArchiveWriter:
+    """Write an archive to a temporary file, renamed into place on close()."""
+
+    def __init__(self, path: Union[str, Path], header: Dict[str, Any]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._temp_path = tempfile.mkstemp(
+            prefix=f".{self.path.name}.", suffix=".tmp", dir=str(self.path.parent)
+        )
+        self._file: BinaryIO = os.fdopen(fd, "wb")
+        self.points = 0
+        self._file.write(ARCHIVE_MAGIC)
+        self._write_frame(
+            b"H",
+            json.dumps(
+                {"version": ARCHIVE_VERSION, "created": time.time(), **header}
+            ).encode("utf-8"),
+        )
+
+    def write_page(self, page: ArchivePage) -> None:
+        """Append one page of points."""
+        meta = json.dumps(
+            {"ids": page.ids, "payloads": page.payloads, "sparse": page.sparse}
+        ).encode("utf-8")
+        vectors = np.ascontiguousarray(page.vectors, dtype="<f4").tobytes()
+        body = zlib.compress(_JSON_LENGTH.pack(len(meta)) + meta + vectors, 1)
+        self._write_frame(b"P", body)
+        self.points += len(page)
+
+    def close(self) -> None:
+        """Finish the archive and publish it atomically."""
+        self._write_frame(b"E", json.dumps({"points": self.points}).encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+        fsync_directory(self.path.parent)
+
+    def abort(self) -> None:
+        """Discard a partially written archive."""
+        self._file.close()
+        try:
+            os.unlink(self._temp_path)
+        except FileNotFoundError:
+            pass
+
+    def _write_frame(self, kind: bytes, body: bytes) -> None:
+        self._file.write(_FRAME.pack(kind, len(body)))
+        self._file.write(body)
+
+
+def read_archive_header(path: Union[str, Path]) -> Dict[str, Any]:
+    """Header of an archive, without reading its pages.
+
+    Raises:
+        ArchiveError: If the file is not an archive
+    """
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def iter_archive(path: Union[str, Path]) -> Iterator[ArchivePage]:
+    """Yield the pages of an archive in order.
+
+    Raises:
+        ArchiveError: If the archive is malformed or truncated
+    """
+    with open(path, "rb") as f:
+        dimension = _read_header(f)["dimension"]
+        points = 0
+        while True:
+            kind, body = _read_frame(f)
+            if kind == b"E":
+                expected = json.loads(body)["points"]
+                if expected != points:
+                    raise ArchiveError(f"Archive holds {points} points, expected {expected}")
+                return
+            if kind != b"P":
+                raise ArchiveError(f"Unexpected archive frame {kind!r}")
+            page = _decode_page(zlib.decompress(body), dimension)
+            points += len(page)
+            yield page
+
+
+def _read_header(f: BinaryIO) -> Dict[str, Any]:
+    if f.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+        raise ArchiveError("Not a prometh-cortex Qdrant archive")
+    kind, body = _read_frame(f)
+    if kind != b"H":
+        raise ArchiveError("Archive header missing")
+    header = json.loads(body)
+    if header.get("version") != ARCHIVE_VERSION:
+        raise ArchiveError(f"Unsupported archive version: {header.get('version')}")
+    return header
+
+
+def _read_frame(f: BinaryIO) -> Tuple[bytes, bytes]:
+    prefix = f.read(_FRAME.size)
+    if len(prefix) < _FRAME.size:
+        raise ArchiveError("Archive is truncated")
+    kind, length = _FRAME.unpack(prefix)
+    body = f.read(length)
+    if len(body) < length:
+        raise ArchiveError("Archive is truncated")
+    return kind, body
+
+
+def _decode_page(data: bytes, dimension: int) -> ArchivePage:
+    (meta_length,) = _JSON_LENGTH.unpack_from(data)
+    start = _JSON_LENGTH.size
+    meta = json.loads(data[start : start + meta_length])
+    vectors = np.frombuffer(data, dtype="<f4", offset=start + meta_length)
+    return ArchivePage(
+        meta["ids"],
+        meta["payloads"],
+        vectors.reshape(len(meta["ids"]), dimension),
+        meta["sparse"],
+    )
@@ -1,26 +1,150 @@
-"""Qdrant vector store implementation."""
-
+"""Qdrant vector store implementation.
+
+The configured collection name is an alias for a versioned collection
+(``<name>_v<n>``). Force rebuilds fill a fresh version and switch the alias
+atomically, so readers never see a partially rebuilt collection. The
+previous version stays behind a ``<collection>_retired_<unix time>`` alias
+until its grace period ends and is then dropped. Memory points are always
+written to the live collection and copied into a rebuilt one just before
+the switch, so memories saved during a rebuild are kept.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import queue
+import re
+import threading
 import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
-from qdrant_client import QdrantClient
+import httpx
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    CollectionConfig,
+    CollectionInfo,
+    CollectionParamsDiff,
     CollectionStatus,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Direction,
+    Disabled,
     Distance,
     FieldCondition,
     Filter,
+    Fusion,
+    FusionQuery,
+    HnswConfigDiff,
+    IsEmptyCondition,
+    KeywordIndexParams,
     MatchAny,
     MatchValue,
+    Modifier,
+    OrderBy,
+    PayloadField,
+    PayloadIndexInfo,
     PayloadSchemaType,
+    PayloadSelectorExclude,
+    PointIdsList,
     PointStruct,
+    Prefetch,
+    QuantizationSearchParams,
     Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     SearchRequest,
+    SparseVector,
+    SparseVectorParams,
     VectorParams,
+    VectorParamsDiff,
+)
+
+from prometh_cortex.embedding import (
+    get_embedding_dimension,
+    get_embedding_model_for_config,
 )
+from prometh_cortex.utils.atomic import atomic_write_json
+
+from .interface import DocumentChange, VectorStoreInterface, project_result
+from .memory_catalog import MemoryCatalog, created_timestamp, parse_memory_cursor
+from .qdrant_archive import ArchivePage, ArchiveWriter, iter_archive, read_archive_header
+from .sparse import document_sparse_vector, query_sparse_vector
+
+logger = logging.getLogger(__name__)
+
+# Retired collections stay available this long after an alias switch, for
+# requests still running against them
+RETIRED_COLLECTION_GRACE_SECONDS = 600
+
+# Vector names of hybrid collections; older collections hold one unnamed
+# dense vector
+DENSE_VECTOR = "dense"
+SPARSE_VECTOR = "bm25"
+
+# Candidates each retriever passes to hybrid fusion, per requested result
+HYBRID_PREFETCH_MULTIPLIER = 4
+
+# Points per scroll page and upsert batch when archiving
+ARCHIVE_PAGE_SIZE = 512
+
+# Payload indexes for fields used in filtering
+PAYLOAD_INDEX_FIELDS = {
+    "source_type": PayloadSchemaType.KEYWORD,
+    # Chunk or memory id, and the parent file of indexed chunks
+    "document_id": PayloadSchemaType.KEYWORD,
+    "file_path": PayloadSchemaType.KEYWORD,
+    "file_name": PayloadSchemaType.KEYWORD,
+    "tags": PayloadSchemaType.KEYWORD,
+    "project": PayloadSchemaType.KEYWORD,
+    "chunk_index": PayloadSchemaType.INTEGER,
+    # Ordered memory listing (scroll order_by) needs a range index
+    "created_ts": PayloadSchemaType.FLOAT,
+}
+
+# Settings that shape the collection; a change forces a full setup
+SCHEMA_SETTINGS = (
+    "qdrant_quantization",
+    "qdrant_quantization_always_ram",
+    "qdrant_hnsw_m",
+    "qdrant_hnsw_ef_construct",
+    "qdrant_on_disk_vectors",
+    "qdrant_on_disk_payload",
+    "qdrant_tenant_index",
+    "qdrant_hybrid",
+)
+
+# Schema fingerprints of set-up collections, in the index directory
+SCHEMA_CACHE_FILE = "qdrant_schema.json"
+
+# Readiness polling backs off from a short first wait
+READY_POLL_INITIAL_SECONDS = 0.05
+READY_POLL_MAX_SECONDS = 1.0
 
-from .interface import DocumentChange, VectorStoreInterface
+# Payload fields returned when listing memories; chunk text is never read
+MEMORY_LIST_FIELDS = [
+    "document_id",
+    "title",
+    "tags",
+    "created",
+    "created_ts",
+    "project",
+    "author",
+    "source_type",
+    "total_chunks",
+]
 
 
 class QdrantVectorStore(VectorStoreInterface):
@@ -34,42 +158,110 @@ class QdrantVectorStore(VectorStoreInterface):
             embed_model: Pre-initialized embedding model
         """
         self.config = config
-        self.embed_model = embed_model
+        self._embed_model = embed_model
+        self._vector_dimension: Optional[int] = None
         self.client: Optional[QdrantClient] = None
-        self.collection_name = config.qdrant_collection_name
+        self._async_client: Optional[AsyncQdrantClient] = None
+        # Reads and writes go through the alias, except during a rebuild
+        self.alias_name = config.qdrant_collection_name
+        self.collection_name = self.alias_name
+        # Unpublished collection being rebuilt, if any
+        self._staging: Optional[str] = None
+        # Collection name -> whether it has the hybrid vector layout
+        self._hybrid_layouts: Dict[str, bool] = {}
         self._initialized = False
 
-        # Get embedding dimension
-        if embed_model:
-            test_embedding = embed_model.get_text_embedding("test")
-            self.vector_dimension = len(test_embedding)
-        else:
-            # Default for all-MiniLM-L6-v2
-            self.vector_dimension = 384
+    @property
+    def embed_model(self):
+        """Embedding model, loaded on first embed rather than at construction."""
+        if self._embed_model is None:
+            self._embed_model = get_embedding_model_for_config(self.config)
+        return self._embed_model
 
-    def initialize(self) -> None:
-        """Initialize the vector store connection and setup."""
-        try:
-            # Create Qdrant client
-            self.client = QdrantClient(
-                host=self.config.qdrant_host,
-                port=self.config.qdrant_port,
-                api_key=self.config.qdrant_api_key,
-                https=self.config.qdrant_use_https,
-                timeout=30.0,
-            )
+    @property
+    def vector_dimension(self) -> Optional[int]:
+        """Vector dimension of the collection.
+
+        Read from the existing collection's config when connected; the
+        embedding model is only probed when a new collection must be created.
+        Returns None if not yet known.
+        """
+        if self._vector_dimension is None and self._initialized:
+            self._vector_dimension = self._get_collection_dimension()
+        return self._vector_dimension
 
-            # Test connection
-            self.client.get_collections()
+    def initialize(self) -> None:
+        """Initialize the vector store connection and setup.
 
-            # Create collection if it doesn't exist
-            self._ensure_collection_exists()
+        A single ``get_collection`` request is enough on a warm start: when
+        the collection's config and payload indexes still match the
+        fingerprint cached by the last full setup, reconciling settings,
+        creating indexes and backfilling memories are all skipped.
+        """
+        try:
+            self.client = self._create_client()
+
+            info = self._get_live_collection()
+            if info is not None:
+                self._hybrid_layouts[self.alias_name] = self._has_sparse_vectors(info)
+            if info is not None and self._schema_fingerprint(info) == (
+                self._cached_schema_fingerprint()
+            ):
+                if not self._collection_ready(info):
+                    self._wait_for_collection_ready()
+            else:
+                # Create the collection, or bring its schema up to date
+                if self._ensure_collection_exists(info):
+                    self._backfill_memory_timestamps()
+                    self._cache_schema_fingerprint()
 
             self._initialized = True
 
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Qdrant client: {e}")
 
+    def _create_client(self) -> QdrantClient:
+        """Connect to the configured Qdrant server."""
+        return QdrantClient(**self._client_options())
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        """Async client for the servers' event loop, connected on first use.
+
+        The collection is set up by initialize() through the sync client.
+        """
+        if not self._initialized:
+            self.initialize()
+        if self._async_client is None:
+            self._async_client = self._create_async_client()
+        return self._async_client
+
+    def _create_async_client(self) -> AsyncQdrantClient:
+        return AsyncQdrantClient(**self._client_options())
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Connection settings shared by the sync and async clients."""
+        pool_size = self.config.qdrant_pool_size
+        return {
+            "host": self.config.qdrant_host,
+            "port": self.config.qdrant_port,
+            "grpc_port": self.config.qdrant_grpc_port,
+            "prefer_grpc": self.config.qdrant_prefer_grpc,
+            "api_key": self.config.qdrant_api_key,
+            "https": self.config.qdrant_use_https,
+            "timeout": self.config.qdrant_timeout,
+            # Keep connections open so concurrent requests do not reconnect
+            "limits": httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+        }
+
+    async def aclose(self) -> None:
+        """Close the async client's connections."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
     def add_documents(self, documents: List[Dict[str, Any]]) -> None:
         """Add documents with vectors and metadata.
 
@@ -82,32 +274,139 @@ class QdrantVectorStore(VectorStoreInterface):
         if not documents:
             return
 
-        points = []
-        for doc in documents:
-            # Generate vector if not provided
-            vector = doc.get("vector")
-            if vector is None and self.embed_model:
-                vector = self.embed_model.get_text_embedding(doc["text"])
-            elif vector is None:
-                raise ValueError("No vector provided and no embedding model available")
+        self._embed_missing(documents)
 
+        # Upload points to Qdrant
+        try:
+            try:
+                self._upsert_documents(documents)
+            except Exception:
+                # The alias may have moved to a collection with another layout
+                if not self._forget_layouts():
+                    raise
+                self._upsert_documents(documents)
+        except Exception as e:
+            raise RuntimeError(f"Failed to add documents to Qdrant: {e}")
+
+    def _upsert_documents(self, documents: List[Dict[str, Any]]) -> None:
+        for collection_name, points in self._points_by_collection(documents).items():
+            self.client.upsert(collection_name=collection_name, points=points)
+
+    async def aadd_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """Add documents through the async client; embedding runs in a thread."""
+        if not documents:
+            return
+
+        client = self.async_client
+        await asyncio.to_thread(self._embed_missing, documents)
+        try:
+            try:
+                await self._aupsert_documents(client, documents)
+            except Exception:
+                if not self._forget_layouts():
+                    raise
+                await self._aupsert_documents(client, documents)
+        except Exception as e:
+            raise RuntimeError(f"Failed to add documents to Qdrant: {e}")
+
+    async def _aupsert_documents(
+        self, client: AsyncQdrantClient, documents: List[Dict[str, Any]]
+    ) -> None:
+        await self._aload_layouts([self.alias_name, self.collection_name])
+        for collection_name, points in self._points_by_collection(documents).items():
+            await client.upsert(collection_name=collection_name, points=points)
+
+    async def _aload_layouts(self, collection_names: List[str]) -> None:
+        """Read unknown vector layouts in a thread, off the event loop."""
+        unknown = [name for name in collection_names if name not in self._hybrid_layouts]
+        for name in unknown:
+            await asyncio.to_thread(self._is_hybrid, name)
+
+    async def adelete(self, document_ids: List[str]) -> None:
+        """Delete documents and their chunks through the async client."""
+        if not document_ids:
+            return
+        try:
+            await self.async_client.delete(
+                collection_name=self.collection_name,
+                points_selector=self._documents_filter(document_ids),
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to delete documents from Qdrant: {e}")
+
+    def _embed_missing(self, documents: List[Dict[str, Any]]) -> None:
+        """Generate vectors not provided, in one batched call."""
+        missing = [doc for doc in documents if doc.get("vector") is None]
+        if missing:
+            vectors = self.embed_model.get_text_embedding_batch(
+                [doc["text"] for doc in missing]
+            )
+            for doc, vector in zip(missing, vectors):
+                doc["vector"] = vector
+
+    def _points_by_collection(
+        self, documents: List[Dict[str, Any]]
+    ) -> Dict[str, List[PointStruct]]:
+        """Points for ``documents``, grouped by the collection they are written to."""
+        points_by_collection: Dict[str, List[PointStruct]] = {}
+        for doc in documents:
+            # Memories go to the live collection, even during a rebuild
+            if doc.get("metadata", {}).get("source_type") == "prmth_memory":
+                collection_name = self.alias_name
+            else:
+                collection_name = self.collection_name
             # Create point
             point = PointStruct(
                 id=self._generate_point_id(doc["id"]),
-                vector=vector,
+                vector=self._point_vector(
+                    collection_name, doc["vector"], doc["text"], doc.get("sparse")
+                ),
                 payload={
                     "document_id": doc["id"],
                     "text": doc["text"],
                     **doc.get("metadata", {}),
                 },
             )
-            points.append(point)
+            points_by_collection.setdefault(collection_name, []).append(point)
+        return points_by_collection
 
-        # Upload points to Qdrant
-        try:
-            self.client.upsert(collection_name=self.collection_name, points=points)
-        except Exception as e:
-            raise RuntimeError(f"Failed to add documents to Qdrant: {e}")
+    def _point_vector(
+        self,
+        collection_name: str,
+        dense: Any,
+        text: str,
+        sparse: Optional[Any] = None,
+    ) -> Any:
+        """Vector of a point in the layout of ``collection_name``.
+
+        Hybrid collections get the dense vector and the chunk's BM25 sparse
+        vector, computed from ``text`` unless given.
+        """
+        if not self._is_hybrid(collection_name):
+            return dense
+        if sparse is None:
+            sparse = document_sparse_vector(text)
+        if isinstance(sparse, dict):
+            sparse = SparseVector(**sparse)
+        return {DENSE_VECTOR: dense, SPARSE_VECTOR: sparse}
+
+    def _is_hybrid(self, collection_name: str) -> bool:
+        """Whether a collection has the hybrid (named dense + sparse) layout."""
+        if collection_name not in self._hybrid_layouts:
+            self._hybrid_layouts[collection_name] = self._has_sparse_vectors(
+                self.client.get_collection(collection_name)
+            )
+        return self._hybrid_layouts[collection_name]
+
+    @staticmethod
+    def _has_sparse_vectors(info: CollectionInfo) -> bool:
+        return SPARSE_VECTOR in (info.config.params.sparse_vectors or {})
+
+    def _forget_layouts(self) -> bool:
+        """Drop cached vector layouts; returns whether any were cached."""
+        cached = bool(self._hybrid_layouts)
+        self._hybrid_layouts.clear()
+        return cached
 
     def update_document(self, document_id: str, document: Dict[str, Any]) -> None:
         """Update a single document by ID.
@@ -121,15 +420,15 @@ class QdrantVectorStore(VectorStoreInterface):
 
         # Generate vector if not provided
         vector = document.get("vector")
-        if vector is None and self.embed_model:
+        if vector is None:
             vector = self.embed_model.get_text_embedding(document["text"])
-        elif vector is None:
-            raise ValueError("No vector provided and no embedding model available")
 
         # Create point
         point = PointStruct(
             id=self._generate_point_id(document_id),
-            vector=vector,
+            vector=self._point_vector(
+                self.collection_name, vector, document["text"], document.get("sparse")
+            ),
             payload={
                 "document_id": document_id,
                 "text": document["text"],
@@ -152,19 +451,46 @@ class QdrantVectorStore(VectorStoreInterface):
             self.initialize()
 
         try:
-            # Delete by document_id in payload
+            self._delete_documents([document_id])
+        except Exception as e:
+            raise RuntimeError(f"Failed to delete document from Qdrant: {e}")
+
+    def delete_chunks(self, chunk_ids: List[str]) -> None:
+        """Delete chunks by ID in one request."""
+        if not chunk_ids:
+            return
+        if not self._initialized:
+            self.initialize()
+
+        try:
             self.client.delete(
                 collection_name=self.collection_name,
-                points_selector=Filter(
-                    must=[
-                        FieldCondition(
-                            key="document_id", match=MatchValue(value=document_id)
-                        )
-                    ]
+                points_selector=PointIdsList(
+                    points=[self._generate_point_id(chunk_id) for chunk_id in chunk_ids]
                 ),
             )
         except Exception as e:
-            raise RuntimeError(f"Failed to delete document from Qdrant: {e}")
+            raise RuntimeError(f"Failed to delete chunks from Qdrant: {e}")
+
+    def _delete_documents(self, document_ids: List[str]) -> None:
+        """Delete documents and all their chunks in one filtered request.
+
+        A document is matched by its own ``document_id`` or, for chunks of
+        an indexed file, by the parent ``file_path``.
+        """
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=self._documents_filter(document_ids),
+        )
+
+    @staticmethod
+    def _documents_filter(document_ids: List[str]) -> Filter:
+        return Filter(
+            should=[
+                FieldCondition(key="document_id", match=MatchAny(any=document_ids)),
+                FieldCondition(key="file_path", match=MatchAny(any=document_ids)),
+            ]
+        )
 
     def document_exists(self, document_id: str) -> bool:
         """Check if a document exists in the index.
@@ -285,20 +611,24 @@ class QdrantVectorStore(VectorStoreInterface):
 
         stats = {"added": 0, "updated": 0, "deleted": 0, "failed": 0}
 
-        for change in changes:
+        # Deleted and updated files lose their old chunks in one request
+        removed = [
+            change for change in changes if change.change_type in ("delete", "update")
+        ]
+        if removed:
             try:
-                if change.change_type == "delete":
-                    self.delete_document(change.file_path)
-                    stats["deleted"] += 1
-                elif change.change_type in ["add", "update"]:
-                    # Note: Actual document content loading happens at higher level
-                    # This just tracks the change types
-                    if change.change_type == "add":
-                        stats["added"] += 1
-                    else:
-                        stats["updated"] += 1
+                self._delete_documents([change.file_path for change in removed])
             except Exception:
-                stats["failed"] += 1
+                stats["failed"] += len(removed)
+                removed = []
+
+        for change in changes:
+            # Note: Actual document content loading happens at higher level
+            # This just tracks the change types
+            if change.change_type == "add":
+                stats["added"] += 1
+        for change in removed:
+            stats["deleted" if change.change_type == "delete" else "updated"] += 1
 
         return stats
 
@@ -311,20 +641,33 @@ class QdrantVectorStore(VectorStoreInterface):
         if not self._initialized:
             self.initialize()
         # Qdrant persists data automatically to the server
-        # No explicit save needed
+        # No explicit save needed; builds end here, so drop expired collections
+        self._drop_retired_collections()
 
     def query(
         self,
         query_vector: List[float],
         top_k: int = 10,
         filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+        query_text: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Search for similar vectors with optional metadata filters.
 
+        Only the requested payload is transferred: ``fields`` and
+        ``include_text`` become the request's payload selector. On a hybrid
+        collection, ``query_text`` also drives a BM25 search and both result
+        lists are fused by the server in the same request; scores are then
+        fusion scores rather than cosine similarities.
+
         Args:
             query_vector: Query vector for similarity search
             top_k: Number of results to return
             filters: Optional metadata filters
+            fields: Metadata fields to return (None = all)
+            include_text: Return chunk text
+            query_text: Query text for lexical search on hybrid collections
 
         Returns:
             List of similar documents with metadata and scores
@@ -332,66 +675,209 @@ class QdrantVectorStore(VectorStoreInterface):
         if not self._initialized:
             self.initialize()
 
+        def request() -> Dict[str, Any]:
+            return self._query_request(
+                query_vector, top_k, filters, fields, include_text, query_text
+            )
+
         try:
-            # Build filter conditions
-            filter_conditions = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    if isinstance(value, list):
-                        conditions.append(
-                            FieldCondition(key=key, match=MatchAny(any=value))
-                        )
-                    elif isinstance(value, dict) and "gte" in value or "lte" in value:
-                        # Range filter
-                        range_params = {}
-                        if "gte" in value:
-                            range_params["gte"] = value["gte"]
-                        if "lte" in value:
-                            range_params["lte"] = value["lte"]
-                        conditions.append(
-                            FieldCondition(key=key, range=Range(**range_params))
-                        )
-                    else:
-                        conditions.append(
-                            FieldCondition(key=key, match=MatchValue(value=value))
-                        )
+            try:
+                search_results = self.client.query_points(**request()).points
+            except Exception:
+                # The alias may have moved to a collection with another layout
+                if not self._forget_layouts():
+                    raise
+                search_results = self.client.query_points(**request()).points
+            return self._format_results(search_results, fields, include_text)
 
-                if conditions:
-                    filter_conditions = Filter(must=conditions)
+        except Exception as e:
+            raise RuntimeError(f"Query failed: {e}")
 
-            # Perform search using updated API
-            search_results = self.client.query_points(
-                collection_name=self.collection_name,
-                query=query_vector,
-                query_filter=filter_conditions,
-                limit=top_k,
-                with_payload=True,
-            ).points
-
-            # Format results
-            results = []
-            for result in search_results:
-                payload = result.payload
-                formatted_result = {
-                    "content": payload.get("text", ""),
-                    "metadata": {
-                        k: v
-                        for k, v in payload.items()
-                        if k not in ["document_id", "text"]
-                    },
-                    "similarity_score": float(result.score),
-                    "source_file": payload.get(
-                        "file_path", payload.get("document_id", "Unknown")
-                    ),
-                }
-                results.append(formatted_result)
+    async def aquery(
+        self,
+        query_vector: List[float],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+        query_text: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search through the async client without blocking the event loop."""
+        client = self.async_client
 
-            return results
+        async def request() -> Dict[str, Any]:
+            await self._aload_layouts([self.collection_name])
+            return self._query_request(
+                query_vector, top_k, filters, fields, include_text, query_text
+            )
+
+        try:
+            try:
+                response = await client.query_points(**await request())
+            except Exception:
+                if not self._forget_layouts():
+                    raise
+                response = await client.query_points(**await request())
+            return self._format_results(response.points, fields, include_text)
 
         except Exception as e:
             raise RuntimeError(f"Query failed: {e}")
 
+    def fetch_texts(self, chunk_ids: List[str]) -> Dict[str, str]:
+        """Get the text of chunks by point ID with one ``retrieve`` request."""
+        if not self._initialized:
+            self.initialize()
+        if not chunk_ids:
+            return {}
+        points = self.client.retrieve(**self._text_request(chunk_ids))
+        return {str(point.id): point.payload.get("text", "") for point in points}
+
+    async def afetch_texts(self, chunk_ids: List[str]) -> Dict[str, str]:
+        """fetch_texts() through the async client."""
+        if not chunk_ids:
+            return {}
+        points = await self.async_client.retrieve(**self._text_request(chunk_ids))
+        return {str(point.id): point.payload.get("text", "") for point in points}
+
+    def fetch_vectors(self, chunk_ids: List[str]) -> Dict[str, Tuple[str, Any]]:
+        """Get the stored text and dense vector of chunks with one ``retrieve`` request."""
+        if not self._initialized:
+            self.initialize()
+        if not chunk_ids:
+            return {}
+        point_ids = {self._generate_point_id(chunk_id): chunk_id for chunk_id in chunk_ids}
+        points = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=list(point_ids),
+            with_payload=["text"],
+            with_vectors=True,
+        )
+        return {
+            point_ids[str(point.id)]: (point.payload.get("text", ""), self._dense_vector(point))
+            for point in points
+        }
+
+    def _text_request(self, chunk_ids: List[str]) -> Dict[str, Any]:
+        return {
+            "collection_name": self.collection_name,
+            "ids": chunk_ids,
+            "with_payload": ["text"],
+            "with_vectors": False,
+        }
+
+    def _query_request(
+        self,
+        query_vector: List[float],
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+        query_text: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Arguments of a query_points() call for a vector search.
+
+        Hybrid collections are searched with a dense and a sparse prefetch,
+        each filtered, whose candidates the server fuses into one ranking.
+        """
+        # Build filter conditions
+        filter_conditions = None
+        if filters:
+            conditions = []
+            for key, value in filters.items():
+                if isinstance(value, list):
+                    conditions.append(
+                        FieldCondition(key=key, match=MatchAny(any=value))
+                    )
+                elif isinstance(value, dict) and "gte" in value or "lte" in value:
+                    # Range filter
+                    range_params = {}
+                    if "gte" in value:
+                        range_params["gte"] = value["gte"]
+                    if "lte" in value:
+                        range_params["lte"] = value["lte"]
+                    conditions.append(
+                        FieldCondition(key=key, range=Range(**range_params))
+                    )
+                else:
+                    conditions.append(
+                        FieldCondition(key=key, match=MatchValue(value=value))
+                    )
+
+            if conditions:
+                filter_conditions = Filter(must=conditions)
+
+        request = {
+            "collection_name": self.collection_name,
+            "query_filter": filter_conditions,
+            "limit": top_k,
+            "with_payload": self._payload_selector(fields, include_text),
+        }
+        if not self._is_hybrid(self.collection_name):
+            request.update(query=query_vector, search_params=self._search_params())
+            return request
+
+        prefetch_limit = top_k * HYBRID_PREFETCH_MULTIPLIER
+        prefetch = [
+            Prefetch(
+                query=query_vector,
+                using=DENSE_VECTOR,
+                filter=filter_conditions,
+                params=self._search_params(),
+                limit=prefetch_limit,
+            )
+        ]
+        if query_text:
+            prefetch.append(
+                Prefetch(
+                    query=SparseVector(**query_sparse_vector(query_text)),
+                    using=SPARSE_VECTOR,
+                    filter=filter_conditions,
+                    limit=prefetch_limit,
+                )
+            )
+        fusion = Fusion.DBSF if self.config.qdrant_fusion == "dbsf" else Fusion.RRF
+        request.update(prefetch=prefetch, query=FusionQuery(fusion=fusion))
+        return request
+
+    @staticmethod
+    def _payload_selector(fields: Optional[List[str]], include_text: bool):
+        """Payload to return with search hits."""
+        if fields is None:
+            return True if include_text else PayloadSelectorExclude(exclude=["text"])
+        # The chunk id and file path identify every result
+        selected = ["document_id", "file_path", *fields]
+        if include_text:
+            selected.append("text")
+        return list(dict.fromkeys(selected))
+
+    @staticmethod
+    def _format_results(
+        search_results,
+        fields: Optional[List[str]] = None,
+        include_text: bool = True,
+    ) -> List[Dict[str, Any]]:
+        results = []
+        for result in search_results:
+            payload = result.payload
+            formatted_result = {
+                "content": payload.get("text", ""),
+                "metadata": {
+                    k: v
+                    for k, v in payload.items()
+                    if k not in ["document_id", "text"]
+                },
+                "similarity_score": float(result.score),
+                "source_file": payload.get(
+                    "file_path", payload.get("document_id", "Unknown")
+                ),
+            }
+            results.append(
+                # Memory chunks store their memory's id as document_id, so
+                # text is fetched back by point id
+                project_result(formatted_result, str(result.id), fields, include_text)
+            )
+        return results
+
     def get_stats(self) -> Dict[str, Any]:
         """Get vector store statistics and health info.
 
@@ -402,7 +888,7 @@ class QdrantVectorStore(VectorStoreInterface):
             "type": "qdrant",
             "host": self.config.qdrant_host,
             "port": self.config.qdrant_port,
-            "collection_name": self.collection_name,
+            "collection_name": self.alias_name,
             "vector_dimension": self.vector_dimension,
         }
 
@@ -415,6 +901,7 @@ class QdrantVectorStore(VectorStoreInterface):
             collection_info = self.client.get_collection(self.collection_name)
             stats.update(
                 {
+                    "generation": self.get_generation(),
                     "status": collection_info.status.value,
                     "total_vectors": collection_info.points_count or 0,
                     "total_points": collection_info.points_count or 0,
@@ -429,16 +916,398 @@ class QdrantVectorStore(VectorStoreInterface):
         return stats
 
     def delete_collection(self) -> None:
-        """Delete the entire collection/index."""
+        """Delete the entire collection/index.
+
+        Deletes the collection behind the alias (or being rebuilt) and the
+        alias itself; retired collections are dropped when they expire.
+        """
         if not self._initialized:
             self.initialize()
 
         try:
-            self.client.delete_collection(self.collection_name)
+            target = self._staging or self._resolve_alias() or self.alias_name
+            if target != self.alias_name and self._resolve_alias() == target:
+                self.client.update_collection_aliases(
+                    change_aliases_operations=[
+                        DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self.alias_name))
+                    ]
+                )
+            self.client.delete_collection(target)
+            self.collection_name = self.alias_name
+            self._staging = None
             self._initialized = False
         except Exception as e:
             raise RuntimeError(f"Failed to delete collection: {e}")
 
+    def get_generation(self) -> Optional[str]:
+        """Versioned collection being written: the rebuild's, or the alias target."""
+        if self._staging is not None:
+            return self._staging
+        if not self._initialized:
+            return None
+        return self._resolve_alias() or self.alias_name
+
+    def begin_generation(self, carry_source: str = "prmth_memory") -> Optional[int]:
+        """Direct all writes to a new, unaliased collection version.
+
+        Points of ``carry_source`` (memories) are copied into it with their
+        stored vectors, so nothing is re-embedded. Queries through the alias
+        keep using the live collection until publish_generation().
+
+        Returns:
+            Number of points carried over
+        """
+        if not self._initialized:
+            self.initialize()
+
+        self._drop_unpublished_collections()
+        live = self._resolve_alias() or self.alias_name
+        target = self._version_name(self._next_version())
+        self._create_collection(target, self.vector_dimension)
+
+        carried = self._copy_points(
+            live,
+            target,
+            Filter(
+                must=[FieldCondition(key="source_type", match=MatchValue(value=carry_source))]
+            ),
+        )
+        self.collection_name = target
+        self._staging = target
+        logger.info(f"Rebuilding into collection {target} ({carried} points carried)")
+        return carried
+
+    def resume_generation(self, name: str) -> bool:
+        """Continue writing to the unaliased collection of an interrupted rebuild.
+
+        Returns:
+            Whether the collection exists and was resumed
+        """
+        if not self._initialized:
+            self.initialize()
+
+        if (
+            self._version_number(name) is None
+            or name not in self._collection_names()
+            or name in self._aliased_collections()
+        ):
+            return False
+
+        self.collection_name = name
+        self._staging = name
+        return True
+
+    def discard_unpublished_generations(self) -> None:
+        """Drop collection versions left by interrupted rebuilds."""
+        if not self._initialized:
+            self.initialize()
+        self._drop_unpublished_collections()
+
+    def publish_generation(self, sync_memories: bool = True) -> Optional[str]:
+        """Atomically point the alias at the rebuilt collection.
+
+        The previous collection is moved behind a retired alias and dropped
+        once RETIRED_COLLECTION_GRACE_SECONDS have passed.
+
+        Args:
+            sync_memories: Replace the rebuilt collection's memories with the
+                live ones; restores keep the memories they brought instead
+        """
+        name = self._staging
+        if name is None:
+            return None
+
+        live = self._resolve_alias()
+        if sync_memories and (live is not None or self.alias_name in self._collection_names()):
+            self._sync_memories(live or self.alias_name, name)
+
+        operations = []
+        if live is not None:
+            operations.append(
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self.alias_name))
+            )
+            operations.append(
+                CreateAliasOperation(
+                    create_alias=CreateAlias(
+                        collection_name=live,
+                        alias_name=f"{live}_retired_{int(time.time())}",
+                    )
+                )
+            )
+        elif self.alias_name in self._collection_names():
+            # A collection created before aliases holds the alias's name and
+            # has to go before the alias can be created
+            logger.warning(
+                f"Replacing collection {self.alias_name} with alias to {name}"
+            )
+            self.client.delete_collection(self.alias_name)
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(collection_name=name, alias_name=self.alias_name)
+            )
+        )
+
+        # All alias operations in one request are applied atomically
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        self.collection_name = self.alias_name
+        self._staging = None
+        self._forget_layouts()
+        logger.info(f"Published collection {name} as {self.alias_name}")
+
+        self._drop_retired_collections()
+        return name
+
+    def export_archive(self, path: Union[str, Path], workers: int = 4) -> int:
+        """Write every point of the live collection, with its vectors, to an archive.
+
+        Points are scrolled in parallel, one partition per source_type, and
+        streamed to a single writer, so memory use stays at a few pages.
+
+        Args:
+            path: Archive file to write (replaced atomically when complete)
+            workers: Partitions scrolled concurrently
+
+        Returns:
+            Number of points written
+        """
+        if not self._initialized:
+            self.initialize()
+
+        writer = ArchiveWriter(
+            path,
+            {
+                "collection": self.alias_name,
+                "embedding_model": self.config.embedding_model,
+                "dimension": self.vector_dimension,
+            },
+        )
+        partitions = self._archive_partitions()
+        pages: "queue.Queue[Optional[ArchivePage]]" = queue.Queue(maxsize=2 * workers)
+        stop = threading.Event()
+
+        def put(page: Optional[ArchivePage]) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(page, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scroll_partition(scroll_filter: Filter) -> None:
+            try:
+                offset = None
+                while not stop.is_set():
+                    points, offset = self.client.scroll(
+                        collection_name=self.alias_name,
+                        scroll_filter=scroll_filter,
+                        limit=ARCHIVE_PAGE_SIZE,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=True,
+                    )
+                    if points:
+                        put(self._archive_page(points))
+                    if offset is None:
+                        return
+            finally:
+                # Marks the partition as finished, even after an error
+                put(None)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(scroll_partition, part) for part in partitions]
+                try:
+                    finished = 0
+                    while finished < len(futures):
+                        page = pages.get()
+                        if page is None:
+                            finished += 1
+                        else:
+                            writer.write_page(page)
+                except BaseException:
+                    stop.set()
+                    raise
+            for future in futures:
+                future.result()
+            writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+
+        logger.info(f"Exported {writer.points} points to {path}")
+        return writer.points
+
+    def restore_archive(self, path: Union[str, Path], workers: int = 4) -> int:
+        """Load an archive into a new collection version and publish it.
+
+        Vectors are uploaded as stored; nothing is embedded. The restored
+        collection replaces the live one with the same atomic alias switch
+        as a rebuild, memories included.
+
+        Args:
+            path: Archive written by export_archive()
+            workers: Concurrent upsert requests
+
+        Returns:
+            Number of points restored
+
+        Raises:
+            ValueError: If the archive was made with another embedding model
+            ArchiveError: If the archive is malformed or truncated
+        """
+        header = read_archive_header(path)
+        if header.get("embedding_model") != self.config.embedding_model:
+            raise ValueError(
+                f"Archive was created with embedding model {header.get('embedding_model')}, "
+                f"but {self.config.embedding_model} is configured"
+            )
+        if not self._initialized:
+            self.initialize()
+
+        self._drop_unpublished_collections()
+        target = self._version_name(self._next_version())
+        self._create_collection(target, header["dimension"])
+
+        restored = 0
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: Deque[Any] = deque()
+            for page in iter_archive(path):
+                pending.append(pool.submit(self._upload_page, target, page))
+                if len(pending) >= 2 * workers:
+                    restored += pending.popleft().result()
+            while pending:
+                restored += pending.popleft().result()
+
+        self.collection_name = target
+        self._staging = target
+        self.publish_generation(sync_memories=False)
+        logger.info(f"Restored {restored} points from {path} into {target}")
+        return restored
+
+    def create_snapshot(self) -> str:
+        """Create a native Qdrant snapshot of the live collection on the server.
+
+        Returns:
+            Snapshot name, downloadable from the server's snapshot API
+        """
+        if not self._initialized:
+            self.initialize()
+        snapshot = self.client.create_snapshot(
+            collection_name=self._resolve_alias() or self.alias_name, wait=True
+        )
+        return snapshot.name
+
+    def recover_snapshot(self, location: str) -> str:
+        """Recover a snapshot into a new collection version and publish it.
+
+        Args:
+            location: Snapshot URL or server-side ``file://`` path
+
+        Returns:
+            Name of the recovered collection
+        """
+        if not self._initialized:
+            self.initialize()
+        self._drop_unpublished_collections()
+        target = self._version_name(self._next_version())
+        self.client.recover_snapshot(collection_name=target, location=location, wait=True)
+        self.collection_name = target
+        self._staging = target
+        return self.publish_generation(sync_memories=False)
+
+    def _archive_partitions(self) -> List[Filter]:
+        """Filters splitting the collection by source_type, plus the rest."""
+        sources = sorted({source.name for source in self.config.sources} | {"prmth_memory"})
+        partitions = [
+            Filter(must=[FieldCondition(key="source_type", match=MatchValue(value=source))])
+            for source in sources
+        ]
+        partitions.append(
+            Filter(must_not=[FieldCondition(key="source_type", match=MatchAny(any=sources))])
+        )
+        return partitions
+
+    @staticmethod
+    def _dense_vector(point: Any) -> List[float]:
+        """Dense vector of a point in either layout."""
+        if isinstance(point.vector, dict):
+            return point.vector.get(DENSE_VECTOR, point.vector.get(""))
+        return point.vector
+
+    @classmethod
+    def _archive_page(cls, points: List[Any]) -> ArchivePage:
+        sparse = []
+        for point in points:
+            sparse_vector = (
+                point.vector.get(SPARSE_VECTOR) if isinstance(point.vector, dict) else None
+            )
+            sparse.append(
+                {"indices": sparse_vector.indices, "values": sparse_vector.values}
+                if sparse_vector is not None
+                else None
+            )
+        return ArchivePage(
+            [point.id for point in points],
+            [point.payload for point in points],
+            np.asarray([cls._dense_vector(point) for point in points], dtype=np.float32),
+            sparse,
+        )
+
+    def iter_chunks(
+        self, batch_size: int = 1024
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """Yield every chunk of the live collection with its dense vector."""
+        if not self._initialized:
+            self.initialize()
+
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.alias_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+            if points:
+                yield (
+                    [self._chunk_record(point.payload) for point in points],
+                    np.asarray([self._dense_vector(point) for point in points], dtype=np.float32),
+                )
+            if offset is None:
+                return
+
+    @staticmethod
+    def _chunk_record(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """The ``{"id", "text", "metadata"}`` chunk a point was written from."""
+        metadata = dict(payload)
+        text = metadata.pop("text", "")
+        chunk_id = metadata.get("document_id")
+        if metadata.get("source_type") == "prmth_memory" and "chunk_index" in metadata:
+            # Memory metadata keeps the parent memory id as document_id
+            chunk_id = f"{chunk_id}_{metadata['chunk_index']}"
+        else:
+            metadata.pop("document_id", None)
+        return {"id": chunk_id, "text": text, "metadata": metadata}
+
+    def _upload_page(self, target: str, page: ArchivePage) -> int:
+        self.client.upsert(
+            collection_name=target,
+            points=[
+                PointStruct(
+                    id=point_id,
+                    vector=self._point_vector(
+                        target, vector.tolist(), payload.get("text", ""), sparse
+                    ),
+                    payload=payload,
+                )
+                for point_id, payload, vector, sparse in zip(
+                    page.ids, page.payloads, page.vectors, page.sparse
+                )
+            ],
+        )
+        return len(page)
+
     def delete_documents_except_source(self, excluded_source: str) -> int:
         """Delete all documents except those from a specific source.
 
@@ -524,8 +1393,6 @@ class QdrantVectorStore(VectorStoreInterface):
         backup_path_obj = Path(backup_path)
         backup_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        import json
-
         with open(backup_path_obj, "w", encoding="utf-8") as f:
             json.dump(backup_data, f, indent=2)
 
@@ -541,8 +1408,6 @@ class QdrantVectorStore(VectorStoreInterface):
         if not backup_path_obj.exists():
             raise FileNotFoundError(f"Backup file not found: {backup_path}")
 
-        import json
-
         with open(backup_path_obj, "r", encoding="utf-8") as f:
             backup_data = json.load(f)
 
@@ -557,114 +1422,150 @@ class QdrantVectorStore(VectorStoreInterface):
         since: Optional[float] = None,
         project: Optional[str] = None,
         tag: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List memory documents with optional filtering.
 
-        Returns one entry per unique document_id (deduplicated across chunks).
+        Returns one entry per unique document_id, read from the first chunk
+        of each memory with only the listing fields. With a ``limit`` the
+        page is ordered by ``created_ts`` on the server, so only that page is
+        transferred; ``since`` and the cursor are range conditions.
 
         Args:
             since: Unix timestamp - only include docs created after this time
-            project: Filter by metadata.project value
+            project: Filter by project value
             tag: Filter by tag value
+            limit: Maximum number of documents to return
+            cursor: Continue after a previous page (see memory_cursor())
 
         Returns:
-            List of memory documents with metadata, deduplicated by document_id
+            List of memory documents with metadata, newest first
         """
         if not self._initialized:
             self.initialize()
 
         try:
-            docs_by_id: Dict[str, Dict[str, Any]] = {}
-            limit = 100
-            offset = None
-
-            # Build Qdrant filter for prmth_memory source
-            must_conditions = [
-                FieldCondition(key="source_type", match=MatchValue(value="prmth_memory"))
+            conditions: List[Any] = [
+                FieldCondition(key="source_type", match=MatchValue(value="prmth_memory")),
+                FieldCondition(key="chunk_index", match=MatchValue(value=0)),
             ]
-
-            # Add optional conditions
             if project is not None:
-                must_conditions.append(
-                    FieldCondition(key="project", match=MatchValue(value=project))
+                # Older memories nested the project under metadata
+                conditions.append(
+                    Filter(
+                        should=[
+                            FieldCondition(key="project", match=MatchValue(value=project)),
+                            FieldCondition(
+                                key="metadata.project", match=MatchValue(value=project)
+                            ),
+                        ]
+                    )
                 )
-
             if tag is not None:
-                must_conditions.append(
-                    FieldCondition(key="tags", match=MatchValue(value=tag))
-                )
+                conditions.append(FieldCondition(key="tags", match=MatchValue(value=tag)))
+
+            catalog = MemoryCatalog()
+            if limit is None:
+                if since is not None:
+                    conditions.append(self._created_range(gte=since))
+                for point in self._scroll_memory_listing(conditions):
+                    catalog.add(str(point.id), point.payload)
+                return catalog.list(cursor=cursor)
+
+            upper = None
+            if cursor is not None:
+                upper, _ = parse_memory_cursor(cursor)
+                # The page continues with memories sharing the cursor's time
+                for point in self._scroll_memory_listing(
+                    conditions + [self._created_range(gte=upper, lte=upper)]
+                ):
+                    catalog.add(str(point.id), point.payload)
+
+            page_conditions = list(conditions)
+            if since is not None or upper is not None:
+                page_conditions.append(self._created_range(gte=since, lt=upper))
+            points, _ = self.client.scroll(
+                collection_name=self.alias_name,
+                scroll_filter=Filter(must=page_conditions),
+                limit=limit,
+                order_by=OrderBy(key="created_ts", direction=Direction.DESC),
+                with_payload=MEMORY_LIST_FIELDS,
+                with_vectors=False,
+            )
+            for point in points:
+                catalog.add(str(point.id), point.payload)
+            if len(points) == limit:
+                # Memories tied with the last one are ordered by document_id
+                last = points[-1].payload["created_ts"]
+                for point in self._scroll_memory_listing(
+                    conditions + [self._created_range(gte=last, lte=last)]
+                ):
+                    catalog.add(str(point.id), point.payload)
+
+            return catalog.list(since=since, limit=limit, cursor=cursor)
+
+        except Exception as e:
+            logger.error(f"Failed to list memory documents from Qdrant: {e}")
+            return []
 
-            scroll_filter = Filter(must=must_conditions)
+    @staticmethod
+    def _created_range(**bounds: Optional[float]) -> FieldCondition:
+        return FieldCondition(key="created_ts", range=Range(**bounds))
+
+    def _scroll_memory_listing(self, conditions: List[Any]):
+        """Yield memory points matching ``conditions`` with the listing fields."""
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.alias_name,
+                scroll_filter=Filter(must=conditions),
+                limit=256,
+                offset=offset,
+                with_payload=MEMORY_LIST_FIELDS,
+                with_vectors=False,
+            )
+            yield from points
+            if not points or offset is None:
+                return
 
-            # Scroll with filter
-            # new_offset=None means last page (all results fit or end reached)
+    def _backfill_memory_timestamps(self) -> None:
+        """Add ``created_ts`` to memories written before it was stored."""
+        try:
+            missing = Filter(
+                must=[
+                    FieldCondition(key="source_type", match=MatchValue(value="prmth_memory")),
+                    IsEmptyCondition(is_empty=PayloadField(key="created_ts")),
+                ]
+            )
+            offset = None
             while True:
-                points, new_offset = self.client.scroll(
-                    collection_name=self.collection_name,
-                    limit=limit,
-                    scroll_filter=scroll_filter,
+                points, offset = self.client.scroll(
+                    collection_name=self.alias_name,
+                    scroll_filter=missing,
+                    limit=256,
                     offset=offset,
+                    with_payload=["created"],
+                    with_vectors=False,
                 )
-
-                if not points:
-                    break
-
                 for point in points:
-                    payload = point.payload
-                    doc_id = payload.get("document_id", str(point.id))
-
-                    # Apply time filter
-                    if since is not None:
-                        created_str = payload.get("created")
-                        if created_str:
-                            try:
-                                from datetime import datetime
-
-                                created_dt = datetime.fromisoformat(
-                                    created_str.replace("Z", "+00:00")
-                                )
-                                created_ts = created_dt.timestamp()
-                                if created_ts < since:
-                                    continue
-                            except Exception:
-                                pass
-
-                    # Deduplicate by document_id
-                    if doc_id not in docs_by_id:
-                        docs_by_id[doc_id] = payload
-
-                offset = new_offset
-                if new_offset is None:
-                    break
-
-            # Convert to list and sort by created date (newest first)
-            result = list(docs_by_id.values())
-            try:
-                from datetime import datetime
-
-                result.sort(
-                    key=lambda x: datetime.fromisoformat(
-                        x.get("created", "").replace("Z", "+00:00")
-                    ),
-                    reverse=True,
-                )
-            except Exception:
-                pass
-
-            return result
-
+                    timestamp = created_timestamp(point.payload)
+                    if timestamp is not None:
+                        self.client.set_payload(
+                            collection_name=self.alias_name,
+                            payload={"created_ts": timestamp},
+                            points=[point.id],
+                        )
+                if offset is None:
+                    return
         except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to list memory documents from Qdrant: {e}")
-            return []
+            logger.warning(f"Failed to add creation timestamps to memories: {e}")
 
     def delete_memory_documents(self, document_ids: List[str]) -> int:
         """Delete specific memory documents by their document_ids.
 
-        For Qdrant, this scrolls to find points with matching document_ids,
-        then deletes by point ID (which doesn't require an index).
+        For Qdrant, all chunks of all the documents are deleted with one
+        filtered request on the indexed ``document_id`` field.
 
         Args:
             document_ids: List of document_ids to delete
@@ -678,125 +1579,458 @@ class QdrantVectorStore(VectorStoreInterface):
         if not document_ids:
             return 0
 
-        import logging
+        ids_to_delete = list(dict.fromkeys(document_ids))
+        try:
+            self.client.delete(
+                collection_name=self.alias_name,
+                points_selector=Filter(
+                    must=[
+                        FieldCondition(
+                            key="source_type", match=MatchValue(value="prmth_memory")
+                        ),
+                        FieldCondition(key="document_id", match=MatchAny(any=ids_to_delete)),
+                    ]
+                ),
+            )
 
-        logger = logging.getLogger(__name__)
+            logger.info(f"Deleted {len(ids_to_delete)} memory documents")
+            return len(ids_to_delete)
 
-        try:
-            # Convert to set for faster lookup
-            ids_to_delete = set(document_ids)
-            points_to_delete = []
+        except Exception as e:
+            logger.error(f"Failed to delete memory documents from Qdrant: {e}")
+            raise
 
-            # Scroll through all documents and find matching point IDs
-            offset = None
+    def _ensure_collection_exists(self, info: Optional[CollectionInfo] = None) -> bool:
+        """Ensure the collection exists in Qdrant with the configured schema.
 
-            while True:
-                points, new_offset = self.client.scroll(
-                    collection_name=self.collection_name,
-                    limit=100,
-                    scroll_filter=Filter(
-                        must=[
-                            FieldCondition(
-                                key="source_type",
-                                match=MatchValue(value="prmth_memory"),
+        A new collection is created as the first version behind the alias.
+        An existing one gets changed storage settings and missing payload
+        indexes applied.
+
+        Args:
+            info: Collection info already read through the alias, if any
+
+        Returns:
+            True if the schema now matches the config
+        """
+        try:
+            if (
+                info is None
+                and self.alias_name not in self._collection_names()
+                and self._resolve_alias() is None
+            ):
+                target = self._version_name(self._next_version())
+                self._create_collection(target, self._vector_dimension)
+                self.client.update_collection_aliases(
+                    change_aliases_operations=[
+                        CreateAliasOperation(
+                            create_alias=CreateAlias(
+                                collection_name=target, alias_name=self.alias_name
                             )
-                        ]
-                    ),
-                    offset=offset,
+                        )
+                    ]
                 )
+                return True
 
-                if not points:
-                    break
+            if info is None or not self._collection_ready(info):
+                info = self._wait_for_collection_ready()
 
-                # Collect point IDs for matching documents
-                for point in points:
-                    if point.payload.get("document_id") in ids_to_delete:
-                        points_to_delete.append(point.id)
+            # Apply storage settings changed since the collection was created
+            reconciled = self._reconcile_collection_config(info.config)
 
-                offset = new_offset
-                if new_offset is None:
-                    break
+            # Create payload indexes for filterable fields
+            indexed = self._ensure_payload_indexes(existing=info.payload_schema)
+            return reconciled and indexed
 
-            if not points_to_delete:
-                logger.info(f"No memory documents found matching IDs: {document_ids}")
-                return 0
+        except Exception as e:
+            raise RuntimeError(f"Failed to ensure collection exists: {e}")
 
-            # Delete by point IDs
-            self.client.delete(
-                collection_name=self.collection_name,
-                points_selector=points_to_delete,
+    def _get_live_collection(self) -> Optional[CollectionInfo]:
+        """Info of the collection behind the alias, or None if it can't be read."""
+        try:
+            return self.client.get_collection(self.alias_name)
+        except Exception:
+            return None
+
+    def _schema_fingerprint(self, info: CollectionInfo) -> str:
+        """Hash of the configured schema and the collection's actual one.
+
+        Point counts and status are left out, so the fingerprint only changes
+        when the config, the collection's settings or its indexes change.
+        """
+        schema = {
+            "settings": {name: getattr(self.config, name) for name in SCHEMA_SETTINGS},
+            "indexes": {
+                name: field_type
+                if isinstance(field_type, str)
+                else field_type.model_dump(mode="json")
+                for name, field_type in self._payload_index_fields().items()
+            },
+            "config": info.config.model_dump(mode="json"),
+            "payload_schema": {
+                name: index.model_dump(mode="json", exclude={"points"})
+                for name, index in (info.payload_schema or {}).items()
+            },
+        }
+        encoded = json.dumps(schema, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _schema_cache_key(self) -> str:
+        return f"{self.config.qdrant_host}:{self.config.qdrant_port}/{self.alias_name}"
+
+    def _schema_cache_path(self) -> Path:
+        return Path(self.config.rag_index_dir) / SCHEMA_CACHE_FILE
+
+    def _cached_schema_fingerprint(self) -> Optional[str]:
+        """Fingerprint stored by the last full setup of this collection."""
+        try:
+            with open(self._schema_cache_path(), encoding="utf-8") as f:
+                return json.load(f).get(self._schema_cache_key())
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _cache_schema_fingerprint(self) -> None:
+        """Record the collection's current schema for the next warm start."""
+        info = self._get_live_collection()
+        if info is None:
+            return
+        path = self._schema_cache_path()
+        try:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            if not isinstance(cache, dict):
+                cache = {}
+            cache[self._schema_cache_key()] = self._schema_fingerprint(info)
+            atomic_write_json(path, cache, sort_keys=True)
+        except OSError as e:
+            logger.warning(f"Failed to cache Qdrant schema fingerprint: {e}")
+
+    def _create_collection(self, name: str, dimension: Optional[int] = None) -> None:
+        """Create a collection with its payload indexes and wait until it is ready."""
+        if dimension is None:
+            # Creating a collection is the only step that needs the model
+            dimension = get_embedding_dimension(self.embed_model)
+        self._vector_dimension = dimension
+
+        vectors_config = VectorParams(
+            size=dimension,
+            distance=Distance.COSINE,
+            on_disk=self.config.qdrant_on_disk_vectors or None,
+        )
+        sparse_vectors_config = None
+        if self.config.qdrant_hybrid:
+            vectors_config = {DENSE_VECTOR: vectors_config}
+            # Qdrant keeps the IDF of each term up to date as points change
+            sparse_vectors_config = {SPARSE_VECTOR: SparseVectorParams(modifier=Modifier.IDF)}
+
+        self.client.create_collection(
+            collection_name=name,
+            vectors_config=vectors_config,
+            sparse_vectors_config=sparse_vectors_config,
+            hnsw_config=self._hnsw_config(),
+            quantization_config=self._quantization_config(),
+            on_disk_payload=self.config.qdrant_on_disk_payload or None,
+        )
+        self._hybrid_layouts[name] = self.config.qdrant_hybrid
+        self._wait_for_collection_ready(name)
+        self._ensure_payload_indexes(name)
+
+    def _quantization_config(self):
+        """Configured quantization, or None to store full vectors only."""
+        mode = self.config.qdrant_quantization
+        always_ram = self.config.qdrant_quantization_always_ram
+        if mode == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=always_ram)
             )
+        if mode == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=always_ram))
+        return None
 
-            logger.info(
-                f"Deleted {len(points_to_delete)} chunks from {len(document_ids)} memory documents"
+    def _hnsw_config(self) -> Optional[HnswConfigDiff]:
+        if self.config.qdrant_hnsw_m is None and self.config.qdrant_hnsw_ef_construct is None:
+            return None
+        return HnswConfigDiff(
+            m=self.config.qdrant_hnsw_m, ef_construct=self.config.qdrant_hnsw_ef_construct
+        )
+
+    def _search_params(self) -> Optional[SearchParams]:
+        """Per-query HNSW width and quantization rescoring."""
+        quantization = None
+        if self.config.qdrant_quantization:
+            quantization = QuantizationSearchParams(
+                rescore=self.config.qdrant_quantization_rescore,
+                oversampling=self.config.qdrant_quantization_oversampling,
             )
-            return len(document_ids)
+        if self.config.qdrant_hnsw_ef is None and quantization is None:
+            return None
+        return SearchParams(hnsw_ef=self.config.qdrant_hnsw_ef, quantization=quantization)
 
-        except Exception as e:
-            logger.error(f"Failed to delete memory documents from Qdrant: {e}")
-            raise
+    def _reconcile_collection_config(self, params: CollectionConfig) -> bool:
+        """Update an existing collection whose storage settings differ from the config.
+
+        Only settings that differ are sent; Qdrant rebuilds the affected
+        segments in the background while the collection keeps serving.
+
+        Args:
+            params: The collection's current config
+
+        Returns:
+            False if the update failed
+        """
+        changes: Dict[str, Any] = {}
+        vectors, vector_name = params.params.vectors, ""
+        if isinstance(vectors, dict):
+            vectors, vector_name = vectors.get(DENSE_VECTOR), DENSE_VECTOR
+        if isinstance(vectors, VectorParams) and bool(vectors.on_disk) != (
+            self.config.qdrant_on_disk_vectors
+        ):
+            changes["vectors_config"] = {
+                vector_name: VectorParamsDiff(on_disk=self.config.qdrant_on_disk_vectors)
+            }
 
-    def _ensure_collection_exists(self) -> None:
-        """Ensure the collection exists in Qdrant."""
+        hybrid = SPARSE_VECTOR in (params.params.sparse_vectors or {})
+        if hybrid != self.config.qdrant_hybrid:
+            # The vector layout is fixed when a collection is created
+            logger.warning(
+                f"Qdrant collection {self.alias_name} was created "
+                f"{'with' if hybrid else 'without'} hybrid search; "
+                "run 'pcortex rebuild' to apply the hybrid setting"
+            )
+        if bool(params.params.on_disk_payload) != self.config.qdrant_on_disk_payload:
+            changes["collection_params"] = CollectionParamsDiff(
+                on_disk_payload=self.config.qdrant_on_disk_payload
+            )
+
+        hnsw = self._hnsw_config()
+        if hnsw is not None and (
+            (hnsw.m is not None and hnsw.m != params.hnsw_config.m)
+            or (
+                hnsw.ef_construct is not None
+                and hnsw.ef_construct != params.hnsw_config.ef_construct
+            )
+        ):
+            changes["hnsw_config"] = hnsw
+
+        quantization = self._quantization_config()
+        if quantization != params.quantization_config:
+            changes["quantization_config"] = quantization or Disabled.DISABLED
+
+        if not changes:
+            return True
         try:
-            # Check if collection exists
-            collections = self.client.get_collections()
-            collection_names = [col.name for col in collections.collections]
+            self.client.update_collection(collection_name=self.collection_name, **changes)
+            logger.info(
+                f"Updated Qdrant collection settings: {', '.join(sorted(changes))}"
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to update Qdrant collection settings: {e}")
+            return False
 
-            if self.collection_name not in collection_names:
-                # Create collection
-                self.client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config=VectorParams(
-                        size=self.vector_dimension, distance=Distance.COSINE
-                    ),
+    def _copy_points(self, source: str, target: str, scroll_filter: Filter) -> int:
+        """Copy matching points, with their vectors, between collections."""
+        copied = 0
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=source,
+                limit=256,
+                scroll_filter=scroll_filter,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+            if points:
+                self.client.upsert(
+                    collection_name=target,
+                    points=[
+                        PointStruct(
+                            id=point.id,
+                            vector=self._copied_vector(target, point),
+                            payload=point.payload,
+                        )
+                        for point in points
+                    ],
                 )
+                copied += len(points)
+            if offset is None:
+                return copied
+
+    def _copied_vector(self, target: str, point: Any) -> Any:
+        """A stored point's vector, converted to the layout of ``target``."""
+        vector, sparse = point.vector, None
+        if isinstance(vector, dict):
+            vector, sparse = vector.get(DENSE_VECTOR, vector.get("")), vector.get(SPARSE_VECTOR)
+        return self._point_vector(target, vector, point.payload.get("text", ""), sparse)
+
+    def _sync_memories(self, source: str, target: str) -> None:
+        """Replace the memory points of ``target`` with those of ``source``."""
+        memory_filter = Filter(
+            must=[FieldCondition(key="source_type", match=MatchValue(value="prmth_memory"))]
+        )
+        self.client.delete(collection_name=target, points_selector=memory_filter)
+        copied = self._copy_points(source, target, memory_filter)
+        logger.info(f"Copied {copied} memory points into {target}")
+
+    def _collection_names(self) -> Set[str]:
+        return {col.name for col in self.client.get_collections().collections}
+
+    def _aliases(self) -> Dict[str, str]:
+        """Alias name -> collection name."""
+        return {
+            alias.alias_name: alias.collection_name
+            for alias in self.client.get_aliases().aliases
+        }
 
-            # Wait for collection to be ready
-            self._wait_for_collection_ready()
+    def _resolve_alias(self) -> Optional[str]:
+        """Collection behind the alias, or None if the name is not an alias."""
+        return self._aliases().get(self.alias_name)
 
-            # Create payload indexes for filterable fields
-            self._ensure_payload_indexes()
+    def _aliased_collections(self) -> Set[str]:
+        """Versions that are live or retired (anything but unpublished rebuilds)."""
+        return set(self._aliases().values())
+
+    def _version_name(self, number: int) -> str:
+        return f"{self.alias_name}_v{number}"
+
+    def _version_number(self, name: str) -> Optional[int]:
+        match = re.fullmatch(rf"{re.escape(self.alias_name)}_v(\d+)", name)
+        return int(match.group(1)) if match else None
+
+    def _next_version(self) -> int:
+        versions = [self._version_number(name) for name in self._collection_names()]
+        return max((v for v in versions if v is not None), default=0) + 1
+
+    def _drop_unpublished_collections(self) -> None:
+        """Drop versions left by rebuilds that never published."""
+        aliased = self._aliased_collections()
+        for name in self._collection_names():
+            if self._version_number(name) is not None and name not in aliased:
+                logger.info(f"Dropping unpublished collection {name}")
+                self.client.delete_collection(name)
 
+    def _drop_retired_collections(self) -> None:
+        """Drop retired versions whose grace period has ended.
+
+        Runs when a build saves or publishes, not on startup, so a warm start
+        stays a single request.
+        """
+        try:
+            aliases = self._aliases()
+            live = aliases.get(self.alias_name)
+            now = time.time()
+            for alias_name, name in aliases.items():
+                match = re.fullmatch(rf"{re.escape(name)}_retired_(\d+)", alias_name)
+                if match is None or self._version_number(name) is None or name == live:
+                    continue
+                if now - int(match.group(1)) < RETIRED_COLLECTION_GRACE_SECONDS:
+                    continue
+                logger.info(f"Dropping retired collection {name}")
+                self.client.delete_collection(name)
         except Exception as e:
-            raise RuntimeError(f"Failed to ensure collection exists: {e}")
+            logger.warning(f"Failed to drop retired collections: {e}")
+
+    def _payload_index_fields(self) -> Dict[str, Any]:
+        """Payload index schema per field used in filtering."""
+        index_fields: Dict[str, Any] = dict(PAYLOAD_INDEX_FIELDS)
+        if self.config.qdrant_tenant_index:
+            # Co-locate each source's points so filtered searches read less
+            index_fields["source_type"] = KeywordIndexParams(
+                type="keyword", is_tenant=True
+            )
+        return index_fields
 
-    def _ensure_payload_indexes(self) -> None:
-        """Create payload indexes for fields used in filtering."""
-        index_fields = {
-            "source_type": PayloadSchemaType.KEYWORD,
-            "file_path": PayloadSchemaType.KEYWORD,
-            "file_name": PayloadSchemaType.KEYWORD,
-            "tags": PayloadSchemaType.KEYWORD,
-            "project": PayloadSchemaType.KEYWORD,
-        }
-        for field_name, field_type in index_fields.items():
+    def _ensure_payload_indexes(
+        self,
+        collection_name: Optional[str] = None,
+        existing: Optional[Dict[str, PayloadIndexInfo]] = None,
+    ) -> bool:
+        """Create the payload indexes a collection is missing.
+
+        Args:
+            collection_name: Collection to index, defaults to the current one
+            existing: The collection's current payload schema, if known
+
+        Returns:
+            False if an index could not be created
+        """
+        existing = existing or {}
+        created = True
+        for field_name, field_type in self._payload_index_fields().items():
+            if field_name in existing and self._index_matches(
+                existing[field_name], field_type
+            ):
+                continue
             try:
                 self.client.create_payload_index(
-                    collection_name=self.collection_name,
+                    collection_name=collection_name or self.collection_name,
                     field_name=field_name,
                     field_schema=field_type,
                 )
-            except Exception:
-                # Index may already exist, skip
-                pass
+            except Exception as e:
+                logger.warning(f"Failed to create payload index on {field_name}: {e}")
+                created = False
+        return created
+
+    @staticmethod
+    def _index_matches(index: PayloadIndexInfo, field_type: Any) -> bool:
+        if isinstance(field_type, KeywordIndexParams):
+            return index.data_type == PayloadSchemaType.KEYWORD and bool(
+                getattr(index.params, "is_tenant", False)
+            ) == bool(field_type.is_tenant)
+        return index.data_type == field_type
+
+    def _get_collection_dimension(self) -> Optional[int]:
+        """Read the vector size from the collection's stored config."""
+        try:
+            collection_info = self.client.get_collection(self.collection_name)
+            vectors = collection_info.config.params.vectors
+            if isinstance(vectors, dict):
+                vectors = next(iter(vectors.values()), None)
+            return vectors.size if vectors is not None else None
+        except Exception:
+            return None
+
+    def _wait_for_collection_ready(
+        self, collection_name: Optional[str] = None, timeout: int = 30
+    ) -> CollectionInfo:
+        """Wait for collection to be ready.
 
-    def _wait_for_collection_ready(self, timeout: int = 30) -> None:
-        """Wait for collection to be ready."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        Polls with exponential backoff, so a collection that becomes ready
+        right away costs milliseconds rather than a full poll interval.
+
+        Returns:
+            The collection info once it is ready
+        """
+        collection_name = collection_name or self.collection_name
+        deadline = time.monotonic() + timeout
+        delay = READY_POLL_INITIAL_SECONDS
+        while True:
             try:
-                collection_info = self.client.get_collection(self.collection_name)
-                if collection_info.status == CollectionStatus.GREEN:
-                    return
-                time.sleep(1)
+                collection_info = self.client.get_collection(collection_name)
+                if self._collection_ready(collection_info):
+                    return collection_info
             except Exception:
-                time.sleep(1)
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, READY_POLL_MAX_SECONDS)
 
         raise RuntimeError(
-            f"Collection {self.collection_name} not ready after {timeout} seconds"
+            f"Collection {collection_name} not ready after {timeout} seconds"
         )
 
+    @staticmethod
+    def _collection_ready(info: CollectionInfo) -> bool:
+        # Yellow means optimizing in the background; the collection serves
+        return info.status in (CollectionStatus.GREEN, CollectionStatus.YELLOW)
+
     def _generate_point_id(self, document_id: str) -> str:
         """Generate a consistent point ID from document ID.
 
@@ -0,0 +1,590 @@
+"""Immutable on-disk vector segments for the local (FAISS) backend.
+
+A segment holds a fixed batch of chunks: L2-normalized float32 vectors that
+are memory-mapped for search, and JSON-lines records (id, text, metadata)
+read back only for the hits. Segments are listed in a small manifest that is
+replaced atomically, so a segment becomes visible only once the manifest
+naming it is saved.
+
+Every segment has a sequence number; when an id appears in several segments
+the copy with the highest sequence wins. Deletes are tombstones recorded in
+the manifest: a tombstone hides copies of its id in segments older than the
+tombstone, while a later write of the same id is visible again. A merge
+policy rewrites groups of similarly sized segments into one, dropping
+superseded and deleted rows, so the number of segments stays logarithmic in
+the number of writes.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from prometh_cortex.utils.atomic import atomic_write_json, fsync_directory
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS_DIR = "segments"
+SEGMENTS_MANIFEST = "manifest.json"
+
+# Segments replaced by a merge stay on disk this long, so readers still
+# holding the previous manifest can finish with them
+RETIRED_SEGMENT_GRACE_SECONDS = 600.0
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so a dot product is cosine similarity."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def top_rows(vectors: np.ndarray, query: np.ndarray, top_k: int) -> List[Tuple[float, int]]:
+    """Return (score, row) pairs of the ``top_k`` rows most similar to ``query``."""
+    if top_k <= 0 or len(vectors) == 0:
+        return []
+    scores = np.asarray(vectors @ query, dtype=np.float32)
+    k = min(top_k, len(scores))
+    rows = np.argpartition(-scores, k - 1)[:k]
+    rows = rows[np.argsort(-scores[rows])]
+    return [(float(scores[row]), int(row)) for row in rows]
+
+
+class Segment:
+    """One immutable segment directory.
+
+    Files:
+        vectors.npy: (n, dim) float32, L2-normalized
+        records.jsonl: one {"id", "text", "metadata"} object per row
+        offsets.npy: (n,) int64 byte offset of each record line
+        ids.json: row ids, for resolving which segment holds the newest copy
+    """
+
+    def __init__(self, path: Path, seq: int = 0):
+        self.path = Path(path)
+        self.seq = seq
+        self._vectors: Optional[np.ndarray] = None
+        self._offsets: Optional[np.ndarray] = None
+        self._ids: Optional[FrozenSet[str]] = None
+        self._rows: Optional[Dict[str, int]] = None
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Memory-mapped vectors."""
+        if self._vectors is None:
+            self._vectors = np.load(self.path / "vectors.npy", mmap_mode="r")
+        return self._vectors
+
+    @property
+    def ids(self) -> FrozenSet[str]:
+        """Ids stored in this segment."""
+        if self._ids is None:
+            self._ids = frozenset(self.row_ids)
+        return self._ids
+
+    @property
+    def row_ids(self) -> Dict[str, int]:
+        """Row of each id."""
+        if self._rows is None:
+            with open(self.path / "ids.json", "r", encoding="utf-8") as f:
+                self._rows = {document_id: row for row, document_id in enumerate(json.load(f))}
+        return self._rows
+
+    @property
+    def dimension(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def __len__(self) -> int:
+        return int(self.vectors.shape[0])
+
+    def search(self, query: np.ndarray, top_k: int) -> List[Tuple[float, int]]:
+        """Return (score, row) pairs of the best ``top_k`` rows, best first.
+
+        Args:
+            query: L2-normalized query vector
+            top_k: Number of rows to return
+        """
+        return top_rows(self.vectors, query, top_k)
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Read one record by row."""
+        if self._offsets is None:
+            self._offsets = np.load(self.path / "offsets.npy", mmap_mode="r")
+        with open(self.path / "records.jsonl", "rb") as f:
+            f.seek(int(self._offsets[row]))
+            return json.loads(f.readline())
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Read all records in row order."""
+        with open(self.path / "records.jsonl", "r", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    @classmethod
+    def write(
+        cls, path: Path, records: List[Dict[str, Any]], vectors: np.ndarray, seq: int = 0
+    ) -> "Segment":
+        """Write a new segment directory and flush it to disk.
+
+        Args:
+            path: Segment directory (must not exist)
+            records: Row records with 'id', 'text' and 'metadata'
+            vectors: (n, dim) vectors, normalized here
+            seq: Sequence number of the segment
+        """
+        path.mkdir(parents=True)
+
+        offsets = np.empty(len(records), dtype=np.int64)
+        with open(path / "records.jsonl", "wb") as f:
+            for row, record in enumerate(records):
+                offsets[row] = f.tell()
+                f.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+                f.write(b"\n")
+
+        np.save(path / "offsets.npy", offsets)
+        np.save(path / "vectors.npy", normalize_rows(np.asarray(vectors, dtype=np.float32)))
+        with open(path / "ids.json", "w", encoding="utf-8") as f:
+            json.dump([record["id"] for record in records], f)
+
+        for file_path in path.iterdir():
+            with open(file_path, "rb") as f:
+                os.fsync(f.fileno())
+        fsync_directory(path)
+
+        return cls(path, seq)
+
+
+@dataclass
+class MergePolicy:
+    """Tiered merge policy.
+
+    Segments are grouped into tiers by size (powers of ``merge_factor``
+    rows); once a tier holds ``merge_factor`` segments, they are merged into
+    one segment of the next tier. Each row is rewritten about
+    log(total rows) times over the life of the index, instead of on every
+    write. Segments of ``max_merged_rows`` or more are left alone.
+    """
+
+    merge_factor: int = 8
+    max_merged_rows: int = 2_000_000
+
+    def select(self, segments: List[Segment]) -> List[Segment]:
+        """Pick segments to merge next, or an empty list."""
+        tiers: Dict[int, List[Segment]] = {}
+        for segment in segments:
+            rows = len(segment)
+            if rows >= self.max_merged_rows:
+                continue
+            tier = 0
+            while rows >= self.merge_factor:
+                rows //= self.merge_factor
+                tier += 1
+            tiers.setdefault(tier, []).append(segment)
+
+        for tier in sorted(tiers):
+            if len(tiers[tier]) >= self.merge_factor:
+                return tiers[tier][: self.merge_factor]
+        return []
+
+
+class SegmentStore:
+    """Segments under ``<index_dir>/segments``, ordered by sequence number.
+
+    Appends, deletes and merges may run on different threads; the segment
+    list is replaced rather than mutated, so searches work on a snapshot.
+    """
+
+    def __init__(self, index_dir: Path):
+        self.directory = Path(index_dir) / SEGMENTS_DIR
+        self.segments: List[Segment] = []
+        self.tombstones: Dict[str, int] = {}
+        self._next_seq = 1
+        self._retired: List[Dict[str, Any]] = []
+        self._dirty = False
+        self._manifest_stat: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether segments or deletes were added since the manifest was last saved."""
+        return self._dirty
+
+    def __len__(self) -> int:
+        """Total rows, counting superseded and deleted copies."""
+        return sum(len(segment) for segment in self.segments)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / SEGMENTS_MANIFEST
+
+    def load(self) -> None:
+        """Load the published manifest.
+
+        Segment directories the manifest does not list (an interrupted write
+        or merge) are ignored here and removed by the next merge.
+        """
+        with self._lock:
+            self.segments = []
+            self.tombstones = {}
+            self._next_seq = 1
+            self._retired = []
+            self._dirty = False
+            self._manifest_stat = self._stat_manifest()
+
+            if self._manifest_stat is None:
+                return
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            self.segments = [
+                Segment(self.directory / entry["name"], entry["seq"])
+                for entry in manifest.get("segments", [])
+            ]
+            self.tombstones = manifest.get("tombstones", {})
+            self._next_seq = manifest.get("next_seq", 1)
+            self._retired = manifest.get("retired", [])
+
+    def refresh(self) -> bool:
+        """Reload the manifest if another process published a new one.
+
+        Returns:
+            Whether the segment list was reloaded
+        """
+        if self._dirty or self._stat_manifest() == self._manifest_stat:
+            return False
+        self.load()
+        return True
+
+    def _stat_manifest(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            return None
+        # Saves replace the file, so the inode changes even within one mtime tick
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def append(self, records: List[Dict[str, Any]], vectors: np.ndarray) -> Segment:
+        """Write records as a new segment; visible to other processes after save()."""
+        with self._lock:
+            seq = self._allocate_seq()
+            segment = Segment.write(self._segment_path(seq), records, vectors, seq)
+            self.segments = self.segments + [segment]
+            self._dirty = True
+            return segment
+
+    def delete(self, document_ids: Iterable[str]) -> int:
+        """Tombstone ids; visible to other processes after save().
+
+        Returns:
+            Number of ids that were present
+        """
+        with self._lock:
+            # Replaced rather than updated, so readers' snapshots stay valid
+            tombstones = dict(self.tombstones)
+            deleted = 0
+            for document_id in document_ids:
+                if self.contains(document_id):
+                    tombstones[document_id] = self._next_seq
+                    deleted += 1
+            if deleted:
+                self.tombstones = tombstones
+                self._dirty = True
+            return deleted
+
+    def save(self) -> None:
+        """Atomically publish the current segments and tombstones."""
+        with self._lock:
+            now = time.time()
+            expired = [
+                entry
+                for entry in self._retired
+                if now - entry["retired_at"] >= RETIRED_SEGMENT_GRACE_SECONDS
+            ]
+            self._retired = [entry for entry in self._retired if entry not in expired]
+
+            atomic_write_json(
+                self.manifest_path,
+                {
+                    "segments": [
+                        {"name": segment.name, "seq": segment.seq}
+                        for segment in self.segments
+                    ],
+                    "next_seq": self._next_seq,
+                    "tombstones": self.tombstones,
+                    "retired": self._retired,
+                },
+            )
+            self._dirty = False
+            self._manifest_stat = self._stat_manifest()
+
+            for entry in expired:
+                shutil.rmtree(self.directory / entry["name"], ignore_errors=True)
+
+    def clear(self) -> None:
+        """Forget all segments (files are removed with the index directory)."""
+        with self._lock:
+            self.segments = []
+            self.tombstones = {}
+            self._next_seq = 1
+            self._retired = []
+            self._dirty = False
+            self._manifest_stat = None
+
+    def _allocate_seq(self) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        return seq
+
+    def _segment_path(self, seq: int) -> Path:
+        path = self.directory / f"seg-{seq:06d}"
+        if path.exists():
+            # Left over from a write that was never published
+            shutil.rmtree(path)
+        return path
+
+    def _snapshot(self) -> Tuple[List[Segment], Dict[str, int]]:
+        """Segments and tombstones at one point in time.
+
+        Both are replaced on every change, never updated in place, so the
+        pair stays consistent after the lock is released.
+        """
+        with self._lock:
+            return self.segments, self.tombstones
+
+    def is_live(self, document_id: str, segment: Segment) -> bool:
+        """Whether ``segment`` holds the visible copy of ``document_id``."""
+        return self._is_live(document_id, segment, *self._snapshot())
+
+    @staticmethod
+    def _is_live(
+        document_id: str,
+        segment: Segment,
+        segments: List[Segment],
+        tombstones: Dict[str, int],
+    ) -> bool:
+        if tombstones.get(document_id, 0) > segment.seq:
+            return False
+        return not any(
+            document_id in newer.ids
+            for newer in segments
+            if newer.seq > segment.seq
+        )
+
+    def contains(self, document_id: str) -> bool:
+        """Whether a visible copy of ``document_id`` exists."""
+        return self._visible_row(document_id) is not None
+
+    def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """Return the visible record for ``document_id``, or None."""
+        found = self._visible_row(document_id)
+        return found[0].record(found[1]) if found else None
+
+    def get_with_vector(self, document_id: str) -> Optional[Tuple[Dict[str, Any], np.ndarray]]:
+        """Return the visible record for ``document_id`` and its stored vector."""
+        found = self._visible_row(document_id)
+        if found is None:
+            return None
+        segment, row = found
+        return segment.record(row), np.array(segment.vectors[row], dtype=np.float32)
+
+    def _visible_row(
+        self,
+        document_id: str,
+        snapshot: Optional[Tuple[List[Segment], Dict[str, int]]] = None,
+    ) -> Optional[Tuple[Segment, int]]:
+        """Segment and row of the visible copy of ``document_id``."""
+        segments, tombstones = snapshot or self._snapshot()
+        for segment in reversed(segments):
+            row = segment.row_ids.get(document_id)
+            if row is None:
+                continue
+            if tombstones.get(document_id, 0) > segment.seq:
+                return None
+            return segment, row
+        return None
+
+    def live_ids(self) -> Set[str]:
+        """Ids with a visible copy."""
+        snapshot = segments, tombstones = self._snapshot()
+        ids: Set[str] = set()
+        for segment in segments:
+            ids.update(segment.ids)
+        ids.difference_update(
+            document_id
+            for document_id in tombstones
+            if self._visible_row(document_id, snapshot) is None
+        )
+        return ids
+
+    def iter_live(
+        self, batch_size: int
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """Yield the visible records with their stored vectors, segment by segment.
+
+        Args:
+            batch_size: Records per batch
+        """
+        segments, tombstones = self._snapshot()
+        for segment in segments:
+            records: List[Dict[str, Any]] = []
+            rows: List[int] = []
+            for row, record in enumerate(segment.iter_records()):
+                if not self._is_live(record["id"], segment, segments, tombstones):
+                    continue
+                records.append(record)
+                rows.append(row)
+                if len(records) >= batch_size:
+                    yield records, np.asarray(segment.vectors[rows], dtype=np.float32)
+                    records, rows = [], []
+            if records:
+                yield records, np.asarray(segment.vectors[rows], dtype=np.float32)
+
+    def search(
+        self,
+        query_vector: List[float],
+        top_k: int,
+        accept: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        exclude: Container[str] = frozenset(),
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """Search all segments and merge, best first.
+
+        Args:
+            query_vector: Query embedding
+            top_k: Number of results
+            accept: Optional record predicate (e.g. metadata filters)
+            exclude: Ids superseded outside the segments
+
+        Returns:
+            (score, record) pairs
+        """
+        segments, tombstones = self._snapshot()
+        if not segments or top_k <= 0:
+            return []
+
+        query = normalize_rows(np.asarray([query_vector], dtype=np.float32))[0]
+
+        # Over-fetch so superseded copies and filtered rows can be skipped
+        fetch_k = top_k * 4 if accept else top_k * 2
+        candidates = []
+        for segment in segments:
+            for score, row in segment.search(query, fetch_k):
+                candidates.append((score, segment, row))
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        results = []
+        seen = set()
+        for score, segment, row in candidates:
+            record = segment.record(row)
+            document_id = record["id"]
+            if document_id in seen or document_id in exclude:
+                continue
+            if not self._is_live(document_id, segment, segments, tombstones):
+                continue
+            seen.add(document_id)
+            if accept and not accept(record):
+                continue
+            results.append((score, record))
+            if len(results) >= top_k:
+                break
+        return results
+
+    def compact(self, policy: Optional[MergePolicy] = None) -> int:
+        """Merge segments chosen by ``policy`` until it selects none.
+
+        Only visible rows are copied; the merged segment takes the highest
+        sequence number of its inputs, so it still loses to any newer copy
+        or tombstone. The rewrite runs without the lock, so appends and
+        deletes can proceed meanwhile.
+
+        Returns:
+            Number of merges performed
+        """
+        policy = policy or MergePolicy()
+        merges = 0
+        while True:
+            with self._lock:
+                selected = policy.select(self.segments)
+                if not selected:
+                    break
+                seq = max(segment.seq for segment in selected)
+                path = self._segment_path(self._allocate_seq())
+                segments, tombstones = self._snapshot()
+
+            records, vectors = [], []
+            for segment in selected:
+                for row, record in enumerate(segment.iter_records()):
+                    if self._is_live(record["id"], segment, segments, tombstones):
+                        records.append(record)
+                        vectors.append(segment.vectors[row])
+
+            merged = Segment.write(path, records, np.vstack(vectors), seq) if records else None
+
+            with self._lock:
+                replaced = {id(segment) for segment in selected}
+                segments = [s for s in self.segments if id(s) not in replaced]
+                if merged is not None:
+                    segments.append(merged)
+                self.segments = sorted(segments, key=lambda segment: segment.seq)
+                self._prune_tombstones()
+                self._retired.extend(
+                    {"name": segment.name, "retired_at": time.time()}
+                    for segment in selected
+                )
+                self.save()
+            merges += 1
+            logger.info(
+                f"Merged {len(selected)} segments into "
+                f"{merged.name if merged else 'nothing'} ({len(records)} rows)"
+            )
+
+        self._remove_orphans()
+        return merges
+
+    def _prune_tombstones(self) -> None:
+        """Drop tombstones that no longer hide any copy."""
+        self.tombstones = {
+            document_id: seq
+            for document_id, seq in self.tombstones.items()
+            if any(
+                segment.seq < seq and document_id in segment.ids
+                for segment in self.segments
+            )
+        }
+
+    def _remove_orphans(self) -> None:
+        """Remove old segment directories no manifest refers to."""
+        if not self.directory.is_dir():
+            return
+        with self._lock:
+            known = {segment.name for segment in self.segments}
+            known.update(entry["name"] for entry in self._retired)
+            cutoff = time.time() - RETIRED_SEGMENT_GRACE_SECONDS
+            for path in self.directory.iterdir():
+                if not path.is_dir() or path.name in known:
+                    continue
+                # A recent directory may belong to a write still in progress
+                if path.stat().st_mtime < cutoff:
+                    logger.info(f"Removing unpublished segment {path.name}")
+                    shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,67 @@
+"""BM25-style sparse vectors for lexical search on Qdrant.
+
+Documents are encoded once, when they are chunked: every term gets its BM25
+term-frequency weight, saturated by ``K1`` and normalized for chunk length by
+``B``. The inverse document frequency depends on the whole collection, so it
+is left to Qdrant (``Modifier.IDF`` on the sparse vector), which keeps it up
+to date as points are written and deleted. Queries weight each distinct term
+by 1, so a query's score against a chunk is its BM25 score.
+
+Terms are hashed into the 32-bit sparse index space; no vocabulary is stored.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, List
+
+# BM25 term-frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# Typical chunk length in terms, standing in for the collection average
+AVERAGE_CHUNK_TERMS = 256
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+SparseVectorData = Dict[str, List]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word terms of ``text``."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def term_index(term: str) -> int:
+    """Sparse vector index of a term."""
+    digest = hashlib.blake2b(term.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
+
+def document_sparse_vector(text: str) -> SparseVectorData:
+    """BM25 term weights of a chunk.
+
+    Args:
+        text: Chunk text
+
+    Returns:
+        ``{"indices": [...], "values": [...]}``, plain lists so the vector
+        can be computed in worker processes and pickled back
+    """
+    counts = Counter(term_index(term) for term in tokenize(text))
+    length_norm = 1 - B + B * sum(counts.values()) / AVERAGE_CHUNK_TERMS
+    weights = {
+        index: count * (K1 + 1) / (count + K1 * length_norm)
+        for index, count in counts.items()
+    }
+    return _as_vector(weights)
+
+
+def query_sparse_vector(text: str) -> SparseVectorData:
+    """Sparse vector of a query: weight 1 for each distinct term."""
+    return _as_vector({term_index(term): 1.0 for term in tokenize(text)})
+
+
+def _as_vector(weights: Dict[int, float]) -> SparseVectorData:
+    indices = sorted(weights)
+    return {"indices": indices, "values": [weights[index] for index in indices]}
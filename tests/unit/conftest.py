@@ -0,0 +1,67 @@
+"""Fixtures and helpers shared by the unit tests.
+
+Helpers are imported by test modules, e.g.
+``from tests.unit.conftest import TOPICS, make_config``.
+"""
+
+import pytest
+
+from prometh_cortex.config import Config
+from prometh_cortex.embedding import loader
+
+TOPICS = ["kubernetes deployment", "garden tomatoes", "sourdough bread", "tax forms"]
+
+# Catch-all source of a typical config
+DEFAULT_SOURCE = {
+    "name": "default",
+    "chunk_size": 512,
+    "chunk_overlap": 50,
+    "source_patterns": ["*"],
+}
+
+# Source for the notes directory of the notes_dir fixture
+NOTES_SOURCE = {
+    "name": "notes",
+    "chunk_size": 256,
+    "chunk_overlap": 20,
+    "source_patterns": ["notes"],
+}
+
+
+def make_config(tmp_path, **overrides):
+    """Config with the index under tmp_path, embedded by the hash provider in-process.
+
+    Args:
+        tmp_path: Test directory; the index goes to ``tmp_path / "index"``
+        **overrides: Config fields to set instead of the defaults, e.g.
+            ``sources`` or ``vector_store_type``
+    """
+    settings = {
+        "rag_index_dir": tmp_path / "index",
+        "embedding_provider": "hash",
+        "embedding_daemon_socket": "",
+        "sources": [DEFAULT_SOURCE, NOTES_SOURCE],
+    }
+    settings.update(overrides)
+    return Config(**settings)
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Drop embedding models cached by other tests."""
+    loader._models.clear()
+    yield
+    loader._models.clear()
+
+
+@pytest.fixture
+def notes_dir(tmp_path, monkeypatch):
+    """A notes directory with one note per topic, relative to the working directory."""
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    for i, topic in enumerate(TOPICS):
+        (notes / f"note{i}.md").write_text(
+            f"---\ntitle: Note {i}\n---\n# Note {i}\n\nAll about {topic}.\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    return notes
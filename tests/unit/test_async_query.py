@@ -0,0 +1,145 @@
+"""Tests for the query paths used by the MCP and HTTP servers."""
+
+import asyncio
+
+from qdrant_client import QdrantClient
+
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from tests.unit.conftest import make_config
+
+
+class AsyncClientOver:
+    """Async facade over an in-process client, so both paths share one store."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+
+def note(doc_id, text, **metadata):
+    return {"id": doc_id, "text": text, "metadata": {"file_path": doc_id, **metadata}}
+
+
+def qdrant_store(tmp_path, monkeypatch):
+    local = QdrantClient(location=":memory:")
+    monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+    monkeypatch.setattr(
+        QdrantVectorStore, "_create_async_client", lambda self: AsyncClientOver(local)
+    )
+    store = QdrantVectorStore(
+        make_config(tmp_path, vector_store_type="qdrant", qdrant_collection_name="notes")
+    )
+    return store, local
+
+
+class TestAsyncQuery:
+    """aquery() matches query() on both backends."""
+
+    def test_indexer_aquery_matches_query(self, tmp_path, notes_dir):
+        indexer = DocumentIndexer(make_config(tmp_path))
+        indexer.build_index()
+
+        results = asyncio.run(indexer.aquery("sourdough bread", max_results=2))
+
+        assert results == indexer.query("sourdough bread", max_results=2)
+        assert results[0]["source_file"].endswith("note2.md")
+
+    def test_qdrant_async_writes_and_reads(self, tmp_path, monkeypatch):
+        store, _ = qdrant_store(tmp_path, monkeypatch)
+        vector = store.embed_model.get_query_embedding("sailing boats")
+
+        async def scenario():
+            await store.aadd_documents([note("a.md", "garden"), note("b.md", "sailing boats")])
+            found = await store.aquery(vector, top_k=1)
+            await store.adelete(["b.md"])
+            return found, await store.aquery(vector, top_k=5)
+
+        found, remaining = asyncio.run(scenario())
+
+        assert [r["source_file"] for r in found] == ["b.md"]
+        assert [r["source_file"] for r in remaining] == ["a.md"]
+
+    def test_client_options_from_config(self, tmp_path):
+        store = QdrantVectorStore(
+            make_config(
+                tmp_path,
+                qdrant_prefer_grpc="true",
+                qdrant_grpc_port=7334,
+                qdrant_pool_size=4,
+                qdrant_timeout=5,
+            )
+        )
+
+        options = store._client_options()
+
+        assert options["prefer_grpc"] is True
+        assert options["grpc_port"] == 7334
+        assert options["timeout"] == 5
+        assert options["limits"].max_connections == 4
+
+
+class TestQueryProjection:
+    """Queries return only the requested fields; text can be fetched later."""
+
+    def test_qdrant_requests_only_selected_payload(self, tmp_path, monkeypatch):
+        store, local = qdrant_store(tmp_path, monkeypatch)
+        store.add_documents(
+            [note("a.md", "garden", title="Garden"), note("b.md", "boats", title="Boats")]
+        )
+        requests = []
+        query_points = local.query_points
+
+        def recording(*args, **kwargs):
+            requests.append(kwargs)
+            return query_points(*args, **kwargs)
+
+        monkeypatch.setattr(local, "query_points", recording)
+        vector = store.embed_model.get_query_embedding("boats")
+
+        (hit,) = store.query(vector, top_k=1, fields=["title"], include_text=False)
+
+        assert set(requests[0]["with_payload"]) == {"document_id", "file_path", "title"}
+        assert hit["content"] is None
+        assert hit["metadata"] == {"title": "Boats"}
+        assert hit["source_file"] == "b.md"
+
+        (hydrated,) = asyncio.run(store.ahydrate_text([hit]))
+        assert hydrated["content"] == "boats"
+        assert "chunk_id" not in hydrated
+
+    def test_qdrant_hydrates_memory_chunks(self, tmp_path, monkeypatch):
+        store, _ = qdrant_store(tmp_path, monkeypatch)
+        store.add_documents(
+            [note("memory_m_0", "deploy checklist", document_id="memory_m")]
+        )
+        vector = store.embed_model.get_query_embedding("deploy checklist")
+
+        hits = store.query(vector, top_k=1, include_text=False)
+
+        assert store.hydrate_text(hits)[0]["content"] == "deploy checklist"
+
+    def test_faiss_hydrates_final_results(self, tmp_path):
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        (notes / "tomatoes.md").write_text("# Tomatoes\n\nGrowing garden tomatoes.\n")
+        config = make_config(
+            tmp_path, sources=[{"name": "notes", "source_patterns": [str(notes)]}]
+        )
+        indexer = DocumentIndexer(config)
+        indexer.build_index()
+
+        (hit,) = indexer.query("garden tomatoes", max_results=1, include_text=False)
+        assert hit["content"] is None
+
+        (hydrated,) = indexer.hydrate_text([dict(hit)])
+        assert hydrated["content"] == indexer.query("garden tomatoes", max_results=1)[0][
+            "content"
+        ]
@@ -0,0 +1,220 @@
+"""Tests for the parallel parse-and-chunk build pipeline and build checkpoints."""
+
+import json
+
+import pytest
+
+from prometh_cortex.indexer import DocumentIndexer, IndexerError, pipeline
+from prometh_cortex.indexer import document_indexer
+from prometh_cortex.indexer.pipeline import (
+    BuildCheckpointer,
+    ChunkTask,
+    PreparedDocument,
+    StoreWriter,
+    iter_prepared_documents,
+    prepare_document,
+    resolve_jobs,
+)
+from tests.unit.conftest import TOPICS, make_config
+
+
+def make_tasks(notes_dir):
+    return [
+        ChunkTask(str(path), "notes", 256, 20)
+        for path in sorted(notes_dir.glob("*.md"))
+    ]
+
+
+class TestPrepareDocument:
+    """Tests for the per-file worker function."""
+
+    def test_builds_vector_store_documents(self, notes_dir):
+        prepared = prepare_document(make_tasks(notes_dir)[0])
+
+        assert prepared.error is None
+        assert len(prepared.file_hash) == 64
+        doc = prepared.documents[0]
+        assert doc["id"] == f"{prepared.file_path}_0"
+        assert doc["metadata"]["source_type"] == "notes"
+        assert doc["metadata"]["chunk_config"] == {"chunk_size": 256, "chunk_overlap": 20}
+
+    def test_reports_errors_instead_of_raising(self, tmp_path):
+        prepared = prepare_document(ChunkTask(str(tmp_path / "missing.md"), "notes", 256, 20))
+
+        assert prepared.error
+        assert prepared.documents == []
+
+
+class TestIterPreparedDocuments:
+    """Tests for ordered, bounded parallel preparation."""
+
+    def test_parallel_matches_serial_order(self, notes_dir):
+        tasks = make_tasks(notes_dir)
+        serial = list(iter_prepared_documents(tasks, jobs=1))
+        parallel = list(iter_prepared_documents(tasks, jobs=2))
+
+        assert [p.file_path for p in parallel] == [t.file_path for t in tasks]
+        assert [p.documents for p in parallel] == [p.documents for p in serial]
+
+    def test_resolve_jobs(self):
+        assert resolve_jobs(3) == 3
+        assert resolve_jobs(0) >= 1
+        assert resolve_jobs(None) == resolve_jobs(0)
+
+
+class TestStoreWriter:
+    """Tests for the background store writer."""
+
+    def test_writes_and_reports_in_order(self):
+        written, reported = [], []
+
+        class Store:
+            def add_documents(self, documents):
+                written.append([doc["id"] for doc in documents])
+
+        writer = StoreWriter(Store(), lambda batch: reported.append(batch[0].file_path))
+        for name in ["a", "b"]:
+            writer.submit([PreparedDocument(name, "notes", documents=[{"id": name}])])
+        writer.close()
+
+        assert written == [["a"], ["b"]]
+        assert reported == ["a", "b"]
+
+    def test_flush_reraises_write_errors(self):
+        class Store:
+            def add_documents(self, documents):
+                raise RuntimeError("disk full")
+
+        writer = StoreWriter(Store(), lambda batch: None)
+        writer.submit([PreparedDocument("a", "notes", documents=[{"id": "a"}])])
+        with pytest.raises(RuntimeError, match="disk full"):
+            writer.close()
+
+
+class TestParallelBuild:
+    """A build with worker processes matches a serial build."""
+
+    def test_jobs_build_matches_serial(self, tmp_path, notes_dir):
+        serial = DocumentIndexer(make_config(tmp_path, rag_index_dir=tmp_path / "serial"))
+        parallel = DocumentIndexer(make_config(tmp_path, rag_index_dir=tmp_path / "parallel"))
+
+        serial_stats = serial.build_index(jobs=1)
+        parallel_stats = parallel.build_index(jobs=2)
+
+        assert parallel_stats["sources"] == serial_stats["sources"]
+        assert parallel_stats["total_documents"] == len(TOPICS)
+        results = parallel.query("sourdough bread", max_results=1)
+        assert results[0]["source_file"].endswith("note2.md")
+
+    def test_parse_errors_are_recorded(self, tmp_path, notes_dir, monkeypatch):
+        (notes_dir / "broken.md").write_text("# Broken\n")
+        parse = pipeline.parse_markdown_file
+
+        def failing_parse(path):
+            if path.name == "broken.md":
+                raise ValueError("bad frontmatter")
+            return parse(path)
+
+        monkeypatch.setattr(pipeline, "parse_markdown_file", failing_parse)
+        indexer = DocumentIndexer(make_config(tmp_path))
+
+        stats = indexer.build_index()
+
+        assert stats["total_documents"] == len(TOPICS)
+        assert any(
+            "broken.md" in error and "bad frontmatter" in error
+            for error in stats["errors"]
+        )
+
+
+class TestBuildCheckpointer:
+    """Tests for checkpoint scheduling."""
+
+    def test_checkpoints_every_n_chunks(self):
+        saves = []
+        checkpointer = BuildCheckpointer(lambda: saves.append(1), every_chunks=10)
+
+        for _ in range(5):
+            checkpointer.record(5)
+
+        assert checkpointer.checkpoints == len(saves) == 2
+
+    def test_checkpoints_every_n_seconds(self):
+        now = [0.0]
+        checkpointer = BuildCheckpointer(
+            lambda: None, every_seconds=60, clock=lambda: now[0]
+        )
+
+        checkpointer.record(1)
+        now[0] = 61.0
+        checkpointer.record(1)
+
+        assert checkpointer.checkpoints == 1
+
+    def test_disabled_triggers_never_checkpoint(self):
+        checkpointer = BuildCheckpointer(lambda: None)
+        checkpointer.record(10_000)
+
+        assert checkpointer.checkpoints == 0
+
+
+class TestBuildCheckpoints:
+    """Interrupted builds keep checkpointed work and resume from it."""
+
+    def test_incremental_build_skips_unchanged(self, tmp_path, notes_dir):
+        DocumentIndexer(make_config(tmp_path)).build_index()
+
+        stats = DocumentIndexer(make_config(tmp_path)).build_index()
+
+        assert stats["total_documents"] == 0
+        assert not (tmp_path / "index" / document_indexer.BUILD_CHECKPOINT_FILE).exists()
+
+    def test_resume_after_interrupt(self, tmp_path, notes_dir, monkeypatch):
+        config = make_config(tmp_path, build_checkpoint_chunks=1)
+        monkeypatch.setattr(document_indexer, "DEFAULT_BATCH_CHUNKS", 1)
+        indexer = DocumentIndexer(config)
+        embed_batch = indexer._embed_batch
+        calls = []
+
+        def interrupting_embed(batch):
+            calls.append(batch)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            embed_batch(batch)
+
+        monkeypatch.setattr(indexer, "_embed_batch", interrupting_embed)
+        with pytest.raises(KeyboardInterrupt):
+            indexer.build_index()
+
+        resumed = DocumentIndexer(config)
+        assert resumed.get_build_checkpoint()["documents"] == 2
+        assert len(resumed.change_detector.indexed_docs) == 2
+
+        stats = resumed.build_index(resume=True)
+
+        assert stats["total_documents"] == len(TOPICS) - 2
+        assert resumed.get_build_checkpoint() is None
+        for i, topic in enumerate(TOPICS):
+            results = resumed.query(topic, max_results=1)
+            assert results[0]["source_file"].endswith(f"note{i}.md")
+
+    def test_resume_and_force_are_exclusive(self, tmp_path, notes_dir):
+        with pytest.raises(IndexerError):
+            DocumentIndexer(make_config(tmp_path)).build_index(
+                force_rebuild=True, resume=True
+            )
+
+    def test_migrates_legacy_manifest(self, tmp_path):
+        index_dir = tmp_path / "index"
+        index_dir.mkdir()
+        legacy = {
+            "/notes/a.md": {"file_hash": "abc", "modified_time": 1.0, "indexed_at": 2.0},
+            "/notes/a.md_0": {"source_type": "notes", "chunk_index": 0},
+        }
+        (index_dir / document_indexer.LEGACY_MANIFEST_FILE).write_text(json.dumps(legacy))
+
+        indexer = DocumentIndexer(make_config(tmp_path))
+
+        assert list(indexer.change_detector.indexed_docs) == ["/notes/a.md"]
+        storage_dir = indexer.vector_store.get_storage_dir()
+        assert (storage_dir / document_indexer.BUILD_MANIFEST_FILE).exists()
@@ -0,0 +1,112 @@
+"""Tests for reusing stored vectors of unchanged chunks when files are re-indexed."""
+
+import pytest
+from qdrant_client import QdrantClient
+
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from tests.unit.conftest import make_config
+
+PARAGRAPHS = [
+    f"Entry {i}: standup notes about topic number {i}, the blockers raised in review, "
+    f"the owners of each follow-up and the deadlines agreed for them."
+    for i in range(8)
+]
+
+
+@pytest.fixture
+def daily_log(tmp_path, monkeypatch):
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    path = notes / "log.md"
+    path.write_text("# Daily log\n\n" + "\n\n".join(PARAGRAPHS) + "\n")
+    monkeypatch.chdir(tmp_path)
+    return path
+
+
+def make_indexer(tmp_path, **overrides):
+    return DocumentIndexer(
+        make_config(
+            tmp_path,
+            qdrant_collection_name="notes",
+            sources=[
+                {
+                    "name": "notes",
+                    "chunk_size": 128,
+                    "chunk_overlap": 0,
+                    "source_patterns": ["notes"],
+                }
+            ],
+            **overrides,
+        )
+    )
+
+
+def count_embeddings(monkeypatch, indexer):
+    embedded = []
+    model_class = type(indexer.embed_model)
+    original = model_class.get_text_embedding_batch
+
+    def recording(self, texts, **kwargs):
+        embedded.extend(texts)
+        return original(self, texts, **kwargs)
+
+    monkeypatch.setattr(model_class, "get_text_embedding_batch", recording)
+    return embedded
+
+
+def chunk_ids(indexer):
+    return {
+        chunk_id
+        for chunk_id in indexer.vector_store.get_indexed_documents()
+        if "log.md" in chunk_id
+    }
+
+
+class TestChunkReuse:
+    """Only new or changed chunk text is embedded; removed chunks are deleted."""
+
+    def test_append_embeds_only_new_text(self, daily_log, tmp_path, monkeypatch):
+        indexer = make_indexer(tmp_path)
+        indexer.build_index()
+        manifest = indexer.change_detector.indexed_docs[str(daily_log.relative_to(tmp_path))]
+        total = len(manifest["chunks"])
+        assert total > 3
+
+        embedded = count_embeddings(monkeypatch, indexer)
+        with open(daily_log, "a") as f:
+            f.write("\nEntry 8: a brand new paragraph about release planning.\n")
+        indexer.build_index()
+
+        assert 0 < len(embedded) <= 2
+        assert any("release planning" in text for text in embedded)
+        hits = indexer.query("release planning", max_results=1)
+        assert "release planning" in hits[0]["content"]
+
+    def test_removed_chunks_are_deleted(self, daily_log, tmp_path, monkeypatch):
+        indexer = make_indexer(tmp_path)
+        indexer.build_index()
+        before = chunk_ids(indexer)
+
+        embedded = count_embeddings(monkeypatch, indexer)
+        daily_log.write_text("# Daily log\n\n" + "\n\n".join(PARAGRAPHS[:2]) + "\n")
+        indexer.build_index()
+
+        after = chunk_ids(indexer)
+        assert after < before
+        assert len(embedded) <= 1
+
+    def test_qdrant_reuses_vectors(self, daily_log, tmp_path, monkeypatch):
+        local = QdrantClient(location=":memory:")
+        monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+        indexer = make_indexer(tmp_path, vector_store_type="qdrant")
+        indexer.build_index()
+        count = local.count("notes").count
+
+        embedded = count_embeddings(monkeypatch, indexer)
+        daily_log.write_text("# Daily log\n\n" + "\n\n".join(PARAGRAPHS[:-1]) + "\n")
+        result = indexer.add_document(daily_log.relative_to(tmp_path))
+
+        assert len(embedded) <= 1
+        assert result["reused_chunks"] == result["chunks"] - len(embedded)
+        assert local.count("notes").count < count
@@ -0,0 +1,115 @@
+"""Tests for content-defined chunk boundaries."""
+
+import pytest
+from pydantic import ValidationError
+
+from prometh_cortex.config.settings import SourceConfig
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.parser import parse_markdown_file
+from prometh_cortex.parser.markdown import content_defined_spans, extract_document_chunks
+from tests.unit.conftest import make_config
+
+PARAGRAPHS = [
+    f"Section {i} covers subject {i * 7 % 11}. It lists the decisions taken, "
+    f"who owns them and when item {i} is due. Reviewers asked for more detail."
+    for i in range(30)
+]
+
+
+def chunk_texts(path, chunking, chunk_size=256):
+    document = parse_markdown_file(path)
+    return [
+        chunk["content"]
+        for chunk in extract_document_chunks(
+            document, chunk_size=chunk_size, chunk_overlap=0, chunking=chunking
+        )
+    ]
+
+
+@pytest.fixture
+def long_note(tmp_path):
+    path = tmp_path / "note.md"
+    path.write_text("# Notes\n\n" + "\n\n".join(PARAGRAPHS) + "\n")
+    return path
+
+
+class TestContentDefinedSpans:
+    """Boundaries respect the size limits and follow the content."""
+
+    def test_spans_cover_text_within_limits(self):
+        text = "\n\n".join(PARAGRAPHS)
+
+        spans = content_defined_spans(text, 256)
+
+        assert spans[0][0] == 0 and spans[-1][1] == len(text)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+        assert all(end - start <= 256 for start, end in spans)
+        assert all(end - start > 64 for start, end in spans[:-1])
+
+    def test_unbroken_text_is_hard_cut(self):
+        assert content_defined_spans("x" * 1000, 300) == [(0, 300), (300, 600), (600, 900), (900, 1000)]
+
+    def test_insert_only_changes_nearby_chunks(self, long_note):
+        before = chunk_texts(long_note, "content_defined")
+        fixed_before = chunk_texts(long_note, "fixed")
+        long_note.write_text(
+            "# Notes\n\nA new opening paragraph, added on top of the file.\n\n"
+            + "\n\n".join(PARAGRAPHS)
+            + "\n"
+        )
+
+        after = chunk_texts(long_note, "content_defined")
+        fixed_after = chunk_texts(long_note, "fixed")
+
+        assert len(set(after) - set(before)) <= 2
+        # Fixed-size chunking shifts every boundary after the insert
+        assert len(set(fixed_after) - set(fixed_before)) > len(fixed_after) // 2
+
+
+class TestContentDefinedBuilds:
+    """Sources opt in per source; edits re-embed only the chunks they touch."""
+
+    def test_invalid_mode_is_rejected(self):
+        with pytest.raises(ValidationError):
+            SourceConfig(name="notes", chunking="semantic", source_patterns=["notes"])
+
+    def test_edit_reembeds_few_chunks(self, tmp_path, monkeypatch):
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        path = notes / "long.md"
+        path.write_text("# Notes\n\n" + "\n\n".join(PARAGRAPHS) + "\n")
+        monkeypatch.chdir(tmp_path)
+        indexer = DocumentIndexer(
+            make_config(
+                tmp_path,
+                sources=[
+                    {
+                        "name": "notes",
+                        "chunk_size": 256,
+                        "chunk_overlap": 0,
+                        "chunking": "content_defined",
+                        "source_patterns": ["notes"],
+                    }
+                ],
+            )
+        )
+        total = indexer.build_index()["total_chunks"]
+
+        embedded = []
+        model_class = type(indexer.embed_model)
+        original = model_class.get_text_embedding_batch
+
+        def recording(self, texts, **kwargs):
+            embedded.extend(texts)
+            return original(self, texts, **kwargs)
+
+        monkeypatch.setattr(model_class, "get_text_embedding_batch", recording)
+        path.write_text(
+            "# Notes\n\nA new opening paragraph, added on top of the file.\n\n"
+            + "\n\n".join(PARAGRAPHS)
+            + "\n"
+        )
+        indexer.build_index()
+
+        assert total > 10
+        assert 0 < len(embedded) <= 2
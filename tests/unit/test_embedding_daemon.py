@@ -0,0 +1,150 @@
+"""Tests for the embedding daemon, its client and daemon-aware model loading."""
+
+import tempfile
+import threading
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from prometh_cortex.embedding import get_embedding_model, loader
+from prometh_cortex.embedding.client import (
+    DaemonEmbedding,
+    EmbeddingClient,
+    EmbeddingClientError,
+)
+from prometh_cortex.embedding.daemon import EmbeddingDaemon, EmbeddingDaemonError
+
+MODEL_NAME = "test/fake-model"
+
+
+class FakeModel:
+    """Stand-in embedding model that records batch sizes."""
+
+    dimension = 3
+
+    def __init__(self):
+        self.batches: List[int] = []
+
+    def get_text_embedding_batch(self, texts):
+        self.batches.append(len(texts))
+        return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+    def get_query_embedding(self, text):
+        return [float(len(text)), 0.0, 1.0]
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are length-limited, so avoid long pytest tmp paths
+    with tempfile.TemporaryDirectory(prefix="embedd") as tmp:
+        yield Path(tmp) / "embedd.sock"
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    model = FakeModel()
+    daemon = EmbeddingDaemon(model, MODEL_NAME, socket_path, batch_wait_ms=50)
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon, model
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+
+class TestEmbeddingDaemon:
+    """Tests for the daemon protocol and batching."""
+
+    def test_ping(self, running_daemon, socket_path):
+        client = EmbeddingClient(socket_path)
+        assert client.ping() == {
+            "model": MODEL_NAME,
+            "provider": "llama-index",
+            "dimension": 3,
+        }
+        client.close()
+
+    def test_embed_text_and_query(self, running_daemon, socket_path):
+        client = EmbeddingClient(socket_path)
+        assert client.embed(["ab", "abcd"]) == [[2.0, 1.0, 0.0], [4.0, 1.0, 0.0]]
+        assert client.embed(["abc"], kind="query") == [[3.0, 0.0, 1.0]]
+        client.close()
+
+    def test_invalid_request_reports_error(self, running_daemon, socket_path):
+        client = EmbeddingClient(socket_path)
+        with pytest.raises(EmbeddingClientError, match="Unknown embedding kind"):
+            client.embed(["a"], kind="image")
+        client.close()
+
+    def test_concurrent_requests_are_batched(self, running_daemon, socket_path):
+        _, model = running_daemon
+        results = {}
+
+        def embed(i):
+            client = EmbeddingClient(socket_path)
+            results[i] = client.embed(["x" * i])
+            client.close()
+
+        threads = [threading.Thread(target=embed, args=(i,)) for i in range(1, 9)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(results[i] == [[float(i), 1.0, 0.0]] for i in range(1, 9))
+        assert sum(model.batches) == 8
+        assert len(model.batches) < 8
+
+    def test_refuses_second_daemon_on_live_socket(self, running_daemon, socket_path):
+        with pytest.raises(EmbeddingDaemonError, match="already listening"):
+            EmbeddingDaemon(FakeModel(), MODEL_NAME, socket_path).bind()
+
+    def test_socket_removed_on_shutdown(self, socket_path):
+        daemon = EmbeddingDaemon(FakeModel(), MODEL_NAME, socket_path)
+        daemon.bind()
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        daemon.shutdown()
+        thread.join(timeout=5)
+
+        assert not socket_path.exists()
+
+
+class TestDaemonAwareLoading:
+    """Tests for get_embedding_model choosing between daemon and local model."""
+
+    def test_uses_daemon_when_available(self, running_daemon, socket_path):
+        with patch.object(
+            loader, "_load_local_model", side_effect=AssertionError
+        ):
+            model = get_embedding_model(MODEL_NAME, socket_path)
+
+        assert isinstance(model, DaemonEmbedding)
+        assert model.dimension == 3
+        assert model.get_text_embedding("abc") == [3.0, 1.0, 0.0]
+        assert get_embedding_model(MODEL_NAME, socket_path) is model
+
+    def test_model_mismatch_loads_locally(self, running_daemon, socket_path):
+        local = FakeModel()
+        with patch.object(loader, "_load_local_model", return_value=local):
+            model = get_embedding_model("other/model", socket_path)
+
+        assert model is local
+
+    def test_missing_socket_loads_locally(self, socket_path):
+        local = FakeModel()
+        with patch.object(loader, "_load_local_model", return_value=local):
+            assert get_embedding_model(MODEL_NAME, socket_path) is local
+
+    def test_falls_back_when_daemon_stops(self, running_daemon, socket_path):
+        daemon, _ = running_daemon
+        local = FakeModel()
+        with patch.object(loader, "_load_local_model", return_value=local):
+            model = get_embedding_model(MODEL_NAME, socket_path)
+            daemon.shutdown()
+            vectors = model.get_text_embedding_batch(["abcd"])
+
+        assert vectors == [[4.0, 1.0, 0.0]]
+        assert local.batches == [1]
@@ -0,0 +1,102 @@
+"""Tests for the embedding provider registry and the hash provider."""
+
+import numpy as np
+import pytest
+
+from prometh_cortex.embedding import (
+    EmbeddingProvider,
+    HashEmbeddingProvider,
+    available_embedding_providers,
+    create_embedding_provider,
+    get_embedding_model,
+    register_embedding_provider,
+)
+from prometh_cortex.embedding import providers
+from prometh_cortex.embedding.adapter import ProviderEmbedding
+from prometh_cortex.indexer import DocumentIndexer
+from tests.unit.conftest import TOPICS, make_config
+
+
+class TestHashEmbeddingProvider:
+    """Tests for the deterministic hash provider."""
+
+    def test_shape_and_dtype(self):
+        provider = HashEmbeddingProvider(dimension=64)
+        vectors = provider.embed_batch(["alpha beta", "gamma", ""])
+
+        assert vectors.shape == (3, 64)
+        assert vectors.dtype == np.float32
+
+    def test_deterministic_and_normalized(self):
+        first = HashEmbeddingProvider().embed_batch(["kubernetes deployment notes"])
+        second = HashEmbeddingProvider().embed_batch(["kubernetes deployment notes"])
+
+        np.testing.assert_array_equal(first, second)
+        assert np.linalg.norm(first[0]) == pytest.approx(1.0)
+
+    def test_empty_text_is_zero_vector(self):
+        vector = HashEmbeddingProvider(dimension=16).embed_batch([""])[0]
+        assert not vector.any()
+
+    def test_shared_words_are_more_similar(self):
+        provider = HashEmbeddingProvider()
+        query = provider.embed_query("kubernetes deployment")
+        related, unrelated = provider.embed_batch(
+            ["notes on kubernetes deployment", "grocery list for the weekend"]
+        )
+
+        assert float(query @ related) > float(query @ unrelated)
+
+
+class TestProviderRegistry:
+    """Tests for provider registration and lookup."""
+
+    def test_builtin_providers_registered(self):
+        assert {"llama-index", "sentence-transformers", "hash"} <= set(
+            available_embedding_providers()
+        )
+
+    def test_unknown_provider(self):
+        with pytest.raises(ValueError, match="Unknown embedding provider"):
+            create_embedding_provider("nope", "model")
+
+    def test_register_custom_provider(self):
+        class ConstantProvider(EmbeddingProvider):
+            name = "constant"
+
+            @property
+            def dimension(self):
+                return 2
+
+            def embed_batch(self, texts):
+                return np.ones((len(texts), 2), dtype=np.float32)
+
+        register_embedding_provider("constant", ConstantProvider)
+        try:
+            provider = create_embedding_provider("constant", "any")
+            assert provider.embed_query("x").tolist() == [1.0, 1.0]
+        finally:
+            providers._PROVIDERS.pop("constant")
+
+    def test_get_embedding_model_wraps_provider(self):
+        model = get_embedding_model("any", provider="hash", batch_size=8)
+
+        assert isinstance(model, ProviderEmbedding)
+        assert isinstance(model.provider, HashEmbeddingProvider)
+        assert model.dimension == 384
+        assert model.embed_batch_size == 8
+        assert len(model.get_text_embedding("hello world")) == 384
+        assert get_embedding_model("any", provider="hash", batch_size=8) is model
+
+
+class TestOfflineBuild:
+    """The hash provider runs a full build and query without a model download."""
+
+    def test_build_and_query(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        indexer = DocumentIndexer(config)
+        stats = indexer.build_index()
+        results = indexer.query("kubernetes deployment", max_results=1)
+
+        assert stats["total_documents"] == len(TOPICS)
+        assert results[0]["source_file"].endswith("note0.md")
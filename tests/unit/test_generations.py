@@ -0,0 +1,248 @@
+"""Tests for published index generations: atomic rebuilds, hot swaps and rollback."""
+
+import json
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from prometh_cortex.cli.commands.generations import generations as generations_command
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.indexer import document_indexer
+from prometh_cortex.vector_store import GenerationError, IndexGenerations
+from tests.unit.conftest import TOPICS, make_config
+
+
+def interrupt_rebuild(config, monkeypatch):
+    """Build the index, then interrupt a forced rebuild after two batches."""
+    DocumentIndexer(config).build_index()
+    monkeypatch.setattr(document_indexer, "DEFAULT_BATCH_CHUNKS", 1)
+    indexer = DocumentIndexer(config)
+    embed_batch = indexer._embed_batch
+    calls = []
+
+    def interrupting_embed(batch):
+        calls.append(batch)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        embed_batch(batch)
+
+    monkeypatch.setattr(indexer, "_embed_batch", interrupting_embed)
+    with pytest.raises(KeyboardInterrupt):
+        indexer.build_index(force_rebuild=True)
+
+
+class TestIndexGenerations:
+    """The pointer file names the current generation."""
+
+    def test_publish_prunes_and_rollback_restores(self, tmp_path):
+        generations = IndexGenerations(tmp_path, keep=2)
+        names = [generations.create() for _ in range(3)]
+        for name in names:
+            generations.publish(name)
+
+        assert generations.current() == "gen-000003"
+        assert [entry["name"] for entry in generations.history()] == [
+            "gen-000003",
+            "gen-000002",
+        ]
+        assert not generations.path("gen-000001").exists()
+
+        assert generations.rollback() == "gen-000002"
+        assert generations.current() == "gen-000002"
+        with pytest.raises(GenerationError):
+            generations.rollback("gen-000001")
+
+    def test_unpublished_generations_are_discarded(self, tmp_path):
+        generations = IndexGenerations(tmp_path)
+        generations.publish(generations.create())
+        leftover = generations.create()
+
+        generations.discard_unpublished()
+
+        assert not generations.path(leftover).exists()
+        assert generations.current_path().exists()
+
+    def test_legacy_layout_becomes_first_generation(self, tmp_path):
+        (tmp_path / "config.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("not part of the index")
+        (tmp_path / document_indexer.BUILD_CHECKPOINT_FILE).write_text("{}")
+        generations = IndexGenerations(tmp_path)
+
+        assert generations.current_path() == tmp_path
+        assert not (tmp_path / "generations.json").exists()
+
+        name = generations.adopt_legacy_layout()
+
+        path = generations.current_path()
+        assert path.name == name == "gen-000001"
+        assert (path / "config.json").exists()
+        assert not (path / "notes.txt").exists()
+        assert (tmp_path / "notes.txt").exists()
+        assert (tmp_path / document_indexer.BUILD_CHECKPOINT_FILE).exists()
+        assert json.loads((tmp_path / "generations.json").read_text())["current"] == path.name
+
+
+class TestGenerationsCommand:
+    """Rollback failures exit cleanly."""
+
+    def test_rollback_without_previous_generation_exits(self, tmp_path):
+        config = make_config(tmp_path)
+
+        result = CliRunner().invoke(
+            generations_command,
+            ["rollback", "--confirm"],
+            obj={"config": config, "verbose": False},
+        )
+
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert "No previous generation" in result.output
+
+    def test_rollback_keeps_memories(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        indexer = DocumentIndexer(config)
+        indexer.build_index()
+        indexer.build_index(force_rebuild=True)
+        indexer.add_memory_document("Deploy notes", "kubernetes rollout checklist")
+
+        result = CliRunner().invoke(
+            generations_command,
+            ["rollback", "--confirm"],
+            obj={"config": config, "verbose": False},
+        )
+
+        assert result.exit_code == 0
+        assert "are all kept" in result.output
+        assert len(DocumentIndexer(config).list_memories()) == 1
+
+
+class TestGenerationRebuilds:
+    """Forced rebuilds publish a new generation without disturbing readers."""
+
+    def test_reader_keeps_old_generation_until_publish(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        DocumentIndexer(config).build_index()
+        reader = DocumentIndexer(config)
+
+        writer = DocumentIndexer(config)
+        writer.vector_store.begin_generation()
+        writer.vector_store.add_documents(
+            [{"id": "sailing", "text": "sailing boats", "metadata": {"file_path": "sailing"}}]
+        )
+
+        assert reader.query("garden tomatoes", max_results=1)[0]["source_file"].endswith(
+            "note1.md"
+        )
+
+        writer.vector_store.publish_generation()
+        results = reader.query("sailing boats", max_results=5)
+
+        assert [r["source_file"] for r in results] == ["sailing"]
+
+    def test_legacy_index_is_moved_by_writers_only(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        DocumentIndexer(config).build_index()
+        index_dir = config.rag_index_dir
+        for entry in (index_dir / "generations" / "gen-000001").iterdir():
+            entry.rename(index_dir / entry.name)
+        shutil.rmtree(index_dir / "generations")
+        (index_dir / "generations.json").unlink()
+
+        reader = DocumentIndexer(config)
+
+        assert reader.query("garden tomatoes", max_results=1)[0]["source_file"].endswith(
+            "note1.md"
+        )
+        assert (index_dir / "config.json").exists()
+        assert not (index_dir / "generations").exists()
+
+        stats = DocumentIndexer(config).build_index()
+
+        assert stats["total_documents"] == 0
+        assert IndexGenerations(index_dir).current() == "gen-000001"
+        assert not (index_dir / "config.json").exists()
+
+    def test_force_rebuild_carries_memories(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        indexer = DocumentIndexer(config)
+        indexer.build_index()
+        indexer.add_memory_document("Deploy notes", "kubernetes rollout checklist")
+
+        stats = indexer.build_index(force_rebuild=True)
+
+        assert stats["generation"] == "gen-000002"
+        assert stats["total_documents"] == len(TOPICS)
+        reopened = DocumentIndexer(config)
+        assert len(reopened.list_memories()) == 1
+        results = reopened.query("kubernetes rollout checklist", max_results=5)
+        assert any(r["metadata"].get("source_type") == "prmth_memory" for r in results)
+        assert [entry["name"] for entry in IndexGenerations(config.rag_index_dir).history()] == [
+            "gen-000002",
+            "gen-000001",
+        ]
+
+    def test_interrupted_rebuild_resumes_in_its_generation(
+        self, tmp_path, notes_dir, monkeypatch
+    ):
+        config = make_config(tmp_path, build_checkpoint_chunks=1)
+        interrupt_rebuild(config, monkeypatch)
+
+        resumed = DocumentIndexer(config)
+        assert resumed.vector_store.get_storage_dir().name == "gen-000001"
+        assert resumed.get_build_checkpoint()["generation"] == "gen-000002"
+
+        stats = resumed.build_index(resume=True)
+
+        assert stats["generation"] == "gen-000002"
+        assert stats["total_documents"] == len(TOPICS) - 2
+        for i, topic in enumerate(TOPICS):
+            results = resumed.query(topic, max_results=1)
+            assert results[0]["source_file"].endswith(f"note{i}.md")
+
+    def test_build_without_resume_discards_interrupted_rebuild(
+        self, tmp_path, notes_dir, monkeypatch
+    ):
+        config = make_config(tmp_path, build_checkpoint_chunks=1)
+        interrupt_rebuild(config, monkeypatch)
+        indexer = DocumentIndexer(config)
+
+        stats = indexer.build_index()
+
+        assert "resumed_from" not in stats
+        assert indexer.get_build_checkpoint() is None
+        assert IndexGenerations(config.rag_index_dir).current() == "gen-000001"
+        assert not (config.rag_index_dir / "generations" / "gen-000002").exists()
+
+    def test_memories_survive_rebuild_and_delete(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        indexer = DocumentIndexer(config)
+        indexer.build_index()
+        indexer.add_memory_document("Deploy notes", "kubernetes rollout checklist")
+        reader = DocumentIndexer(config)
+
+        # A memory saved by a server while a rebuild is in progress
+        rebuilder = DocumentIndexer(config)
+        rebuilder.vector_store.begin_generation()
+        reader.add_memory_document("Garden", "tomato watering schedule")
+        rebuilder.vector_store.publish_generation()
+        indexer.vector_store.delete_collection()
+
+        memories = DocumentIndexer(config).list_memories()
+        assert {memory["title"] for memory in memories} == {"Deploy notes", "Garden"}
+        results = reader.query("tomato watering schedule", max_results=1)
+        assert results[0]["metadata"]["source_type"] == "prmth_memory"
+
+    def test_delete_collection_keeps_previous_generation(self, tmp_path, notes_dir):
+        config = make_config(tmp_path)
+        indexer = DocumentIndexer(config)
+        indexer.build_index()
+
+        indexer.vector_store.delete_collection()
+
+        assert indexer.query("garden tomatoes") == []
+        generations = IndexGenerations(config.rag_index_dir)
+        generations.rollback()
+        assert DocumentIndexer(config).query("garden tomatoes", max_results=1)[0][
+            "source_file"
+        ].endswith("note1.md")
@@ -0,0 +1,120 @@
+"""Tests for Qdrant hybrid search: BM25 sparse vectors fused with dense search."""
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import FusionQuery
+
+from prometh_cortex.indexer.pipeline import ChunkTask, prepare_document
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from prometh_cortex.vector_store.sparse import (
+    document_sparse_vector,
+    query_sparse_vector,
+    term_index,
+)
+from tests.unit.conftest import make_config
+
+
+@pytest.fixture
+def client(monkeypatch):
+    local = QdrantClient(location=":memory:")
+    monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+    return local
+
+
+def make_store(tmp_path, **overrides):
+    store = QdrantVectorStore(
+        make_config(
+            tmp_path,
+            vector_store_type="qdrant",
+            qdrant_collection_name="notes",
+            **overrides,
+        )
+    )
+    store.initialize()
+    return store
+
+
+def note(doc_id, text, **metadata):
+    return {"id": doc_id, "text": text, "metadata": {"file_path": doc_id, **metadata}}
+
+
+def weights(vector):
+    return dict(zip(vector["indices"], vector["values"]))
+
+
+class TestSparseVectors:
+    """Chunks get saturated term frequencies; queries weight terms equally."""
+
+    def test_term_frequency_saturates(self):
+        vector = weights(document_sparse_vector("error error error timeout"))
+
+        assert vector[term_index("error")] > vector[term_index("timeout")]
+        assert vector[term_index("error")] < 3 * vector[term_index("timeout")]
+        assert weights(query_sparse_vector("Error error")) == {term_index("error"): 1.0}
+
+    def test_chunking_attaches_sparse_vectors(self, tmp_path):
+        path = tmp_path / "note.md"
+        path.write_text("# Note\n\nThe ERR_4711 code.\n")
+
+        plain = prepare_document(ChunkTask(str(path), "notes", 512, 50))
+        hybrid = prepare_document(
+            ChunkTask(str(path), "notes", 512, 50, sparse_vectors=True)
+        )
+
+        assert "sparse" not in plain.documents[0]
+        assert term_index("err_4711") in hybrid.documents[0]["sparse"]["indices"]
+
+
+class TestQdrantHybridSearch:
+    """Lexical and semantic hits are fused by the server in one request."""
+
+    def test_exact_term_found_by_fused_query(self, client, tmp_path, monkeypatch):
+        store = make_store(tmp_path, qdrant_hybrid=True, qdrant_fusion="dbsf")
+        store.add_documents(
+            [
+                note("a.md", "garden tomatoes and basil"),
+                note("b.md", "deploy failed with ERR_4711"),
+                note("c.md", "sailing boats", document_id="c"),
+            ]
+        )
+        requests = []
+        query_points = client.query_points
+
+        def recording(*args, **kwargs):
+            requests.append(kwargs)
+            return query_points(*args, **kwargs)
+
+        monkeypatch.setattr(client, "query_points", recording)
+        # A query vector pointing away from the document with the term
+        vector = store.embed_model.get_query_embedding("garden tomatoes")
+
+        results = store.query(vector, top_k=1, query_text="ERR_4711")
+
+        assert [r["source_file"] for r in results] == ["b.md"]
+        (request,) = requests
+        assert [p.using for p in request["prefetch"]] == ["dense", "bm25"]
+        assert isinstance(request["query"], FusionQuery)
+        assert request["query"].fusion == "dbsf"
+
+    def test_rebuild_converts_to_hybrid_layout(self, client, tmp_path):
+        store = make_store(tmp_path)
+        store.add_documents(
+            [note("memory_m_0", "rotate the ERR_4711 keys", source_type="prmth_memory")]
+        )
+        vector = store.embed_model.get_query_embedding("garden")
+
+        hybrid = make_store(tmp_path, qdrant_hybrid=True)
+        hybrid.begin_generation()
+        hybrid.add_documents([note("a.md", "garden tomatoes")])
+        hybrid.publish_generation()
+
+        assert client.get_collection("notes").config.params.sparse_vectors
+        found = hybrid.query(vector, top_k=1, query_text="ERR_4711")
+        assert [r["source_file"] for r in found] == ["memory_m_0"]
+        # A store opened before the switch follows the new layout
+        store.add_documents([note("b.md", "sailing boats")])
+        assert store.query(vector, top_k=3, query_text="sailing")
+
+    def test_invalid_fusion_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            make_config(tmp_path, qdrant_fusion="sum")
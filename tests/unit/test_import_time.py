@@ -0,0 +1,115 @@
+"""Import-time budget tests for the CLI entry point and lightweight commands."""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Heavy dependencies that must only load when an embedding model or vector
+# store backend is actually used.
+HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "sentence_transformers",
+    "llama_index",
+    "faiss",
+    "qdrant_client",
+    "fastapi",
+    "fastmcp",
+)
+
+# Cumulative `-X importtime` budget (microseconds) for the CLI entry point.
+# The target is ~200 ms; the extra headroom absorbs slow CI machines.
+CLI_IMPORT_BUDGET_US = 500_000
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Run `statement` in a fresh interpreter and return cumulative import times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _heavy_modules_loaded(times: Dict[str, int]):
+    return sorted(
+        name for name in times if name.split(".")[0] in HEAVY_MODULES
+    )
+
+
+class TestImportTime:
+    """Tests that keep `pcortex` startup free of heavy imports."""
+
+    def test_cli_main_does_not_import_heavy_modules(self):
+        """Importing the CLI entry point should not load ML or backend libraries."""
+        times = _import_times("import prometh_cortex.cli.main")
+        assert _heavy_modules_loaded(times) == []
+
+    def test_cli_main_within_budget(self):
+        """The CLI entry point should import within the startup budget."""
+        times = _import_times("import prometh_cortex.cli.main")
+        assert times["prometh_cortex.cli.main"] < CLI_IMPORT_BUDGET_US
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "prometh_cortex",
+            "prometh_cortex.vector_store",
+            "prometh_cortex.indexer",
+            "prometh_cortex.cli.commands.memory",
+            "prometh_cortex.cli.commands.sources",
+            "prometh_cortex.cli.commands.health",
+        ],
+    )
+    def test_lightweight_modules_do_not_import_heavy_modules(self, module):
+        """Package roots and metadata commands should stay lightweight."""
+        times = _import_times(f"import {module}")
+        assert _heavy_modules_loaded(times) == []
+
+
+class TestLazyAttributes:
+    """Tests for PEP 562 lazy attributes on package roots."""
+
+    def test_package_root_resolves_lazy_attributes(self):
+        """Public attributes of prometh_cortex resolve on first access."""
+        import prometh_cortex
+        from prometh_cortex.config import load_config
+
+        assert prometh_cortex.load_config is load_config
+        assert "DocumentIndexer" in dir(prometh_cortex)
+
+    def test_package_root_unknown_attribute(self):
+        """Unknown attributes still raise AttributeError."""
+        import prometh_cortex
+
+        with pytest.raises(AttributeError):
+            prometh_cortex.does_not_exist
+
+    def test_vector_store_backends_resolve_lazily(self):
+        """Backend classes remain importable from the vector_store package."""
+        from prometh_cortex.vector_store import FAISSVectorStore
+        from prometh_cortex.vector_store.faiss_store import (
+            FAISSVectorStore as DirectFAISSVectorStore,
+        )
+
+        assert FAISSVectorStore is DirectFAISSVectorStore
+
+    def test_cli_lists_lazy_commands(self):
+        """Lazy commands appear in the CLI without being imported up front."""
+        from prometh_cortex.cli.main import LAZY_COMMANDS, cli
+
+        commands = cli.list_commands(None)
+        for name in LAZY_COMMANDS:
+            assert name in commands
+        assert "config" in commands
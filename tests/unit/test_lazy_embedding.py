@@ -0,0 +1,168 @@
+"""Tests for lazy embedding model loading in the indexer and vector stores."""
+
+import hashlib
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from prometh_cortex.config import Config
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.vector_store.faiss_store import FAISSVectorStore
+
+DIMENSION = 8
+
+
+class HashEmbedding(BaseEmbedding):
+    """Deterministic, model-free embedding for tests."""
+
+    def _embed(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255.0 for byte in digest[:DIMENSION]]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+def _fail_to_load(config):
+    raise AssertionError(f"embedding model {config.embedding_model} should not be loaded")
+
+
+def _memory_chunk(document_id: str, index: int, text: str) -> dict:
+    return {
+        "id": f"{document_id}_{index}",
+        "text": text,
+        "metadata": {
+            "title": document_id,
+            "source_type": "prmth_memory",
+            "document_id": document_id,
+            "created": "2025-01-01T00:00:00",
+        },
+    }
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(rag_index_dir=tmp_path / "index")
+
+
+@pytest.fixture
+def built_store(config):
+    """A FAISS store persisted to disk with two memory documents and a plain one."""
+    store = FAISSVectorStore(config, embed_model=HashEmbedding())
+    store.initialize()
+    store.add_documents(
+        [
+            _memory_chunk("memory_a", 0, "alpha notes"),
+            _memory_chunk("memory_a", 1, "more alpha"),
+            _memory_chunk("memory_b", 0, "beta notes"),
+            {"id": "plain_0", "text": "gamma notes", "metadata": {}},
+        ]
+    )
+    store.save_index()
+    return store
+
+
+class TestFAISSLazyEmbedding:
+    """Metadata-only FAISS operations must not load the embedding model."""
+
+    def test_construction_does_not_load_model(self, config):
+        with patch(
+            "prometh_cortex.vector_store.faiss_store.get_embedding_model_for_config",
+            side_effect=_fail_to_load,
+        ):
+            store = FAISSVectorStore(config)
+            store.initialize()
+
+        assert store._embed_model is None
+
+    def test_vector_dimension_persisted(self, config, built_store):
+        with patch(
+            "prometh_cortex.vector_store.faiss_store.get_embedding_model_for_config",
+            side_effect=_fail_to_load,
+        ):
+            store = FAISSVectorStore(config)
+            store.initialize()
+            stats = store.get_stats()
+
+        assert stats["vector_dimension"] == DIMENSION
+        assert stats["index_exists"] is True
+        assert stats["total_documents"] == 4
+
+    def test_list_and_forget_without_model(self, config, built_store):
+        with patch(
+            "prometh_cortex.vector_store.faiss_store.get_embedding_model_for_config",
+            side_effect=_fail_to_load,
+        ):
+            store = FAISSVectorStore(config)
+            store.initialize()
+
+            listed = {doc["document_id"] for doc in store.list_memory_documents()}
+            assert listed == {"memory_a", "memory_b"}
+
+            assert store.delete_memory_documents(["memory_a"]) == 1
+
+            reloaded = FAISSVectorStore(config)
+            reloaded.initialize()
+            remaining = reloaded.get_indexed_documents()
+
+        assert remaining == {"memory_b_0", "plain_0"}
+
+    def test_forget_removes_vectors(self, config, built_store):
+        built_store.delete_memory_documents(["memory_a"])
+
+        store = FAISSVectorStore(config, embed_model=HashEmbedding())
+        store.initialize()
+        results = store.query_by_text("alpha notes", top_k=10)
+
+        assert {r["metadata"].get("document_id") for r in results} == {
+            "memory_b",
+            None,
+        }
+
+    def test_query_uses_given_vector(self, config, built_store):
+        with patch(
+            "prometh_cortex.vector_store.faiss_store.get_embedding_model_for_config",
+            side_effect=_fail_to_load,
+        ):
+            store = FAISSVectorStore(config)
+            store.initialize()
+            results = store.query(HashEmbedding()._embed("gamma notes"), top_k=1)
+
+        assert results[0]["content"] == "gamma notes"
+
+
+class TestIndexerLazyEmbedding:
+    """DocumentIndexer defers model loading until the first embed."""
+
+    def test_init_does_not_load_model(self, config):
+        with patch(
+            "prometh_cortex.indexer.document_indexer.get_embedding_model_for_config",
+            side_effect=_fail_to_load,
+        ), patch(
+            "prometh_cortex.vector_store.faiss_store.get_embedding_model_for_config",
+            side_effect=_fail_to_load,
+        ):
+            indexer = DocumentIndexer(config)
+            indexer.vector_store.list_memory_documents()
+
+        assert indexer._embed_model is None
+
+    def test_model_loaded_on_first_use(self, config):
+        embedding = HashEmbedding()
+        with patch(
+            "prometh_cortex.indexer.document_indexer.get_embedding_model_for_config",
+            return_value=embedding,
+        ) as loader:
+            indexer = DocumentIndexer(config)
+            assert indexer.embed_model is embedding
+            assert indexer.embed_model is embedding
+
+        loader.assert_called_once_with(config)
@@ -0,0 +1,140 @@
+"""Tests for chunking markdown along its heading structure."""
+
+from pathlib import Path
+
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.parser import parse_markdown_content
+from prometh_cortex.parser.markdown import extract_document_chunks
+from prometh_cortex.parser.structure import parse_sections
+from tests.unit.conftest import make_config
+
+REFERENCE = "# CLI Reference\n\nAll commands of the tool.\n\n" + "\n\n".join(
+    f"## cmd{i}\n\nRuns step {i} of the pipeline.\n\n### Options\n\n- `--force`: redo step {i}\n- `--dry-run`: print only"
+    for i in range(12)
+)
+
+CODE = "\n".join(f"echo line {i}" for i in range(30))
+
+GUIDE = f"""---
+title: Install Guide
+tags: [setup]
+---
+# Install Guide
+
+Intro paragraph.
+
+## Linux
+
+```bash
+{CODE}
+```
+
+## Settings
+
+| key | value |
+|-----|-------|
+""" + "\n".join(f"| option{i} | the value of option {i} |" for i in range(20)) + "\n"
+
+FENCE = "  ```python\n" + "\n".join(f"  value_{i} = compute({i})" for i in range(12)) + "\n  ```"
+
+STEPS = f"# Setup\n\n- Step one:\n\n{FENCE}\n- Step two: run the script.\n"
+
+NESTED = "# Guide\n\n" + "\n\n".join(
+    f"## Part {i}\n\n" + " ".join(f"Part {i} sentence {j}." for j in range(8)) for i in range(3)
+)
+
+
+def chunks_of(content, chunking, chunk_size=256):
+    document = parse_markdown_content(content, Path("doc.md"))
+    return extract_document_chunks(document, chunk_size=chunk_size, chunk_overlap=0, chunking=chunking)
+
+
+class TestStructuralChunks:
+    """Sections are packed whole; code blocks and table rows are never cut."""
+
+    def test_sections_follow_heading_hierarchy(self):
+        sections = parse_sections(REFERENCE)
+
+        assert sections[0].section_path == "CLI Reference"
+        assert sections[2].section_path == "CLI Reference > cmd0 > Options"
+        assert sections[3].section_path == "CLI Reference > cmd1"
+
+    def test_small_sections_are_packed(self):
+        structural = chunks_of(REFERENCE, "markdown")
+        document = parse_markdown_content(REFERENCE, Path("doc.md"))
+        fixed = extract_document_chunks(document, chunk_size=256, chunk_overlap=50)
+
+        assert len(structural) <= len(parse_sections(REFERENCE)) // 4
+        assert len(structural) <= len(fixed)
+        assert all(len(chunk["content"]) <= 256 for chunk in structural)
+        # Every command section stays in one chunk with its options
+        for i in range(12):
+            (chunk,) = [c for c in structural if f"## cmd{i}\n" in c["content"]]
+            assert f"redo step {i}" in chunk["content"]
+
+    def test_code_blocks_and_table_rows_stay_whole(self):
+        chunks = chunks_of(GUIDE, "markdown", chunk_size=200)
+
+        (code,) = [c for c in chunks if "echo line 0" in c["content"]]
+        assert CODE in code["content"]
+        assert code["content"].startswith("## Linux")
+        assert code["metadata"]["section_path"] == "Install Guide > Linux"
+
+        tables = [c for c in chunks if "| option" in c["content"]]
+        assert len(tables) > 1
+        for chunk in tables:
+            assert chunk["metadata"]["section_path"] == "Install Guide > Settings"
+            rows = [line for line in chunk["content"].split("\n") if line.startswith("|")]
+            assert rows[:2] == ["| key | value |", "|-----|-------|"]
+            assert all(row.endswith("|") for row in rows)
+        assert sum(c["content"].count("| option") for c in tables) == 20
+
+    def test_code_blocks_in_lists_stay_whole(self):
+        chunks = chunks_of(STEPS, "markdown", chunk_size=200)
+
+        (code,) = [c for c in chunks if "value_0" in c["content"]]
+        assert FENCE.strip() in code["content"]
+
+    def test_heading_without_text_leads_first_subsection(self):
+        chunks = chunks_of(NESTED, "markdown", chunk_size=200)
+
+        assert chunks[0]["content"].startswith("# Guide\n\n## Part 0\n\nPart 0 sentence 0.")
+        assert chunks[0]["metadata"]["section_path"] == "Guide > Part 0"
+        assert not any(c["content"].strip() == "# Guide" for c in chunks)
+
+    def test_frontmatter_text_leads_first_chunk(self):
+        first = chunks_of(GUIDE, "markdown", chunk_size=200)[0]
+
+        assert first["content"].startswith("Install Guide setup")
+        assert first["metadata"]["section_path"] == ""
+        assert "Intro paragraph." in first["content"]
+
+
+class TestMarkdownSourceBuild:
+    """A markdown source stores section paths with its chunks."""
+
+    def test_query_results_carry_section_path(self, tmp_path, monkeypatch):
+        notes = tmp_path / "docs"
+        notes.mkdir()
+        (notes / "reference.md").write_text(REFERENCE)
+        monkeypatch.chdir(tmp_path)
+        indexer = DocumentIndexer(
+            make_config(
+                tmp_path,
+                sources=[
+                    {
+                        "name": "docs",
+                        "chunk_size": 256,
+                        "chunk_overlap": 0,
+                        "chunking": "markdown",
+                        "source_patterns": ["docs"],
+                    }
+                ],
+            )
+        )
+        indexer.build_index()
+
+        (hit,) = indexer.query("cmd7 redo step 7", max_results=1)
+
+        assert "## cmd7" in hit["content"]
+        assert hit["metadata"]["section_path"].startswith("CLI Reference > cmd")
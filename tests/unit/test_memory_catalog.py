@@ -0,0 +1,116 @@
+"""Tests for the memory catalog: ordered, filtered and paginated memory listing."""
+
+import numpy as np
+import pytest
+
+from prometh_cortex.vector_store.faiss_store import FAISSVectorStore
+from prometh_cortex.vector_store.memory_catalog import (
+    MemoryCatalog,
+    created_timestamp,
+    memory_cursor,
+)
+from tests.unit.conftest import make_config
+
+
+def memory(document_id, day, **metadata):
+    return {
+        "document_id": document_id,
+        "source_type": "prmth_memory",
+        "created": f"2026-03-{day:02d}T12:00:00",
+        **metadata,
+    }
+
+
+def ids(memories):
+    return [m["document_id"] for m in memories]
+
+
+@pytest.fixture
+def catalog():
+    return MemoryCatalog.from_chunks(
+        {
+            "m1_0": memory("m1", 1, project="alpha", tags=["ops"]),
+            "m1_1": memory("m1", 1, project="alpha", tags=["ops"]),
+            "m2_0": memory("m2", 2, project="beta", tags=["ops", "db"]),
+            "m3_0": memory("m3", 3, project="alpha"),
+            "m4_0": memory("m4", 4, tags=["db"]),
+            "old_0": {"document_id": "old", "source_type": "prmth_memory"},
+        }
+    )
+
+
+class TestMemoryCatalog:
+    """One entry per document, newest first."""
+
+    def test_lists_documents_newest_first(self, catalog):
+        assert ids(catalog.list()) == ["m4", "m3", "m2", "m1", "old"]
+        assert ids(catalog.list(since=created_timestamp(memory("x", 2)))) == [
+            "m4",
+            "m3",
+            "m2",
+        ]
+
+    def test_secondary_indexes_filter(self, catalog):
+        assert ids(catalog.list(project="alpha")) == ["m3", "m1"]
+        assert ids(catalog.list(tag="db")) == ["m4", "m2"]
+        assert ids(catalog.list(project="beta", tag="ops")) == ["m2"]
+        assert catalog.list(project="missing") == []
+
+    def test_project_nested_in_metadata_is_indexed(self):
+        catalog = MemoryCatalog()
+        catalog.add("n_0", memory("n", 5, metadata={"project": "alpha"}))
+
+        assert ids(catalog.list(project="alpha")) == ["n"]
+
+    def test_cursor_pages_through_without_overlap(self, catalog):
+        pages, cursor = [], None
+        while True:
+            page = catalog.list(limit=2, cursor=cursor)
+            if not page:
+                break
+            pages.append(ids(page))
+            cursor = memory_cursor(page[-1])
+
+        assert pages == [["m4", "m3"], ["m2", "m1"], ["old"]]
+
+    def test_document_removed_with_its_last_chunk(self, catalog):
+        catalog.remove_chunks(["m1_0"])
+        assert "m1" in catalog
+
+        catalog.remove_chunks(["m1_1", "m2_0"])
+
+        assert ids(catalog.list()) == ["m4", "m3", "old"]
+        assert ids(catalog.list(tag="ops")) == []
+        assert catalog.chunk_ids(["m1", "m3"]) == {"m3_0"}
+
+
+class TestFAISSMemoryListing:
+    """The FAISS store lists memories from its catalog."""
+
+    def test_listing_survives_reopen_and_delete(self, tmp_path):
+        config = make_config(tmp_path)
+        store = FAISSVectorStore(config)
+        store.initialize()
+        store.add_documents(
+            [
+                {
+                    "id": f"m{day}_0",
+                    "text": f"memory {day}",
+                    "vector": np.ones(4, dtype=np.float32),
+                    "metadata": memory(f"m{day}", day, project="alpha" if day % 2 else "beta"),
+                }
+                for day in range(1, 6)
+            ]
+        )
+
+        reopened = FAISSVectorStore(config)
+        reopened.initialize()
+        first = reopened.list_memory_documents(limit=2)
+        rest = reopened.list_memory_documents(cursor=memory_cursor(first[-1]))
+
+        assert ids(first) == ["m5", "m4"]
+        assert ids(rest) == ["m3", "m2", "m1"]
+        assert ids(reopened.list_memory_documents(project="alpha")) == ["m5", "m3", "m1"]
+
+        assert reopened.delete_memory_documents(["m5"]) == 1
+        assert ids(store.list_memory_documents(limit=1)) == ["m4"]
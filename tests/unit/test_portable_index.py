@@ -0,0 +1,102 @@
+"""Tests for portable index exports moved between the FAISS and Qdrant backends."""
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from qdrant_client import QdrantClient
+
+from prometh_cortex.cli.commands.portable import import_index
+from prometh_cortex.indexer import DocumentIndexer, IndexerError
+from prometh_cortex.vector_store.portable import (
+    ExportFormatError,
+    iter_export,
+    read_export_manifest,
+)
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from tests.unit.conftest import TOPICS, make_config
+
+
+def index_config(tmp_path, name, **overrides):
+    return make_config(tmp_path, rag_index_dir=tmp_path / name, **overrides)
+
+
+def forbid_embedding(monkeypatch, indexer):
+    monkeypatch.setattr(
+        type(indexer.vector_store.embed_model),
+        "get_text_embedding_batch",
+        lambda *args, **kwargs: pytest.fail("import must not embed"),
+    )
+
+
+class TestPortableIndex:
+    """An export loads into either backend with its vectors and memories."""
+
+    def test_faiss_to_qdrant_and_back(self, notes_dir, tmp_path, monkeypatch):
+        faiss = DocumentIndexer(index_config(tmp_path, "faiss"))
+        faiss.build_index()
+        faiss.add_memory_document("Deploy checklist", "Rotate the keys first.")
+        (expected,) = faiss.query("sourdough bread", max_results=1)
+
+        manifest = faiss.export_index(tmp_path / "export")
+
+        assert manifest["source_backend"] == "faiss"
+        assert manifest["chunks"] == len(TOPICS) + 1
+        batches = list(iter_export(tmp_path / "export"))
+        assert batches[0][1].dtype == np.float32
+        assert np.load(tmp_path / "export" / "vectors-00000.npy").dtype == np.float16
+
+        local = QdrantClient(location=":memory:")
+        monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+        qdrant = DocumentIndexer(index_config(tmp_path, "qdrant", vector_store_type="qdrant"))
+        forbid_embedding(monkeypatch, qdrant)
+
+        stats = qdrant.import_index(tmp_path / "export")
+
+        assert stats["chunks"] == len(TOPICS) + 1 and stats["memories"] == 1
+        (found,) = qdrant.query("sourdough bread", max_results=1)
+        assert found["source_file"] == expected["source_file"]
+        assert found["similarity_score"] == pytest.approx(expected["similarity_score"], abs=1e-3)
+        (memory,) = qdrant.list_memories()
+        assert memory["title"] == "Deploy checklist"
+        # File hashes came along, so nothing needs re-indexing
+        assert qdrant.build_index()["total_chunks"] == 0
+
+        qdrant.export_index(tmp_path / "export-qdrant")
+        back = DocumentIndexer(index_config(tmp_path, "faiss-again"))
+        back.import_index(tmp_path / "export-qdrant")
+
+        (found,) = back.query("sourdough bread", max_results=1)
+        assert found["source_file"] == expected["source_file"]
+        assert back.list_memories()[0]["document_id"] == memory["document_id"]
+
+    def test_incomplete_export_is_rejected(self, notes_dir, tmp_path):
+        indexer = DocumentIndexer(index_config(tmp_path, "faiss"))
+        indexer.build_index()
+        indexer.export_index(tmp_path / "export")
+        (tmp_path / "export" / "manifest.json").unlink()
+
+        with pytest.raises(ExportFormatError):
+            read_export_manifest(tmp_path / "export")
+        with pytest.raises(IndexerError):
+            indexer.import_index(tmp_path / "export")
+
+    def test_export_from_other_model_is_rejected(self, notes_dir, tmp_path):
+        DocumentIndexer(index_config(tmp_path, "faiss")).build_index()
+        DocumentIndexer(index_config(tmp_path, "faiss")).export_index(tmp_path / "export")
+
+        other = DocumentIndexer(index_config(tmp_path, "other", embedding_model="other/model"))
+
+        with pytest.raises(IndexerError, match="embedding model"):
+            other.import_index(tmp_path / "export")
+
+    def test_import_command_exits_on_invalid_export(self, notes_dir, tmp_path):
+        (tmp_path / "export").mkdir()
+
+        result = CliRunner().invoke(
+            import_index,
+            [str(tmp_path / "export"), "--confirm"],
+            obj={"config": index_config(tmp_path, "faiss"), "verbose": False},
+        )
+
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
@@ -0,0 +1,174 @@
+"""Tests for blue/green Qdrant rebuilds behind a collection alias and memory listing."""
+
+import pytest
+from qdrant_client import QdrantClient
+
+from prometh_cortex.vector_store import DocumentChange, qdrant_store
+from prometh_cortex.vector_store.memory_catalog import created_timestamp, memory_cursor
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from tests.unit.conftest import make_config
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """One in-process Qdrant shared by every store in the test."""
+    local = QdrantClient(location=":memory:")
+    monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+    return local
+
+
+@pytest.fixture
+def config(tmp_path):
+    return make_config(
+        tmp_path, vector_store_type="qdrant", qdrant_collection_name="notes"
+    )
+
+
+def make_store(config):
+    store = QdrantVectorStore(config)
+    store.initialize()
+    return store
+
+
+def note(doc_id, text, **metadata):
+    return {"id": doc_id, "text": text, "metadata": {"file_path": doc_id, **metadata}}
+
+
+def aliases(client):
+    return {alias.alias_name: alias.collection_name for alias in client.get_aliases().aliases}
+
+
+class TestQdrantAliases:
+    """Rebuilds fill a new collection version and switch the alias."""
+
+    def test_new_collection_is_first_version_behind_alias(self, client, config):
+        make_store(config)
+
+        assert aliases(client) == {"notes": "notes_v1"}
+
+    def test_rebuild_is_invisible_until_publish(self, client, config):
+        writer = make_store(config)
+        writer.add_documents(
+            [
+                note("a.md", "garden tomatoes"),
+                note("memory_x_0", "deploy checklist", source_type="prmth_memory"),
+            ]
+        )
+        reader = make_store(config)
+        vector = writer.embed_model.get_query_embedding("sailing boats")
+
+        assert writer.begin_generation("prmth_memory") == 1
+        writer.add_documents([note("b.md", "sailing boats")])
+
+        assert {r["source_file"] for r in reader.query(vector, top_k=5)} == {
+            "a.md",
+            "memory_x_0",
+        }
+
+        assert writer.publish_generation() == "notes_v2"
+
+        assert {r["source_file"] for r in reader.query(vector, top_k=5)} == {
+            "b.md",
+            "memory_x_0",
+        }
+        assert aliases(client)["notes"] == "notes_v2"
+        assert any(alias.startswith("notes_v1_retired_") for alias in aliases(client))
+
+    def test_retired_collection_dropped_after_grace(self, client, config, monkeypatch):
+        store = make_store(config)
+        store.begin_generation()
+        store.publish_generation()
+        assert "notes_v1" in {c.name for c in client.get_collections().collections}
+
+        monkeypatch.setattr(qdrant_store, "RETIRED_COLLECTION_GRACE_SECONDS", 0)
+        store.save_index()
+
+        assert {c.name for c in client.get_collections().collections} == {"notes_v2"}
+
+    def test_unpublished_rebuild_is_resumed_or_discarded(self, client, config):
+        store = make_store(config)
+        store.begin_generation()
+        store.add_documents([note("a.md", "garden tomatoes")])
+
+        resumed = make_store(config)
+        assert resumed.resume_generation("notes_v2")
+        assert not resumed.resume_generation("notes_v1")
+
+        restarted = make_store(config)
+        restarted.begin_generation()
+        assert restarted.get_generation() == "notes_v2"
+        assert client.count("notes_v2").count == 0
+
+
+def memory(day, **metadata):
+    return note(
+        f"memory_{day}_0",
+        f"memory {day}",
+        source_type="prmth_memory",
+        document_id=f"memory_{day}",
+        chunk_index=0,
+        created=f"2026-03-{day:02d}T12:00:00",
+        **metadata,
+    )
+
+
+class TestQdrantMemoryListing:
+    """Memory pages are ordered and filtered by the server."""
+
+    def test_pages_follow_creation_time(self, client, config):
+        store = make_store(config)
+        store.add_documents(
+            [memory(day, project="alpha" if day % 2 else "beta") for day in range(1, 6)]
+        )
+        # Memories written before created_ts was stored, by a version that
+        # kept no schema fingerprint, get it on startup
+        (config.rag_index_dir / "qdrant_schema.json").unlink()
+        store = make_store(config)
+
+        first = store.list_memory_documents(limit=2)
+        rest = store.list_memory_documents(limit=5, cursor=memory_cursor(first[-1]))
+
+        assert [m["document_id"] for m in first] == ["memory_5", "memory_4"]
+        assert [m["document_id"] for m in rest] == ["memory_3", "memory_2", "memory_1"]
+        assert "text" not in first[0]
+        assert [
+            m["document_id"] for m in store.list_memory_documents(project="alpha", limit=5)
+        ] == ["memory_5", "memory_3", "memory_1"]
+        since = created_timestamp({"created": "2026-03-04T00:00:00"})
+        assert [m["document_id"] for m in store.list_memory_documents(since=since)] == [
+            "memory_5",
+            "memory_4",
+        ]
+
+    def test_forget_many_memories_in_one_delete(self, client, config, monkeypatch):
+        store = make_store(config)
+        store.add_documents([memory(day) for day in range(1, 6)])
+        calls = []
+        delete = client.delete
+
+        def counting_delete(*args, **kwargs):
+            calls.append(kwargs)
+            return delete(*args, **kwargs)
+
+        monkeypatch.setattr(client, "delete", counting_delete)
+
+        assert store.delete_memory_documents(["memory_1", "memory_3", "memory_5"]) == 3
+
+        assert len(calls) == 1
+        assert [m["document_id"] for m in store.list_memory_documents()] == [
+            "memory_4",
+            "memory_2",
+        ]
+
+    def test_file_changes_delete_all_chunks(self, client, config):
+        store = make_store(config)
+        store.add_documents(
+            [note(f"a.md_{i}", f"chunk {i}", file_path="a.md") for i in range(3)]
+            + [note("b.md_0", "other", file_path="b.md")]
+        )
+
+        store.apply_incremental_changes(
+            [DocumentChange(file_path="a.md", change_type="delete")]
+        )
+
+        assert store.get_indexed_documents() == {"b.md_0"}
@@ -0,0 +1,131 @@
+"""Tests for Qdrant backup archives and restore without re-embedding."""
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from qdrant_client import QdrantClient
+
+from prometh_cortex.cli.commands.backup import backup
+from prometh_cortex.vector_store.qdrant_archive import (
+    ArchiveError,
+    ArchivePage,
+    ArchiveWriter,
+    iter_archive,
+    read_archive_header,
+)
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from tests.unit.conftest import make_config
+
+
+def use_client(monkeypatch):
+    local = QdrantClient(location=":memory:")
+    monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+    return local
+
+
+def make_store(tmp_path, **overrides):
+    return QdrantVectorStore(
+        make_config(
+            tmp_path,
+            vector_store_type="qdrant",
+            qdrant_collection_name="notes",
+            **overrides,
+        )
+    )
+
+
+def note(doc_id, text, **metadata):
+    return {"id": doc_id, "text": text, "metadata": {"file_path": doc_id, **metadata}}
+
+
+class TestArchiveFormat:
+    """Pages round-trip; incomplete archives are rejected."""
+
+    def test_pages_round_trip(self, tmp_path):
+        path = tmp_path / "backup.pcqa"
+        writer = ArchiveWriter(path, {"embedding_model": "m", "dimension": 2})
+        writer.write_page(
+            ArchivePage(
+                ["a", "b"],
+                [{"text": "x"}, {"text": "y"}],
+                np.array([[1, 2], [3, 4]], dtype=np.float32),
+                [{"indices": [7], "values": [0.5]}, None],
+            )
+        )
+        writer.close()
+
+        (page,) = list(iter_archive(path))
+
+        assert read_archive_header(path)["dimension"] == 2
+        assert page.ids == ["a", "b"]
+        assert page.vectors.tolist() == [[1, 2], [3, 4]]
+        assert page.sparse == [{"indices": [7], "values": [0.5]}, None]
+
+    def test_truncated_archive_is_rejected(self, tmp_path):
+        path = tmp_path / "backup.pcqa"
+        writer = ArchiveWriter(path, {"embedding_model": "m", "dimension": 1})
+        writer.write_page(ArchivePage(["a"], [{}], np.ones((1, 1), dtype=np.float32)))
+        writer.close()
+        path.write_bytes(path.read_bytes()[:-4])
+
+        with pytest.raises(ArchiveError):
+            list(iter_archive(path))
+
+
+class TestQdrantBackup:
+    """A backup restores into another server with the same vectors."""
+
+    def test_restore_uploads_stored_vectors(self, tmp_path, monkeypatch):
+        use_client(monkeypatch)
+        store = make_store(tmp_path)
+        store.add_documents(
+            [
+                note("a.md", "garden tomatoes", source_type="notes"),
+                note("b.md", "sailing boats"),
+                note("memory_m_0", "deploy checklist", source_type="prmth_memory"),
+            ]
+        )
+        vector = store.embed_model.get_query_embedding("sailing boats")
+        expected = [(r["source_file"], r["content"]) for r in store.query(vector, top_k=3)]
+        path = tmp_path / "backup.pcqa"
+
+        assert store.export_archive(path, workers=2) == 3
+
+        restored_client = use_client(monkeypatch)
+        restored = make_store(tmp_path / "restored", qdrant_hybrid=True)
+        monkeypatch.setattr(
+            type(store.embed_model),
+            "get_text_embedding_batch",
+            lambda *args, **kwargs: pytest.fail("restore must not embed"),
+        )
+
+        assert restored.restore_archive(path) == 3
+        found = restored.query(vector, top_k=3)
+        assert [(r["source_file"], r["content"]) for r in found] == expected
+        assert restored_client.get_aliases().aliases[0].collection_name == "notes_v1"
+        assert restored.query(vector, top_k=1, query_text="checklist")
+
+    def test_archive_from_other_model_is_rejected(self, tmp_path, monkeypatch):
+        use_client(monkeypatch)
+        store = make_store(tmp_path)
+        store.add_documents([note("a.md", "garden")])
+        path = tmp_path / "backup.pcqa"
+        store.export_archive(path)
+
+        with pytest.raises(ValueError):
+            make_store(tmp_path, embedding_model="other/model").restore_archive(path)
+
+
+class TestBackupCommand:
+    """The command refuses other backends with a clean exit."""
+
+    def test_faiss_backend_exits_with_error(self, tmp_path):
+        config = make_config(tmp_path)
+
+        result = CliRunner().invoke(
+            backup, [str(tmp_path / "backup.pcqa")], obj={"config": config, "verbose": False}
+        )
+
+        assert result.exit_code == 1
+        assert isinstance(result.exception, SystemExit)
+        assert "only available for the Qdrant backend" in result.output
@@ -0,0 +1,139 @@
+"""Tests for Qdrant storage settings: quantization, HNSW and on-disk storage."""
+
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import ScalarQuantization
+
+from prometh_cortex.config.settings import _load_from_env, config_to_env_vars
+from prometh_cortex.vector_store.qdrant_store import QdrantVectorStore
+from tests.unit.conftest import make_config
+
+
+@pytest.fixture
+def client(monkeypatch):
+    local = QdrantClient(location=":memory:")
+    monkeypatch.setattr(QdrantVectorStore, "_create_client", lambda self: local)
+    return local
+
+
+def make_qdrant_config(tmp_path, **overrides):
+    return make_config(
+        tmp_path, vector_store_type="qdrant", qdrant_collection_name="notes", **overrides
+    )
+
+
+def record(client, monkeypatch, method):
+    calls = []
+    original = getattr(client, method)
+
+    def recording(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(client, method, recording)
+    return calls
+
+
+class TestQdrantSettings:
+    """Settings are applied at create time and reconciled afterwards."""
+
+    def test_new_collection_uses_configured_storage(self, client, tmp_path, monkeypatch):
+        created = record(client, monkeypatch, "create_collection")
+        config = make_qdrant_config(
+            tmp_path,
+            qdrant_quantization="scalar",
+            qdrant_on_disk_vectors=True,
+            qdrant_on_disk_payload=True,
+            qdrant_hnsw_m=32,
+            qdrant_hnsw_ef=64,
+        )
+        store = QdrantVectorStore(config)
+        store.initialize()
+
+        (kwargs,) = created
+        assert isinstance(kwargs["quantization_config"], ScalarQuantization)
+        assert kwargs["quantization_config"].scalar.always_ram
+        assert kwargs["vectors_config"].on_disk
+        assert kwargs["on_disk_payload"]
+        assert kwargs["hnsw_config"].m == 32
+        assert store._search_params().hnsw_ef == 64
+        assert store._search_params().quantization.rescore
+        assert store.query([0.1] * store.vector_dimension, top_k=1) == []
+
+    def test_existing_collection_is_reconciled(self, client, tmp_path, monkeypatch):
+        QdrantVectorStore(make_qdrant_config(tmp_path)).initialize()
+        updates = record(client, monkeypatch, "update_collection")
+
+        QdrantVectorStore(make_qdrant_config(tmp_path)).initialize()
+        assert updates == []
+
+        QdrantVectorStore(make_qdrant_config(tmp_path, qdrant_on_disk_vectors=True)).initialize()
+
+        (kwargs,) = updates
+        assert kwargs["vectors_config"][""].on_disk
+        assert set(kwargs) == {"collection_name", "vectors_config"}
+
+    def test_invalid_quantization_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            make_qdrant_config(tmp_path, qdrant_quantization="product")
+
+
+class TestQdrantWarmStart:
+    """A collection set up as configured is opened with one request."""
+
+    def test_second_start_reads_only_the_collection(self, client, tmp_path, monkeypatch):
+        QdrantVectorStore(make_qdrant_config(tmp_path)).initialize()
+        assert (tmp_path / "index" / "qdrant_schema.json").exists()
+        calls = {
+            method: record(client, monkeypatch, method)
+            for method in [
+                "get_collection",
+                "get_collections",
+                "get_aliases",
+                "create_payload_index",
+                "update_collection",
+                "scroll",
+            ]
+        }
+
+        store = QdrantVectorStore(make_qdrant_config(tmp_path))
+        store.initialize()
+
+        assert len(calls["get_collection"]) == 1
+        assert not any(calls[method] for method in calls if method != "get_collection")
+        assert store.query([0.1] * store.vector_dimension, top_k=1) == []
+
+    def test_changed_setting_runs_full_setup(self, client, tmp_path, monkeypatch):
+        QdrantVectorStore(make_qdrant_config(tmp_path)).initialize()
+        indexes = record(client, monkeypatch, "create_payload_index")
+
+        QdrantVectorStore(make_qdrant_config(tmp_path, qdrant_tenant_index=True)).initialize()
+
+        assert indexes
+        indexes.clear()
+        QdrantVectorStore(make_qdrant_config(tmp_path, qdrant_tenant_index=True)).initialize()
+        assert indexes == []
+
+
+class TestQdrantSettingsEnvironment:
+    """Storage settings survive the trip through environment variables."""
+
+    def test_env_vars_round_trip(self, tmp_path, monkeypatch):
+        config = make_qdrant_config(
+            tmp_path,
+            qdrant_quantization="binary",
+            qdrant_quantization_always_ram=False,
+            qdrant_quantization_rescore=False,
+            qdrant_quantization_oversampling=2.5,
+            qdrant_tenant_index=True,
+        )
+        for name, value in config_to_env_vars(config).items():
+            monkeypatch.setenv(name, value)
+
+        loaded = _load_from_env()
+
+        assert loaded.qdrant_quantization == "binary"
+        assert loaded.qdrant_quantization_always_ram is False
+        assert loaded.qdrant_quantization_rescore is False
+        assert loaded.qdrant_quantization_oversampling == 2.5
+        assert loaded.qdrant_tenant_index is True
@@ -0,0 +1,238 @@
+"""Tests for the segmented FAISS index: tombstones, merges and incremental saves."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from prometh_cortex.vector_store.faiss_store import FAISSVectorStore
+from prometh_cortex.vector_store.segments import MergePolicy, SegmentStore
+from tests.unit.conftest import make_config
+
+DIMENSION = 4
+
+
+@pytest.fixture
+def config(tmp_path):
+    return make_config(tmp_path)
+
+
+def unit(i):
+    vector = np.zeros(DIMENSION, dtype=np.float32)
+    vector[i % DIMENSION] = 1.0
+    return vector
+
+
+def make_records(*ids):
+    return [{"id": i, "text": f"text {i}", "metadata": {}} for i in ids]
+
+
+def make_doc(doc_id, axis, **metadata):
+    return {"id": doc_id, "text": doc_id, "vector": unit(axis), "metadata": metadata}
+
+
+class TestTombstones:
+    """Deletes hide older copies until a newer write."""
+
+    def test_delete_hides_and_rewrite_revives(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        store.append(make_records("a", "b"), np.array([unit(0), unit(1)]))
+
+        assert store.delete(["a", "missing"]) == 1
+        assert not store.contains("a")
+        assert store.live_ids() == {"b"}
+
+        store.append(make_records("a"), np.array([unit(0)]))
+        assert store.search(unit(0), top_k=1)[0][1]["id"] == "a"
+
+    def test_tombstones_are_published(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        store.append(make_records("a"), np.array([unit(0)]))
+        store.delete(["a"])
+        store.save()
+
+        reloaded = SegmentStore(tmp_path)
+        reloaded.load()
+
+        assert reloaded.search(unit(0), top_k=1) == []
+
+    def test_reads_during_deletes_see_consistent_state(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        ids = [f"doc{i}" for i in range(2000)]
+        store.append(make_records(*ids), np.array([unit(i) for i in range(len(ids))]))
+        deleter = threading.Thread(target=lambda: [store.delete([i]) for i in ids])
+
+        deleter.start()
+        sizes = []
+        while deleter.is_alive():
+            sizes.append(len(store.live_ids()))
+        deleter.join()
+
+        assert sizes == sorted(sizes, reverse=True)
+        assert store.live_ids() == set()
+
+
+class TestCompaction:
+    """Merges keep exactly the visible rows."""
+
+    def test_policy_merges_full_tier(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        for i in range(3):
+            store.append(make_records(f"d{i}"), np.array([unit(i)]))
+
+        assert MergePolicy(merge_factor=4).select(store.segments) == []
+        assert len(MergePolicy(merge_factor=3).select(store.segments)) == 3
+
+    def test_merge_drops_superseded_and_deleted_rows(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        store.append(make_records("a", "b"), np.array([unit(0), unit(1)]))
+        store.append(make_records("a"), np.array([unit(3)]))
+        store.delete(["b"])
+        store.append(make_records("c", "d"), np.array([unit(2), unit(1)]))
+        before = {i: store.get(i)["text"] for i in store.live_ids()}
+
+        assert store.compact(MergePolicy(merge_factor=3)) == 1
+
+        assert len(store.segments) == 1
+        assert len(store.segments[0]) == 3
+        assert store.tombstones == {}
+        assert {i: store.get(i)["text"] for i in store.live_ids()} == before
+        assert store.search(unit(3), top_k=1)[0][1]["id"] == "a"
+
+        reloaded = SegmentStore(tmp_path)
+        reloaded.load()
+        assert reloaded.live_ids() == {"a", "c", "d"}
+
+    def test_merged_rows_lose_to_later_writes(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        store.append(make_records("a"), np.array([unit(0)]))
+        store.append(make_records("b"), np.array([unit(1)]))
+        store.append(make_records("a"), np.array([unit(2)]))
+        store.delete(["b"])
+
+        store.compact(MergePolicy(merge_factor=2))
+
+        assert store.live_ids() == {"a"}
+        assert store.search(unit(2), top_k=1)[0][0] == pytest.approx(1.0)
+
+
+class TestFAISSSegmentedWrites:
+    """Writes outside a build are persisted as small segments."""
+
+    def test_memory_write_appends_one_memory_segment(self, config):
+        store = FAISSVectorStore(config)
+        store.initialize()
+        store.add_documents([make_doc(f"doc{i}", i) for i in range(8)])
+        first = store._segments.segments[0]
+        first_mtime = (first.path / "vectors.npy").stat().st_mtime_ns
+
+        store.add_documents(
+            [make_doc("memory_x_0", 2, source_type="prmth_memory", document_id="memory_x")]
+        )
+
+        assert store._segments.segments == [first]
+        assert len(store._memory.segments) == 1
+        assert len(store._memory.segments[0]) == 1
+        assert (first.path / "vectors.npy").stat().st_mtime_ns == first_mtime
+
+        reopened = FAISSVectorStore(config)
+        reopened.initialize()
+        assert [doc["document_id"] for doc in reopened.list_memory_documents()] == [
+            "memory_x"
+        ]
+        assert reopened.query(unit(2), top_k=2)[0]["content"] in {"doc2", "memory_x_0"}
+
+    def test_background_merge_compacts_small_segments(self, config):
+        store = FAISSVectorStore(config)
+        store.initialize()
+        store._merge_policy = MergePolicy(merge_factor=3)
+
+        for i in range(3):
+            store.add_documents([make_doc(f"doc{i}", i)])
+        store.wait_for_compaction()
+
+        assert len(store._segments.segments) == 1
+        assert store.get_indexed_documents() == {"doc0", "doc1", "doc2"}
+
+    def test_bulk_load_head_is_searchable_before_sealing(self, config):
+        store = FAISSVectorStore(config)
+        store.initialize()
+        store.begin_bulk_load(64 * 1024 * 1024)
+        store.add_documents([make_doc("doc0", 0), make_doc("doc1", 1)])
+
+        assert store._segments.segments == []
+        assert store.query(unit(1), top_k=1)[0]["content"] == "doc1"
+
+        store.end_bulk_load()
+        store.save_index()
+        assert len(store._segments.segments) == 1
+
+    def test_reader_picks_up_published_segments(self, config):
+        writer = FAISSVectorStore(config)
+        writer.initialize()
+        writer.add_documents([make_doc("doc0", 0)])
+        reader = FAISSVectorStore(config)
+        reader.initialize()
+
+        writer.add_documents([make_doc("doc1", 1)])
+
+        assert reader.query(unit(1), top_k=1)[0]["content"] == "doc1"
+
+
+class TestLegacyStorageMigration:
+    """Indexes in the LlamaIndex storage format are converted once."""
+
+    def test_llama_index_storage_becomes_a_segment(self, config):
+        from llama_index.core import VectorStoreIndex
+        from llama_index.core.schema import NodeRelationship, RelatedNodeInfo, TextNode
+
+        from prometh_cortex.embedding import get_embedding_model_for_config
+
+        nodes = [
+            TextNode(
+                id_=doc_id,
+                text=doc_id,
+                metadata=metadata,
+                embedding=list(unit(axis)),
+                relationships={NodeRelationship.SOURCE: RelatedNodeInfo(node_id=doc_id)},
+            )
+            for doc_id, axis, metadata in [
+                ("doc0", 0, {"file_path": "/notes/a.md"}),
+                ("memory_y_0", 1, {"source_type": "prmth_memory", "document_id": "memory_y"}),
+            ]
+        ]
+        index = VectorStoreIndex(
+            nodes=nodes, embed_model=get_embedding_model_for_config(config)
+        )
+        index.storage_context.persist(str(config.rag_index_dir))
+        (config.rag_index_dir / "document_metadata.json").write_text(
+            '{"doc0": {}, "memory_y_0": {"source_type": "prmth_memory", '
+            '"document_id": "memory_y"}}'
+        )
+
+        store = FAISSVectorStore(config)
+        store.initialize()
+
+        assert not (config.rag_index_dir / "docstore.json").exists()
+        assert store.get_indexed_documents() == {"doc0", "memory_y_0"}
+        assert list(store._document_metadata) == ["memory_y_0"]
+        assert store.query(unit(0), top_k=1)[0]["source_file"] == "/notes/a.md"
+
+    def test_generation_memories_move_to_memory_store(self, config):
+        store = FAISSVectorStore(config)
+        store.initialize()
+        memory = make_doc("memory_z_0", 3, source_type="prmth_memory", document_id="memory_z")
+        # Written the way indexes did before the memory store existed
+        store._add_to_head(memory)
+        store.add_documents([make_doc("doc0", 0)])
+        (store.get_storage_dir() / "document_metadata.json").write_text(
+            '{"memory_z_0": {"source_type": "prmth_memory", "document_id": "memory_z"}}'
+        )
+
+        reopened = FAISSVectorStore(config)
+        reopened.initialize()
+
+        assert reopened._memory.live_ids() == {"memory_z_0"}
+        assert reopened._segments.live_ids() == {"doc0"}
+        assert not (reopened.get_storage_dir() / "document_metadata.json").exists()
+        assert reopened.query(unit(3), top_k=1)[0]["content"] == "memory_z_0"
@@ -0,0 +1,131 @@
+"""Tests for on-disk vector segments and the bounded-memory streaming build."""
+
+import numpy as np
+import pytest
+
+from prometh_cortex.indexer import DocumentIndexer
+from prometh_cortex.indexer import document_indexer
+from prometh_cortex.vector_store.segments import Segment, SegmentStore
+from tests.unit.conftest import TOPICS, make_config
+
+
+def make_streaming_config(tmp_path, **overrides):
+    return make_config(tmp_path, build_memory_limit_mb=64, **overrides)
+
+
+def make_records(*ids):
+    return [{"id": i, "text": f"text {i}", "metadata": {"file_path": i}} for i in ids]
+
+
+class TestSegments:
+    """Tests for segment files and the segment store."""
+
+    def test_write_search_and_read_back(self, tmp_path):
+        vectors = np.array([[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]], dtype=np.float32)
+        segment = Segment.write(tmp_path / "seg", make_records("a", "b", "c"), vectors)
+
+        hits = segment.search(np.array([0.0, 1.0], dtype=np.float32), top_k=2)
+
+        assert [row for _, row in hits] == [1, 2]
+        assert hits[0][0] == pytest.approx(1.0)
+        assert segment.record(2)["id"] == "c"
+        assert segment.ids == {"a", "b", "c"}
+
+    def test_newest_copy_wins(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        store.append(make_records("a", "b"), np.array([[1.0, 0.0], [0.0, 1.0]]))
+        store.append(make_records("a"), np.array([[0.0, 1.0]]))
+
+        results = store.search([1.0, 0.0], top_k=2)
+
+        assert [record["id"] for _, record in results] == ["b", "a"]
+        assert all(score < 0.5 for score, _ in results)
+
+    def test_unpublished_segments_are_discarded(self, tmp_path):
+        store = SegmentStore(tmp_path)
+        store.append(make_records("a"), np.array([[1.0, 0.0]]))
+        store.save()
+        store.append(make_records("b"), np.array([[0.0, 1.0]]))
+
+        reloaded = SegmentStore(tmp_path)
+        reloaded.load()
+
+        assert [segment.name for segment in reloaded.segments] == ["seg-000001"]
+
+        # The leftover directory is replaced by the next write
+        reloaded.append(make_records("c"), np.array([[0.0, 1.0]]))
+        assert reloaded.segments[-1].ids == {"c"}
+
+
+class TestStreamingBuild:
+    """The streaming build writes segments and stays queryable."""
+
+    def test_build_writes_segments(self, tmp_path, notes_dir, monkeypatch):
+        monkeypatch.setattr(document_indexer, "DEFAULT_BATCH_CHUNKS", 1)
+        config = make_streaming_config(tmp_path, build_checkpoint_chunks=2)
+        indexer = DocumentIndexer(config)
+
+        stats = indexer.build_index(jobs=2)
+
+        assert stats["total_documents"] == len(TOPICS)
+        assert stats["sources"]["default"]["documents"] + stats["sources"]["notes"][
+            "documents"
+        ] == len(TOPICS)
+
+        reopened = DocumentIndexer(make_streaming_config(tmp_path))
+        store_stats = reopened.vector_store.get_stats()
+        assert store_stats["segments"] >= 2
+        assert store_stats["segment_chunks"] == len(TOPICS)
+        for i, topic in enumerate(TOPICS):
+            results = reopened.query(topic, max_results=1)
+            assert results[0]["source_file"].endswith(f"note{i}.md")
+
+    def test_updated_file_supersedes_old_chunks(self, tmp_path, notes_dir):
+        DocumentIndexer(make_streaming_config(tmp_path)).build_index()
+        (notes_dir / "note1.md").write_text("# Note 1\n\nAll about sailing boats.\n")
+
+        indexer = DocumentIndexer(make_streaming_config(tmp_path))
+        stats = indexer.build_index()
+        results = indexer.query("garden tomatoes sailing boats", max_results=len(TOPICS))
+
+        assert stats["total_documents"] == 1
+        note1 = [r for r in results if r["source_file"].endswith("note1.md")]
+        assert len(note1) == 1
+        assert "sailing" in note1[0]["content"]
+
+    def test_memories_and_segments_are_merged(self, tmp_path, notes_dir):
+        indexer = DocumentIndexer(make_streaming_config(tmp_path))
+        indexer.build_index()
+        indexer.add_memory_document("Deploy notes", "kubernetes rollout checklist")
+
+        results = indexer.query("kubernetes", max_results=5)
+
+        source_types = {r["metadata"].get("source_type") for r in results}
+        assert "prmth_memory" in source_types
+        assert any(r["source_file"].endswith("note0.md") for r in results)
+
+    def test_no_documents(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "notes").mkdir()
+        indexer = DocumentIndexer(make_streaming_config(tmp_path))
+
+        assert indexer.build_index()["message"] == "No documents found"
+        assert indexer.get_build_checkpoint() is None
+
+
+class TestDocumentDiscovery:
+    """Tests for lazy document discovery."""
+
+    def test_nested_patterns_are_walked_once(self, tmp_path, notes_dir):
+        (notes_dir / "work").mkdir()
+        (notes_dir / "work" / "plan.md").write_text("# Plan\n")
+        config = make_streaming_config(tmp_path)
+        config.sources.append(
+            config.sources[1].copy(update={"name": "work", "source_patterns": ["notes/work"]})
+        )
+        indexer = DocumentIndexer(config)
+
+        paths = list(indexer.iter_document_paths())
+
+        assert len(paths) == len(set(paths)) == len(TOPICS) + 1
+        assert indexer.discover_documents() == sorted(paths)
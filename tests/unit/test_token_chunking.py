@@ -0,0 +1,131 @@
+"""Tests for chunks sized in embedding model tokens and truncation analysis."""
+
+import json
+
+import pytest
+from tokenizers import Tokenizer, models, pre_tokenizers, processors
+
+from prometh_cortex.analyzer import DocumentAnalyzer
+from prometh_cortex.config.settings import SourceConfig
+from prometh_cortex.embedding.tokenizer import TokenizerError, load_tokenizer
+from prometh_cortex.indexer import DocumentIndexer, IndexerError
+from tests.unit.conftest import make_config
+
+WORDS = "the release plan lists owners deadlines and risks for each milestone".split()
+
+PARAGRAPHS = [" ".join(WORDS[i % 4 :] + WORDS[: i % 4]) + f" item{i}." for i in range(40)]
+
+
+@pytest.fixture
+def tokenizer_dir(tmp_path):
+    """A BERT-style word-level tokenizer with a 64-token window."""
+    vocab = {"[UNK]": 0, "[CLS]": 1, "[SEP]": 2}
+    for word in WORDS:
+        vocab.setdefault(word, len(vocab))
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]", special_tokens=[("[CLS]", 1), ("[SEP]", 2)]
+    )
+    directory = tmp_path / "model"
+    directory.mkdir()
+    tokenizer.save(str(directory / "tokenizer.json"))
+    (directory / "sentence_bert_config.json").write_text(json.dumps({"max_seq_length": 64}))
+    return directory
+
+
+@pytest.fixture
+def notes(tmp_path, monkeypatch):
+    directory = tmp_path / "notes"
+    directory.mkdir()
+    (directory / "plan.md").write_text("# Plan\n\n" + "\n\n".join(PARAGRAPHS) + "\n")
+    monkeypatch.chdir(tmp_path)
+    return directory
+
+
+def make_indexer(tmp_path, tokenizer):
+    return DocumentIndexer(
+        make_config(
+            tmp_path,
+            embedding_tokenizer=str(tokenizer),
+            sources=[
+                {
+                    "name": "notes",
+                    "chunk_size": 512,
+                    "chunk_overlap": 8,
+                    "chunking": "tokens",
+                    "source_patterns": ["notes"],
+                }
+            ],
+        )
+    )
+
+
+class TestModelTokenizer:
+    """The window comes from the model; spans fill it without splitting words."""
+
+    def test_window_excludes_special_tokens(self, tokenizer_dir):
+        tokenizer = load_tokenizer(str(tokenizer_dir))
+
+        assert tokenizer.max_tokens == 64
+        assert tokenizer.window == 62
+        assert load_tokenizer(str(tokenizer_dir), 16).window == 14
+
+    def test_spans_fill_window(self, tokenizer_dir):
+        tokenizer = load_tokenizer(str(tokenizer_dir))
+        text = "\n\n".join(PARAGRAPHS)
+
+        spans = tokenizer.spans(text, 512, overlap=4)
+        counts = tokenizer.count([text[start:end] for start, end in spans])
+
+        assert spans[0][0] == 0 and spans[-1][1] == len(text)
+        assert max(counts) <= 62
+        assert sum(counts[:-1]) / len(counts[:-1]) > 62 * 0.75
+        assert all(text[end - 1] != " " and text[start] != " " for start, end in spans)
+
+    def test_missing_tokenizer_is_reported(self, tmp_path):
+        with pytest.raises(TokenizerError):
+            load_tokenizer(str(tmp_path))
+
+
+class TestTokenChunkBuilds:
+    """Token-sized sources never exceed the window; others report truncation."""
+
+    def test_build_chunks_fit_window(self, notes, tokenizer_dir, tmp_path):
+        indexer = make_indexer(tmp_path, tokenizer_dir)
+
+        indexer.build_index()
+
+        tokenizer = load_tokenizer(str(tokenizer_dir))
+        texts = [
+            record["text"]
+            for records, _ in indexer.vector_store.iter_chunks()
+            for record in records
+        ]
+        assert len(texts) > 3
+        assert max(tokenizer.count(texts)) <= tokenizer.window
+
+    def test_unloadable_tokenizer_fails_build(self, notes, tmp_path):
+        indexer = make_indexer(tmp_path, tmp_path / "no-model")
+
+        with pytest.raises(IndexerError, match="tokenizer"):
+            indexer.build_index()
+
+    def test_analyzer_reports_truncation(self, notes, tokenizer_dir):
+        analyzer = DocumentAnalyzer(tokenizer=load_tokenizer(str(tokenizer_dir)))
+        by_chars = SourceConfig(name="notes", chunk_size=2048, source_patterns=["notes"])
+        by_tokens = SourceConfig(
+            name="notes", chunk_size=512, chunking="tokens", source_patterns=["notes"]
+        )
+
+        chars_result = analyzer.analyze_collection(by_chars)
+        tokens_result = analyzer.analyze_collection(by_tokens)
+
+        assert chars_result.token_window == 62
+        assert chars_result.truncation_rate > 0.5
+        assert chars_result.ignored_token_rate > 0.5
+        assert tokens_result.truncation_rate == 0
+        assert tokens_result.window_utilization > 0.75
+        report = analyzer.generate_report([chars_result, tokens_result])
+        assert 'chunk_size = 512\nchunk_overlap = 50\nchunking = "tokens"' in report
+        assert 'Set `chunking = "tokens"`' in report